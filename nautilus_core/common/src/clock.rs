@@ -108,6 +108,17 @@ impl TestClock {
             .collect()
     }
 
+    /// Returns the earliest next time of all active timers (zero if none).
+    #[inline]
+    pub fn next_event_time_ns(&self) -> Timestamp {
+        self.timers
+            .values()
+            .filter(|timer| !timer.is_expired)
+            .map(|timer| timer.next_time_ns)
+            .min()
+            .unwrap_or(0)
+    }
+
     // #[inline]
     // pub fn match_handlers(&self, events: Vec<TimeEvent>) -> Vec<TimeEventHandler> {
     //     events
@@ -365,6 +376,11 @@ pub unsafe extern "C" fn test_clock_next_time_ns(
     clock.next_time_ns(name.as_str())
 }
 
+#[no_mangle]
+pub extern "C" fn test_clock_next_event_time_ns(clock: &CTestClock) -> Timestamp {
+    clock.next_event_time_ns()
+}
+
 /// # Safety
 /// - Assumes `name` is borrowed from a valid Python UTF-8 `str`.
 #[no_mangle]
@@ -415,4 +431,17 @@ mod tests {
         assert_eq!(clock.timer_names().len(), 1);
         assert_eq!(clock.timer_count(), 1);
     }
+
+    #[test]
+    fn test_next_event_time_ns() {
+        let mut clock = TestClock::new();
+        assert_eq!(clock.next_event_time_ns(), 0);
+
+        clock.set_timer_ns(String::from("TEST_TIME1"), 10, 0, None, None);
+        clock.set_timer_ns(String::from("TEST_TIME2"), 3, 0, Some(3), None);
+        assert_eq!(clock.next_event_time_ns(), 3);
+
+        clock.advance_time(3);
+        assert_eq!(clock.next_event_time_ns(), 10);
+    }
 }
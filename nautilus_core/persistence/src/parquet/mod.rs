@@ -297,13 +297,15 @@ pub unsafe extern "C" fn parquet_writer_new(
     metadata: *mut ffi::PyObject,
 ) -> *mut c_void {
     let file_path = pystr_to_string(file_path);
-    let schema = QuoteTick::encode_schema(pydict_to_btree_map(metadata));
+    let metadata = pydict_to_btree_map(metadata);
     match writer_type {
         ParquetType::QuoteTick => {
+            let schema = QuoteTick::encode_schema(metadata);
             let b = Box::new(ParquetWriter::<QuoteTick>::new(&file_path, schema));
             Box::into_raw(b) as *mut c_void
         }
         ParquetType::TradeTick => {
+            let schema = TradeTick::encode_schema(metadata);
             let b = Box::new(ParquetWriter::<TradeTick>::new(&file_path, schema));
             Box::into_raw(b) as *mut c_void
         }
@@ -315,13 +317,16 @@ pub unsafe extern "C" fn parquet_writer_new(
 /// has a corresponding ParquetType enum.
 #[no_mangle]
 pub unsafe extern "C" fn parquet_writer_drop(writer: *mut c_void, writer_type: ParquetType) {
+    // The writer is ended first so the file footer is written
     match writer_type {
         ParquetType::QuoteTick => {
-            let writer = Box::from_raw(writer as *mut ParquetWriter<QuoteTick>);
+            let mut writer = Box::from_raw(writer as *mut ParquetWriter<QuoteTick>);
+            writer.end_writer();
             drop(writer);
         }
         ParquetType::TradeTick => {
-            let writer = Box::from_raw(writer as *mut ParquetWriter<TradeTick>);
+            let mut writer = Box::from_raw(writer as *mut ParquetWriter<TradeTick>);
+            writer.end_writer();
             drop(writer);
         }
     }
@@ -343,7 +348,12 @@ pub unsafe extern "C" fn parquet_writer_chunk_append(
             data.push(*item);
             CVec::from(data)
         }
-        ParquetType::TradeTick => todo!(),
+        ParquetType::TradeTick => {
+            let mut data: Vec<TradeTick> = Vec::from_raw_parts(ptr as *mut TradeTick, len, cap);
+            let item = Box::from_raw(item as *mut TradeTick);
+            data.push(*item);
+            CVec::from(data)
+        }
     }
 }
 
@@ -359,7 +369,6 @@ pub unsafe extern "C" fn parquet_writer_write(
     data: *mut c_void,
     len: usize,
 ) {
-    println!("parquet_writer_write");
     match writer_type {
         ParquetType::QuoteTick => {
             let mut writer = Box::from_raw(writer as *mut ParquetWriter<QuoteTick>);
@@ -369,7 +378,14 @@ pub unsafe extern "C" fn parquet_writer_write(
             // Leak writer value back otherwise it will be dropped after this function
             Box::into_raw(writer);
         }
-        ParquetType::TradeTick => todo!(),
+        ParquetType::TradeTick => {
+            let mut writer = Box::from_raw(writer as *mut ParquetWriter<TradeTick>);
+            let data: &[TradeTick] = slice::from_raw_parts(data as *const TradeTick, len);
+            // TODO: handle errors better
+            writer.write(data).expect("Could not write data to file");
+            // Leak writer value back otherwise it will be dropped after this function
+            Box::into_raw(writer);
+        }
     }
 }
 
@@ -118,11 +118,11 @@ impl DecodeFromChunk for QuoteTick {
             .as_any()
             .downcast_ref::<Int64Array>()
             .unwrap();
-        let ask_size_values = cols.arrays()[2]
+        let bid_size_values = cols.arrays()[2]
             .as_any()
             .downcast_ref::<UInt64Array>()
             .unwrap();
-        let bid_size_values = cols.arrays()[3]
+        let ask_size_values = cols.arrays()[3]
             .as_any()
             .downcast_ref::<UInt64Array>()
             .unwrap();
@@ -130,7 +130,7 @@ impl DecodeFromChunk for QuoteTick {
             .as_any()
             .downcast_ref::<UInt64Array>()
             .unwrap();
-        let ts_init_values = cols.arrays()[4]
+        let ts_init_values = cols.arrays()[5]
             .as_any()
             .downcast_ref::<UInt64Array>()
             .unwrap();
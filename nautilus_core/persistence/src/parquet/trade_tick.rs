@@ -43,9 +43,9 @@ impl EncodeToChunk for TradeTick {
     fn encode_schema(metadata: BTreeMap<String, String>) -> Schema {
         let fields = vec![
             Field::new("price", DataType::Int64, false),
-            Field::new("size", DataType::Int64, false),
+            Field::new("size", DataType::UInt64, false),
             Field::new("aggressor_side", DataType::UInt8, false),
-            Field::new("trade_id", DataType::Binary, false),
+            Field::new("trade_id", DataType::Utf8, false),
             Field::new("ts_event", DataType::UInt64, false),
             Field::new("ts_init", DataType::UInt64, false),
         ];
@@ -132,7 +132,7 @@ impl DecodeFromChunk for TradeTick {
             .as_any()
             .downcast_ref::<UInt64Array>()
             .unwrap();
-        let ts_init_values = cols.arrays()[4]
+        let ts_init_values = cols.arrays()[5]
             .as_any()
             .downcast_ref::<UInt64Array>()
             .unwrap();
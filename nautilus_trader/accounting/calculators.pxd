@@ -31,6 +31,21 @@ cdef class ExchangeRateCalculator:
     )
 
 
+cdef class ExchangeRateGraph:
+    cdef dict _quotes
+    cdef dict _adjacency
+    cdef dict _paths
+    cdef dict _rates
+    cdef dict _dependents
+
+    cpdef int pair_count(self) except *
+    cpdef void update(self, str base_code, str quote_code, double bid, double ask) except *
+    cpdef double get_rate(self, Currency from_currency, Currency to_currency, PriceType price_type) except *
+    cpdef void clear(self) except *
+
+    cdef list _find_path(self, str from_code, str to_code)
+    cdef double _path_rate(self, list path, PriceType price_type) except *
+
 cdef class RolloverInterestCalculator:
     cdef dict _rate_data
 
@@ -182,6 +182,203 @@ cdef class ExchangeRateCalculator:
         return quotes.get(to_currency.code, 0.0)
 
 
+cdef class ExchangeRateGraph:
+    """
+    Provides exchange rate calculations from a live graph of currency pair quotes.
+
+    Each currency is a node and each quoted pair an edge, with the edges
+    updated in place as quotes arrive. Conversion paths between currencies are
+    resolved by breadth-first search (fewest pairs) and cached until a new pair
+    is added, and calculated rates are cached until a quote on their path
+    changes.
+    """
+
+    def __init__(self):
+        self._quotes = {}      # type: dict[tuple[str, str], tuple[float, float]]
+        self._adjacency = {}   # type: dict[str, dict[str, tuple[tuple[str, str], bool]]]
+        self._paths = {}       # type: dict[tuple[str, str], list[tuple[tuple[str, str], bool]]]
+        self._rates = {}       # type: dict[tuple[str, str, PriceType], float]
+        self._dependents = {}  # type: dict[tuple[str, str], set[tuple[str, str, PriceType]]]
+
+    cpdef int pair_count(self) except *:
+        """
+        Return the count of currency pairs in the graph.
+
+        Returns
+        -------
+        int
+
+        """
+        return len(self._quotes)
+
+    cpdef void update(self, str base_code, str quote_code, double bid, double ask) except *:
+        """
+        Update the graph with the given currency pair quote.
+
+        Parameters
+        ----------
+        base_code : str
+            The base currency code of the pair.
+        quote_code : str
+            The quote currency code of the pair.
+        bid : double
+            The bid price of the pair.
+        ask : double
+            The ask price of the pair.
+
+        """
+        cdef tuple pair = (base_code, quote_code)
+        cdef tuple last = self._quotes.get(pair)
+        self._quotes[pair] = (bid, ask)
+
+        if last is None:
+            # New edge, previously resolved paths may no longer be the shortest
+            self._adjacency.setdefault(base_code, {})[quote_code] = (pair, False)
+            self._adjacency.setdefault(quote_code, {})[base_code] = (pair, True)
+            self._paths.clear()
+            self._rates.clear()
+            self._dependents.clear()
+            return
+
+        if last[0] == bid and last[1] == ask:
+            return  # No change to rates
+
+        # Invalidate rates calculated across this pair
+        cdef set dependents = self._dependents.pop(pair, None)
+        if dependents:
+            for key in dependents:
+                self._rates.pop(key, None)
+
+    cpdef double get_rate(
+        self,
+        Currency from_currency,
+        Currency to_currency,
+        PriceType price_type,
+    ) except *:
+        """
+        Return the calculated exchange rate for the given price type.
+
+        Parameters
+        ----------
+        from_currency : Currency
+            The currency to convert from.
+        to_currency : Currency
+            The currency to convert to.
+        price_type : PriceType
+            The price type for conversion.
+
+        Returns
+        -------
+        double
+
+        Raises
+        ------
+        ValueError
+            If `price_type` is ``LAST``.
+
+        Notes
+        -----
+        If insufficient data to calculate exchange rate then will return 0.
+
+        """
+        Condition.not_none(from_currency, "from_currency")
+        Condition.not_none(to_currency, "to_currency")
+        Condition.true(price_type != PriceType.LAST, "price_type was invalid (LAST)")
+
+        if from_currency == to_currency:
+            return 1.0  # No conversion necessary
+
+        cdef str from_code = from_currency.code
+        cdef str to_code = to_currency.code
+        cdef tuple key = (from_code, to_code, price_type)
+        rate = self._rates.get(key)
+        if rate is not None:
+            return rate
+
+        cdef tuple path_key = (from_code, to_code)
+        cdef list path = self._paths.get(path_key)
+        if path is None:
+            path = self._find_path(from_code, to_code)
+            self._paths[path_key] = path
+
+        if not path:
+            return 0.0  # Not enough data
+
+        cdef double xrate = self._path_rate(path, price_type)
+        self._rates[key] = xrate
+
+        cdef tuple step
+        for step in path:
+            self._dependents.setdefault(step[0], set()).add(key)
+
+        return xrate
+
+    cpdef void clear(self) except *:
+        """
+        Clear all quotes and cached calculations from the graph.
+        """
+        self._quotes.clear()
+        self._adjacency.clear()
+        self._paths.clear()
+        self._rates.clear()
+        self._dependents.clear()
+
+    cdef list _find_path(self, str from_code, str to_code):
+        if from_code not in self._adjacency or to_code not in self._adjacency:
+            return []
+
+        # Breadth-first search so the path crosses the fewest pairs
+        cdef dict previous = {from_code: None}  # type: dict[str, tuple[str, tuple]]
+        cdef list frontier = [from_code]
+        cdef list next_frontier
+        cdef str code
+        cdef str neighbor
+        while frontier and to_code not in previous:
+            next_frontier = []
+            for code in frontier:
+                for neighbor, edge in self._adjacency[code].items():
+                    if neighbor in previous:
+                        continue
+                    previous[neighbor] = (code, edge)
+                    next_frontier.append(neighbor)
+            frontier = next_frontier
+
+        if to_code not in previous:
+            return []
+
+        cdef list path = []
+        cdef tuple link
+        code = to_code
+        while code != from_code:
+            link = previous[code]
+            path.append(link[1])
+            code = link[0]
+        path.reverse()
+        return path
+
+    cdef double _path_rate(self, list path, PriceType price_type) except *:
+        cdef double xrate = 1.0
+        cdef double rate
+        cdef tuple step
+        cdef tuple quote
+        for step in path:
+            quote = self._quotes[step[0]]
+            if price_type == PriceType.BID:
+                rate = quote[0]
+            elif price_type == PriceType.ASK:
+                rate = quote[1]
+            elif price_type == PriceType.MID:
+                rate = (quote[0] + quote[1]) / 2.0
+            else:
+                raise ValueError(f"Cannot calculate exchange rate for PriceType."
+                                 f"{PriceTypeParser.to_str(price_type)}")
+            if rate == 0.0:
+                return 0.0
+            if step[1]:  # Inverse of the quoted pair
+                rate = 1.0 / rate
+            xrate *= rate
+        return xrate
+
 cdef class RolloverInterestCalculator:
     """
     Provides rollover interest rate calculations.
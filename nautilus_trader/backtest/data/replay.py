@@ -0,0 +1,376 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import struct
+from operator import attrgetter
+from typing import Dict, List, Optional, Union
+
+import msgspec
+import numpy as np
+import pandas as pd
+
+from nautilus_trader.backtest.data.stream import BarDataStream
+from nautilus_trader.backtest.data.stream import ColumnarDataStream
+from nautilus_trader.backtest.data.stream import QuoteTickDataStream
+from nautilus_trader.backtest.data.stream import TradeTickDataStream
+from nautilus_trader.core.correctness import PyCondition
+from nautilus_trader.model.data.bar import Bar
+from nautilus_trader.model.data.bar import BarType
+from nautilus_trader.model.data.tick import QuoteTick
+from nautilus_trader.model.data.tick import TradeTick
+from nautilus_trader.model.identifiers import InstrumentId
+from nautilus_trader.model.instruments.base import Instrument
+from nautilus_trader.persistence.catalog.base import BaseDataCatalog
+
+
+REPLAY_MAGIC = b"NTREPLAY"
+REPLAY_VERSION = 2
+
+# Magic, version, metadata length (followed by JSON metadata, then padding
+# so records start on an aligned offset)
+_PREFIX = struct.Struct("<8sII")
+_ALIGNMENT = 64
+
+QUOTE_TICK_RECORD = np.dtype(
+    [
+        ("ts_init", "<u8"),
+        ("ts_event", "<u8"),
+        ("bid", "<i8"),
+        ("ask", "<i8"),
+        ("bid_size", "<u8"),
+        ("ask_size", "<u8"),
+        ("key_index", "<u2"),
+    ],
+    align=True,
+)
+
+
+def trade_tick_record(trade_id_size: int) -> np.dtype:
+    """
+    Return the trade tick record dtype for trade IDs of the given byte width.
+
+    Trade IDs are held losslessly as fixed-width UTF-8 bytes, sized for the
+    widest trade ID in the file.
+
+    Parameters
+    ----------
+    trade_id_size : int
+        The byte width of the trade ID field.
+
+    Returns
+    -------
+    np.dtype
+
+    """
+    return np.dtype(
+        [
+            ("ts_init", "<u8"),
+            ("ts_event", "<u8"),
+            ("price", "<i8"),
+            ("size", "<u8"),
+            ("key_index", "<u2"),
+            ("aggressor_side", "u1"),
+            ("trade_id", f"S{trade_id_size}"),
+        ],
+        align=True,
+    )
+
+
+BAR_RECORD = np.dtype(
+    [
+        ("ts_init", "<u8"),
+        ("ts_event", "<u8"),
+        ("open", "<i8"),
+        ("high", "<i8"),
+        ("low", "<i8"),
+        ("close", "<i8"),
+        ("volume", "<u8"),
+        ("key_index", "<u2"),
+    ],
+    align=True,
+)
+
+_RECORDS: Dict[str, np.dtype] = {
+    QuoteTick.__name__: QUOTE_TICK_RECORD,
+    Bar.__name__: BAR_RECORD,
+}
+
+_STREAM_KINDS: Dict[type, str] = {
+    QuoteTickDataStream: QuoteTick.__name__,
+    TradeTickDataStream: TradeTick.__name__,
+    BarDataStream: Bar.__name__,
+}
+
+
+def write_replay_file(path: str, stream: ColumnarDataStream) -> int:
+    """
+    Write the given data stream to a replay file at the given path.
+
+    A replay file holds one fixed-width binary record per row, sorted by
+    `ts_init`, and can be memory-mapped back into a stream with
+    `open_replay_file()` without deserializing any data. As the stream was
+    validated on construction, the header records the data as sorted so it is
+    not validated again when opened.
+
+    Parameters
+    ----------
+    path : str
+        The path for the replay file (overwritten if it exists).
+    stream : ColumnarDataStream
+        The data stream to write.
+
+    Returns
+    -------
+    int
+        The total bytes written.
+
+    Raises
+    ------
+    KeyError
+        If `stream` is not a quote tick, trade tick or bar stream.
+
+    """
+    PyCondition.not_none(stream, "stream")
+
+    kind: str = _STREAM_KINDS[type(stream)]
+    columns: Dict[str, np.ndarray] = stream.columns()
+
+    header: Dict = {"kind": kind, "count": len(stream), "sorted": True}
+    if kind == TradeTick.__name__:
+        header["trade_id_size"] = columns["trade_id"].dtype.itemsize
+        dtype: np.dtype = trade_tick_record(header["trade_id_size"])
+    else:
+        dtype = _RECORDS[kind]
+
+    records = np.zeros(len(stream), dtype=dtype)
+    for name in dtype.names:
+        records[name] = columns[name]
+
+    if isinstance(stream, BarDataStream):
+        header["keys"] = [str(bar_type) for bar_type in stream.bar_types()]
+    else:
+        header["keys"] = [str(instrument_id) for instrument_id in stream.instrument_ids()]
+
+    metadata: bytes = msgspec.json.encode(header)
+    header_size: int = _PREFIX.size + len(metadata)
+    padding: int = -header_size % _ALIGNMENT
+
+    with open(path, "wb") as f:
+        f.write(_PREFIX.pack(REPLAY_MAGIC, REPLAY_VERSION, len(metadata)))
+        f.write(metadata)
+        f.write(b"\x00" * padding)
+        records.tofile(f)
+
+    return header_size + padding + records.nbytes
+
+
+def read_replay_header(path: str) -> Dict:
+    """
+    Return the header of the replay file at the given path.
+
+    Parameters
+    ----------
+    path : str
+        The path to the replay file.
+
+    Returns
+    -------
+    dict
+        The header containing the data `kind`, record `count`, the instrument
+        ID or bar type `keys`, whether the records are known to be `sorted`,
+        the `trade_id_size` (trade ticks only), and the byte `offset` of the
+        first record.
+
+    Raises
+    ------
+    ValueError
+        If the file is not a replay file, or is an unsupported version.
+
+    """
+    with open(path, "rb") as f:
+        prefix: bytes = f.read(_PREFIX.size)
+        if len(prefix) < _PREFIX.size:
+            raise ValueError(f"invalid replay file, was {path}")
+        magic, version, metadata_size = _PREFIX.unpack(prefix)
+        if magic != REPLAY_MAGIC:
+            raise ValueError(f"invalid replay file, was {path}")
+        if version != REPLAY_VERSION:
+            raise ValueError(f"unsupported replay file version, was {version}")
+        header: Dict = msgspec.json.decode(f.read(metadata_size))
+
+    header_size: int = _PREFIX.size + metadata_size
+    header["offset"] = header_size + (-header_size % _ALIGNMENT)
+    return header
+
+
+def open_replay_file(path: str, instruments: List[Instrument]) -> ColumnarDataStream:
+    """
+    Return a data stream memory-mapped from the replay file at the given path.
+
+    The stream columns are read-only views into the mapped records, and the
+    same file opened from multiple processes shares pages through the OS page
+    cache. Files written by `write_replay_file()` are recorded as sorted, so
+    opening them only reads the header; otherwise the stream is validated,
+    which reads every record.
+
+    Parameters
+    ----------
+    path : str
+        The path to the replay file.
+    instruments : list[Instrument]
+        The instruments for the data (may include unrelated instruments).
+
+    Returns
+    -------
+    QuoteTickDataStream or TradeTickDataStream or BarDataStream
+
+    Raises
+    ------
+    ValueError
+        If the file is not a replay file, or is an unsupported version.
+    ValueError
+        If an instrument for the data is not in `instruments`.
+
+    """
+    header: Dict = read_replay_header(path)
+    kind: str = header["kind"]
+    if kind == TradeTick.__name__:
+        dtype: np.dtype = trade_tick_record(header["trade_id_size"])
+    else:
+        dtype = _RECORDS[kind]
+    validate: bool = not header.get("sorted", False)
+    records = np.memmap(
+        path,
+        dtype=dtype,
+        mode="r",
+        offset=header["offset"],
+        shape=(header["count"],),
+    )
+
+    instruments_by_id: Dict[InstrumentId, Instrument] = {i.id: i for i in instruments}
+    if kind == Bar.__name__:
+        bar_types: List[BarType] = [BarType.from_str(key) for key in header["keys"]]
+        instrument_ids = [bar_type.instrument_id for bar_type in bar_types]
+    else:
+        instrument_ids = [InstrumentId.from_str(key) for key in header["keys"]]
+
+    for instrument_id in instrument_ids:
+        PyCondition.true(
+            instrument_id in instruments_by_id,
+            f"`Instrument` {instrument_id} for the replay file not found",
+        )
+
+    stream_instruments = [instruments_by_id[instrument_id] for instrument_id in instrument_ids]
+    if kind == QuoteTick.__name__:
+        return QuoteTickDataStream(
+            instruments=stream_instruments,
+            bid=records["bid"],
+            ask=records["ask"],
+            bid_size=records["bid_size"],
+            ask_size=records["ask_size"],
+            ts_init=records["ts_init"],
+            ts_event=records["ts_event"],
+            instrument_index=records["key_index"],
+            validate=validate,
+        )
+    elif kind == TradeTick.__name__:
+        return TradeTickDataStream(
+            instruments=stream_instruments,
+            price=records["price"],
+            size=records["size"],
+            aggressor_side=records["aggressor_side"],
+            ts_init=records["ts_init"],
+            ts_event=records["ts_event"],
+            instrument_index=records["key_index"],
+            trade_id=records["trade_id"],
+            validate=validate,
+        )
+    else:
+        return BarDataStream(
+            bar_types=bar_types,
+            instruments=stream_instruments,
+            open=records["open"],
+            high=records["high"],
+            low=records["low"],
+            close=records["close"],
+            volume=records["volume"],
+            ts_init=records["ts_init"],
+            ts_event=records["ts_event"],
+            bar_type_index=records["key_index"],
+            validate=validate,
+        )
+
+
+def write_replay_file_from_catalog(
+    catalog: BaseDataCatalog,
+    path: str,
+    cls: type,
+    instrument_ids: Optional[List[str]] = None,
+    start: Optional[Union[pd.Timestamp, str, int]] = None,
+    end: Optional[Union[pd.Timestamp, str, int]] = None,
+) -> int:
+    """
+    Convert data from the given catalog into a replay file at the given path.
+
+    Parameters
+    ----------
+    catalog : BaseDataCatalog
+        The catalog to read the data and instruments from.
+    path : str
+        The path for the replay file (overwritten if it exists).
+    cls : type
+        The data type to convert, one of `QuoteTick`, `TradeTick` or `Bar`.
+    instrument_ids : list[str], optional
+        The instrument IDs to filter the data by.
+    start : pd.Timestamp or str or int, optional
+        The start time (UNIX nanoseconds) of the data to convert.
+    end : pd.Timestamp or str or int, optional
+        The end time (UNIX nanoseconds) of the data to convert.
+
+    Returns
+    -------
+    int
+        The total bytes written.
+
+    Raises
+    ------
+    ValueError
+        If `cls` is not a supported data type.
+    ValueError
+        If no data was found in the catalog.
+
+    """
+    PyCondition.true(cls in (QuoteTick, TradeTick, Bar), f"unsupported data type, was {cls}")
+
+    if cls is QuoteTick:
+        query = catalog.quote_ticks
+    elif cls is TradeTick:
+        query = catalog.trade_ticks
+    else:
+        query = catalog.bars
+
+    data = query(instrument_ids=instrument_ids, start=start, end=end, as_nautilus=True)
+    PyCondition.not_empty(data, "data")
+    data = sorted(data, key=attrgetter("ts_init"))  # Stable for equal timestamps
+
+    instruments: List[Instrument] = catalog.instruments(as_nautilus=True)
+    if cls is QuoteTick:
+        stream = QuoteTickDataStream.from_ticks(instruments, data)
+    elif cls is TradeTick:
+        stream = TradeTickDataStream.from_ticks(instruments, data)
+    else:
+        stream = BarDataStream.from_bars(instruments, data)
+
+    return write_replay_file(path, stream)
@@ -0,0 +1,84 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from libc.stdint cimport int64_t
+from libc.stdint cimport uint8_t
+from libc.stdint cimport uint16_t
+from libc.stdint cimport uint64_t
+
+from nautilus_trader.core.data cimport Data
+
+
+cdef class ColumnarDataStream:
+    cdef list _keys
+    cdef list _columns
+    cdef const uint16_t[:] _key_index
+    cdef const uint8_t[:] _price_prec
+    cdef const uint8_t[:] _size_prec
+    cdef const uint64_t[:] _ts_event
+    cdef const uint64_t[:] _ts_init
+
+    cdef readonly int64_t count
+    """The count of rows in the stream.\n\n:returns: `int`"""
+    cdef readonly int64_t index
+    """The index of the next row to materialize.\n\n:returns: `int`"""
+
+    cpdef list instrument_ids(self)
+    cpdef dict columns(self)
+    cpdef bint is_exhausted(self) except *
+    cpdef uint64_t first_ts(self) except *
+    cpdef uint64_t last_ts(self) except *
+    cpdef uint64_t peek_ts(self) except *
+    cpdef Data pop(self)
+    cpdef void seek(self, uint64_t ts_init) except *
+    cpdef void reset(self) except *
+
+    cdef object _column(self, object values, object dtype)
+    cdef void _init_index(
+        self,
+        list keys,
+        list price_precisions,
+        list size_precisions,
+        object key_index,
+        object ts_init,
+        object ts_event,
+        bint validate,
+    ) except *
+    cdef Data _materialize(self, int64_t row)
+
+
+cdef class QuoteTickDataStream(ColumnarDataStream):
+    cdef const int64_t[:] _bid
+    cdef const int64_t[:] _ask
+    cdef const uint64_t[:] _bid_size
+    cdef const uint64_t[:] _ask_size
+
+
+cdef class TradeTickDataStream(ColumnarDataStream):
+    cdef const int64_t[:] _price
+    cdef const uint64_t[:] _size
+    cdef const uint8_t[:] _aggressor_side
+    cdef object _trade_id
+    cdef bint _has_trade_id
+
+
+cdef class BarDataStream(ColumnarDataStream):
+    cdef const int64_t[:] _open
+    cdef const int64_t[:] _high
+    cdef const int64_t[:] _low
+    cdef const int64_t[:] _close
+    cdef const uint64_t[:] _volume
+
+    cpdef list bar_types(self)
@@ -0,0 +1,739 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from typing import Optional
+
+import numpy as np
+
+from libc.stdint cimport int64_t
+from libc.stdint cimport uint8_t
+from libc.stdint cimport uint16_t
+from libc.stdint cimport uint64_t
+
+from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.core.data cimport Data
+from nautilus_trader.model.c_enums.aggressor_side cimport AggressorSide
+from nautilus_trader.model.data.bar cimport Bar
+from nautilus_trader.model.data.bar cimport BarType
+from nautilus_trader.model.data.tick cimport QuoteTick
+from nautilus_trader.model.data.tick cimport TradeTick
+from nautilus_trader.model.identifiers cimport InstrumentId
+from nautilus_trader.model.identifiers cimport TradeId
+from nautilus_trader.model.instruments.base cimport Instrument
+
+
+cdef class ColumnarDataStream:
+    """
+    The base class for backtest data streams held as columns of raw fixed-point
+    values, sorted by `ts_init`.
+
+    Each row references its instrument (or bar type) through a key index
+    column, with the price and size precisions held once per key. Rows are only
+    materialized as data objects one at a time as the stream is consumed, so
+    memory scales with the size of the columns rather than with the per-object
+    overhead of holding every data object.
+
+    Columns are held as read-only views where the given arrays already have the
+    required dtype (no copy is made), so a stream may be backed by the fields
+    of a memory-mapped record array.
+
+    Warnings
+    --------
+    This class should not be used directly, but through a concrete subclass.
+    """
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self):
+        cdef int64_t row
+        for row in range(self.count):
+            yield self._materialize(row)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(count={self.count}, index={self.index})"
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Return the total bytes consumed by the streams columns.
+
+        Returns
+        -------
+        int
+
+        """
+        return sum([column.nbytes for column in self._columns])
+
+    cpdef list instrument_ids(self):
+        """
+        Return the instrument IDs referenced by the stream.
+
+        Returns
+        -------
+        list[InstrumentId]
+
+        """
+        return self._keys.copy()
+
+    cpdef dict columns(self):
+        """
+        Return the streams columns (as NumPy arrays) by name.
+
+        Returns
+        -------
+        dict[str, np.ndarray]
+
+        """
+        return {
+            "ts_init": np.asarray(self._ts_init),
+            "ts_event": np.asarray(self._ts_event),
+            "key_index": np.asarray(self._key_index),
+        }
+
+    cpdef bint is_exhausted(self) except *:
+        """
+        Return whether all rows of the stream have been materialized.
+
+        Returns
+        -------
+        bool
+
+        """
+        return self.index >= self.count
+
+    cpdef uint64_t first_ts(self) except *:
+        """
+        Return the `ts_init` of the first row of the stream.
+
+        Returns
+        -------
+        uint64_t
+
+        """
+        return self._ts_init[0]
+
+    cpdef uint64_t last_ts(self) except *:
+        """
+        Return the `ts_init` of the last row of the stream.
+
+        Returns
+        -------
+        uint64_t
+
+        """
+        return self._ts_init[self.count - 1]
+
+    cpdef uint64_t peek_ts(self) except *:
+        """
+        Return the `ts_init` of the next row to materialize.
+
+        Returns
+        -------
+        uint64_t
+
+        Raises
+        ------
+        ValueError
+            If the stream is exhausted.
+
+        """
+        Condition.true(self.index < self.count, "stream was exhausted")
+
+        return self._ts_init[self.index]
+
+    cpdef Data pop(self):
+        """
+        Materialize the next row of the stream and advance.
+
+        Returns
+        -------
+        Data or ``None``
+            ``None`` if the stream is exhausted.
+
+        """
+        if self.index >= self.count:
+            return None
+
+        cdef int64_t row = self.index
+        self.index += 1
+        return self._materialize(row)
+
+    cpdef void seek(self, uint64_t ts_init) except *:
+        """
+        Move the stream to the first row with a `ts_init` at or after the given
+        timestamp.
+
+        Parameters
+        ----------
+        ts_init : uint64_t
+            The UNIX timestamp (nanoseconds) to seek to.
+
+        """
+        self.index = np.searchsorted(np.asarray(self._ts_init), ts_init, side="left")
+
+    cpdef void reset(self) except *:
+        """
+        Move the stream back to the first row.
+
+        """
+        self.index = 0
+
+    cdef object _column(self, object values, object dtype):
+        cdef object column = np.asarray(values, dtype=dtype)
+        Condition.equal(len(column), self.count, "column length", "ts_init length")
+        self._columns.append(column)
+        return column
+
+    cdef void _init_index(
+        self,
+        list keys,
+        list price_precisions,
+        list size_precisions,
+        object key_index,
+        object ts_init,
+        object ts_event,
+        bint validate,
+    ) except *:
+        Condition.not_empty(keys, "keys")
+        Condition.true(len(keys) <= 65_536, "more than 65,536 keys")
+
+        cdef object ts_init_array = np.asarray(ts_init, dtype=np.uint64)
+        Condition.true(ts_init_array.ndim == 1 and len(ts_init_array) > 0, "ts_init was empty")
+        if validate:  # Reads every row
+            Condition.true(
+                bool(np.all(ts_init_array[1:] >= ts_init_array[:-1])),
+                "ts_init was not sorted",
+            )
+
+        self.count = len(ts_init_array)
+        self.index = 0
+        self._columns = []
+        self._keys = keys
+        self._price_prec = np.asarray(price_precisions, dtype=np.uint8)
+        self._size_prec = np.asarray(size_precisions, dtype=np.uint8)
+        self._ts_init = self._column(ts_init_array, np.uint64)
+        if ts_event is None:
+            self._ts_event = self._ts_init  # Shares memory
+        else:
+            self._ts_event = self._column(ts_event, np.uint64)
+
+        if key_index is None:
+            Condition.true(len(keys) == 1, "key index was None with more than one key")
+            self._key_index = self._column(np.zeros(self.count, dtype=np.uint16), np.uint16)
+        else:
+            key_index = np.asarray(key_index)
+            if validate:  # Reads every row
+                Condition.true(
+                    int(key_index.min()) >= 0 and int(key_index.max()) < len(keys),
+                    "key index out of range",
+                )
+            self._key_index = self._column(key_index, np.uint16)
+
+    cdef Data _materialize(self, int64_t row):
+        """Abstract method (implement in subclass)."""
+        raise NotImplementedError("method must be implemented in the subclass")  # pragma: no cover
+
+
+cdef class QuoteTickDataStream(ColumnarDataStream):
+    """
+    Provides a columnar stream of quote ticks for one or more instruments.
+
+    Parameters
+    ----------
+    instruments : list[Instrument]
+        The instruments for the stream (indexed by `instrument_index`).
+    bid : np.ndarray
+        The raw fixed-point bid prices (int64).
+    ask : np.ndarray
+        The raw fixed-point ask prices (int64).
+    bid_size : np.ndarray
+        The raw fixed-point bid sizes (uint64).
+    ask_size : np.ndarray
+        The raw fixed-point ask sizes (uint64).
+    ts_init : np.ndarray
+        The UNIX timestamps (nanoseconds) when the ticks were initialized (uint64),
+        must be sorted.
+    ts_event : np.ndarray, optional
+        The UNIX timestamps (nanoseconds) when the tick events occurred (uint64).
+        If ``None`` then `ts_init` is used.
+    instrument_index : np.ndarray, optional
+        The index into `instruments` for each tick. May only be ``None`` for a
+        single instrument.
+    validate : bool, default True
+        If `ts_init` is checked as sorted and the `instrument_index` values as in range,
+        which reads every row. Only disable for data known to be valid.
+
+    Raises
+    ------
+    ValueError
+        If `instruments` is empty.
+    ValueError
+        If any column is not the same length as `ts_init`.
+    ValueError
+        If `ts_init` is empty, or not sorted (when validated).
+    ValueError
+        If any `instrument_index` value is out of range (when validated).
+    """
+
+    def __init__(
+        self,
+        list instruments not None,
+        bid not None: np.ndarray,
+        ask not None: np.ndarray,
+        bid_size not None: np.ndarray,
+        ask_size not None: np.ndarray,
+        ts_init not None: np.ndarray,
+        ts_event: Optional[np.ndarray] = None,
+        instrument_index: Optional[np.ndarray] = None,
+        bint validate = True,
+    ):
+        Condition.not_empty(instruments, "instruments")
+
+        cdef Instrument instrument
+        self._init_index(
+            keys=[instrument.id for instrument in instruments],
+            price_precisions=[instrument.price_precision for instrument in instruments],
+            size_precisions=[instrument.size_precision for instrument in instruments],
+            key_index=instrument_index,
+            ts_init=ts_init,
+            ts_event=ts_event,
+            validate=validate,
+        )
+
+        self._bid = self._column(bid, np.int64)
+        self._ask = self._column(ask, np.int64)
+        self._bid_size = self._column(bid_size, np.uint64)
+        self._ask_size = self._column(ask_size, np.uint64)
+
+    @staticmethod
+    def from_ticks(list instruments not None, list ticks not None) -> "QuoteTickDataStream":
+        """
+        Return a stream built from the given ticks.
+
+        Parameters
+        ----------
+        instruments : list[Instrument]
+            The instruments for the ticks (may include unrelated instruments).
+        ticks : list[QuoteTick]
+            The ticks for the stream (sorted by `ts_init`).
+
+        Returns
+        -------
+        QuoteTickDataStream
+
+        """
+        Condition.not_empty(ticks, "ticks")
+
+        cdef dict index = {}  # Only instruments referenced by the ticks
+        cdef int64_t count = len(ticks)
+        cdef int64_t[::1] bid = np.empty(count, dtype=np.int64)
+        cdef int64_t[::1] ask = np.empty(count, dtype=np.int64)
+        cdef uint64_t[::1] bid_size = np.empty(count, dtype=np.uint64)
+        cdef uint64_t[::1] ask_size = np.empty(count, dtype=np.uint64)
+        cdef uint64_t[::1] ts_event = np.empty(count, dtype=np.uint64)
+        cdef uint64_t[::1] ts_init = np.empty(count, dtype=np.uint64)
+        cdef uint16_t[::1] instrument_index = np.empty(count, dtype=np.uint16)
+
+        cdef int64_t i
+        cdef QuoteTick tick
+        for i in range(count):
+            tick = ticks[i]
+            bid[i] = tick._mem.bid.raw
+            ask[i] = tick._mem.ask.raw
+            bid_size[i] = tick._mem.bid_size.raw
+            ask_size[i] = tick._mem.ask_size.raw
+            ts_event[i] = tick.ts_event
+            ts_init[i] = tick.ts_init
+            instrument_index[i] = index.setdefault(tick.instrument_id, len(index))
+
+        cdef dict instruments_by_id = {instrument.id: instrument for instrument in instruments}
+        return QuoteTickDataStream(
+            instruments=[instruments_by_id[instrument_id] for instrument_id in index],
+            bid=np.asarray(bid),
+            ask=np.asarray(ask),
+            bid_size=np.asarray(bid_size),
+            ask_size=np.asarray(ask_size),
+            ts_init=np.asarray(ts_init),
+            ts_event=np.asarray(ts_event),
+            instrument_index=np.asarray(instrument_index),
+        )
+
+    cpdef dict columns(self):
+        cdef dict columns = ColumnarDataStream.columns(self)
+        columns["bid"] = np.asarray(self._bid)
+        columns["ask"] = np.asarray(self._ask)
+        columns["bid_size"] = np.asarray(self._bid_size)
+        columns["ask_size"] = np.asarray(self._ask_size)
+        return columns
+
+    cdef Data _materialize(self, int64_t row):
+        cdef uint16_t key = self._key_index[row]
+        return QuoteTick.from_raw_c(
+            <InstrumentId>self._keys[key],
+            self._bid[row],
+            self._ask[row],
+            self._price_prec[key],
+            self._bid_size[row],
+            self._ask_size[row],
+            self._size_prec[key],
+            self._ts_event[row],
+            self._ts_init[row],
+        )
+
+
+cdef class TradeTickDataStream(ColumnarDataStream):
+    """
+    Provides a columnar stream of trade ticks for one or more instruments.
+
+    Parameters
+    ----------
+    instruments : list[Instrument]
+        The instruments for the stream (indexed by `instrument_index`).
+    price : np.ndarray
+        The raw fixed-point trade prices (int64).
+    size : np.ndarray
+        The raw fixed-point trade sizes (uint64).
+    aggressor_side : np.ndarray
+        The `AggressorSide` enum values of the trades (uint8).
+    ts_init : np.ndarray
+        The UNIX timestamps (nanoseconds) when the ticks were initialized (uint64),
+        must be sorted.
+    ts_event : np.ndarray, optional
+        The UNIX timestamps (nanoseconds) when the tick events occurred (uint64).
+        If ``None`` then `ts_init` is used.
+    instrument_index : np.ndarray, optional
+        The index into `instruments` for each tick. May only be ``None`` for a
+        single instrument.
+    trade_id : np.ndarray, optional
+        The trade IDs as fixed-width UTF-8 bytes (`np.bytes_`), other arrays are
+        converted with `astype(np.bytes_)`. If ``None`` then the row index is used.
+    validate : bool, default True
+        If `ts_init` is checked as sorted and the `instrument_index` values as in range,
+        which reads every row. Only disable for data known to be valid.
+
+    Raises
+    ------
+    ValueError
+        If `instruments` is empty.
+    ValueError
+        If any column is not the same length as `ts_init`.
+    ValueError
+        If `ts_init` is empty, or not sorted (when validated).
+    ValueError
+        If any `instrument_index` value is out of range (when validated).
+    """
+
+    def __init__(
+        self,
+        list instruments not None,
+        price not None: np.ndarray,
+        size not None: np.ndarray,
+        aggressor_side not None: np.ndarray,
+        ts_init not None: np.ndarray,
+        ts_event: Optional[np.ndarray] = None,
+        instrument_index: Optional[np.ndarray] = None,
+        trade_id: Optional[np.ndarray] = None,
+        bint validate = True,
+    ):
+        Condition.not_empty(instruments, "instruments")
+
+        cdef Instrument instrument
+        self._init_index(
+            keys=[instrument.id for instrument in instruments],
+            price_precisions=[instrument.price_precision for instrument in instruments],
+            size_precisions=[instrument.size_precision for instrument in instruments],
+            key_index=instrument_index,
+            ts_init=ts_init,
+            ts_event=ts_event,
+            validate=validate,
+        )
+
+        self._price = self._column(price, np.int64)
+        self._size = self._column(size, np.uint64)
+        self._aggressor_side = self._column(aggressor_side, np.uint8)
+        self._has_trade_id = trade_id is not None
+        if self._has_trade_id:
+            trade_id = np.asarray(trade_id)
+            if trade_id.dtype.kind != "S":
+                trade_id = trade_id.astype(np.bytes_)
+            self._trade_id = self._column(trade_id, trade_id.dtype)
+
+    @staticmethod
+    def from_ticks(list instruments not None, list ticks not None) -> "TradeTickDataStream":
+        """
+        Return a stream built from the given ticks.
+
+        Parameters
+        ----------
+        instruments : list[Instrument]
+            The instruments for the ticks (may include unrelated instruments).
+        ticks : list[TradeTick]
+            The ticks for the stream (sorted by `ts_init`).
+
+        Returns
+        -------
+        TradeTickDataStream
+
+        """
+        Condition.not_empty(ticks, "ticks")
+
+        cdef dict index = {}  # Only instruments referenced by the ticks
+        cdef int64_t count = len(ticks)
+        cdef int64_t[::1] price = np.empty(count, dtype=np.int64)
+        cdef uint64_t[::1] size = np.empty(count, dtype=np.uint64)
+        cdef uint8_t[::1] aggressor_side = np.empty(count, dtype=np.uint8)
+        cdef list trade_id = [None] * count
+        cdef uint64_t[::1] ts_event = np.empty(count, dtype=np.uint64)
+        cdef uint64_t[::1] ts_init = np.empty(count, dtype=np.uint64)
+        cdef uint16_t[::1] instrument_index = np.empty(count, dtype=np.uint16)
+
+        cdef int64_t i
+        cdef TradeTick tick
+        for i in range(count):
+            tick = ticks[i]
+            price[i] = tick._mem.price.raw
+            size[i] = tick._mem.size.raw
+            aggressor_side[i] = <uint8_t>tick._mem.aggressor_side
+            trade_id[i] = tick.trade_id.value.encode()
+            ts_event[i] = tick.ts_event
+            ts_init[i] = tick.ts_init
+            instrument_index[i] = index.setdefault(tick.instrument_id, len(index))
+
+        cdef dict instruments_by_id = {instrument.id: instrument for instrument in instruments}
+        return TradeTickDataStream(
+            instruments=[instruments_by_id[instrument_id] for instrument_id in index],
+            price=np.asarray(price),
+            size=np.asarray(size),
+            aggressor_side=np.asarray(aggressor_side),
+            ts_init=np.asarray(ts_init),
+            ts_event=np.asarray(ts_event),
+            instrument_index=np.asarray(instrument_index),
+            trade_id=np.array(trade_id, dtype=np.bytes_),  # Widest trade ID
+        )
+
+    cpdef dict columns(self):
+        cdef dict columns = ColumnarDataStream.columns(self)
+        columns["price"] = np.asarray(self._price)
+        columns["size"] = np.asarray(self._size)
+        columns["aggressor_side"] = np.asarray(self._aggressor_side)
+        if self._has_trade_id:
+            columns["trade_id"] = self._trade_id
+        else:
+            columns["trade_id"] = np.arange(self.count).astype(np.bytes_)
+        return columns
+
+    cdef Data _materialize(self, int64_t row):
+        cdef uint16_t key = self._key_index[row]
+        cdef str trade_id = self._trade_id[row].decode() if self._has_trade_id else str(row)
+        return TradeTick.from_raw_c(
+            <InstrumentId>self._keys[key],
+            self._price[row],
+            self._price_prec[key],
+            self._size[row],
+            self._size_prec[key],
+            <AggressorSide>self._aggressor_side[row],
+            TradeId(trade_id),
+            self._ts_event[row],
+            self._ts_init[row],
+        )
+
+
+cdef class BarDataStream(ColumnarDataStream):
+    """
+    Provides a columnar stream of bars for one or more bar types.
+
+    Parameters
+    ----------
+    bar_types : list[BarType]
+        The bar types for the stream (indexed by `bar_type_index`).
+    instruments : list[Instrument]
+        The instruments for the bar types (for price and size precisions).
+    open : np.ndarray
+        The raw fixed-point open prices (int64).
+    high : np.ndarray
+        The raw fixed-point high prices (int64).
+    low : np.ndarray
+        The raw fixed-point low prices (int64).
+    close : np.ndarray
+        The raw fixed-point close prices (int64).
+    volume : np.ndarray
+        The raw fixed-point volumes (uint64).
+    ts_init : np.ndarray
+        The UNIX timestamps (nanoseconds) when the bars were initialized (uint64),
+        must be sorted.
+    ts_event : np.ndarray, optional
+        The UNIX timestamps (nanoseconds) when the bars closed (uint64).
+        If ``None`` then `ts_init` is used.
+    bar_type_index : np.ndarray, optional
+        The index into `bar_types` for each bar. May only be ``None`` for a
+        single bar type.
+    validate : bool, default True
+        If `ts_init` is checked as sorted and the `bar_type_index` values as in range,
+        which reads every row. Only disable for data known to be valid.
+
+    Raises
+    ------
+    ValueError
+        If `bar_types` is empty.
+    KeyError
+        If the instrument for a bar type is not in `instruments`.
+    ValueError
+        If any column is not the same length as `ts_init`.
+    ValueError
+        If `ts_init` is empty, or not sorted (when validated).
+    ValueError
+        If any `bar_type_index` value is out of range (when validated).
+    """
+
+    def __init__(
+        self,
+        list bar_types not None,
+        list instruments not None,
+        open not None: np.ndarray,
+        high not None: np.ndarray,
+        low not None: np.ndarray,
+        close not None: np.ndarray,
+        volume not None: np.ndarray,
+        ts_init not None: np.ndarray,
+        ts_event: Optional[np.ndarray] = None,
+        bar_type_index: Optional[np.ndarray] = None,
+        bint validate = True,
+    ):
+        Condition.not_empty(bar_types, "bar_types")
+
+        cdef Instrument instrument
+        cdef dict instruments_by_id = {instrument.id: instrument for instrument in instruments}
+        cdef list bar_instruments = [
+            instruments_by_id[bar_type.instrument_id] for bar_type in bar_types
+        ]
+        self._init_index(
+            keys=bar_types,
+            price_precisions=[instrument.price_precision for instrument in bar_instruments],
+            size_precisions=[instrument.size_precision for instrument in bar_instruments],
+            key_index=bar_type_index,
+            ts_init=ts_init,
+            ts_event=ts_event,
+            validate=validate,
+        )
+
+        self._open = self._column(open, np.int64)
+        self._high = self._column(high, np.int64)
+        self._low = self._column(low, np.int64)
+        self._close = self._column(close, np.int64)
+        self._volume = self._column(volume, np.uint64)
+
+    @staticmethod
+    def from_bars(list instruments not None, list bars not None) -> "BarDataStream":
+        """
+        Return a stream built from the given bars.
+
+        Parameters
+        ----------
+        instruments : list[Instrument]
+            The instruments for the bars (may include unrelated instruments).
+        bars : list[Bar]
+            The bars for the stream (sorted by `ts_init`).
+
+        Returns
+        -------
+        BarDataStream
+
+        """
+        Condition.not_empty(bars, "bars")
+
+        cdef dict index = {}
+        cdef int64_t count = len(bars)
+        cdef int64_t[::1] open_ = np.empty(count, dtype=np.int64)
+        cdef int64_t[::1] high = np.empty(count, dtype=np.int64)
+        cdef int64_t[::1] low = np.empty(count, dtype=np.int64)
+        cdef int64_t[::1] close = np.empty(count, dtype=np.int64)
+        cdef uint64_t[::1] volume = np.empty(count, dtype=np.uint64)
+        cdef uint64_t[::1] ts_event = np.empty(count, dtype=np.uint64)
+        cdef uint64_t[::1] ts_init = np.empty(count, dtype=np.uint64)
+        cdef uint16_t[::1] bar_type_index = np.empty(count, dtype=np.uint16)
+
+        cdef int64_t i
+        cdef Bar bar
+        for i in range(count):
+            bar = bars[i]
+            open_[i] = bar._mem.open.raw
+            high[i] = bar._mem.high.raw
+            low[i] = bar._mem.low.raw
+            close[i] = bar._mem.close.raw
+            volume[i] = bar._mem.volume.raw
+            ts_event[i] = bar.ts_event
+            ts_init[i] = bar.ts_init
+            bar_type_index[i] = index.setdefault(bar.type, len(index))
+
+        return BarDataStream(
+            bar_types=list(index.keys()),
+            instruments=instruments,
+            open=np.asarray(open_),
+            high=np.asarray(high),
+            low=np.asarray(low),
+            close=np.asarray(close),
+            volume=np.asarray(volume),
+            ts_init=np.asarray(ts_init),
+            ts_event=np.asarray(ts_event),
+            bar_type_index=np.asarray(bar_type_index),
+        )
+
+    cpdef list instrument_ids(self):
+        """
+        Return the instrument IDs referenced by the stream.
+
+        Returns
+        -------
+        list[InstrumentId]
+
+        """
+        cdef BarType bar_type
+        return list(dict.fromkeys([bar_type.instrument_id for bar_type in self._keys]))
+
+    cpdef list bar_types(self):
+        """
+        Return the bar types referenced by the stream.
+
+        Returns
+        -------
+        list[BarType]
+
+        """
+        return self._keys.copy()
+
+    cpdef dict columns(self):
+        cdef dict columns = ColumnarDataStream.columns(self)
+        columns["open"] = np.asarray(self._open)
+        columns["high"] = np.asarray(self._high)
+        columns["low"] = np.asarray(self._low)
+        columns["close"] = np.asarray(self._close)
+        columns["volume"] = np.asarray(self._volume)
+        return columns
+
+    cdef Data _materialize(self, int64_t row):
+        cdef uint16_t key = self._key_index[row]
+        return Bar.from_raw_c(
+            <BarType>self._keys[key],
+            self._open[row],
+            self._high[row],
+            self._low[row],
+            self._close[row],
+            self._price_prec[key],
+            self._volume[row],
+            self._size_prec[key],
+            self._ts_event[row],
+            self._ts_init[row],
+        )
@@ -16,10 +16,14 @@
 from cpython.datetime cimport datetime
 from libc.stdint cimport uint64_t
 
+from nautilus_trader.backtest.data.stream cimport ColumnarDataStream
+from nautilus_trader.backtest.exchange cimport SimulatedExchange
 from nautilus_trader.common.clock cimport Clock
+from nautilus_trader.common.clock cimport TestClockScheduler
 from nautilus_trader.common.logging cimport Logger
 from nautilus_trader.common.logging cimport LoggerAdapter
 from nautilus_trader.core.data cimport Data
+from nautilus_trader.core.rust.model cimport InstrumentId_t
 from nautilus_trader.core.uuid cimport UUID4
 from nautilus_trader.system.kernel cimport NautilusKernel
 
@@ -33,8 +37,16 @@ cdef class BacktestEngine:
 
     cdef dict _venues
     cdef list _data
+    cdef list _data_pending
+    cdef list _data_streams
     cdef uint64_t _data_len
     cdef uint64_t _index
+    cdef TestClockScheduler _scheduler
+    cdef dict _dispatch_kinds
+    cdef dict _dispatch_venues
+    cdef uint64_t _dispatch_counts[5]
+    cdef uint64_t _timer_skip_count
+    cdef uint64_t _time_event_count
 
     cdef readonly NautilusKernel kernel
     """The internal kernel for the engine.\n\n:returns: `NautilusKernel`"""
@@ -54,4 +66,7 @@ cdef class BacktestEngine:
     """The last backtest run time range end (if run).\n\n:returns: `datetime` or ``None``"""
 
     cdef Data _next(self)
+    cdef int _dispatch_kind(self, Data data) except -1
+    cdef SimulatedExchange _dispatch_venue(self, const InstrumentId_t *raw, Data data)
     cdef list _advance_time(self, uint64_t now_ns)
+    cdef void _reset_loop_counters(self) except *
@@ -13,12 +13,15 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import heapq
 import pickle
 from decimal import Decimal
+from operator import attrgetter
 from typing import Dict, List, Optional, Union
 
 import pandas as pd
 
+from nautilus_trader.backtest.data.replay import open_replay_file
 from nautilus_trader.backtest.results import BacktestResult
 from nautilus_trader.common import Environment
 from nautilus_trader.config import BacktestEngineConfig
@@ -32,6 +35,8 @@ from nautilus_trader.config.error import InvalidConfiguration
 from cpython.datetime cimport datetime
 from libc.stdint cimport uint64_t
 
+from nautilus_trader.backtest.data.stream cimport BarDataStream
+from nautilus_trader.backtest.data.stream cimport ColumnarDataStream
 from nautilus_trader.backtest.data_client cimport BacktestDataClient
 from nautilus_trader.backtest.data_client cimport BacktestMarketDataClient
 from nautilus_trader.backtest.exchange cimport SimulatedExchange
@@ -42,6 +47,7 @@ from nautilus_trader.backtest.modules cimport SimulationModule
 from nautilus_trader.cache.base cimport CacheFacade
 from nautilus_trader.common.actor cimport Actor
 from nautilus_trader.common.clock cimport LiveClock
+from nautilus_trader.common.clock cimport TestClockScheduler
 from nautilus_trader.common.logging cimport Logger
 from nautilus_trader.common.logging cimport LoggerAdapter
 from nautilus_trader.common.logging cimport LogLevelParser
@@ -51,6 +57,8 @@ from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.data cimport Data
 from nautilus_trader.core.datetime cimport maybe_dt_to_unix_nanos
 from nautilus_trader.core.datetime cimport unix_nanos_to_dt
+from nautilus_trader.core.rust.model cimport instrument_id_eq
+from nautilus_trader.core.rust.model cimport instrument_id_hash
 from nautilus_trader.core.uuid cimport UUID4
 from nautilus_trader.model.c_enums.account_type cimport AccountType
 from nautilus_trader.model.c_enums.aggregation_source cimport AggregationSource
@@ -61,6 +69,7 @@ from nautilus_trader.model.data.base cimport GenericData
 from nautilus_trader.model.data.tick cimport QuoteTick
 from nautilus_trader.model.data.tick cimport TradeTick
 from nautilus_trader.model.identifiers cimport ClientId
+from nautilus_trader.model.identifiers cimport InstrumentId
 from nautilus_trader.model.identifiers cimport TraderId
 from nautilus_trader.model.identifiers cimport Venue
 from nautilus_trader.model.instruments.base cimport Instrument
@@ -73,6 +82,28 @@ from nautilus_trader.trading.strategy cimport Strategy
 from nautilus_trader.trading.trader cimport Trader
 
 
+cdef object _TS_INIT = attrgetter("ts_init")
+
+
+# Main loop data dispatch kinds (indexes the engines dispatch counts)
+cdef enum _DispatchKind:
+    DISPATCH_OTHER = 0
+    DISPATCH_ORDER_BOOK = 1
+    DISPATCH_QUOTE_TICK = 2
+    DISPATCH_TRADE_TICK = 3
+    DISPATCH_BAR = 4
+
+
+cdef inline bint _is_sorted(list data) except *:
+    cdef uint64_t last_ts = 0
+    cdef Data x
+    for x in data:
+        if x.ts_init < last_ts:
+            return False
+        last_ts = x.ts_init
+    return True
+
+
 cdef class BacktestEngine:
     """
     Provides a backtest engine to run a portfolio of strategies over historical
@@ -107,9 +138,17 @@ cdef class BacktestEngine:
         # Venues and data
         self._venues: Dict[Venue, SimulatedExchange] = {}
         self._data: List[Data] = []
+        self._data_pending: List[List[Data]] = []  # Added streams awaiting merge
+        self._data_streams: List[ColumnarDataStream] = []  # Materialized on demand
         self._data_len: int = 0
         self._index: int = 0
 
+        # Main loop dispatch
+        self._scheduler = TestClockScheduler()
+        self._dispatch_kinds: Dict[type, int] = {}
+        self._dispatch_venues: Dict[int, tuple] = {}  # Instrument ID hash -> (ID, exchange)
+        self._reset_loop_counters()
+
         # Timing
         self.run_started: Optional[datetime] = None
         self.run_finished: Optional[datetime] = None
@@ -131,6 +170,9 @@ cdef class BacktestEngine:
             strategy_configs=config.strategies,
             log_level=LogLevelParser.from_str(config.log_level.upper()),
             bypass_logging=config.bypass_logging,
+            msgbus_profiling=config.msgbus_profiling,
+            portfolio_incremental=config.portfolio_incremental,
+            log_sinks_async=config.log_sinks_async,
         )
 
         # Setup engine logging
@@ -212,8 +254,29 @@ cdef class BacktestEngine:
         """
         Return the engines internal data stream.
         """
+        self.finalize_data()
         return self._data.copy()
 
+    @property
+    def loop_counters(self) -> Dict[str, int]:
+        """
+        Return the main loop counters since the engine was last reset.
+
+        Returns
+        -------
+        dict[str, int]
+
+        """
+        return {
+            "order_book": self._dispatch_counts[<int>DISPATCH_ORDER_BOOK],
+            "quote_tick": self._dispatch_counts[<int>DISPATCH_QUOTE_TICK],
+            "trade_tick": self._dispatch_counts[<int>DISPATCH_TRADE_TICK],
+            "bar": self._dispatch_counts[<int>DISPATCH_BAR],
+            "other": self._dispatch_counts[<int>DISPATCH_OTHER],
+            "timer_checks_skipped": self._timer_skip_count,
+            "time_events": self._time_event_count,
+        }
+
     @property
     def portfolio(self) -> PortfolioFacade:
         """
@@ -253,6 +316,7 @@ cdef class BacktestEngine:
         bint routing: bool = False,
         bint frozen_account = False,
         bint reject_stop_orders: bool = True,
+        bint indexed_order_matching: bool = False,
     ) -> None:
         """
         Add a `SimulatedExchange` with the given parameters to the backtest engine.
@@ -288,6 +352,9 @@ cdef class BacktestEngine:
             If the account for this exchange is frozen (balances will not change).
         reject_stop_orders : bool, default True
             If stop orders are rejected on submission if trigger price is in the market.
+        indexed_order_matching : bool, default False
+            If the exchange holds resting orders in a price indexed store, so that
+            each market update only visits orders which cross the top of book.
 
         Raises
         ------
@@ -330,6 +397,7 @@ cdef class BacktestEngine:
             logger=self.kernel.logger,
             frozen_account=frozen_account,
             reject_stop_orders=reject_stop_orders,
+            indexed_order_matching=indexed_order_matching,
         )
 
         self._venues[venue] = exchange
@@ -434,6 +502,12 @@ cdef class BacktestEngine:
         Assumes all data elements are of the same type. Adding lists of varying
         data types could result in incorrect backtest logic.
 
+        Notes
+        -----
+        The data is held as a separate stream (sorted by `ts_init` only if not
+        already ordered) and merged into the engines data stream on the next
+        call to `finalize_data()`, which happens automatically on `run()`.
+
         """
         Condition.not_empty(data, "data")
 
@@ -469,14 +543,123 @@ cdef class BacktestEngine:
             if isinstance(first, GenericData):
                 data_prepend_str = f"{type(data[0].data).__name__} "
 
-        # Add data
-        self._data = sorted(self._data + data, key=lambda x: x.ts_init)
+        # Add data (stream merged on finalize)
+        if _is_sorted(data):
+            self._data_pending.append(list(data))
+        else:
+            self._data_pending.append(sorted(data, key=_TS_INIT))
 
         self._log.info(
             f"Added {len(data):,} {data_prepend_str}"
             f"{type(first).__name__} element{'' if len(data) == 1 else 's'}.",
         )
 
+    def add_data_stream(self, ColumnarDataStream stream not None) -> None:
+        """
+        Add the given columnar data stream to the backtest engine.
+
+        Rows are materialized one at a time as the main loop advances, and are
+        interleaved with the engines data stream by `ts_init`. For equal
+        timestamps data added with `add_data()` is processed first, then
+        streams in the order they were added.
+
+        Parameters
+        ----------
+        stream : ColumnarDataStream
+            The data stream to add.
+
+        Raises
+        ------
+        ValueError
+            If an `instrument_id` for the stream is not found in the cache.
+        ValueError
+            If a bar type for a `BarDataStream` is not externally aggregated.
+
+        """
+        cdef InstrumentId instrument_id
+        for instrument_id in stream.instrument_ids():
+            Condition.true(
+                instrument_id in self.kernel.cache.instrument_ids(),
+                f"`Instrument` {instrument_id} for the given data not found in the cache. "
+                "Please add the instrument through `add_instrument()` prior to adding related data.",
+            )
+            # Check client has been registered
+            self._add_market_data_client_if_not_exists(instrument_id.venue)
+
+        if isinstance(stream, BarDataStream):
+            for bar_type in stream.bar_types():
+                Condition.equal(
+                    bar_type.aggregation_source,
+                    AggregationSource.EXTERNAL,
+                    "bar_type.aggregation_source",
+                    "required source",
+                )
+
+        self._data_streams.append(stream)
+
+        self._log.info(f"Added {stream!r}.")
+
+    def add_replay_file(self, str path not None) -> None:
+        """
+        Add the replay file at the given path to the backtest engine.
+
+        The file is memory-mapped and added as a data stream, so no data is
+        loaded or deserialized up front.
+
+        Parameters
+        ----------
+        path : str
+            The path to the replay file (see `write_replay_file()`).
+
+        Raises
+        ------
+        ValueError
+            If the file is not a valid replay file.
+        ValueError
+            If an instrument for the data is not found in the cache.
+
+        """
+        self.add_data_stream(open_replay_file(path, self.kernel.cache.instruments()))
+
+    def finalize_data(self) -> None:
+        """
+        Merge all added data streams into the engines internal data stream.
+
+        The merge is stable, for equal `ts_init` timestamps data retains the
+        order in which it was added. This is called automatically on `run()`
+        and when accessing the data stream, so only needs calling explicitly
+        to control when the cost of the merge is paid.
+
+        """
+        if not self._data_pending:
+            return
+
+        cdef list streams = self._data_pending
+        if self._data:
+            streams.insert(0, self._data)
+
+        # Streams which follow on from each other are concatenated, otherwise
+        # they are k-way merged (`heapq.merge` favours earlier streams on ties)
+        cdef bint ordered = True
+        cdef uint64_t last_ts = 0
+        cdef list stream
+        for stream in streams:
+            if (<Data>stream[0]).ts_init < last_ts:
+                ordered = False
+                break
+            last_ts = (<Data>stream[-1]).ts_init
+
+        cdef list merged
+        if ordered:
+            merged = []
+            for stream in streams:
+                merged.extend(stream)
+        else:
+            merged = list(heapq.merge(*streams, key=_TS_INIT))
+
+        self._data = merged
+        self._data_pending = []
+
     def dump_pickled_data(self) -> bytes:
         """
         Return the internal data stream pickled.
@@ -486,6 +669,7 @@ cdef class BacktestEngine:
         bytes
 
         """
+        self.finalize_data()
         return pickle.dumps(self._data)
 
     def load_pickled_data(self, bytes data) -> None:
@@ -507,6 +691,7 @@ cdef class BacktestEngine:
         Condition.not_none(data, "data")
 
         self._data = pickle.loads(data)
+        self._data_pending.clear()
 
         self._log.info(
             f"Loaded {len(self._data):,} data "
@@ -572,6 +757,7 @@ cdef class BacktestEngine:
 
         # Reset timing
         self.iteration = 0
+        self._reset_loop_counters()
         self.run_started = None
         self.run_finished = None
         self.backtest_start = None
@@ -587,6 +773,8 @@ cdef class BacktestEngine:
 
         """
         self._data.clear()
+        self._data_pending.clear()
+        self._data_streams.clear()
         self._data_len = 0
         self._index = 0
 
@@ -610,6 +798,8 @@ cdef class BacktestEngine:
         self.kernel.data_engine.dispose()
         self.kernel.exec_engine.dispose()
         self.kernel.risk_engine.dispose()
+        self.kernel.dump_msgbus_profile()
+        self.kernel.logger.disable_async_sinks()  # Flushes queued sink records
 
         if self.kernel.writer is not None:
             self.kernel.writer.close()
@@ -741,30 +931,42 @@ cdef class BacktestEngine:
     ):
         cdef uint64_t start_ns
         cdef uint64_t end_ns
+        self.finalize_data()
+        Condition.true(self._data or self._data_streams, "data was empty")
+
+        cdef ColumnarDataStream stream
+        cdef list first_ts = [stream.first_ts() for stream in self._data_streams]
+        cdef list last_ts = [stream.last_ts() for stream in self._data_streams]
+        if self._data:
+            first_ts.append(self._data[0].ts_init)
+            last_ts.append(self._data[-1].ts_init)
+
         # Time range check and set
         if start is None:
             # Set `start` to start of data
-            start_ns = self._data[0].ts_init
+            start_ns = min(first_ts)
             start = unix_nanos_to_dt(start_ns)
         else:
             start = pd.to_datetime(start, utc=True)
             start_ns = int(start.to_datetime64())
         if end is None:
             # Set `end` to end of data
-            end_ns = self._data[-1].ts_init
+            end_ns = max(last_ts)
             end = unix_nanos_to_dt(end_ns)
         else:
             end = pd.to_datetime(end, utc=True)
             end_ns = int(end.to_datetime64())
         Condition.true(start_ns < end_ns, "start was >= end")
-        Condition.not_empty(self._data, "data")
 
-        # Set clocks
-        self.kernel.clock.set_time(start_ns)
+        # Set clocks (registered with a shared time scheduler which only
+        # advances a clock when one of its timers is due)
+        self._scheduler = TestClockScheduler()
         for actor in self.kernel.trader.actors_c():
-            actor.clock.set_time(start_ns)
+            self._scheduler.register(actor.clock)
         for strategy in self.kernel.trader.strategies_c():
-            strategy.clock.set_time(start_ns)
+            self._scheduler.register(strategy.clock)
+        self._scheduler.register(self.kernel.clock)
+        self._scheduler.set_time(start_ns)
 
         cdef SimulatedExchange exchange
         if self.iteration == 0:
@@ -787,28 +989,48 @@ cdef class BacktestEngine:
         # Set data stream length
         self._data_len = len(self._data)
 
+        # Resolve main loop dispatch (venues may have been added)
+        self._dispatch_venues.clear()
+
         # Set starting index
         cdef uint64_t i
         for i in range(self._data_len):
             if start_ns <= self._data[i].ts_init:
                 self._index = i
                 break
+        for stream in self._data_streams:
+            stream.seek(start_ns)
 
         # -- MAIN BACKTEST LOOP -----------------------------------------------#
         cdef list now_events
+        cdef int kind
         cdef Data data = self._next()
         while data is not None:
             if data.ts_init > end_ns:
                 break
             now_events = self._advance_time(data.ts_init)
-            if isinstance(data, OrderBookData):
-                self._venues[data.instrument_id.venue].process_order_book(data)
-            elif isinstance(data, QuoteTick):
-                self._venues[data.instrument_id.venue].process_quote_tick(data)
-            elif isinstance(data, TradeTick):
-                self._venues[data.instrument_id.venue].process_trade_tick(data)
-            elif isinstance(data, Bar):
-                self._venues[data.type.instrument_id.venue].process_bar(data)
+            kind = self._dispatch_kind(data)
+            if kind == DISPATCH_QUOTE_TICK:
+                self._dispatch_venue(
+                    &(<QuoteTick>data)._mem.instrument_id,
+                    data,
+                ).process_quote_tick(data)
+            elif kind == DISPATCH_TRADE_TICK:
+                self._dispatch_venue(
+                    &(<TradeTick>data)._mem.instrument_id,
+                    data,
+                ).process_trade_tick(data)
+            elif kind == DISPATCH_ORDER_BOOK:
+                self._dispatch_venue(
+                    &(<OrderBookData>data).instrument_id._mem,
+                    data,
+                ).process_order_book(data)
+            elif kind == DISPATCH_BAR:
+                self._dispatch_venue(
+                    &(<Bar>data)._mem.bar_type.instrument_id,
+                    data,
+                ).process_bar(data)
+            self._dispatch_counts[kind] += 1
             self.kernel.data_engine.process(data)
             for event_handler in now_events:
                 event_handler.handle()
@@ -835,26 +1057,87 @@ cdef class BacktestEngine:
 
     cdef Data _next(self):
         cdef uint64_t cursor = self._index
+        if not self._data_streams:
+            self._index += 1
+            if cursor < self._data_len:
+                return self._data[cursor]
+            return None
+
+        # Take the earliest head across the data list and columnar streams
+        # (ties go to the data list, then to streams in the order added)
+        cdef bint has_next = cursor < self._data_len
+        cdef uint64_t next_ts = (<Data>self._data[cursor]).ts_init if has_next else 0
+        cdef ColumnarDataStream next_stream = None
+        cdef ColumnarDataStream stream
+        for stream in self._data_streams:
+            if stream.index >= stream.count:
+                continue
+            if not has_next or stream._ts_init[stream.index] < next_ts:
+                next_ts = stream._ts_init[stream.index]
+                next_stream = stream
+                has_next = True
+
+        if next_stream is not None:
+            return next_stream.pop()
+
         self._index += 1
         if cursor < self._data_len:
             return self._data[cursor]
+        return None
+
+    cdef int _dispatch_kind(self, Data data) except -1:
+        kind = self._dispatch_kinds.get(type(data))
+        if kind is not None:
+            return kind
+
+        # Resolve once per data type
+        if isinstance(data, OrderBookData):
+            kind = DISPATCH_ORDER_BOOK
+        elif isinstance(data, QuoteTick):
+            kind = DISPATCH_QUOTE_TICK
+        elif isinstance(data, TradeTick):
+            kind = DISPATCH_TRADE_TICK
+        elif isinstance(data, Bar):
+            kind = DISPATCH_BAR
+        else:
+            kind = DISPATCH_OTHER
+
+        self._dispatch_kinds[type(data)] = kind
+        return kind
+
+    cdef SimulatedExchange _dispatch_venue(self, const InstrumentId_t *raw, Data data):
+        # Keyed by the hash of the raw instrument ID, which avoids building an
+        # `InstrumentId` object for every data point (checked for equality in
+        # case of a hash collision).
+        cdef uint64_t key = instrument_id_hash(raw)
+        cdef tuple entry = self._dispatch_venues.get(key)
+        if entry is not None and instrument_id_eq(&(<InstrumentId>entry[0])._mem, raw):
+            return entry[1]
+
+        # Resolve once per instrument
+        cdef InstrumentId instrument_id
+        if isinstance(data, Bar):
+            instrument_id = data.type.instrument_id
+        else:
+            instrument_id = data.instrument_id
+        cdef SimulatedExchange exchange = self._venues[instrument_id.venue]
+        if entry is None:
+            self._dispatch_venues[key] = (instrument_id, exchange)
+
+        return exchange
 
     cdef list _advance_time(self, uint64_t now_ns):
-        cdef list all_events = []  # type: list[TimeEventHandler]
         cdef list now_events = []  # type: list[TimeEventHandler]
-        cdef:
-            Actor actor
-            Strategy strategy
-        for actor in self.kernel.trader.actors_c():
-            all_events += actor.clock.advance_time(now_ns)
-        for strategy in self.kernel.trader.strategies_c():
-            all_events += strategy.clock.advance_time(now_ns)
+        cdef list all_events = self._scheduler.advance_time(now_ns)
+        if not all_events:
+            self._timer_skip_count += 1  # No timers due
+            return now_events
 
-        all_events += self.kernel.clock.advance_time(now_ns)
+        self._time_event_count += len(all_events)
 
-        # Handle all events prior to the `now_ns`
+        # Handle all events prior to the `now_ns` (already merged in timestamp order)
         cdef TimeEventHandler event_handler
-        for event_handler in sorted(all_events):
+        for event_handler in all_events:
             if event_handler.event.ts_event == now_ns:
                 now_events.append(event_handler)
                 continue
@@ -863,6 +1146,13 @@ cdef class BacktestEngine:
         # Return the remaining events to be handled
         return now_events
 
+    cdef void _reset_loop_counters(self) except *:
+        cdef int i
+        for i in range(5):
+            self._dispatch_counts[i] = 0
+        self._timer_skip_count = 0
+        self._time_event_count = 0
+
     def _log_pre_run(self):
         log_memory(self._log)
 
@@ -905,6 +1195,16 @@ cdef class BacktestEngine:
         self._log.info(f"Backtest end:   {self.backtest_end}")
         self._log.info(f"Backtest range: {self.backtest_end - self.backtest_start}")
         self._log.info(f"Iterations: {self.iteration:,}")
+        self._log.info(
+            f"Data dispatched: "
+            f"{self._dispatch_counts[<int>DISPATCH_ORDER_BOOK]:,} order book, "
+            f"{self._dispatch_counts[<int>DISPATCH_QUOTE_TICK]:,} quote tick, "
+            f"{self._dispatch_counts[<int>DISPATCH_TRADE_TICK]:,} trade tick, "
+            f"{self._dispatch_counts[<int>DISPATCH_BAR]:,} bar, "
+            f"{self._dispatch_counts[<int>DISPATCH_OTHER]:,} other",
+        )
+        self._log.info(f"Timer checks skipped: {self._timer_skip_count:,}")
+        self._log.info(f"Time events: {self._time_event_count:,}")
         self._log.info(f"Total events: {self.kernel.exec_engine.event_count:,}")
         self._log.info(f"Total orders: {self.kernel.cache.orders_total_count():,}")
 
@@ -943,11 +1243,11 @@ cdef class BacktestEngine:
                     self._log.info(Money(-c.as_double(), c.currency).to_str())  # Display commission as negative
                 self._log.info("\033[36m-----------------------------------------------------------------")
                 self._log.info(f"Unrealized PnLs:")
-                unrealized_pnls = self.portfolio.unrealized_pnls(Venue(exchange.id.value)).values()
+                unrealized_pnls = self.portfolio.unrealized_pnls(Venue(exchange.id.value))
                 if not unrealized_pnls:
                     self._log.info("None")
                 else:
-                    for b in self.portfolio.unrealized_pnls(Venue(exchange.id.value)).values():
+                    for b in unrealized_pnls.values():
                         self._log.info(b.to_str())
 
             # Log output diagnostics for all simulation modules
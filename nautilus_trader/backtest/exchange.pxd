@@ -17,6 +17,7 @@ from libc.stdint cimport uint64_t
 
 from nautilus_trader.accounting.accounts.base cimport Account
 from nautilus_trader.backtest.execution_client cimport BacktestExecClient
+from nautilus_trader.backtest.inflight cimport InflightQueue
 from nautilus_trader.backtest.models cimport FillModel
 from nautilus_trader.backtest.models cimport LatencyModel
 from nautilus_trader.cache.cache cimport Cache
@@ -89,6 +90,8 @@ cdef class SimulatedExchange:
     """The fill model for the exchange.\n\n:returns: `FillModel`"""
     cdef readonly bint reject_stop_orders
     """If stop orders are rejected on submission if in the market.\n\n:returns: `bool`"""
+    cdef readonly bint indexed_order_matching
+    """If resting orders are matched using a price indexed store.\n\n:returns: `bool`"""
     cdef readonly list modules
     """The simulation modules registered with the exchange.\n\n:returns: `list[SimulationModule]`"""
     cdef readonly dict instruments
@@ -105,6 +108,7 @@ cdef class SimulatedExchange:
     cdef dict _order_index
     cdef dict _orders_bid
     cdef dict _orders_ask
+    cdef dict _order_indexes
     cdef dict _oto_orders
     cdef bint _bar_execution
 
@@ -112,8 +116,7 @@ cdef class SimulatedExchange:
     cdef dict _symbol_ord_count
     cdef int _executions_count
     cdef Queue _message_queue
-    cdef list _inflight_queue
-    cdef dict _inflight_counter
+    cdef InflightQueue _inflight_queue
 
 # -- REGISTRATION ---------------------------------------------------------------------------------
 
@@ -133,11 +136,12 @@ cdef class SimulatedExchange:
     cpdef list get_open_bid_orders(self, InstrumentId instrument_id=*)
     cpdef list get_open_ask_orders(self, InstrumentId instrument_id=*)
     cpdef Account get_account(self)
+    cpdef dict get_inflight_stats(self)
 
 # -- COMMANDS -------------------------------------------------------------------------------------
 
     cpdef void adjust_account(self, Money adjustment) except *
-    cdef tuple generate_inflight_command(self, TradingCommand command)
+    cdef uint64_t _command_latency(self, TradingCommand command) except *
     cpdef void send(self, TradingCommand command) except *
     cpdef void process_order_book(self, OrderBookData data) except *
     cpdef void process_quote_tick(self, QuoteTick tick) except *
@@ -176,6 +180,9 @@ cdef class SimulatedExchange:
     cdef void _add_order(self, Order order) except *
     cdef void _delete_order(self, Order order) except *
     cdef void _iterate_matching_engine(self, InstrumentId instrument_id, uint64_t timestamp_ns) except *
+    cdef void _iterate_indexed(self, InstrumentId instrument_id, uint64_t timestamp_ns) except *
+    cdef void _reindex_order(self, Order order) except *
+    cdef list _get_indexed_orders(self, InstrumentId instrument_id, bint bids)
     cdef void _iterate_side(self, list orders, uint64_t timestamp_ns) except *
     cdef void _match_order(self, Order order) except *
     cdef void _match_limit_order(self, Order order) except *
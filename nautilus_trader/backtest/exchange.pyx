@@ -14,7 +14,6 @@
 # -------------------------------------------------------------------------------------------------
 
 from decimal import Decimal
-from heapq import heappush
 from typing import Dict, Optional
 
 from nautilus_trader.config.error import InvalidConfiguration
@@ -26,6 +25,8 @@ from libc.stdint cimport uint64_t
 
 from nautilus_trader.accounting.accounts.base cimport Account
 from nautilus_trader.backtest.execution_client cimport BacktestExecClient
+from nautilus_trader.backtest.inflight cimport InflightQueue
+from nautilus_trader.backtest.matching cimport RestingOrderIndex
 from nautilus_trader.backtest.models cimport FillModel
 from nautilus_trader.backtest.models cimport LatencyModel
 from nautilus_trader.backtest.modules cimport SimulationModule
@@ -123,6 +124,9 @@ cdef class SimulatedExchange:
         If the account for this exchange is frozen (balances will not change).
     reject_stop_orders : bool, default True
         If stop orders are rejected on submission if in the market.
+    indexed_order_matching : bool, default False
+        If resting orders are held in a price indexed store, so that each market
+        update only visits orders which cross the new top of book.
 
     Raises
     ------
@@ -159,6 +163,7 @@ cdef class SimulatedExchange:
         BookType book_type = BookType.L1_TBBO,
         bint frozen_account = False,
         bint reject_stop_orders = True,
+        bint indexed_order_matching = False,
     ):
         Condition.list_type(instruments, Instrument, "instruments", "Instrument")
         Condition.not_empty(starting_balances, "starting_balances")
@@ -193,6 +198,7 @@ cdef class SimulatedExchange:
 
         # Execution
         self.reject_stop_orders = reject_stop_orders
+        self.indexed_order_matching = indexed_order_matching
         self.fill_model = fill_model
         self.latency_model = latency_model
         self._bar_execution = False
@@ -223,14 +229,14 @@ cdef class SimulatedExchange:
         self._order_index = {}       # type: dict[ClientOrderId, Order]
         self._orders_bid = {}        # type: dict[InstrumentId, list[Order]]
         self._orders_ask = {}        # type: dict[InstrumentId, list[Order]]
+        self._order_indexes = {}     # type: dict[InstrumentId, RestingOrderIndex]
         self._oto_orders = {}        # type: dict[ClientOrderId, ClientOrderId]
 
         self._symbol_pos_count = {}  # type: dict[InstrumentId, int]
         self._symbol_ord_count = {}  # type: dict[InstrumentId, int]
         self._executions_count = 0
         self._message_queue = Queue()
-        self._inflight_queue = []
-        self._inflight_counter = {}  # type: dict[uint64_t, int]
+        self._inflight_queue = InflightQueue()
 
     def __repr__(self) -> str:
         return (
@@ -465,6 +471,9 @@ cdef class SimulatedExchange:
         list[Order]
 
         """
+        if self.indexed_order_matching:
+            return self._get_indexed_orders(instrument_id, bids=True)
+
         cdef list bids = []
         if instrument_id is None:
             for orders in self._orders_bid.values():
@@ -488,6 +497,9 @@ cdef class SimulatedExchange:
         list[Order]
 
         """
+        if self.indexed_order_matching:
+            return self._get_indexed_orders(instrument_id, bids=False)
+
         cdef list asks = []
         if instrument_id is None:
             for orders in self._orders_ask.values():
@@ -511,6 +523,21 @@ cdef class SimulatedExchange:
 
         return self.exec_client.get_account()
 
+    cpdef dict get_inflight_stats(self):
+        """
+        Return the in-flight command queue statistics for the exchange.
+
+        Includes the current and maximum queue depth, the total count of
+        commands sent through the latency model, and the min, max, mean and
+        standard deviation of the simulated latency (nanoseconds).
+
+        Returns
+        -------
+        dict[str, object]
+
+        """
+        return self._inflight_queue.stats()
+
 # -- COMMANDS -------------------------------------------------------------------------------------
 
     cpdef void adjust_account(self, Money adjustment) except *:
@@ -569,26 +596,22 @@ cdef class SimulatedExchange:
         """
         Condition.not_none(command, "command")
 
+        cdef uint64_t latency_ns
         if self.latency_model is None:
             self._message_queue.put_nowait(command)
         else:
-            heappush(self._inflight_queue, self.generate_inflight_command(command))
+            latency_ns = self._command_latency(command)
+            self._inflight_queue.push(command.ts_init + latency_ns, latency_ns, command)
 
-    cdef tuple generate_inflight_command(self, TradingCommand command):
-        cdef uint64_t ts
+    cdef uint64_t _command_latency(self, TradingCommand command) except *:
         if isinstance(command, (SubmitOrder, SubmitOrderList)):
-            ts = command.ts_init + self.latency_model.insert_latency_nanos
+            return self.latency_model.insert_latency_nanos
         elif isinstance(command, ModifyOrder):
-            ts = command.ts_init + self.latency_model.update_latency_nanos
+            return self.latency_model.update_latency_nanos
         elif isinstance(command, (CancelOrder, CancelAllOrders)):
-            ts = command.ts_init + self.latency_model.cancel_latency_nanos
+            return self.latency_model.cancel_latency_nanos
         else:  # pragma: no cover (design-time error)
             raise ValueError(f"invalid command, was {command}")
-        if ts not in self._inflight_counter:
-            self._inflight_counter[ts] = 0
-        self._inflight_counter[ts] += 1
-        cdef (uint64_t, uint64_t) key = (ts, self._inflight_counter[ts])
-        return key, command
 
     cpdef void process_order_book(self, OrderBookData data) except *:
         """
@@ -843,17 +866,11 @@ cdef class SimulatedExchange:
         """
         self._clock.set_time(now_ns)
 
-        cdef:
-            uint64_t ts
-        while self._inflight_queue:
-            # Peek at timestamp of next in-flight message
-            ts = self._inflight_queue[0][0][0]
-            if ts <= now_ns:
-                # Place message on queue to be processed
-                self._message_queue.put_nowait(self._inflight_queue.pop(0)[1])
-                self._inflight_counter.pop(ts, None)
-            else:
-                break
+        # Place arrived in-flight messages on queue to be processed
+        cdef TradingCommand inflight
+        if self._inflight_queue.count > 0:
+            for inflight in self._inflight_queue.pop_due(now_ns):
+                self._message_queue.put_nowait(inflight)
 
         cdef:
             TradingCommand command
@@ -900,8 +917,8 @@ cdef class SimulatedExchange:
                     self._cancel_order(order)
             elif isinstance(command, CancelAllOrders):
                 orders = (
-                    self._orders_bid.get(command.instrument_id, [])
-                    + self._orders_ask.get(command.instrument_id, [])
+                    self.get_open_bid_orders(command.instrument_id)
+                    + self.get_open_ask_orders(command.instrument_id)
                 )
                 for order in orders:
                     if order.is_inflight_c() or order.is_open_c():
@@ -938,13 +955,13 @@ cdef class SimulatedExchange:
         self._order_index.clear()
         self._orders_bid.clear()
         self._orders_ask.clear()
+        self._order_indexes.clear()
 
         self._symbol_pos_count.clear()
         self._symbol_ord_count.clear()
         self._executions_count = 0
         self._message_queue = Queue()
-        self._inflight_queue.clear()
-        self._inflight_counter.clear()
+        self._inflight_queue.reset()
 
         self._log.info("Reset.")
 
@@ -1277,7 +1294,12 @@ cdef class SimulatedExchange:
         cdef:
             list orders_bid
             list orders_ask
-        if order.is_buy_c():
+            RestingOrderIndex index
+        if self.indexed_order_matching:
+            index = self._order_indexes.get(order.instrument_id)
+            if index is not None:
+                index.remove(order)
+        elif order.is_buy_c():
             orders_bid = self._orders_bid.get(order.instrument_id)
             if orders_bid and order in orders_bid:
                 orders_bid.remove(order)
@@ -1317,7 +1339,14 @@ cdef class SimulatedExchange:
         cdef:
             list orders_bid
             list orders_ask
-        if order.is_buy_c():
+            RestingOrderIndex index
+        if self.indexed_order_matching:
+            index = self._order_indexes.get(order.instrument_id)
+            if index is None:
+                index = RestingOrderIndex(order.instrument_id)
+                self._order_indexes[order.instrument_id] = index
+            index.add(order)
+        elif order.is_buy_c():
             orders_bid = self._orders_bid.get(order.instrument_id)
             if not orders_bid:
                 orders_bid = []
@@ -1338,7 +1367,12 @@ cdef class SimulatedExchange:
         cdef:
             list orders_bid
             list orders_ask
-        if order.is_buy_c():
+            RestingOrderIndex index
+        if self.indexed_order_matching:
+            index = self._order_indexes.get(order.instrument_id)
+            if index is not None:
+                index.remove(order)
+        elif order.is_buy_c():
             orders_bid = self._orders_bid.get(order.instrument_id)
             if orders_bid:
                 orders_bid.remove(order)
@@ -1351,6 +1385,10 @@ cdef class SimulatedExchange:
         self, InstrumentId instrument_id,
         uint64_t timestamp_ns,
     ) except *:
+        if self.indexed_order_matching:
+            self._iterate_indexed(instrument_id, timestamp_ns)
+            return
+
         # Iterate bids
         cdef list orders_bid = self._orders_bid.get(instrument_id)
         if orders_bid:
@@ -1361,6 +1399,60 @@ cdef class SimulatedExchange:
         if orders_ask:
             self._iterate_side(orders_ask.copy(), timestamp_ns)  # Copy list for safe loop
 
+    cdef void _iterate_indexed(self, InstrumentId instrument_id, uint64_t timestamp_ns) except *:
+        cdef RestingOrderIndex index = self._order_indexes.get(instrument_id)
+        if index is None or index.count() == 0:
+            return
+
+        cdef Order order
+        for order in index.expired(timestamp_ns):
+            if order.is_open_c():
+                self._delete_order(order)
+                self._expire_order(order)
+
+        cdef list orders
+        if self._bar_execution:
+            # Bar execution fills move the last bid and ask mid pass, so all
+            # orders are visited (bids then asks) as per the unindexed path
+            self._iterate_side(index.bids.orders(), timestamp_ns)
+            self._iterate_side(index.asks.orders(), timestamp_ns)
+            return
+
+        # Only visit orders which cross the current top of book
+        orders = index.candidates(
+            self.best_bid_price(instrument_id),
+            self.best_ask_price(instrument_id),
+        )
+        for order in orders:
+            if not order.is_open_c():
+                continue  # Orders state has changed since the loop started
+            # Check for order match
+            self._match_order(order)
+
+            if order.is_open_c() and (order.type == OrderType.TRAILING_STOP_MARKET or order.type == OrderType.TRAILING_STOP_LIMIT):
+                self._manage_trailing_stop(order)
+
+    cdef void _reindex_order(self, Order order) except *:
+        if not self.indexed_order_matching:
+            return
+
+        cdef RestingOrderIndex index = self._order_indexes.get(order.instrument_id)
+        if index is not None:
+            index.update(order)
+
+    cdef list _get_indexed_orders(self, InstrumentId instrument_id, bint bids):
+        cdef list orders = []
+        cdef RestingOrderIndex index
+        if instrument_id is None:
+            for index in self._order_indexes.values():
+                orders.extend(index.bids.orders() if bids else index.asks.orders())
+            return orders
+
+        index = self._order_indexes.get(instrument_id)
+        if index is None:
+            return orders
+        return index.bids.orders() if bids else index.asks.orders()
+
     cdef void _iterate_side(self, list orders, uint64_t timestamp_ns) except *:
         cdef Price
         cdef Order order
@@ -2246,6 +2338,9 @@ cdef class SimulatedExchange:
             venue_order_id_modified=venue_order_id_modified,
         )
 
+        # Price or trigger price may have changed
+        self._reindex_order(order)
+
     cdef void _generate_order_canceled(self, Order order) except *:
         self.exec_client.generate_order_canceled(
             strategy_id=order.strategy_id,
@@ -2264,6 +2359,9 @@ cdef class SimulatedExchange:
             ts_event=self._clock.timestamp_ns(),
         )
 
+        # Triggered orders now rest at their limit price
+        self._reindex_order(order)
+
     cdef void _generate_order_expired(self, Order order) except *:
         self.exec_client.generate_order_expired(
             strategy_id=order.strategy_id,
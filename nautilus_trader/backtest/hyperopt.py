@@ -13,10 +13,16 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
 from decimal import Decimal
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
+
+import numpy as np
 
 from nautilus_trader.backtest.node import BacktestNode
+from nautilus_trader.backtest.results import BacktestResult
 
 
 try:
@@ -32,6 +38,7 @@ from nautilus_trader.common.logging import LogLevel
 from nautilus_trader.config import BacktestRunConfig
 from nautilus_trader.config import ImportableStrategyConfig
 from nautilus_trader.config import StrategyConfig
+from nautilus_trader.core.correctness import PyCondition
 from nautilus_trader.model.data.bar import BarType
 from nautilus_trader.model.identifiers import InstrumentId
 
@@ -84,10 +91,16 @@ class HyperoptBacktestNode(BacktestNode):
         params: Dict[str, Any],
         minimum_positions: int = 50,
         max_evals: int = 50,
+        workers: Optional[int] = None,
+        trials_path: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Run with hyperopt to optimize strategy parameters.
 
+        If `workers` is set then batches of candidate parameter sets are
+        suggested together and evaluated concurrently on local worker processes,
+        each running its own backtest engine.
+
         Parameters
         ----------
         params : Dict[str, Any]
@@ -95,7 +108,14 @@ class HyperoptBacktestNode(BacktestNode):
         minimum_positions: int, default 50
             The minimum number of positions to accept a gradient.
         max_evals : int, default 50
-            The maximum number of evaluations for the optimization problem.
+            The maximum number of evaluations for the optimization problem
+            (including any evaluations resumed from `trials_path`).
+        workers : int, optional
+            The number of worker processes for parallel trial evaluation.
+        trials_path : str, optional
+            The file path to persist the trials state to after each evaluation
+            (or batch of evaluations). If the file exists then the search is
+            resumed from it, without repeating completed evaluations.
 
         Returns
         -------
@@ -106,6 +126,8 @@ class HyperoptBacktestNode(BacktestNode):
         ------
         ImportError
             If hyperopt is not available.
+        ValueError
+            If `workers` is not a positive integer.
 
         """
         if hyperopt is None:
@@ -117,6 +139,17 @@ class HyperoptBacktestNode(BacktestNode):
         logger = Logger(clock=LiveClock(), level_stdout=LogLevel.INFO)
         logger_adapter = LoggerAdapter(component_name="HYPEROPT_LOGGER", logger=logger)
 
+        if workers is not None:
+            PyCondition.positive_int(workers, "workers")
+            return self._hyperopt_search_parallel(
+                params=params,
+                minimum_positions=minimum_positions,
+                max_evals=max_evals,
+                workers=workers,
+                trials_path=trials_path,
+                logger_adapter=logger_adapter,
+            )
+
         def objective(args):
             logger_adapter.info(f"Searching with {args}")
 
@@ -143,25 +176,17 @@ class HyperoptBacktestNode(BacktestNode):
                 base_currency = self.config.venues[0].base_currency
                 # logger_adapter.info(f"{result.stats_pnls[base_currency]}")
                 pnl_pct = result.stats_pnls[base_currency]["PnL%"]
-                profit_factor = result.stats_returns["Profit Factor"]
                 logger_adapter.info(f"OBJECTIVE: {1/pnl_pct}")
                 # win_rate = result.stats_pnls['USDT']['Win Rate']
 
-                if (
-                    (1 / profit_factor) == 0
-                    or profit_factor <= 0
-                    or result.total_positions < minimum_positions
-                ):
-                    ret = {"status": hyperopt.STATUS_FAIL}
-                else:
-                    ret = {"status": hyperopt.STATUS_OK, "loss": (1 / profit_factor)}
+                ret = _trial_loss(result=result, minimum_positions=minimum_positions)
 
             except Exception as e:
                 ret = {"status": hyperopt.STATUS_FAIL}
                 logger_adapter.error(f"Bankruptcy : {e} ")
             return ret
 
-        trials = hyperopt.Trials()
+        trials = _load_trials(trials_path)
 
         return hyperopt.fmin(
             fn=objective,
@@ -169,4 +194,128 @@ class HyperoptBacktestNode(BacktestNode):
             algo=hyperopt.tpe.suggest,
             trials=trials,
             max_evals=max_evals,
+            trials_save_file=trials_path or "",
         )
+
+    def _hyperopt_search_parallel(
+        self,
+        params: Dict[str, Any],
+        minimum_positions: int,
+        max_evals: int,
+        workers: int,
+        trials_path: Optional[str],
+        logger_adapter: LoggerAdapter,
+    ) -> Dict[str, Any]:
+        trials = _load_trials(trials_path)
+        if len(trials) > 0:
+            logger_adapter.info(f"Resuming search with {len(trials)} completed trials.")
+
+        # The domain is only used by the algorithm to suggest new points, the
+        # evaluations themselves happen in the worker processes.
+        domain = hyperopt.Domain(fn=lambda _: None, expr=params)
+        rstate = np.random.default_rng()
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            while len(trials) < max_evals:
+                n_suggest = min(workers, max_evals - len(trials))
+                new_ids = trials.new_trial_ids(n_suggest)
+                trials.refresh()
+                new_docs: List[Dict] = hyperopt.tpe.suggest(
+                    new_ids,
+                    domain,
+                    trials,
+                    rstate.integers(2 ** 31 - 1),
+                )
+                if not new_docs:
+                    break  # Search space exhausted
+
+                futures = []
+                for doc in new_docs:
+                    spec = hyperopt.base.spec_from_misc(doc["misc"])
+                    args = hyperopt.space_eval(params, spec)
+                    logger_adapter.info(f"Searching with {args}")
+                    futures.append(
+                        executor.submit(
+                            _run_trial_in_worker,
+                            self.config,
+                            self.strategy_path,
+                            self.config_path,
+                            args,
+                            minimum_positions,
+                        ),
+                    )
+
+                for doc, future in zip(new_docs, futures):
+                    try:
+                        ret = future.result()
+                    except Exception as e:  # The worker process itself failed
+                        logger_adapter.error(f"Trial {doc['tid']} failed: {e}")
+                        ret = {"status": hyperopt.STATUS_FAIL}
+                    now = hyperopt.utils.coarse_utcnow()
+                    doc["state"] = hyperopt.JOB_STATE_DONE
+                    doc["result"] = ret
+                    doc["book_time"] = now
+                    doc["refresh_time"] = now
+
+                # Only completed trials are inserted and persisted, so a killed
+                # search will at most repeat the batch which was in flight.
+                trials.insert_trial_docs(new_docs)
+                trials.refresh()
+                _save_trials(trials, trials_path)
+
+        return trials.argmin
+
+
+def _trial_loss(result: BacktestResult, minimum_positions: int) -> Dict[str, Any]:
+    profit_factor = result.stats_returns["Profit Factor"]
+    if (
+        (1 / profit_factor) == 0
+        or profit_factor <= 0
+        or result.total_positions < minimum_positions
+    ):
+        return {"status": hyperopt.STATUS_FAIL}
+    else:
+        return {"status": hyperopt.STATUS_OK, "loss": (1 / profit_factor)}
+
+
+def _run_trial_in_worker(
+    base_config: BacktestRunConfig,
+    strategy_path: str,
+    config_path: str,
+    args: Dict[str, Any],
+    minimum_positions: int,
+) -> Dict[str, Any]:
+    # Runs in a worker process against its own copy of the base config
+    base_config.engine.strategies = [
+        ImportableStrategyConfig(
+            strategy_path=strategy_path,
+            config_path=config_path,
+            config=args,
+        ),
+    ]
+    node = BacktestNode(configs=[base_config])
+    try:
+        result = node.run()[0]
+        return _trial_loss(result=result, minimum_positions=minimum_positions)
+    except Exception:
+        return {"status": hyperopt.STATUS_FAIL}
+    finally:
+        node.dispose()
+
+
+def _load_trials(path: Optional[str]):
+    if path is not None and os.path.exists(path):
+        with open(path, "rb") as f:
+            return pickle.load(f)  # noqa (trusted local trials state)
+    return hyperopt.Trials()
+
+
+def _save_trials(trials, path: Optional[str]) -> None:
+    if path is None:
+        return
+    # Write to a temporary file first so an interrupted write cannot corrupt
+    # the existing trials state.
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump(trials, f)
+    os.replace(tmp_path, path)
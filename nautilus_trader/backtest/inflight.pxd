@@ -0,0 +1,44 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from libc.stdint cimport uint64_t
+
+
+cdef class InflightQueue:
+    cdef list _heap
+    cdef uint64_t _seq
+    cdef double _latency_mean
+    cdef double _latency_m2
+
+    cdef readonly int count
+    """The current count of in-flight items.\n\n:returns: `int`"""
+    cdef readonly int max_count
+    """The maximum count of in-flight items held at once.\n\n:returns: `int`"""
+    cdef readonly uint64_t total_count
+    """The total count of items pushed onto the queue.\n\n:returns: `int`"""
+    cdef readonly uint64_t latency_min_ns
+    """The minimum simulated latency (nanoseconds) of pushed items.\n\n:returns: `int`"""
+    cdef readonly uint64_t latency_max_ns
+    """The maximum simulated latency (nanoseconds) of pushed items.\n\n:returns: `int`"""
+
+    cpdef void push(self, uint64_t ts_arrival, uint64_t latency_ns, item) except *
+    cpdef uint64_t peek_ts(self) except *
+    cpdef object pop(self)
+    cpdef list pop_due(self, uint64_t now_ns)
+    cpdef double latency_mean_ns(self) except *
+    cpdef double latency_std_ns(self) except *
+    cpdef dict stats(self)
+    cpdef void clear(self) except *
+    cpdef void reset(self) except *
@@ -0,0 +1,200 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from heapq import heappop
+from heapq import heappush
+
+from libc.math cimport sqrt
+from libc.stdint cimport uint64_t
+
+
+cdef class InflightQueue:
+    """
+    Provides a priority queue for items in-flight to a simulated venue.
+
+    Items are ordered by their arrival timestamp, with items arriving at the
+    same timestamp released in the order they were pushed. Statistics on the
+    queue depth and the spread of simulated latency are maintained as items
+    are pushed.
+    """
+
+    def __init__(self):
+        self._heap = []  # type: list[tuple[int, int, object]]
+        self._seq = 0
+        self.count = 0
+        self.max_count = 0
+        self.total_count = 0
+        self.latency_min_ns = 0
+        self.latency_max_ns = 0
+        self._latency_mean = 0.0
+        self._latency_m2 = 0.0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(count={self.count}, max_count={self.max_count})"
+
+    cpdef void push(self, uint64_t ts_arrival, uint64_t latency_ns, item) except *:
+        """
+        Push the given item onto the queue.
+
+        Parameters
+        ----------
+        ts_arrival : uint64_t
+            The UNIX timestamp (nanoseconds) when the item arrives at the venue.
+        latency_ns : uint64_t
+            The simulated latency (nanoseconds) applied to the item.
+        item : object
+            The item to push.
+
+        """
+        self._seq += 1
+        heappush(self._heap, (ts_arrival, self._seq, item))
+        self.count += 1
+        if self.count > self.max_count:
+            self.max_count = self.count
+
+        # Update latency statistics (Welford's online algorithm)
+        self.total_count += 1
+        if self.total_count == 1 or latency_ns < self.latency_min_ns:
+            self.latency_min_ns = latency_ns
+        if latency_ns > self.latency_max_ns:
+            self.latency_max_ns = latency_ns
+        cdef double delta = latency_ns - self._latency_mean
+        self._latency_mean += delta / self.total_count
+        self._latency_m2 += delta * (latency_ns - self._latency_mean)
+
+    cpdef uint64_t peek_ts(self) except *:
+        """
+        Return the arrival timestamp of the next item on the queue.
+
+        Returns
+        -------
+        uint64_t
+
+        Raises
+        ------
+        IndexError
+            If the queue is empty.
+
+        """
+        if not self._heap:
+            raise IndexError("cannot peek, queue is empty")
+        return self._heap[0][0]
+
+    cpdef object pop(self):
+        """
+        Pop the next item from the queue.
+
+        Returns
+        -------
+        object
+
+        Raises
+        ------
+        IndexError
+            If the queue is empty.
+
+        """
+        if not self._heap:
+            raise IndexError("cannot pop, queue is empty")
+        self.count -= 1
+        return heappop(self._heap)[2]
+
+    cpdef list pop_due(self, uint64_t now_ns):
+        """
+        Pop all items which have arrived as at the given timestamp.
+
+        Parameters
+        ----------
+        now_ns : uint64_t
+            The UNIX timestamp (nanoseconds) now.
+
+        Returns
+        -------
+        list[object]
+            The items in arrival order.
+
+        """
+        cdef list items = []
+        while self._heap and self._heap[0][0] <= now_ns:
+            items.append(heappop(self._heap)[2])
+        self.count -= len(items)
+        return items
+
+    cpdef double latency_mean_ns(self) except *:
+        """
+        Return the mean simulated latency (nanoseconds) of pushed items.
+
+        Returns
+        -------
+        double
+
+        """
+        return self._latency_mean
+
+    cpdef double latency_std_ns(self) except *:
+        """
+        Return the standard deviation of simulated latency (nanoseconds) of
+        pushed items.
+
+        Returns
+        -------
+        double
+
+        """
+        if self.total_count < 2:
+            return 0.0
+        return sqrt(self._latency_m2 / self.total_count)
+
+    cpdef dict stats(self):
+        """
+        Return the queue depth and latency statistics.
+
+        Returns
+        -------
+        dict[str, object]
+
+        """
+        return {
+            "count": self.count,
+            "max_count": self.max_count,
+            "total_count": self.total_count,
+            "latency_min_ns": self.latency_min_ns,
+            "latency_max_ns": self.latency_max_ns,
+            "latency_mean_ns": self.latency_mean_ns(),
+            "latency_std_ns": self.latency_std_ns(),
+        }
+
+    cpdef void clear(self) except *:
+        """
+        Clear all items from the queue (statistics are retained).
+        """
+        self._heap.clear()
+        self.count = 0
+
+    cpdef void reset(self) except *:
+        """
+        Clear all items from the queue and reset the statistics.
+        """
+        self.clear()
+        self._seq = 0
+        self.max_count = 0
+        self.total_count = 0
+        self.latency_min_ns = 0
+        self.latency_max_ns = 0
+        self._latency_mean = 0.0
+        self._latency_m2 = 0.0
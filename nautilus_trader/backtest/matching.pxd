@@ -0,0 +1,64 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from libc.stdint cimport uint64_t
+
+from nautilus_trader.model.identifiers cimport InstrumentId
+from nautilus_trader.model.objects cimport Price
+from nautilus_trader.model.orders.base cimport Order
+
+
+cdef class RestingOrderSide:
+    cdef readonly bint is_bid
+    """If the side holds buy orders.\n\n:returns: `bool`"""
+
+    cdef list _limit_keys
+    cdef list _limit_orders
+    cdef list _stop_keys
+    cdef list _stop_orders
+    cdef dict _unindexed
+    cdef dict _locations
+
+    cpdef int count(self) except *
+    cpdef bint contains(self, Order order) except *
+    cpdef void add(self, Order order) except *
+    cpdef bint remove(self, Order order) except *
+    cpdef list orders(self)
+    cpdef list candidates(self, Price touch)
+    cpdef void clear(self) except *
+
+    cdef void _insert(self, list keys, list orders, object key, Order order) except *
+    cdef void _delete(self, list keys, list orders, object key, Order order) except *
+
+
+cdef class RestingOrderIndex:
+    cdef list _expiry_heap
+    cdef uint64_t _expiry_seq
+
+    cdef readonly InstrumentId instrument_id
+    """The instrument ID for the index.\n\n:returns: `InstrumentId`"""
+    cdef readonly RestingOrderSide bids
+    """The resting buy orders.\n\n:returns: `RestingOrderSide`"""
+    cdef readonly RestingOrderSide asks
+    """The resting sell orders.\n\n:returns: `RestingOrderSide`"""
+
+    cpdef int count(self) except *
+    cpdef bint contains(self, Order order) except *
+    cpdef void add(self, Order order) except *
+    cpdef bint remove(self, Order order) except *
+    cpdef void update(self, Order order) except *
+    cpdef list expired(self, uint64_t timestamp_ns)
+    cpdef list candidates(self, Price bid, Price ask)
+    cpdef void clear(self) except *
@@ -0,0 +1,458 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from bisect import bisect_left
+from bisect import bisect_right
+from heapq import heappop
+from heapq import heappush
+
+from libc.stdint cimport uint64_t
+
+from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.model.c_enums.order_side cimport OrderSide
+from nautilus_trader.model.c_enums.order_type cimport OrderType
+from nautilus_trader.model.identifiers cimport InstrumentId
+from nautilus_trader.model.objects cimport Price
+from nautilus_trader.model.orders.base cimport Order
+
+
+cdef int _LIMIT = 0
+cdef int _STOP = 1
+cdef int _UNINDEXED = 2
+
+
+cdef tuple _index_key(Order order, bint is_bid):
+    # Determine which bucket the order rests in and its sort key within that
+    # bucket. Keys are arranged so that the orders which could match first
+    # always sort first, and the matchable prefix ends at the touch price.
+    cdef Price price
+    if (
+        order.type == OrderType.TRAILING_STOP_MARKET
+        or order.type == OrderType.TRAILING_STOP_LIMIT
+    ):
+        return _UNINDEXED, None  # Trigger moves with the market every iteration
+
+    if (
+        order.type == OrderType.LIMIT
+        or order.type == OrderType.MARKET_TO_LIMIT
+        or (
+            (order.type == OrderType.STOP_LIMIT or order.type == OrderType.LIMIT_IF_TOUCHED)
+            and order.is_triggered
+        )
+    ):
+        price = order.price
+        if price is None:
+            return _UNINDEXED, None
+        return _LIMIT, -price._mem.raw if is_bid else price._mem.raw
+
+    price = order.trigger_price
+    if price is None:
+        return _UNINDEXED, None
+    return _STOP, price._mem.raw if is_bid else -price._mem.raw
+
+
+cdef class RestingOrderSide:
+    """
+    Provides a price indexed store of resting orders for one side of a market.
+
+    Limit priced orders are keyed by their limit price, and untriggered stop
+    and touched orders by their trigger price, such that the orders which
+    could match against a given touch price form a prefix of each index.
+
+    Parameters
+    ----------
+    is_bid : bool
+        If the side holds buy orders (otherwise sell orders).
+    """
+
+    def __init__(self, bint is_bid):
+        self.is_bid = is_bid
+
+        self._limit_keys = []
+        self._limit_orders = []
+        self._stop_keys = []
+        self._stop_orders = []
+        self._unindexed = {}  # type: dict[ClientOrderId, Order]
+        self._locations = {}  # type: dict[ClientOrderId, tuple[int, int]]
+
+    def __len__(self) -> int:
+        return self.count()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(is_bid={self.is_bid}, count={self.count()})"
+
+    cpdef int count(self) except *:
+        """
+        Return the count of orders held on the side.
+
+        Returns
+        -------
+        int
+
+        """
+        return len(self._locations)
+
+    cpdef bint contains(self, Order order) except *:
+        """
+        Return a value indicating whether the given order is held on the side.
+
+        Parameters
+        ----------
+        order : Order
+            The order to check.
+
+        Returns
+        -------
+        bool
+
+        """
+        Condition.not_none(order, "order")
+
+        return order.client_order_id in self._locations
+
+    cpdef void add(self, Order order) except *:
+        """
+        Add the given order to the side.
+
+        Orders sharing a key keep their insertion (time) priority.
+
+        Parameters
+        ----------
+        order : Order
+            The order to add.
+
+        Raises
+        ------
+        KeyError
+            If `order` is already held on the side.
+
+        """
+        Condition.not_none(order, "order")
+        Condition.not_in(order.client_order_id, self._locations, "order.client_order_id", "_locations")
+
+        cdef int bucket
+        bucket, key = _index_key(order, self.is_bid)
+        if bucket == _LIMIT:
+            self._insert(self._limit_keys, self._limit_orders, key, order)
+        elif bucket == _STOP:
+            self._insert(self._stop_keys, self._stop_orders, key, order)
+        else:
+            self._unindexed[order.client_order_id] = order
+
+        self._locations[order.client_order_id] = (bucket, key)
+
+    cpdef bint remove(self, Order order) except *:
+        """
+        Remove the given order from the side (if found).
+
+        The order is located using the key it was added with, so the order
+        may have been amended since being added.
+
+        Parameters
+        ----------
+        order : Order
+            The order to remove.
+
+        Returns
+        -------
+        bool
+            True if the order was found and removed, else False.
+
+        """
+        Condition.not_none(order, "order")
+
+        cdef tuple location = self._locations.pop(order.client_order_id, None)
+        if location is None:
+            return False
+
+        cdef int bucket = location[0]
+        if bucket == _LIMIT:
+            self._delete(self._limit_keys, self._limit_orders, location[1], order)
+        elif bucket == _STOP:
+            self._delete(self._stop_keys, self._stop_orders, location[1], order)
+        else:
+            self._unindexed.pop(order.client_order_id, None)
+
+        return True
+
+    cpdef list orders(self):
+        """
+        Return all orders held on the side.
+
+        Limit priced orders are returned first in matching priority, followed
+        by stop orders in trigger priority, then any unindexed orders.
+
+        Returns
+        -------
+        list[Order]
+
+        """
+        return self._limit_orders + self._stop_orders + list(self._unindexed.values())
+
+    cpdef list candidates(self, Price touch):
+        """
+        Return the orders which could match or trigger against the given touch.
+
+        The touch is the best price on the opposite side of the market. Orders
+        resting exactly at the touch are included, as whether they fill is
+        decided by the fill model. Unindexed orders are always included.
+
+        Parameters
+        ----------
+        touch : Price, optional
+            The best opposite side price (``None`` if no market).
+
+        Returns
+        -------
+        list[Order]
+
+        """
+        cdef list candidates = []
+        cdef int limit_end
+        cdef int stop_end
+        if touch is not None:
+            if self.is_bid:
+                limit_end = bisect_right(self._limit_keys, -touch._mem.raw)
+                stop_end = bisect_right(self._stop_keys, touch._mem.raw)
+            else:
+                limit_end = bisect_right(self._limit_keys, touch._mem.raw)
+                stop_end = bisect_right(self._stop_keys, -touch._mem.raw)
+            candidates = self._limit_orders[:limit_end] + self._stop_orders[:stop_end]
+
+        if self._unindexed:
+            candidates.extend(self._unindexed.values())
+
+        return candidates
+
+    cpdef void clear(self) except *:
+        """
+        Clear all orders from the side.
+        """
+        self._limit_keys.clear()
+        self._limit_orders.clear()
+        self._stop_keys.clear()
+        self._stop_orders.clear()
+        self._unindexed.clear()
+        self._locations.clear()
+
+    cdef void _insert(self, list keys, list orders, object key, Order order) except *:
+        cdef int idx = bisect_right(keys, key)
+        keys.insert(idx, key)
+        orders.insert(idx, order)
+
+    cdef void _delete(self, list keys, list orders, object key, Order order) except *:
+        cdef int idx = bisect_left(keys, key)
+        cdef int end = len(keys)
+        while idx < end and keys[idx] == key:
+            if (<Order>orders[idx]).client_order_id == order.client_order_id:
+                del keys[idx]
+                del orders[idx]
+                return
+            idx += 1
+        raise KeyError(f"{order.client_order_id!r} not found at key {key}")  # pragma: no cover
+
+
+cdef class RestingOrderIndex:
+    """
+    Provides a price indexed store of the resting orders for one instrument
+    at a simulated exchange.
+
+    Inserts and removals locate their position by binary search, and each
+    market update only visits the orders whose price or trigger price crosses
+    the new top of book. Expiring orders are tracked in a heap so expiry
+    checks do not require scanning every order.
+
+    Parameters
+    ----------
+    instrument_id : InstrumentId
+        The instrument ID for the index.
+    """
+
+    def __init__(self, InstrumentId instrument_id not None):
+        self.instrument_id = instrument_id
+        self.bids = RestingOrderSide(is_bid=True)
+        self.asks = RestingOrderSide(is_bid=False)
+
+        self._expiry_heap = []  # type: list[tuple[int, int, Order]]
+        self._expiry_seq = 0
+
+    def __len__(self) -> int:
+        return self.count()
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}("
+            f"instrument_id={self.instrument_id}, "
+            f"bids={self.bids.count()}, "
+            f"asks={self.asks.count()})"
+        )
+
+    cpdef int count(self) except *:
+        """
+        Return the count of resting orders in the index.
+
+        Returns
+        -------
+        int
+
+        """
+        return self.bids.count() + self.asks.count()
+
+    cpdef bint contains(self, Order order) except *:
+        """
+        Return a value indicating whether the given order is resting in the index.
+
+        Parameters
+        ----------
+        order : Order
+            The order to check.
+
+        Returns
+        -------
+        bool
+
+        """
+        Condition.not_none(order, "order")
+
+        if order.side == OrderSide.BUY:
+            return self.bids.contains(order)
+        else:
+            return self.asks.contains(order)
+
+    cpdef void add(self, Order order) except *:
+        """
+        Add the given order to the index.
+
+        Parameters
+        ----------
+        order : Order
+            The order to add.
+
+        Raises
+        ------
+        ValueError
+            If `order.instrument_id` is not equal to the indexes instrument ID.
+        KeyError
+            If `order` is already resting in the index.
+
+        """
+        Condition.not_none(order, "order")
+        Condition.equal(order.instrument_id, self.instrument_id, "order.instrument_id", "instrument_id")
+
+        if order.side == OrderSide.BUY:
+            self.bids.add(order)
+        else:
+            self.asks.add(order)
+
+        cdef uint64_t expire_time_ns = order.expire_time_ns
+        if expire_time_ns > 0:
+            self._expiry_seq += 1
+            heappush(self._expiry_heap, (expire_time_ns, self._expiry_seq, order))
+
+    cpdef bint remove(self, Order order) except *:
+        """
+        Remove the given order from the index (if found).
+
+        Parameters
+        ----------
+        order : Order
+            The order to remove.
+
+        Returns
+        -------
+        bool
+            True if the order was found and removed, else False.
+
+        """
+        Condition.not_none(order, "order")
+
+        # Expiry heap entries for removed orders are discarded lazily
+        if order.side == OrderSide.BUY:
+            return self.bids.remove(order)
+        else:
+            return self.asks.remove(order)
+
+    cpdef void update(self, Order order) except *:
+        """
+        Reposition the given order after its price, trigger price or
+        triggered state has changed.
+
+        Orders which are not resting in the index are ignored.
+
+        Parameters
+        ----------
+        order : Order
+            The order to update.
+
+        """
+        Condition.not_none(order, "order")
+
+        cdef RestingOrderSide side = self.bids if order.side == OrderSide.BUY else self.asks
+        if side.remove(order):
+            side.add(order)
+
+    cpdef list expired(self, uint64_t timestamp_ns):
+        """
+        Return the resting orders which have expired as at the given timestamp.
+
+        The orders remain in the index until removed.
+
+        Parameters
+        ----------
+        timestamp_ns : uint64_t
+            The UNIX timestamp (nanoseconds) to check expiry against.
+
+        Returns
+        -------
+        list[Order]
+
+        """
+        cdef list expired = []
+        cdef Order order
+        while self._expiry_heap and self._expiry_heap[0][0] <= timestamp_ns:
+            order = heappop(self._expiry_heap)[2]
+            if self.contains(order):
+                expired.append(order)
+
+        return expired
+
+    cpdef list candidates(self, Price bid, Price ask):
+        """
+        Return the resting orders which could match or trigger against the
+        given top of book.
+
+        Buy orders are returned ahead of sell orders.
+
+        Parameters
+        ----------
+        bid : Price, optional
+            The best bid price (``None`` if no market).
+        ask : Price, optional
+            The best ask price (``None`` if no market).
+
+        Returns
+        -------
+        list[Order]
+
+        """
+        return self.bids.candidates(ask) + self.asks.candidates(bid)
+
+    cpdef void clear(self) except *:
+        """
+        Clear all orders from the index.
+        """
+        self.bids.clear()
+        self.asks.clear()
+        self._expiry_heap.clear()
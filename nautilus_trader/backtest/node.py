@@ -13,8 +13,11 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import multiprocessing
+import traceback
+from concurrent.futures import ProcessPoolExecutor
 from decimal import Decimal
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import pandas as pd
 
@@ -69,6 +72,7 @@ class BacktestNode:
         # Configuration
         self._configs: List[BacktestRunConfig] = configs
         self._engines: Dict[str, BacktestEngine] = {}
+        self._failures: Dict[int, str] = {}
 
     @property
     def configs(self) -> List[BacktestRunConfig]:
@@ -110,17 +114,62 @@ class BacktestNode:
         """
         return list(self._engines.values())
 
-    def run(self) -> List[BacktestResult]:  # noqa (kwargs for extensibility)
+    def get_failures(self) -> Dict[int, str]:
         """
-        Execute a group of backtest run configs synchronously.
+        Return the formatted tracebacks for any failed parallel runs, keyed
+        by the index of the run (the same as for its config and result).
 
         Returns
         -------
-        list[BacktestResult]
-            The results of the backtest runs.
+        dict[int, str]
 
         """
-        results: List[BacktestResult] = []
+        return self._failures.copy()
+
+    def run(
+        self,
+        workers: Optional[int] = None,
+        share_catalog: bool = False,
+    ) -> List[Optional[BacktestResult]]:
+        """
+        Execute a group of backtest run configs.
+
+        If `workers` is ``None`` then the configs are run synchronously one after
+        another in this process. Otherwise the configs are fanned out across a
+        pool of worker processes, each building its own independent engine.
+
+        Parameters
+        ----------
+        workers : int, optional
+            The number of worker processes for parallel execution.
+        share_catalog : bool, default False
+            If worker processes should be forked so they inherit a read-only view
+            of this process's catalog state (e.g. an in-memory catalog), rather than
+            being spawned fresh. Only applies when `workers` is set.
+
+        Returns
+        -------
+        list[BacktestResult or ``None``]
+            The results of the backtest runs in the same order as the configs.
+            When running in parallel a failed run results in ``None``, with its
+            traceback available from `get_failures`.
+
+        Raises
+        ------
+        ValueError
+            If `workers` is not a positive integer.
+
+        Warnings
+        --------
+        When running in parallel the engines live in the worker processes, and
+        so are not available from `get_engine` or `get_engines`.
+
+        """
+        if workers is not None:
+            PyCondition.positive_int(workers, "workers")
+            return self._run_parallel(workers=workers, share_catalog=share_catalog)
+
+        results: List[Optional[BacktestResult]] = []
         for config in self._configs:
             config.check()  # Check all values set
             result = self._run(
@@ -134,6 +183,31 @@ class BacktestNode:
 
         return results
 
+    def _run_parallel(self, workers: int, share_catalog: bool) -> List[Optional[BacktestResult]]:
+        for config in self._configs:
+            config.check()  # Check all values set
+
+        self._failures.clear()
+        results: List[Optional[BacktestResult]] = [None] * len(self._configs)
+
+        if share_catalog and "fork" in multiprocessing.get_all_start_methods():
+            mp_context = multiprocessing.get_context("fork")
+        else:
+            mp_context = multiprocessing.get_context("spawn")
+
+        with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as executor:
+            futures = [executor.submit(_run_config_in_worker, config) for config in self._configs]
+            for i, future in enumerate(futures):
+                try:
+                    result, error = future.result()
+                except Exception:  # The worker process itself failed (e.g. was killed)
+                    result, error = None, traceback.format_exc()
+                if error is not None:
+                    self._failures[i] = error
+                results[i] = result
+
+        return results
+
     def _validate_configs(self, configs: List[BacktestRunConfig]):
         venue_ids: List[Venue] = []
         for config in configs:
@@ -180,6 +254,7 @@ class BacktestNode:
                 routing=config.routing,
                 frozen_account=config.frozen_account,
                 reject_stop_orders=config.reject_stop_orders,
+                indexed_order_matching=config.indexed_order_matching,
             )
 
         # Add instruments
@@ -303,3 +378,17 @@ class BacktestNode:
     def dispose(self):
         for engine in self.get_engines():
             engine.dispose()
+
+
+def _run_config_in_worker(
+    config: BacktestRunConfig,
+) -> Tuple[Optional[BacktestResult], Optional[str]]:
+    # Entry point for a worker process, failures are returned rather than raised
+    # so that one failing run does not abort the rest of the batch.
+    node = BacktestNode(configs=[config])
+    try:
+        return node.run()[0], None
+    except Exception:
+        return None, traceback.format_exc()
+    finally:
+        node.dispose()
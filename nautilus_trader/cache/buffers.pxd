@@ -0,0 +1,92 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from libc.stdint cimport int64_t
+from libc.stdint cimport uint8_t
+from libc.stdint cimport uint64_t
+
+from nautilus_trader.model.data.bar cimport Bar
+from nautilus_trader.model.data.bar cimport BarType
+from nautilus_trader.model.data.tick cimport QuoteTick
+from nautilus_trader.model.data.tick cimport TradeTick
+from nautilus_trader.model.identifiers cimport InstrumentId
+
+
+cdef class ColumnarBuffer:
+    cdef int _pos
+    cdef dict _columns
+    cdef object _last
+
+    cdef readonly int capacity
+    """The maximum number of rows held by the buffer.\n\n:returns: `int`"""
+    cdef readonly int count
+    """The current number of rows held by the buffer.\n\n:returns: `int`"""
+
+    cpdef dict arrays(self, int count=*)
+    cpdef void clear(self) except *
+
+    cdef object _column(self, str name, object dtype)
+    cdef int _row(self, int index) except -1
+    cdef void _advance(self) except *
+    cdef object _materialize(self, int row)
+
+
+cdef class QuoteTickBuffer(ColumnarBuffer):
+    cdef int64_t[::1] _bid
+    cdef int64_t[::1] _ask
+    cdef uint64_t[::1] _bid_size
+    cdef uint64_t[::1] _ask_size
+    cdef uint8_t[::1] _price_prec
+    cdef uint8_t[::1] _size_prec
+    cdef uint64_t[::1] _ts_event
+    cdef uint64_t[::1] _ts_init
+
+    cdef readonly InstrumentId instrument_id
+    """The instrument ID for the buffer.\n\n:returns: `InstrumentId`"""
+
+    cpdef void appendleft(self, QuoteTick tick) except *
+
+
+cdef class TradeTickBuffer(ColumnarBuffer):
+    cdef int64_t[::1] _price
+    cdef uint64_t[::1] _size
+    cdef uint8_t[::1] _aggressor_side
+    cdef uint8_t[::1] _price_prec
+    cdef uint8_t[::1] _size_prec
+    cdef uint64_t[::1] _ts_event
+    cdef uint64_t[::1] _ts_init
+    cdef list _trade_ids
+
+    cdef readonly InstrumentId instrument_id
+    """The instrument ID for the buffer.\n\n:returns: `InstrumentId`"""
+
+    cpdef void appendleft(self, TradeTick tick) except *
+
+
+cdef class BarBuffer(ColumnarBuffer):
+    cdef int64_t[::1] _open
+    cdef int64_t[::1] _high
+    cdef int64_t[::1] _low
+    cdef int64_t[::1] _close
+    cdef uint64_t[::1] _volume
+    cdef uint8_t[::1] _price_prec
+    cdef uint8_t[::1] _size_prec
+    cdef uint64_t[::1] _ts_event
+    cdef uint64_t[::1] _ts_init
+
+    cdef readonly BarType bar_type
+    """The bar type for the buffer.\n\n:returns: `BarType`"""
+
+    cpdef void appendleft(self, Bar bar) except *
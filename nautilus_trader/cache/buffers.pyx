@@ -0,0 +1,372 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import numpy as np
+
+from libc.stdint cimport uint8_t
+
+from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.model.c_enums.aggressor_side cimport AggressorSide
+from nautilus_trader.model.data.bar cimport Bar
+from nautilus_trader.model.data.bar cimport BarType
+from nautilus_trader.model.data.tick cimport QuoteTick
+from nautilus_trader.model.data.tick cimport TradeTick
+from nautilus_trader.model.identifiers cimport InstrumentId
+
+
+cdef class ColumnarBuffer:
+    """
+    The base class for fixed capacity ring buffers holding data as columns of
+    raw fixed-point values.
+
+    Rows behave like a ``deque`` with a max length appended to on the left:
+    index 0 is the most recent row, and the oldest row is dropped once the
+    buffer is at capacity. The most recently added object is held as is, and
+    objects for older rows are only materialized when the row is accessed.
+
+    Each column is allocated at twice the capacity, with every row written to
+    both halves. The most recent rows are then always contiguous, so
+    `arrays` can return read-only views of the recent history without copying.
+
+    Parameters
+    ----------
+    capacity : int
+        The maximum number of rows for the buffer.
+
+    Raises
+    ------
+    ValueError
+        If `capacity` is not positive (> 0).
+
+    Warnings
+    --------
+    This class should not be used directly, but through a concrete subclass.
+    """
+
+    def __init__(self, int capacity):
+        Condition.positive_int(capacity, "capacity")
+
+        self._pos = 0
+        self._columns = {}  # type: dict[str, np.ndarray]
+        self._last = None   # The most recently added object
+
+        self.capacity = capacity
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, int index):
+        cdef int row = self._row(index)
+        if index == 0 or index == -self.count:
+            return self._last
+        return self._materialize(row)
+
+    def __iter__(self):
+        if self.count == 0:
+            return
+        yield self._last
+        cdef int i
+        for i in range(1, self.count):
+            yield self._materialize(self._row(i))
+
+    cpdef dict arrays(self, int count=-1):
+        """
+        Return views of the column arrays for the most recent rows.
+
+        The arrays are in chronological order (oldest first), read-only, and
+        share memory with the buffer, so are only valid until the next row is
+        added.
+
+        Parameters
+        ----------
+        count : int, optional
+            The number of most recent rows to return. If negative or greater
+            than the current count then all rows are returned.
+
+        Returns
+        -------
+        dict[str, np.ndarray]
+
+        """
+        if count < 0 or count > self.count:
+            count = self.count
+
+        cdef int end = self._pos + self.capacity
+        cdef int start = end - count
+
+        cdef dict arrays = {}
+        cdef str name
+        for name, column in self._columns.items():
+            view = column[start:end]
+            view.flags.writeable = False
+            arrays[name] = view
+
+        return arrays
+
+    cpdef void clear(self) except *:
+        """
+        Clear all rows from the buffer.
+
+        """
+        self._pos = 0
+        self._last = None
+        self.count = 0
+
+    cdef object _column(self, str name, object dtype):
+        cdef object column = np.zeros(self.capacity * 2, dtype=dtype)
+        self._columns[name] = column
+        return column
+
+    cdef int _row(self, int index) except -1:
+        if index < 0:
+            index += self.count
+        if index < 0 or index >= self.count:
+            raise IndexError("buffer index out of range")
+
+        return self._pos + self.capacity - 1 - index
+
+    cdef void _advance(self) except *:
+        self._pos += 1
+        if self._pos == self.capacity:
+            self._pos = 0
+        if self.count < self.capacity:
+            self.count += 1
+
+    cdef object _materialize(self, int row):
+        """Abstract method (implement in subclass)."""
+        raise NotImplementedError("method must be implemented in the subclass")  # pragma: no cover
+
+
+cdef class QuoteTickBuffer(ColumnarBuffer):
+    """
+    Provides a columnar ring buffer of quote ticks for an instrument.
+
+    Parameters
+    ----------
+    instrument_id : InstrumentId
+        The instrument ID for the buffer.
+    capacity : int
+        The maximum number of ticks for the buffer.
+
+    Raises
+    ------
+    ValueError
+        If `capacity` is not positive (> 0).
+    """
+
+    def __init__(self, InstrumentId instrument_id not None, int capacity):
+        super().__init__(capacity)
+
+        self.instrument_id = instrument_id
+
+        self._bid = self._column("bid", np.int64)
+        self._ask = self._column("ask", np.int64)
+        self._bid_size = self._column("bid_size", np.uint64)
+        self._ask_size = self._column("ask_size", np.uint64)
+        self._price_prec = self._column("price_prec", np.uint8)
+        self._size_prec = self._column("size_prec", np.uint8)
+        self._ts_event = self._column("ts_event", np.uint64)
+        self._ts_init = self._column("ts_init", np.uint64)
+
+    cpdef void appendleft(self, QuoteTick tick) except *:
+        """
+        Add the given tick as the most recent row.
+
+        Parameters
+        ----------
+        tick : QuoteTick
+            The tick to add.
+
+        """
+        cdef int row
+        for row in (self._pos, self._pos + self.capacity):
+            self._bid[row] = tick._mem.bid.raw
+            self._ask[row] = tick._mem.ask.raw
+            self._bid_size[row] = tick._mem.bid_size.raw
+            self._ask_size[row] = tick._mem.ask_size.raw
+            self._price_prec[row] = tick._mem.bid.precision
+            self._size_prec[row] = tick._mem.bid_size.precision
+            self._ts_event[row] = tick.ts_event
+            self._ts_init[row] = tick.ts_init
+
+        self._last = tick
+        self._advance()
+
+    cdef object _materialize(self, int row):
+        return QuoteTick.from_raw_c(
+            self.instrument_id,
+            self._bid[row],
+            self._ask[row],
+            self._price_prec[row],
+            self._bid_size[row],
+            self._ask_size[row],
+            self._size_prec[row],
+            self._ts_event[row],
+            self._ts_init[row],
+        )
+
+
+cdef class TradeTickBuffer(ColumnarBuffer):
+    """
+    Provides a columnar ring buffer of trade ticks for an instrument.
+
+    Trade IDs are held as objects alongside the columns, and are not included
+    in the arrays.
+
+    Parameters
+    ----------
+    instrument_id : InstrumentId
+        The instrument ID for the buffer.
+    capacity : int
+        The maximum number of ticks for the buffer.
+
+    Raises
+    ------
+    ValueError
+        If `capacity` is not positive (> 0).
+    """
+
+    def __init__(self, InstrumentId instrument_id not None, int capacity):
+        super().__init__(capacity)
+
+        self.instrument_id = instrument_id
+
+        self._price = self._column("price", np.int64)
+        self._size = self._column("size", np.uint64)
+        self._aggressor_side = self._column("aggressor_side", np.uint8)
+        self._price_prec = self._column("price_prec", np.uint8)
+        self._size_prec = self._column("size_prec", np.uint8)
+        self._ts_event = self._column("ts_event", np.uint64)
+        self._ts_init = self._column("ts_init", np.uint64)
+        self._trade_ids = [None] * capacity  # type: list[TradeId]
+
+    cpdef void appendleft(self, TradeTick tick) except *:
+        """
+        Add the given tick as the most recent row.
+
+        Parameters
+        ----------
+        tick : TradeTick
+            The tick to add.
+
+        """
+        self._trade_ids[self._pos] = tick.trade_id
+
+        cdef int row
+        for row in (self._pos, self._pos + self.capacity):
+            self._price[row] = tick._mem.price.raw
+            self._size[row] = tick._mem.size.raw
+            self._aggressor_side[row] = <uint8_t>tick._mem.aggressor_side
+            self._price_prec[row] = tick._mem.price.precision
+            self._size_prec[row] = tick._mem.size.precision
+            self._ts_event[row] = tick.ts_event
+            self._ts_init[row] = tick.ts_init
+
+        self._last = tick
+        self._advance()
+
+    cpdef void clear(self) except *:
+        """
+        Clear all rows from the buffer.
+
+        """
+        ColumnarBuffer.clear(self)
+        self._trade_ids = [None] * self.capacity
+
+    cdef object _materialize(self, int row):
+        return TradeTick.from_raw_c(
+            self.instrument_id,
+            self._price[row],
+            self._price_prec[row],
+            self._size[row],
+            self._size_prec[row],
+            <AggressorSide>self._aggressor_side[row],
+            self._trade_ids[row % self.capacity],
+            self._ts_event[row],
+            self._ts_init[row],
+        )
+
+
+cdef class BarBuffer(ColumnarBuffer):
+    """
+    Provides a columnar ring buffer of bars for a bar type.
+
+    Parameters
+    ----------
+    bar_type : BarType
+        The bar type for the buffer.
+    capacity : int
+        The maximum number of bars for the buffer.
+
+    Raises
+    ------
+    ValueError
+        If `capacity` is not positive (> 0).
+    """
+
+    def __init__(self, BarType bar_type not None, int capacity):
+        super().__init__(capacity)
+
+        self.bar_type = bar_type
+
+        self._open = self._column("open", np.int64)
+        self._high = self._column("high", np.int64)
+        self._low = self._column("low", np.int64)
+        self._close = self._column("close", np.int64)
+        self._volume = self._column("volume", np.uint64)
+        self._price_prec = self._column("price_prec", np.uint8)
+        self._size_prec = self._column("size_prec", np.uint8)
+        self._ts_event = self._column("ts_event", np.uint64)
+        self._ts_init = self._column("ts_init", np.uint64)
+
+    cpdef void appendleft(self, Bar bar) except *:
+        """
+        Add the given bar as the most recent row.
+
+        Parameters
+        ----------
+        bar : Bar
+            The bar to add.
+
+        """
+        cdef int row
+        for row in (self._pos, self._pos + self.capacity):
+            self._open[row] = bar._mem.open.raw
+            self._high[row] = bar._mem.high.raw
+            self._low[row] = bar._mem.low.raw
+            self._close[row] = bar._mem.close.raw
+            self._volume[row] = bar._mem.volume.raw
+            self._price_prec[row] = bar._mem.close.precision
+            self._size_prec[row] = bar._mem.volume.precision
+            self._ts_event[row] = bar.ts_event
+            self._ts_init[row] = bar.ts_init
+
+        self._last = bar
+        self._advance()
+
+    cdef object _materialize(self, int row):
+        return Bar.from_raw_c(
+            self.bar_type,
+            self._open[row],
+            self._high[row],
+            self._low[row],
+            self._close[row],
+            self._price_prec[row],
+            self._volume[row],
+            self._size_prec[row],
+            self._ts_event[row],
+            self._ts_init[row],
+        )
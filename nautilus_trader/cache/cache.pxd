@@ -14,13 +14,14 @@
 # -------------------------------------------------------------------------------------------------
 
 from nautilus_trader.accounting.accounts.base cimport Account
-from nautilus_trader.accounting.calculators cimport ExchangeRateCalculator
+from nautilus_trader.accounting.calculators cimport ExchangeRateGraph
 from nautilus_trader.cache.base cimport CacheFacade
 from nautilus_trader.cache.database cimport CacheDatabase
 from nautilus_trader.common.logging cimport LoggerAdapter
 from nautilus_trader.model.c_enums.oms_type cimport OMSType
 from nautilus_trader.model.currency cimport Currency
 from nautilus_trader.model.data.bar cimport Bar
+from nautilus_trader.model.data.bar cimport BarType
 from nautilus_trader.model.data.tick cimport QuoteTick
 from nautilus_trader.model.data.tick cimport TradeTick
 from nautilus_trader.model.data.ticker cimport Ticker
@@ -40,8 +41,7 @@ from nautilus_trader.trading.strategy cimport Strategy
 cdef class Cache(CacheFacade):
     cdef LoggerAdapter _log
     cdef CacheDatabase _database
-    cdef ExchangeRateCalculator _xrate_calculator
-
+    cdef dict _xrate_graphs
     cdef dict _xrate_symbols
     cdef dict _tickers
     cdef dict _quote_ticks
@@ -75,11 +75,20 @@ cdef class Cache(CacheFacade):
     cdef set _index_positions_open
     cdef set _index_positions_closed
     cdef set _index_strategies
+    cdef dict _index_orders_partitions
+    cdef dict _index_orders_open_partitions
+    cdef dict _index_orders_closed_partitions
+    cdef dict _index_orders_inflight_partitions
+    cdef dict _index_positions_partitions
+    cdef dict _index_positions_open_partitions
+    cdef dict _index_positions_closed_partitions
 
     cdef readonly int tick_capacity
     """The caches tick capacity.\n\n:returns: `int`"""
     cdef readonly int bar_capacity
     """The caches bar capacity.\n\n:returns: `int`"""
+    cdef readonly bint columnar
+    """If the caches tick and bar history is held in columnar buffers.\n\n:returns: `bool`"""
 
     cpdef void cache_currencies(self) except *
     cpdef void cache_instruments(self) except *
@@ -93,14 +102,23 @@ cdef class Cache(CacheFacade):
     cpdef void clear_index(self) except *
     cpdef void reset(self) except *
     cpdef void flush_db(self) except *
+    cpdef void dispose(self) except *
 
-    cdef tuple _build_quote_table(self, Venue venue)
+    cdef void _update_xrate_graph(self, InstrumentId instrument_id, tuple pair, QuoteTick tick) except *
     cdef void _build_index_venue_account(self) except *
     cdef void _cache_venue_account_id(self, AccountId account_id) except *
     cdef void _build_indexes_from_orders(self) except *
     cdef void _build_indexes_from_positions(self) except *
-    cdef set _build_ord_query_filter_set(self, Venue venue, InstrumentId instrument_id, StrategyId strategy_id)
-    cdef set _build_pos_query_filter_set(self, Venue venue, InstrumentId instrument_id, StrategyId strategy_id)
+    cdef object _new_quote_tick_history(self, InstrumentId instrument_id)
+    cdef object _new_trade_tick_history(self, InstrumentId instrument_id)
+    cdef object _new_bar_history(self, BarType bar_type)
+    cdef void _index_add(self, set index, dict partitions, object key, Venue venue, InstrumentId instrument_id, StrategyId strategy_id) except *
+    cdef void _index_discard(self, set index, dict partitions, object key, Venue venue, InstrumentId instrument_id, StrategyId strategy_id) except *
+    cdef void _index_order(self, set index, dict partitions, Order order) except *
+    cdef void _deindex_order(self, set index, dict partitions, Order order) except *
+    cdef void _index_position(self, set index, dict partitions, Position position) except *
+    cdef void _deindex_position(self, set index, dict partitions, Position position) except *
+    cdef set _query_index(self, set index, dict partitions, Venue venue, InstrumentId instrument_id, StrategyId strategy_id)
 
     cpdef Instrument load_instrument(self, InstrumentId instrument_id)
     cpdef Account load_account(self, AccountId account_id)
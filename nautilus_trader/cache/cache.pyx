@@ -25,8 +25,12 @@ from nautilus_trader.config import CacheConfig
 from libc.stdint cimport uint64_t
 
 from nautilus_trader.accounting.accounts.base cimport Account
-from nautilus_trader.accounting.calculators cimport ExchangeRateCalculator
+from nautilus_trader.accounting.calculators cimport ExchangeRateGraph
 from nautilus_trader.cache.base cimport CacheFacade
+from nautilus_trader.cache.buffers cimport BarBuffer
+from nautilus_trader.cache.buffers cimport ColumnarBuffer
+from nautilus_trader.cache.buffers cimport QuoteTickBuffer
+from nautilus_trader.cache.buffers cimport TradeTickBuffer
 from nautilus_trader.common.logging cimport LogColor
 from nautilus_trader.common.logging cimport Logger
 from nautilus_trader.common.logging cimport LoggerAdapter
@@ -55,6 +59,27 @@ from nautilus_trader.model.orders.base cimport Order
 from nautilus_trader.trading.strategy cimport Strategy
 
 
+cdef set _EMPTY_SET = set()
+
+
+cdef inline tuple _partition_keys(
+    Venue venue,
+    InstrumentId instrument_id,
+    StrategyId strategy_id,
+):
+    # Every (venue, instrument ID, strategy ID) filter combination an entry
+    # matches, excluding the unfiltered case which is the index set itself
+    return (
+        (venue, None, None),
+        (None, instrument_id, None),
+        (None, None, strategy_id),
+        (venue, instrument_id, None),
+        (venue, None, strategy_id),
+        (None, instrument_id, strategy_id),
+        (venue, instrument_id, strategy_id),
+    )
+
+
 cdef class Cache(CacheFacade):
     """
     Provides a common object cache for market and execution related data.
@@ -86,19 +111,20 @@ cdef class Cache(CacheFacade):
 
         self._database = database
         self._log = LoggerAdapter(component_name=type(self).__name__, logger=logger)
-        self._xrate_calculator = ExchangeRateCalculator()
 
         # Configuration
         self.tick_capacity = config.tick_capacity
         self.bar_capacity = config.bar_capacity
+        self.columnar = config.columnar
 
         # Caches
-        self._xrate_symbols = {}               # type: dict[InstrumentId, str]
+        self._xrate_graphs = {}                # type: dict[Venue, ExchangeRateGraph]
+        self._xrate_symbols = {}               # type: dict[InstrumentId, tuple[str, str]]
         self._tickers = {}                     # type: dict[InstrumentId, deque[Ticker]]
-        self._quote_ticks = {}                 # type: dict[InstrumentId, deque[QuoteTick]]
-        self._trade_ticks = {}                 # type: dict[InstrumentId, deque[TradeTick]]
+        self._quote_ticks = {}                 # type: dict[InstrumentId, deque[QuoteTick] | QuoteTickBuffer]
+        self._trade_ticks = {}                 # type: dict[InstrumentId, deque[TradeTick] | TradeTickBuffer]
         self._order_books = {}                 # type: dict[InstrumentId, OrderBook]
-        self._bars = {}                        # type: dict[BarType, deque[Bar]]
+        self._bars = {}                        # type: dict[BarType, deque[Bar] | BarBuffer]
         self._currencies = {}                  # type: dict[str, Currency]
         self._instruments = {}                 # type: dict[InstrumentId, Instrument]
         self._accounts = {}                    # type: dict[AccountId, Account]
@@ -128,6 +154,16 @@ cdef class Cache(CacheFacade):
         self._index_positions_closed = set()   # type: set[PositionId]
         self._index_strategies = set()         # type: set[StrategyId]
 
+        # Index partitions: the ID sets above split by every combination of
+        # (venue, instrument ID, strategy ID) query filter
+        self._index_orders_partitions = {}             # type: dict[tuple, set[ClientOrderId]]
+        self._index_orders_open_partitions = {}        # type: dict[tuple, set[ClientOrderId]]
+        self._index_orders_closed_partitions = {}      # type: dict[tuple, set[ClientOrderId]]
+        self._index_orders_inflight_partitions = {}    # type: dict[tuple, set[ClientOrderId]]
+        self._index_positions_partitions = {}          # type: dict[tuple, set[PositionId]]
+        self._index_positions_open_partitions = {}     # type: dict[tuple, set[PositionId]]
+        self._index_positions_closed_partitions = {}   # type: dict[tuple, set[PositionId]]
+
         self._log.info("INITIALIZED.")
 
 # -- COMMANDS -------------------------------------------------------------------------------------
@@ -579,6 +615,13 @@ cdef class Cache(CacheFacade):
         self._index_positions_open.clear()
         self._index_positions_closed.clear()
         self._index_strategies.clear()
+        self._index_orders_partitions.clear()
+        self._index_orders_open_partitions.clear()
+        self._index_orders_closed_partitions.clear()
+        self._index_orders_inflight_partitions.clear()
+        self._index_positions_partitions.clear()
+        self._index_positions_open_partitions.clear()
+        self._index_positions_closed_partitions.clear()
 
         self._log.debug(f"Cleared index.")
 
@@ -590,6 +633,7 @@ cdef class Cache(CacheFacade):
         """
         self._log.info("Resetting cache...")
 
+        self._xrate_graphs.clear()
         self._xrate_symbols.clear()
         self._instruments.clear()
         self._tickers.clear()
@@ -617,6 +661,14 @@ cdef class Cache(CacheFacade):
 
         self._log.info("Execution database flushed.")
 
+    cpdef void dispose(self) except *:
+        """
+        Dispose of the cache, completing any pending database writes.
+
+        """
+        if self._database is not None:
+            self._database.dispose()
+
     cdef void _build_index_venue_account(self) except *:
         cdef AccountId account_id
         for account_id in self._accounts.keys():
@@ -656,19 +708,19 @@ cdef class Cache(CacheFacade):
             self._index_strategy_orders[order.strategy_id].add(client_order_id)
 
             # 7: Build _index_orders -> {ClientOrderId}
-            self._index_orders.add(client_order_id)
+            self._index_order(self._index_orders, self._index_orders_partitions, order)
 
             # 8: Build _index_orders_open -> {ClientOrderId}
             if order.is_open_c():
-                self._index_orders_open.add(client_order_id)
+                self._index_order(self._index_orders_open, self._index_orders_open_partitions, order)
 
             # 9: Build _index_orders_closed -> {ClientOrderId}
             if order.is_closed_c():
-                self._index_orders_closed.add(client_order_id)
+                self._index_order(self._index_orders_closed, self._index_orders_closed_partitions, order)
 
             # 10: Build _index_orders_inflight -> {ClientOrderId}
             if order.is_inflight_c():
-                self._index_orders_inflight.add(client_order_id)
+                self._index_order(self._index_orders_inflight, self._index_orders_inflight_partitions, order)
 
             # 11: Build _index_strategies -> {StrategyId}
             self._index_strategies.add(order.strategy_id)
@@ -705,18 +757,33 @@ cdef class Cache(CacheFacade):
             self._index_strategy_positions[position.strategy_id].add(position.id)
 
             # 6: Build _index_positions -> {PositionId}
-            self._index_positions.add(position_id)
+            self._index_position(self._index_positions, self._index_positions_partitions, position)
 
             # 7: Build _index_positions_open -> {PositionId}
             if position.is_open_c():
-                self._index_positions_open.add(position_id)
+                self._index_position(self._index_positions_open, self._index_positions_open_partitions, position)
             # 8: Build _index_positions_closed -> {PositionId}
             elif position.is_closed_c():
-                self._index_positions_closed.add(position_id)
+                self._index_position(self._index_positions_closed, self._index_positions_closed_partitions, position)
 
             # 9: Build _index_strategies -> {StrategyId}
             self._index_strategies.add(position.strategy_id)
 
+    cdef object _new_quote_tick_history(self, InstrumentId instrument_id):
+        if self.columnar:
+            return QuoteTickBuffer(instrument_id, self.tick_capacity)
+        return deque(maxlen=self.tick_capacity)
+
+    cdef object _new_trade_tick_history(self, InstrumentId instrument_id):
+        if self.columnar:
+            return TradeTickBuffer(instrument_id, self.tick_capacity)
+        return deque(maxlen=self.tick_capacity)
+
+    cdef object _new_bar_history(self, BarType bar_type):
+        if self.columnar:
+            return BarBuffer(bar_type, self.bar_capacity)
+        return deque(maxlen=self.bar_capacity)
+
     cpdef void load_strategy(self, Strategy strategy) except *:
         """
         Load the state dictionary for the given strategy.
@@ -872,11 +939,15 @@ cdef class Cache(CacheFacade):
 
         if not ticks:
             # The instrument_id was not registered
-            ticks = deque(maxlen=self.tick_capacity)
+            ticks = self._new_quote_tick_history(instrument_id)
             self._quote_ticks[instrument_id] = ticks
 
         ticks.appendleft(tick)
 
+        cdef tuple xrate_pair = self._xrate_symbols.get(instrument_id)
+        if xrate_pair is not None:
+            self._update_xrate_graph(instrument_id, xrate_pair, tick)
+
     cpdef void add_trade_tick(self, TradeTick tick) except *:
         """
         Add the given trade tick to the cache.
@@ -894,7 +965,7 @@ cdef class Cache(CacheFacade):
 
         if not ticks:
             # The instrument_id was not registered
-            ticks = deque(maxlen=self.tick_capacity)
+            ticks = self._new_trade_tick_history(instrument_id)
             self._trade_ticks[instrument_id] = ticks
 
         ticks.appendleft(tick)
@@ -915,7 +986,7 @@ cdef class Cache(CacheFacade):
 
         if not bars:
             # The bar type was not registered
-            bars = deque(maxlen=self.bar_capacity)
+            bars = self._new_bar_history(bar.type)
             self._bars[bar.type] = bars
 
         bars.appendleft(bar)
@@ -945,7 +1016,7 @@ cdef class Cache(CacheFacade):
 
         if not cached_ticks:
             # The instrument_id was not registered
-            cached_ticks = deque(maxlen=self.tick_capacity)
+            cached_ticks = self._new_quote_tick_history(instrument_id)
             self._quote_ticks[instrument_id] = cached_ticks
         elif len(cached_ticks) > 0:
             # Currently the simple solution for multiple consumers requesting
@@ -957,6 +1028,10 @@ cdef class Cache(CacheFacade):
         for tick in ticks:
             cached_ticks.appendleft(tick)
 
+        cdef tuple xrate_pair = self._xrate_symbols.get(instrument_id)
+        if xrate_pair is not None:
+            self._update_xrate_graph(instrument_id, xrate_pair, cached_ticks[0])
+
     cpdef void add_trade_ticks(self, list ticks) except *:
         """
         Add the given trade ticks to the cache.
@@ -982,7 +1057,7 @@ cdef class Cache(CacheFacade):
 
         if not cached_ticks:
             # The instrument_id was not registered
-            cached_ticks = deque(maxlen=self.tick_capacity)
+            cached_ticks = self._new_trade_tick_history(instrument_id)
             self._trade_ticks[instrument_id] = cached_ticks
         elif len(cached_ticks) > 0:
             # Currently the simple solution for multiple consumers requesting
@@ -1019,7 +1094,7 @@ cdef class Cache(CacheFacade):
 
         if not cached_bars:
             # The instrument_id was not registered
-            cached_bars = deque(maxlen=self.bar_capacity)
+            cached_bars = self._new_bar_history(bar_type)
             self._bars[bar_type] = cached_bars
         elif len(cached_bars) > 0:
             # Currently the simple solution for multiple consumers requesting
@@ -1064,10 +1139,13 @@ cdef class Cache(CacheFacade):
         """
         self._instruments[instrument.id] = instrument
 
+        cdef tuple xrate_pair
         if isinstance(instrument, (CurrencyPair, CryptoPerpetual)):
-            self._xrate_symbols[instrument.id] = (
-                f"{instrument.base_currency}/{instrument.quote_currency}"
-            )
+            xrate_pair = (instrument.base_currency.code, instrument.quote_currency.code)
+            self._xrate_symbols[instrument.id] = xrate_pair
+            ticks = self._quote_ticks.get(instrument.id)
+            if ticks:
+                self._update_xrate_graph(instrument.id, xrate_pair, ticks[0])
 
         self._log.debug(f"Added instrument {instrument.id}.")
 
@@ -1128,7 +1206,7 @@ cdef class Cache(CacheFacade):
         Condition.not_in(order.client_order_id, self._index_order_strategy, "order.client_order_id", "_index_order_strategy")
 
         self._orders[order.client_order_id] = order
-        self._index_orders.add(order.client_order_id)
+        self._index_order(self._index_orders, self._index_orders_partitions, order)
         self._index_order_strategy[order.client_order_id] = order.strategy_id
 
         # Index: Venue -> Set[ClientOrderId]
@@ -1244,8 +1322,8 @@ cdef class Cache(CacheFacade):
             Condition.not_in(position.id, self._index_positions_open, "position.id", "_index_positions_open")
 
         self._positions[position.id] = position
-        self._index_positions.add(position.id)
-        self._index_positions_open.add(position.id)
+        self._index_position(self._index_positions, self._index_positions_partitions, position)
+        self._index_position(self._index_positions_open, self._index_positions_open_partitions, position)
 
         self.add_position_id(
             position.id,
@@ -1335,15 +1413,15 @@ cdef class Cache(CacheFacade):
             self._index_order_ids[order.venue_order_id] = order.client_order_id
 
         if order.is_inflight_c():
-            self._index_orders_inflight.add(order.client_order_id)
+            self._index_order(self._index_orders_inflight, self._index_orders_inflight_partitions, order)
         elif order.is_open_c():
-            self._index_orders_inflight.discard(order.client_order_id)
-            self._index_orders_closed.discard(order.client_order_id)
-            self._index_orders_open.add(order.client_order_id)
+            self._deindex_order(self._index_orders_inflight, self._index_orders_inflight_partitions, order)
+            self._deindex_order(self._index_orders_closed, self._index_orders_closed_partitions, order)
+            self._index_order(self._index_orders_open, self._index_orders_open_partitions, order)
         elif order.is_closed_c():
-            self._index_orders_inflight.discard(order.client_order_id)
-            self._index_orders_open.discard(order.client_order_id)
-            self._index_orders_closed.add(order.client_order_id)
+            self._deindex_order(self._index_orders_inflight, self._index_orders_inflight_partitions, order)
+            self._deindex_order(self._index_orders_open, self._index_orders_open_partitions, order)
+            self._index_order(self._index_orders_closed, self._index_orders_closed_partitions, order)
 
         # Update database
         if self._database is not None:
@@ -1362,11 +1440,11 @@ cdef class Cache(CacheFacade):
         Condition.not_none(position, "position")
 
         if position.is_open_c():
-            self._index_positions_open.add(position.id)
-            self._index_positions_closed.discard(position.id)
+            self._index_position(self._index_positions_open, self._index_positions_open_partitions, position)
+            self._deindex_position(self._index_positions_closed, self._index_positions_closed_partitions, position)
         elif position.is_closed_c():
-            self._index_positions_closed.add(position.id)
-            self._index_positions_open.discard(position.id)
+            self._index_position(self._index_positions_closed, self._index_positions_closed_partitions, position)
+            self._deindex_position(self._index_positions_open, self._index_positions_open_partitions, position)
 
         # Update database
         if self._database is not None:
@@ -1494,6 +1572,102 @@ cdef class Cache(CacheFacade):
 
         return list(self._bars.get(bar_type, []))
 
+    cpdef dict quote_tick_arrays(self, InstrumentId instrument_id, int count = -1):
+        """
+        Return array views of the most recent quote ticks for the given instrument ID.
+
+        Only available when the cache is configured as `columnar`. The arrays
+        hold raw fixed-point values in chronological order (oldest first), and
+        share memory with the cache so are only valid until the next tick
+        is added.
+
+        Parameters
+        ----------
+        instrument_id : InstrumentId
+            The instrument ID for the quote ticks.
+        count : int, optional
+            The number of most recent quote ticks to return. If negative then all
+            cached quote ticks are returned.
+
+        Returns
+        -------
+        dict[str, np.ndarray] or ``None``
+            If the cache is not columnar or holds no quote ticks for the instrument ID
+            then returns ``None``.
+
+        """
+        Condition.not_none(instrument_id, "instrument_id")
+
+        cdef ColumnarBuffer buffer = self._quote_ticks.get(instrument_id) if self.columnar else None
+        if buffer is None:
+            return None
+
+        return buffer.arrays(count)
+
+    cpdef dict trade_tick_arrays(self, InstrumentId instrument_id, int count = -1):
+        """
+        Return array views of the most recent trade ticks for the given instrument ID.
+
+        Only available when the cache is configured as `columnar`. The arrays
+        hold raw fixed-point values in chronological order (oldest first), and
+        share memory with the cache so are only valid until the next tick
+        is added.
+
+        Parameters
+        ----------
+        instrument_id : InstrumentId
+            The instrument ID for the trade ticks.
+        count : int, optional
+            The number of most recent trade ticks to return. If negative then all
+            cached trade ticks are returned.
+
+        Returns
+        -------
+        dict[str, np.ndarray] or ``None``
+            If the cache is not columnar or holds no trade ticks for the instrument ID
+            then returns ``None``.
+
+        """
+        Condition.not_none(instrument_id, "instrument_id")
+
+        cdef ColumnarBuffer buffer = self._trade_ticks.get(instrument_id) if self.columnar else None
+        if buffer is None:
+            return None
+
+        return buffer.arrays(count)
+
+    cpdef dict bar_arrays(self, BarType bar_type, int count = -1):
+        """
+        Return array views of the most recent bars for the given bar type.
+
+        Only available when the cache is configured as `columnar`. The arrays
+        hold raw fixed-point values in chronological order (oldest first), and
+        share memory with the cache so are only valid until the next bar
+        is added.
+
+        Parameters
+        ----------
+        bar_type : BarType
+            The bar type for the bars.
+        count : int, optional
+            The number of most recent bars to return. If negative then all
+            cached bars are returned.
+
+        Returns
+        -------
+        dict[str, np.ndarray] or ``None``
+            If the cache is not columnar or holds no bars for the bar type
+            then returns ``None``.
+
+        """
+        Condition.not_none(bar_type, "bar_type")
+
+        cdef ColumnarBuffer buffer = self._bars.get(bar_type) if self.columnar else None
+        if buffer is None:
+            return None
+
+        return buffer.arrays(count)
+
     cpdef Price price(self, InstrumentId instrument_id, PriceType price_type):
         """
         Return the price for the given instrument ID and price type.
@@ -1895,44 +2069,28 @@ cdef class Cache(CacheFacade):
         """
         Condition.not_none(from_currency, "from_currency")
         Condition.not_none(to_currency, "to_currency")
+        Condition.true(price_type != PriceType.LAST, "price_type was invalid (LAST)")
 
         if from_currency == to_currency:
             return Decimal(1)  # No conversion necessary
 
-        cdef tuple quotes = self._build_quote_table(venue)
+        cdef ExchangeRateGraph graph = self._xrate_graphs.get(venue)
+        if graph is None:
+            return 0.0  # No quotes for venue
 
-        return self._xrate_calculator.get_rate(
+        return graph.get_rate(
             from_currency=from_currency,
             to_currency=to_currency,
             price_type=price_type,
-            bid_quotes=quotes[0],  # Bid
-            ask_quotes=quotes[1],  # Ask
         )
 
-    cdef tuple _build_quote_table(self, Venue venue):
-        cdef dict bid_quotes = {}
-        cdef dict ask_quotes = {}
-
-        cdef:
-            InstrumentId instrument_id
-            str base_quote
-            Price bid
-            Price ask
-        for instrument_id, base_quote in self._xrate_symbols.items():
-            if instrument_id.venue != venue:
-                continue
-
-            ticks = self._quote_ticks.get(instrument_id)
-            if not ticks:
-                # No quotes for instrument_id
-                continue
-
-            bid = ticks[0].bid
-            ask = ticks[0].ask
-            bid_quotes[base_quote] = bid.as_f64_c()
-            ask_quotes[base_quote] = ask.as_f64_c()
+    cdef void _update_xrate_graph(self, InstrumentId instrument_id, tuple pair, QuoteTick tick) except *:
+        cdef ExchangeRateGraph graph = self._xrate_graphs.get(instrument_id.venue)
+        if graph is None:
+            graph = ExchangeRateGraph()
+            self._xrate_graphs[instrument_id.venue] = graph
 
-        return bid_quotes, ask_quotes
+        graph.update(pair[0], pair[1], tick.bid.as_f64_c(), tick.ask.as_f64_c())
 
 # -- INSTRUMENT QUERIES ---------------------------------------------------------------------------
 
@@ -2058,53 +2216,110 @@ cdef class Cache(CacheFacade):
 
 # -- IDENTIFIER QUERIES ---------------------------------------------------------------------------
 
-    cdef set _build_ord_query_filter_set(
+    cdef void _index_add(
         self,
+        set index,
+        dict partitions,
+        object key,
         Venue venue,
         InstrumentId instrument_id,
         StrategyId strategy_id,
-    ):
-        cdef set query = None
-
-        # Build potential query set
-        if venue is not None:
-            query = self._index_venue_orders.get(venue, set())
-        if instrument_id is not None:
-            if query is None:
-                query = self._index_instrument_orders.get(instrument_id, set())
-            else:
-                query = query.intersection(self._index_instrument_orders.get(instrument_id, set()))
-        if strategy_id is not None:
-            if query is None:
-                query = self._index_strategy_orders.get(strategy_id, set())
+    ) except *:
+        if key in index:
+            return  # Already indexed
+
+        index.add(key)
+
+        cdef tuple partition_key
+        cdef set partition
+        for partition_key in _partition_keys(venue, instrument_id, strategy_id):
+            partition = partitions.get(partition_key)
+            if partition is None:
+                partitions[partition_key] = {key}
             else:
-                query = query.intersection(self._index_strategy_orders.get(strategy_id, set()))
+                partition.add(key)
+
+    cdef void _index_discard(
+        self,
+        set index,
+        dict partitions,
+        object key,
+        Venue venue,
+        InstrumentId instrument_id,
+        StrategyId strategy_id,
+    ) except *:
+        if key not in index:
+            return  # Not indexed
+
+        index.discard(key)
+
+        cdef tuple partition_key
+        cdef set partition
+        for partition_key in _partition_keys(venue, instrument_id, strategy_id):
+            partition = partitions.get(partition_key)
+            if partition is None:
+                continue
+            partition.discard(key)
+            if not partition:
+                del partitions[partition_key]
+
+    cdef void _index_order(self, set index, dict partitions, Order order) except *:
+        self._index_add(
+            index,
+            partitions,
+            order.client_order_id,
+            order.instrument_id.venue,
+            order.instrument_id,
+            order.strategy_id,
+        )
+
+    cdef void _deindex_order(self, set index, dict partitions, Order order) except *:
+        self._index_discard(
+            index,
+            partitions,
+            order.client_order_id,
+            order.instrument_id.venue,
+            order.instrument_id,
+            order.strategy_id,
+        )
+
+    cdef void _index_position(self, set index, dict partitions, Position position) except *:
+        self._index_add(
+            index,
+            partitions,
+            position.id,
+            position.instrument_id.venue,
+            position.instrument_id,
+            position.strategy_id,
+        )
 
-        return query
+    cdef void _deindex_position(self, set index, dict partitions, Position position) except *:
+        self._index_discard(
+            index,
+            partitions,
+            position.id,
+            position.instrument_id.venue,
+            position.instrument_id,
+            position.strategy_id,
+        )
 
-    cdef set _build_pos_query_filter_set(
+    cdef set _query_index(
         self,
+        set index,
+        dict partitions,
         Venue venue,
         InstrumentId instrument_id,
         StrategyId strategy_id,
     ):
-        cdef set query = None
-
-        # Build potential query set
-        if venue is not None:
-            query = self._index_venue_positions.get(venue, set())
-        if instrument_id is not None:
-            if query is None:
-                query = self._index_instrument_positions.get(instrument_id, set())
-            else:
-                query = query.intersection(self._index_instrument_positions.get(instrument_id, set()))
-        if strategy_id is not None:
-            if query is None:
-                query = self._index_strategy_positions.get(strategy_id, set())
-            else:
-                query = query.intersection(self._index_strategy_positions.get(strategy_id, set()))
+        # Returns the live index or partition set (callers must not mutate it)
+        if venue is None and instrument_id is None and strategy_id is None:
+            return index
 
-        return query
+        cdef set partition = partitions.get((venue, instrument_id, strategy_id))
+        if partition is None:
+            return _EMPTY_SET
+
+        return partition
 
     cpdef set client_order_ids(
         self,
@@ -2129,12 +2344,16 @@ cdef class Cache(CacheFacade):
         set[ClientOrderId]
 
         """
-        cdef set query = self._build_ord_query_filter_set(venue, instrument_id, strategy_id)
-
-        if query is None:
+        if venue is None and instrument_id is None and strategy_id is None:
             return self._index_orders
-        else:
-            return self._index_orders.intersection(query)
+
+        return set(self._query_index(
+            self._index_orders,
+            self._index_orders_partitions,
+            venue,
+            instrument_id,
+            strategy_id,
+        ))
 
     cpdef set client_order_ids_inflight(
         self,
@@ -2159,12 +2378,16 @@ cdef class Cache(CacheFacade):
         set[ClientOrderId]
 
         """
-        cdef set query = self._build_ord_query_filter_set(venue, instrument_id, strategy_id)
-
-        if query is None:
+        if venue is None and instrument_id is None and strategy_id is None:
             return self._index_orders_inflight
-        else:
-            return self._index_orders_inflight.intersection(query)
+
+        return set(self._query_index(
+            self._index_orders_inflight,
+            self._index_orders_inflight_partitions,
+            venue,
+            instrument_id,
+            strategy_id,
+        ))
 
     cpdef set client_order_ids_open(
         self,
@@ -2189,12 +2412,16 @@ cdef class Cache(CacheFacade):
         set[ClientOrderId]
 
         """
-        cdef set query = self._build_ord_query_filter_set(venue, instrument_id, strategy_id)
-
-        if query is None:
+        if venue is None and instrument_id is None and strategy_id is None:
             return self._index_orders_open
-        else:
-            return self._index_orders_open.intersection(query)
+
+        return set(self._query_index(
+            self._index_orders_open,
+            self._index_orders_open_partitions,
+            venue,
+            instrument_id,
+            strategy_id,
+        ))
 
     cpdef set client_order_ids_closed(
         self,
@@ -2219,12 +2446,16 @@ cdef class Cache(CacheFacade):
         set[ClientOrderId]
 
         """
-        cdef set query = self._build_ord_query_filter_set(venue, instrument_id, strategy_id)
-
-        if query is None:
+        if venue is None and instrument_id is None and strategy_id is None:
             return self._index_orders_closed
-        else:
-            return self._index_orders_closed.intersection(query)
+
+        return set(self._query_index(
+            self._index_orders_closed,
+            self._index_orders_closed_partitions,
+            venue,
+            instrument_id,
+            strategy_id,
+        ))
 
     cpdef set position_ids(
         self,
@@ -2249,12 +2480,16 @@ cdef class Cache(CacheFacade):
         Set[PositionId]
 
         """
-        cdef set query = self._build_pos_query_filter_set(venue, instrument_id, strategy_id)
-
-        if query is None:
+        if venue is None and instrument_id is None and strategy_id is None:
             return self._index_positions
-        else:
-            return self._index_positions.intersection(query)
+
+        return set(self._query_index(
+            self._index_positions,
+            self._index_positions_partitions,
+            venue,
+            instrument_id,
+            strategy_id,
+        ))
 
     cpdef set position_open_ids(
         self,
@@ -2279,12 +2514,16 @@ cdef class Cache(CacheFacade):
         Set[PositionId]
 
         """
-        cdef set query = self._build_pos_query_filter_set(venue, instrument_id, strategy_id)
-
-        if query is None:
+        if venue is None and instrument_id is None and strategy_id is None:
             return self._index_positions_open
-        else:
-            return self._index_positions_open.intersection(query)
+
+        return set(self._query_index(
+            self._index_positions_open,
+            self._index_positions_open_partitions,
+            venue,
+            instrument_id,
+            strategy_id,
+        ))
 
     cpdef set position_closed_ids(
         self,
@@ -2309,12 +2548,16 @@ cdef class Cache(CacheFacade):
         Set[PositionId]
 
         """
-        cdef set query = self._build_pos_query_filter_set(venue, instrument_id, strategy_id)
-
-        if query is None:
+        if venue is None and instrument_id is None and strategy_id is None:
             return self._index_positions_closed
-        else:
-            return self._index_positions_closed.intersection(query)
+
+        return set(self._query_index(
+            self._index_positions_closed,
+            self._index_positions_closed_partitions,
+            venue,
+            instrument_id,
+            strategy_id,
+        ))
 
     cpdef set strategy_ids(self):
         """
@@ -2399,7 +2642,13 @@ cdef class Cache(CacheFacade):
         list[Order]
 
         """
-        cdef set client_order_ids = self.client_order_ids(venue, instrument_id, strategy_id)
+        cdef set client_order_ids = self._query_index(
+            self._index_orders,
+            self._index_orders_partitions,
+            venue,
+            instrument_id,
+            strategy_id,
+        )
 
         try:
             return [self._orders[client_order_id] for client_order_id in client_order_ids]
@@ -2451,7 +2700,13 @@ cdef class Cache(CacheFacade):
         list[Order]
 
         """
-        cdef set client_order_ids = self.client_order_ids_open(venue, instrument_id, strategy_id)
+        cdef set client_order_ids = self._query_index(
+            self._index_orders_open,
+            self._index_orders_open_partitions,
+            venue,
+            instrument_id,
+            strategy_id,
+        )
 
         try:
             return [self._orders[client_order_id] for client_order_id in client_order_ids]
@@ -2481,7 +2736,13 @@ cdef class Cache(CacheFacade):
         list[Order]
 
         """
-        cdef set client_order_ids = self.client_order_ids_closed(venue, instrument_id, strategy_id)
+        cdef set client_order_ids = self._query_index(
+            self._index_orders_closed,
+            self._index_orders_closed_partitions,
+            venue,
+            instrument_id,
+            strategy_id,
+        )
 
         try:
             return [self._orders[client_order_id] for client_order_id in client_order_ids]
@@ -2511,7 +2772,13 @@ cdef class Cache(CacheFacade):
         list[Order]
 
         """
-        cdef set client_order_ids = self.client_order_ids_inflight(venue, instrument_id, strategy_id)
+        cdef set client_order_ids = self._query_index(
+            self._index_orders_inflight,
+            self._index_orders_inflight_partitions,
+            venue,
+            instrument_id,
+            strategy_id,
+        )
 
         try:
             return [self._orders[client_order_id] for client_order_id in client_order_ids]
@@ -2627,7 +2894,13 @@ cdef class Cache(CacheFacade):
         list[Position]
 
         """
-        cdef set position_ids = self.position_ids(venue, instrument_id, strategy_id)
+        cdef set position_ids = self._query_index(
+            self._index_positions,
+            self._index_positions_partitions,
+            venue,
+            instrument_id,
+            strategy_id,
+        )
 
         try:
             return [self._positions[position_id] for position_id in position_ids]
@@ -2657,7 +2930,13 @@ cdef class Cache(CacheFacade):
         list[Position]
 
         """
-        cdef set position_ids = self.position_open_ids(venue, instrument_id, strategy_id)
+        cdef set position_ids = self._query_index(
+            self._index_positions_open,
+            self._index_positions_open_partitions,
+            venue,
+            instrument_id,
+            strategy_id,
+        )
 
         try:
             return [self._positions[position_id] for position_id in position_ids]
@@ -2687,7 +2966,13 @@ cdef class Cache(CacheFacade):
         list[Position]
 
         """
-        cdef set position_ids = self.position_closed_ids(venue, instrument_id, strategy_id)
+        cdef set position_ids = self._query_index(
+            self._index_positions_closed,
+            self._index_positions_closed_partitions,
+            venue,
+            instrument_id,
+            strategy_id,
+        )
 
         try:
             return [self._positions[position_id] for position_id in position_ids]
@@ -2789,7 +3074,13 @@ cdef class Cache(CacheFacade):
         int
 
         """
-        return len(self.client_order_ids_open(venue, instrument_id, strategy_id))
+        return len(self._query_index(
+            self._index_orders_open,
+            self._index_orders_open_partitions,
+            venue,
+            instrument_id,
+            strategy_id,
+        ))
 
     cpdef int orders_closed_count(
         self,
@@ -2814,7 +3105,13 @@ cdef class Cache(CacheFacade):
         int
 
         """
-        return len(self.client_order_ids_closed(venue, instrument_id, strategy_id))
+        return len(self._query_index(
+            self._index_orders_closed,
+            self._index_orders_closed_partitions,
+            venue,
+            instrument_id,
+            strategy_id,
+        ))
 
     cpdef int orders_inflight_count(
         self,
@@ -2839,7 +3136,13 @@ cdef class Cache(CacheFacade):
         int
 
         """
-        return len(self.client_order_ids_inflight(venue, instrument_id, strategy_id))
+        return len(self._query_index(
+            self._index_orders_inflight,
+            self._index_orders_inflight_partitions,
+            venue,
+            instrument_id,
+            strategy_id,
+        ))
 
     cpdef int orders_total_count(
         self,
@@ -2864,7 +3167,13 @@ cdef class Cache(CacheFacade):
         int
 
         """
-        return len(self.client_order_ids(venue, instrument_id, strategy_id))
+        return len(self._query_index(
+            self._index_orders,
+            self._index_orders_partitions,
+            venue,
+            instrument_id,
+            strategy_id,
+        ))
 
     cpdef bint position_exists(self, PositionId position_id) except *:
         """
@@ -2945,7 +3254,13 @@ cdef class Cache(CacheFacade):
         int
 
         """
-        return len(self.position_open_ids(venue, instrument_id, strategy_id))
+        return len(self._query_index(
+            self._index_positions_open,
+            self._index_positions_open_partitions,
+            venue,
+            instrument_id,
+            strategy_id,
+        ))
 
     cpdef int positions_closed_count(
         self,
@@ -2970,7 +3285,13 @@ cdef class Cache(CacheFacade):
         int
 
         """
-        return len(self.position_closed_ids(venue, instrument_id, strategy_id))
+        return len(self._query_index(
+            self._index_positions_closed,
+            self._index_positions_closed_partitions,
+            venue,
+            instrument_id,
+            strategy_id,
+        ))
 
     cpdef int positions_total_count(
         self,
@@ -2995,7 +3316,13 @@ cdef class Cache(CacheFacade):
         int
 
         """
-        return len(self.position_ids(venue, instrument_id, strategy_id))
+        return len(self._query_index(
+            self._index_positions,
+            self._index_positions_partitions,
+            venue,
+            instrument_id,
+            strategy_id,
+        ))
 
 # -- STRATEGY QUERIES -----------------------------------------------------------------------------
 
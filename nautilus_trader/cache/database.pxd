@@ -54,3 +54,5 @@ cdef class CacheDatabase:
     cpdef void update_order(self, Order order) except *
     cpdef void update_position(self, Position position) except *
     cpdef void update_strategy(self, Strategy strategy) except *
+
+    cpdef void dispose(self) except *
@@ -132,3 +132,14 @@ cdef class CacheDatabase:
     cpdef void update_strategy(self, Strategy strategy) except *:
         """Abstract method (implement in subclass)."""
         raise NotImplementedError("method must be implemented in the subclass")  # pragma: no cover
+
+    cpdef void dispose(self) except *:
+        """
+        Dispose of the database, completing any pending writes and releasing
+        resources.
+
+        The base implementation does nothing, override in a subclass which
+        holds resources.
+
+        """
+        pass
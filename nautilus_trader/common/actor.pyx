@@ -71,6 +71,14 @@ from nautilus_trader.model.instruments.base cimport Instrument
 from nautilus_trader.model.orderbook.data cimport OrderBookData
 from nautilus_trader.model.orderbook.data cimport OrderBookSnapshot
 from nautilus_trader.msgbus.bus cimport MessageBus
+from nautilus_trader.msgbus.topics cimport get_bars_topic
+from nautilus_trader.msgbus.topics cimport get_book_deltas_topic
+from nautilus_trader.msgbus.topics cimport get_book_snapshots_topic
+from nautilus_trader.msgbus.topics cimport get_close_price_topic
+from nautilus_trader.msgbus.topics cimport get_instrument_topic
+from nautilus_trader.msgbus.topics cimport get_quotes_topic
+from nautilus_trader.msgbus.topics cimport get_tickers_topic
+from nautilus_trader.msgbus.topics cimport get_trades_topic
 
 
 cdef class Actor(Component):
@@ -618,9 +626,7 @@ cdef class Actor(Component):
         Condition.true(self.trader_id is not None, "The actor has not been registered")
 
         self._msgbus.subscribe(
-            topic=f"data.instrument"
-                  f".{instrument_id.venue}"
-                  f".{instrument_id.symbol}",
+            topic=get_instrument_topic(instrument_id),
             handler=self.handle_instrument,
         )
 
@@ -696,9 +702,7 @@ cdef class Actor(Component):
         Condition.true(self.trader_id is not None, "The actor has not been registered")
 
         self._msgbus.subscribe(
-            topic=f"data.book.deltas"
-                  f".{instrument_id.venue}"
-                  f".{instrument_id.symbol}",
+            topic=get_book_deltas_topic(instrument_id),
             handler=self.handle_order_book_delta,
         )
 
@@ -770,10 +774,7 @@ cdef class Actor(Component):
             return
 
         self._msgbus.subscribe(
-            topic=f"data.book.snapshots"
-                  f".{instrument_id.venue}"
-                  f".{instrument_id.symbol}"
-                  f".{interval_ms}",
+            topic=get_book_snapshots_topic(instrument_id, interval_ms),
             handler=self.handle_order_book,
         )
 
@@ -810,9 +811,7 @@ cdef class Actor(Component):
         Condition.true(self.trader_id is not None, "The actor has not been registered")
 
         self._msgbus.subscribe(
-            topic=f"data.tickers"
-                  f".{instrument_id.venue}"
-                  f".{instrument_id.symbol}",
+            topic=get_tickers_topic(instrument_id),
             handler=self.handle_ticker,
         )
 
@@ -843,9 +842,7 @@ cdef class Actor(Component):
         Condition.true(self.trader_id is not None, "The actor has not been registered")
 
         self._msgbus.subscribe(
-            topic=f"data.quotes"
-                  f".{instrument_id.venue}"
-                  f".{instrument_id.symbol}",
+            topic=get_quotes_topic(instrument_id),
             handler=self.handle_quote_tick,
         )
 
@@ -876,9 +873,7 @@ cdef class Actor(Component):
         Condition.true(self.trader_id is not None, "The actor has not been registered")
 
         self._msgbus.subscribe(
-            topic=f"data.trades"
-                  f".{instrument_id.venue}"
-                  f".{instrument_id.symbol}",
+            topic=get_trades_topic(instrument_id),
             handler=self.handle_trade_tick,
         )
 
@@ -909,7 +904,7 @@ cdef class Actor(Component):
         Condition.true(self.trader_id is not None, "The actor has not been registered")
 
         self._msgbus.subscribe(
-            topic=f"data.bars.{bar_type}",
+            topic=get_bars_topic(bar_type),
             handler=self.handle_bar,
         )
 
@@ -992,7 +987,7 @@ cdef class Actor(Component):
         Condition.true(self.trader_id is not None, "The actor has not been registered")
 
         self._msgbus.subscribe(
-            topic=f"data.venue.close_price.{instrument_id.to_str()}",
+            topic=get_close_price_topic(instrument_id),
             handler=self.handle_instrument_close_price,
         )
 
@@ -1088,9 +1083,7 @@ cdef class Actor(Component):
         Condition.true(self.trader_id is not None, "The actor has not been registered")
 
         self._msgbus.unsubscribe(
-            topic=f"data.instrument"
-                  f".{instrument_id.venue}"
-                  f".{instrument_id.symbol}",
+            topic=get_instrument_topic(instrument_id),
             handler=self.handle_instrument,
         )
 
@@ -1121,9 +1114,7 @@ cdef class Actor(Component):
         Condition.true(self.trader_id is not None, "The actor has not been registered")
 
         self._msgbus.unsubscribe(
-            topic=f"data.book.deltas"
-                  f".{instrument_id.venue}"
-                  f".{instrument_id.symbol}",
+            topic=get_book_deltas_topic(instrument_id),
             handler=self.handle_order_book_delta,
         )
 
@@ -1163,10 +1154,7 @@ cdef class Actor(Component):
         Condition.true(self.trader_id is not None, "The actor has not been registered")
 
         self._msgbus.unsubscribe(
-            topic=f"data.book.snapshots"
-                  f".{instrument_id.venue}"
-                  f".{instrument_id.symbol}"
-                  f".{interval_ms}",
+            topic=get_book_snapshots_topic(instrument_id, interval_ms),
             handler=self.handle_order_book,
         )
 
@@ -1200,9 +1188,7 @@ cdef class Actor(Component):
         Condition.true(self.trader_id is not None, "The actor has not been registered")
 
         self._msgbus.unsubscribe(
-            topic=f"data.tickers"
-                  f".{instrument_id.venue}"
-                  f".{instrument_id.symbol}",
+            topic=get_tickers_topic(instrument_id),
             handler=self.handle_ticker,
         )
 
@@ -1233,9 +1219,7 @@ cdef class Actor(Component):
         Condition.true(self.trader_id is not None, "The actor has not been registered")
 
         self._msgbus.unsubscribe(
-            topic=f"data.quotes"
-                  f".{instrument_id.venue}"
-                  f".{instrument_id.symbol}",
+            topic=get_quotes_topic(instrument_id),
             handler=self.handle_quote_tick,
         )
 
@@ -1266,9 +1250,7 @@ cdef class Actor(Component):
         Condition.true(self.trader_id is not None, "The actor has not been registered")
 
         self._msgbus.unsubscribe(
-            topic=f"data.trades"
-                  f".{instrument_id.venue}"
-                  f".{instrument_id.symbol}",
+            topic=get_trades_topic(instrument_id),
             handler=self.handle_trade_tick,
         )
 
@@ -1299,7 +1281,7 @@ cdef class Actor(Component):
         Condition.true(self.trader_id is not None, "The actor has not been registered")
 
         self._msgbus.unsubscribe(
-            topic=f"data.bars.{bar_type}",
+            topic=get_bars_topic(bar_type),
             handler=self.handle_bar,
         )
 
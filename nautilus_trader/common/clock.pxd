@@ -25,6 +25,9 @@ from nautilus_trader.common.timer cimport TimeEvent
 from nautilus_trader.core.rust.common cimport CTestClock
 
 
+cdef class TestClockScheduler
+
+
 cdef class Clock:
     cdef dict _handlers
     cdef object _default_handler
@@ -70,10 +73,39 @@ cdef class Clock:
 
 cdef class TestClock(Clock):
     cdef CTestClock _mem
+    cdef TestClockScheduler _scheduler
+    cdef uint64_t _next_event_time_ns
+
+    cpdef void set_time(self, uint64_t to_time_ns) except *
+    cpdef uint64_t next_event_time_ns(self) except *
+    cpdef list advance_time(self, uint64_t to_time_ns)
+
+    cdef void _sync_time(self) except *
+    cdef void _timers_changed(self) except *
+
 
+cdef class TestClockScheduler:
+    cdef list _clocks
+    cdef bint _advancing
+
+    cdef readonly uint64_t time_ns
+    """The shared UNIX time (nanoseconds) of the registered clocks.\n\n:returns: `uint64_t`"""
+    cdef readonly uint64_t next_event_time_ns
+    """The earliest next time of all active timers (zero if none).\n\n:returns: `uint64_t`"""
+    cdef readonly int clock_advance_count
+    """The count of individual clock advances performed.\n\n:returns: `int`"""
+    cdef readonly int clock_sync_count
+    """The count of individual clock time syncs performed.\n\n:returns: `int`"""
+
+    cpdef list clocks(self)
+    cpdef void register(self, TestClock clock) except *
+    cpdef void deregister(self, TestClock clock) except *
     cpdef void set_time(self, uint64_t to_time_ns) except *
     cpdef list advance_time(self, uint64_t to_time_ns)
 
+    cdef void _update(self, TestClock clock) except *
+    cdef void _update_next_event_time(self) except *
+
 
 cdef class LiveClock(Clock):
     cdef object _loop
@@ -98,3 +130,35 @@ cdef class LiveClock(Clock):
         uint64_t start_time_ns,
         uint64_t stop_time_ns,
     )
+
+
+cdef class HeapLiveClock(LiveClock):
+    cdef list _heap
+    cdef uint64_t _seq
+    cdef int _stale_count
+    cdef object _lock
+    cdef object _wakeup
+    cdef object _thread
+    cdef object _handle
+    cdef uint64_t _handle_time_ns
+    cdef object _log
+
+    cdef readonly int wakeup_count
+    """The count of scheduler wakeups which raised events.\n\n:returns: `int`"""
+    cdef readonly int event_count
+    """The count of time events raised by the scheduler.\n\n:returns: `int`"""
+    cdef readonly int error_count
+    """The count of errors raised by handlers on the scheduler thread.\n\n:returns: `int`"""
+    cdef readonly object last_error
+    """The last error raised by a handler on the scheduler thread.\n\n:returns: `Exception` or ``None``"""
+
+    cpdef void register_logger(self, logger) except *
+    cpdef int heap_size(self) except *
+
+    cdef bint _is_scheduled(self, tuple entry) except *
+    cdef void _push(self, LiveTimer timer) except *
+    cdef void _compact(self) except *
+    cdef void _reschedule(self) except *
+    cdef list _pop_due(self, uint64_t now_ns)
+    cdef void _fire(self) except *
+    cdef void _on_error(self, str msg, ex) except *
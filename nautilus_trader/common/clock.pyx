@@ -14,6 +14,10 @@
 # -------------------------------------------------------------------------------------------------
 
 import asyncio
+import heapq
+import sys
+import threading
+import traceback
 from typing import Callable, List, Optional
 
 import cython
@@ -27,6 +31,7 @@ from cpython.object cimport PyObject
 from libc.stdint cimport uint64_t
 
 from nautilus_trader.common.timer cimport LoopTimer
+from nautilus_trader.common.timer cimport ScheduledTimer
 from nautilus_trader.common.timer cimport ThreadTimer
 from nautilus_trader.common.timer cimport TimeEventHandler
 from nautilus_trader.core.correctness cimport Condition
@@ -38,6 +43,7 @@ from nautilus_trader.core.rust.common cimport test_clock_cancel_timer
 from nautilus_trader.core.rust.common cimport test_clock_cancel_timers
 from nautilus_trader.core.rust.common cimport test_clock_free
 from nautilus_trader.core.rust.common cimport test_clock_new
+from nautilus_trader.core.rust.common cimport test_clock_next_event_time_ns
 from nautilus_trader.core.rust.common cimport test_clock_next_time_ns
 from nautilus_trader.core.rust.common cimport test_clock_set_time
 from nautilus_trader.core.rust.common cimport test_clock_set_time_alert_ns
@@ -412,6 +418,11 @@ cdef class TestClock(Clock):
     """
     Provides a monotonic clock for backtesting and unit testing.
 
+    Notes
+    -----
+    When registered with a `TestClockScheduler` the clock shares the time of
+    the scheduler (which then also advances the clock when a timer is due).
+
     """
 
     __test__ = False  # Required so pytest does not consider this a test class
@@ -420,6 +431,8 @@ cdef class TestClock(Clock):
         super().__init__()
 
         self._mem = test_clock_new()
+        self._scheduler = None
+        self._next_event_time_ns = 0
 
     def __del__(self) -> None:
         test_clock_free(self._mem)
@@ -433,12 +446,18 @@ cdef class TestClock(Clock):
         return test_clock_timer_count(&self._mem)
 
     cpdef double timestamp(self) except *:
+        if self._scheduler is not None:
+            return nanos_to_secs(self._scheduler.time_ns)
         return nanos_to_secs(test_clock_time_ns(&self._mem))
 
     cpdef uint64_t timestamp_ms(self) except *:
+        if self._scheduler is not None:
+            return nanos_to_millis(self._scheduler.time_ns)
         return nanos_to_millis(test_clock_time_ns(&self._mem))
 
     cpdef uint64_t timestamp_ns(self) except *:
+        if self._scheduler is not None:
+            return self._scheduler.time_ns
         return test_clock_time_ns(&self._mem)
 
     cpdef void set_time_alert_ns(
@@ -453,7 +472,9 @@ cdef class TestClock(Clock):
 
         self._handlers[name] = callback
 
+        self._sync_time()
         test_clock_set_time_alert_ns(&self._mem, <PyObject *>name, alert_time_ns)
+        self._timers_changed()
 
     cpdef void set_timer_ns(
         self,
@@ -476,6 +497,7 @@ cdef class TestClock(Clock):
             Condition.true(stop_time_ns > now_ns, "stop_time was < now")
             Condition.true(start_time_ns + interval_ns <= stop_time_ns, "start_time + interval was > stop_time")
 
+        self._sync_time()
         test_clock_set_timer_ns(
             &self._mem,
             <PyObject *>name,
@@ -483,28 +505,50 @@ cdef class TestClock(Clock):
             start_time_ns,
             stop_time_ns,
         )
+        self._timers_changed()
 
     cpdef uint64_t next_time_ns(self, str name) except*:
         return test_clock_next_time_ns(&self._mem, <PyObject *>name)
 
     cpdef void cancel_timer(self, str name) except *:
         test_clock_cancel_timer(&self._mem, <PyObject *>name)
+        self._timers_changed()
 
     cpdef void cancel_timers(self) except *:
         test_clock_cancel_timers(&self._mem)
+        self._timers_changed()
 
     cpdef void set_time(self, uint64_t to_time_ns) except *:
         """
         Set the clocks datetime to the given time (UTC).
 
+        If the clock is registered with a scheduler then this sets the shared
+        time of all the schedulers clocks.
+
         Parameters
         ----------
         to_time_ns : uint64_t
             The UNIX time (nanoseconds) to set.
 
         """
+        if self._scheduler is not None:
+            self._scheduler.set_time(to_time_ns)
+            return
+
         test_clock_set_time(&self._mem, to_time_ns)
 
+    cpdef uint64_t next_event_time_ns(self) except *:
+        """
+        Return the earliest next time of all *active* timers.
+
+        Returns
+        -------
+        uint64_t
+            The UNIX time (nanoseconds), or zero if there are no active timers.
+
+        """
+        return test_clock_next_event_time_ns(&self._mem)
+
     cpdef list advance_time(self, uint64_t to_time_ns):
         """
         Advance the clocks time to the given `to_time_ns`.
@@ -525,6 +569,8 @@ cdef class TestClock(Clock):
             If `to_time_ns` is < the clocks current time.
 
         """
+        self._sync_time()
+
         # Ensure monotonic
         Condition.true(to_time_ns >= test_clock_time_ns(&self._mem), "to_time_ns was < time_ns")
 
@@ -544,9 +590,183 @@ cdef class TestClock(Clock):
             event_handlers.append(event_handler)
 
         vec_time_events_drop(raw_events)
+        self._timers_changed()
 
         return sorted(event_handlers)
 
+    cdef void _sync_time(self) except *:
+        # The shared time is only pushed to the Rust clock when it is needed
+        # (setting or advancing timers), rather than on every `set_time`
+        if self._scheduler is not None:
+            test_clock_set_time(&self._mem, self._scheduler.time_ns)
+            self._scheduler.clock_sync_count += 1
+
+    cdef void _timers_changed(self) except *:
+        if self._scheduler is not None:
+            self._scheduler._update(self)
+
+
+cdef class TestClockScheduler:
+    """
+    Provides a shared time scheduler for a group of test clocks.
+
+    All registered clocks share the schedulers time, and the earliest next
+    time of all their active timers is tracked as the timers change. On
+    `advance_time` only the clocks with a timer actually due are advanced, so
+    when no timer is due advancing is O(1) regardless of the number of clocks.
+
+    """
+
+    __test__ = False  # Required so pytest does not consider this a test class
+
+    def __init__(self):
+        self._clocks = []  # type: list[TestClock]
+        self._advancing = False
+
+        self.time_ns = 0
+        self.next_event_time_ns = 0
+        self.clock_advance_count = 0
+        self.clock_sync_count = 0
+
+    cpdef list clocks(self):
+        """
+        Return the registered clocks (in registration order).
+
+        Returns
+        -------
+        list[TestClock]
+
+        """
+        return self._clocks.copy()
+
+    cpdef void register(self, TestClock clock) except *:
+        """
+        Register the given clock with the scheduler.
+
+        The clock will share the schedulers time from this point (if the clock
+        is registered with another scheduler it is first deregistered).
+
+        Events due at the same timestamp on different clocks are returned in
+        registration order.
+
+        Parameters
+        ----------
+        clock : TestClock
+            The clock to register.
+
+        """
+        Condition.not_none(clock, "clock")
+
+        if clock._scheduler is self:
+            return  # Already registered
+        if clock._scheduler is not None:
+            clock._scheduler.deregister(clock)
+
+        clock._scheduler = self
+        self._clocks.append(clock)
+        self._update(clock)
+
+    cpdef void deregister(self, TestClock clock) except *:
+        """
+        Deregister the given clock from the scheduler.
+
+        The clock retains the schedulers current time.
+
+        Parameters
+        ----------
+        clock : TestClock
+            The clock to deregister.
+
+        """
+        Condition.not_none(clock, "clock")
+
+        if clock._scheduler is not self:
+            return  # Not registered
+
+        clock._sync_time()
+        clock._scheduler = None
+        self._clocks.remove(clock)
+        self._update_next_event_time()
+
+    cpdef void set_time(self, uint64_t to_time_ns) except *:
+        """
+        Set the shared time of all registered clocks (UTC).
+
+        This is O(1), each clock catches up with the shared time when its
+        timers are next set or advanced.
+
+        Parameters
+        ----------
+        to_time_ns : uint64_t
+            The UNIX time (nanoseconds) to set.
+
+        """
+        self.time_ns = to_time_ns
+
+    cpdef list advance_time(self, uint64_t to_time_ns):
+        """
+        Advance the shared time to the given `to_time_ns`, advancing only those
+        clocks with a timer due.
+
+        Parameters
+        ----------
+        to_time_ns : uint64_t
+            The UNIX time (nanoseconds) to advance the clocks to.
+
+        Returns
+        -------
+        list[TimeEventHandler]
+            Merged chronologically across all clocks.
+
+        Raises
+        ------
+        ValueError
+            If `to_time_ns` is < the schedulers current time.
+
+        """
+        # Ensure monotonic
+        Condition.true(to_time_ns >= self.time_ns, "to_time_ns was < time_ns")
+
+        self.time_ns = to_time_ns
+        if self.next_event_time_ns == 0 or self.next_event_time_ns > to_time_ns:
+            return []  # No timers due
+
+        cdef list streams = []
+        cdef TestClock clock
+        self._advancing = True
+        try:
+            for clock in self._clocks:
+                if clock._next_event_time_ns == 0 or clock._next_event_time_ns > to_time_ns:
+                    continue
+                streams.append(clock.advance_time(to_time_ns))
+                self.clock_advance_count += 1
+        finally:
+            self._advancing = False
+            self._update_next_event_time()
+
+        if len(streams) == 1:
+            return streams[0]
+
+        # Each clocks events are already sorted, `heapq.merge` is stable so
+        # events at the same timestamp retain the clock registration order.
+        return list(heapq.merge(*streams))
+
+    cdef void _update(self, TestClock clock) except *:
+        clock._next_event_time_ns = test_clock_next_event_time_ns(&clock._mem)
+        if not self._advancing:
+            self._update_next_event_time()
+
+    cdef void _update_next_event_time(self) except *:
+        cdef uint64_t next_time_ns = 0
+        cdef TestClock clock
+        for clock in self._clocks:
+            if clock._next_event_time_ns == 0:
+                continue
+            if next_time_ns == 0 or clock._next_event_time_ns < next_time_ns:
+                next_time_ns = clock._next_event_time_ns
+
+        self.next_event_time_ns = next_time_ns
+
 
 cdef class LiveClock(Clock):
     """
@@ -753,3 +973,260 @@ cdef class LiveClock(Clock):
         handler = self._handlers.get(event.name)
         if handler is not None:
             handler(event)
+
+
+cdef class HeapLiveClock(LiveClock):
+    """
+    Provides a monotonic clock for live trading, with all timers driven by a
+    single scheduler. All times are timezone aware UTC.
+
+    Rather than each timer owning a ``ThreadTimer`` thread or ``LoopTimer``
+    handle, the timers are held in a min-heap keyed by their next time. Adding
+    a timer is O(log n) and cancelling is O(1) (cancelled entries are discarded
+    lazily, with the heap compacted when they make up over half of it). A single
+    scheduler thread (or a single event loop callback when a `loop` is given)
+    wakes at the earliest next time, and raises the events for *all* timers due
+    at that instant together, in timestamp order.
+
+    Parameters
+    ----------
+    loop : asyncio.AbstractEventLoop, optional
+        The event loop for the clocks scheduler. If ``None`` then a scheduler
+        thread is used.
+    """
+
+    def __init__(self, loop: Optional[asyncio.AbstractEventLoop] = None):
+        super().__init__(loop=loop)
+
+        self._heap = []  # type: list[tuple[int, int, LiveTimer]]
+        self._seq = 0
+        self._stale_count = 0
+        self._lock = threading.RLock()
+        self._wakeup = threading.Condition(self._lock)
+        self._thread = None
+        self._handle = None
+        self._handle_time_ns = 0
+        self._log = None
+
+        self.wakeup_count = 0
+        self.event_count = 0
+        self.error_count = 0
+        self.last_error = None
+
+    cpdef void register_logger(self, logger) except *:
+        """
+        Register the given logger adapter for reporting errors raised by time
+        event handlers.
+
+        If no logger is registered then errors are written to stderr.
+
+        Parameters
+        ----------
+        logger : LoggerAdapter
+            The logger adapter to register.
+
+        """
+        Condition.not_none(logger, "logger")
+
+        self._log = logger
+
+    cpdef int heap_size(self) except *:
+        """
+        Return the count of entries in the schedule (including any cancelled
+        entries not yet discarded).
+
+        Returns
+        -------
+        int
+
+        """
+        return len(self._heap)
+
+    cpdef void cancel_timer(self, str name) except *:
+        Condition.valid_string(name, "name")
+
+        cdef LiveTimer timer
+        with self._lock:
+            timer = self._timers.get(name)
+            if timer is None:
+                # No timer with given name
+                return
+
+            timer.cancel()
+            self._remove_timer(timer)
+
+    cdef void _add_timer(self, LiveTimer timer, handler: Callable[[TimeEvent], None]) except *:
+        with self._lock:
+            if timer.name in self._timers:
+                self._stale_count += 1  # Replaced timers entry is now stale
+            self._timers[timer.name] = timer
+            self._handlers[timer.name] = handler
+            self._timer_count = len(self._timers)
+            self._push(timer)
+            self._reschedule()
+
+    cdef void _remove_timer(self, LiveTimer timer) except *:
+        with self._lock:
+            self._timers.pop(timer.name, None)
+            self._handlers.pop(timer.name, None)
+            self._timer_count = len(self._timers)
+            self._stale_count += 1
+            self._compact()
+            self._reschedule()
+
+    cdef LiveTimer _create_timer(
+        self,
+        str name,
+        callback: Callable[[TimeEvent], None],
+        uint64_t interval_ns,
+        uint64_t start_time_ns,
+        uint64_t stop_time_ns,
+    ):
+        return ScheduledTimer(
+            name=name,
+            callback=self._raise_time_event,
+            interval_ns=interval_ns,
+            now_ns=self.timestamp_ns(),  # Timestamp now here for accuracy
+            start_time_ns=start_time_ns,
+            stop_time_ns=stop_time_ns,
+        )
+
+    cdef bint _is_scheduled(self, tuple entry) except *:
+        cdef LiveTimer timer = entry[2]
+        return self._timers.get(timer.name) is timer
+
+    cdef void _push(self, LiveTimer timer) except *:
+        # The sequence number breaks ties between equal times (in insertion
+        # order) so that timers are never compared directly.
+        heapq.heappush(self._heap, (timer.next_time_ns, self._seq, timer))
+        self._seq += 1
+
+    cdef void _compact(self) except *:
+        if self._stale_count <= 64 or self._stale_count * 2 <= len(self._heap):
+            return
+
+        cdef tuple entry
+        self._heap = [entry for entry in self._heap if self._is_scheduled(entry)]
+        heapq.heapify(self._heap)
+        self._stale_count = 0
+
+    cdef void _reschedule(self) except *:
+        # Discard any cancelled entries at the top of the heap
+        while self._heap and not self._is_scheduled(self._heap[0]):
+            heapq.heappop(self._heap)
+            self._stale_count -= 1
+
+        cdef uint64_t next_time_ns = self._heap[0][0] if self._heap else 0
+        self._next_event_time_ns = next_time_ns
+
+        if self._loop is None:
+            if next_time_ns and self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="HeapLiveClock",
+                    daemon=True,
+                )
+                self._thread.start()
+            self._wakeup.notify()
+            return
+
+        if self._handle is not None:
+            if self._handle_time_ns == next_time_ns:
+                return  # Already scheduled
+            self._handle.cancel()
+            self._handle = None
+            self._handle_time_ns = 0
+
+        if next_time_ns == 0:
+            return  # Nothing to schedule
+
+        cdef uint64_t now_ns = self.timestamp_ns()
+        cdef double delay = nanos_to_secs(next_time_ns - now_ns) if next_time_ns > now_ns else 0.0
+        self._handle = self._loop.call_later(delay, self._on_wakeup)
+        self._handle_time_ns = next_time_ns
+
+    cdef list _pop_due(self, uint64_t now_ns):
+        cdef list handlers = []
+        cdef tuple entry
+        cdef LiveTimer timer
+        cdef TimeEvent event
+        while self._heap and self._heap[0][0] <= now_ns:
+            entry = heapq.heappop(self._heap)
+            if not self._is_scheduled(entry):
+                self._stale_count -= 1
+                continue
+
+            timer = entry[2]
+            event = timer.pop_event(
+                event_id=UUID4(),
+                ts_init=now_ns,
+            )
+            handlers.append(TimeEventHandler(event, self._handlers[timer.name]))
+
+            timer.iterate_next_time(now_ns)
+            if timer.is_expired:
+                self._timers.pop(timer.name, None)
+                self._handlers.pop(timer.name, None)
+                self._timer_count = len(self._timers)
+            else:  # Continue timing (if the next time has already passed
+                # then the timer is raised again within this wakeup)
+                self._push(timer)
+
+        return handlers
+
+    cdef void _fire(self) except *:
+        cdef list handlers
+        with self._lock:
+            handlers = self._pop_due(self.timestamp_ns())
+            if handlers:
+                self.wakeup_count += 1
+                self.event_count += len(handlers)
+
+        # Handlers are called outside of the lock so they may set or cancel
+        # timers. A failing handler must not lose the other events popped in
+        # this wakeup, so each handler is isolated.
+        cdef TimeEventHandler handler
+        try:
+            for handler in handlers:
+                try:
+                    handler.handle()
+                except Exception as e:
+                    self._on_error(f"Error handling {handler.event!r}", e)
+        finally:
+            with self._lock:
+                self._reschedule()
+
+    cdef void _on_error(self, str msg, ex) except *:
+        self.error_count += 1
+        self.last_error = ex
+        if self._log is not None:
+            self._log.exception(msg, ex)
+        else:
+            traceback.print_exception(type(ex), ex, ex.__traceback__, file=sys.stderr)
+
+    def _on_wakeup(self) -> None:
+        with self._lock:
+            self._handle = None
+            self._handle_time_ns = 0
+
+        self._fire()
+
+    def _run(self) -> None:
+        cdef uint64_t now_ns
+        cdef uint64_t next_time_ns
+        while True:
+            with self._wakeup:
+                if not self._heap:
+                    self._thread = None
+                    return  # Restarted when a timer is next added
+
+                now_ns = self.timestamp_ns()
+                next_time_ns = self._heap[0][0]
+                if next_time_ns > now_ns:
+                    self._wakeup.wait(nanos_to_secs(next_time_ns - now_ns))
+                    continue
+
+            try:
+                self._fire()
+            except Exception as e:
+                self._on_error("Error in scheduler thread", e)
@@ -62,14 +62,50 @@ cdef class LogLevelParser:
     cdef LogLevel from_str(str value)
 
 
+cdef class LogSinkWorker:
+    cdef list _sinks
+    cdef object _queue
+    cdef object _thread
+    cdef bint _is_stopped
+
+    cdef readonly int batch_size
+    """The maximum count of records delivered per batch.\n\n:returns: `int`"""
+    cdef readonly int drop_count
+    """The count of records dropped as the queue was full.\n\n:returns: `int`"""
+    cdef readonly int delivered_count
+    """The count of records delivered to the sinks.\n\n:returns: `int`"""
+    cdef readonly int batch_count
+    """The count of batches delivered to the sinks.\n\n:returns: `int`"""
+    cdef readonly int error_count
+    """The count of errors raised by sink handlers.\n\n:returns: `int`"""
+    cdef readonly object last_error
+    """The last error raised by a sink handler.\n\n:returns: `Exception` or ``None``"""
+
+    cpdef bint is_running(self) except *
+    cpdef int pending_count(self) except *
+    cpdef void start(self) except *
+    cpdef bint put(self, dict record) except *
+    cpdef void flush(self) except *
+    cpdef void stop(self) except *
+
+    cdef void _deliver(self, list batch) except *
+
+
 cdef class Logger:
     cdef Clock _clock
     cdef CLogger _logger
     cdef list _sinks
+    cdef str _trader_id_str
+    cdef str _machine_id
+    cdef str _instance_id_str
+    cdef LogSinkWorker _sink_worker
 
     cpdef void register_sink(self, handler: Callable[[Dict], None]) except *
+    cpdef void enable_async_sinks(self, int queue_size=*, int batch_size=*) except *
+    cpdef void disable_async_sinks(self) except *
+    cpdef void flush_sinks(self) except *
     cdef void change_clock_c(self, Clock clock) except *
-    cdef dict create_record(self, LogLevel level, str component, str msg, dict annotations=*)
+    cdef dict create_record(self, uint64_t timestamp_ns, LogLevel level, str component, str msg, dict annotations=*)
     cdef void log(
         self,
         uint64_t timestamp_ns,
@@ -15,8 +15,10 @@
 
 import asyncio
 import platform
+import queue
 import socket
 import sys
+import threading
 import traceback
 from asyncio import Task
 from collections import defaultdict
@@ -116,6 +118,200 @@ cdef class LogLevelParser:
         return LogLevelParser.from_str(value)
 
 
+cdef class LogSinkWorker:
+    """
+    Provides a background worker which delivers log records to sink handlers
+    in batches.
+
+    Parameters
+    ----------
+    sinks : list[Callable[[dict], None]]
+        The sink handlers to deliver records to (shared with the logger).
+    queue_size : int, default 10_000
+        The maximum count of records waiting for delivery.
+    batch_size : int, default 100
+        The maximum count of records delivered per batch.
+
+    Raises
+    ------
+    ValueError
+        If `queue_size` is not positive (> 0).
+    ValueError
+        If `batch_size` is not positive (> 0).
+    """
+
+    def __init__(
+        self,
+        list sinks not None,
+        int queue_size = 10_000,
+        int batch_size = 100,
+    ):
+        Condition.positive_int(queue_size, "queue_size")
+        Condition.positive_int(batch_size, "batch_size")
+
+        self._sinks = sinks
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._thread = None
+        self._is_stopped = False
+
+        self.batch_size = batch_size
+        self.drop_count = 0
+        self.delivered_count = 0
+        self.batch_count = 0
+        self.error_count = 0
+        self.last_error = None
+
+    cpdef bint is_running(self) except *:
+        """
+        Return whether the worker thread is running.
+
+        Returns
+        -------
+        bool
+
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    cpdef int pending_count(self) except *:
+        """
+        Return the count of records waiting for delivery.
+
+        Returns
+        -------
+        int
+
+        """
+        return self._queue.qsize()
+
+    cpdef void start(self) except *:
+        """
+        Start the worker thread.
+
+        """
+        if self.is_running():
+            return
+
+        self._thread = threading.Thread(
+            target=self._run,
+            name="LogSinkWorker",
+            daemon=True,
+        )
+        self._thread.start()
+
+    cpdef bint put(self, dict record) except *:
+        """
+        Queue the given record for delivery.
+
+        If the worker has been stopped then the record is delivered from the
+        calling thread.
+
+        Parameters
+        ----------
+        record : dict
+            The log record.
+
+        Returns
+        -------
+        bool
+            True if queued, else False if dropped as the queue was full.
+
+        """
+        if self._is_stopped:
+            self._deliver([record])
+            return True
+
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self.drop_count += 1
+            return False
+
+        return True
+
+    cpdef void flush(self) except *:
+        """
+        Block until all queued records have been delivered.
+
+        """
+        if self.is_running():
+            self._queue.join()
+
+    cpdef void stop(self) except *:
+        """
+        Deliver all queued records and stop the worker thread.
+
+        Records queued concurrently after the stop sentinel are delivered from
+        the calling thread.
+
+        """
+        if not self.is_running():
+            return
+
+        self._queue.put(None)  # Sentinel (blocks rather than dropping)
+        self._thread.join()
+        self._thread = None
+        self._is_stopped = True
+
+        cdef list remaining = []
+        while True:
+            try:
+                remaining.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+            self._queue.task_done()
+
+        self._deliver([record for record in remaining if record is not None])
+
+    def _run(self) -> None:
+        cdef list batch
+        cdef int taken
+        cdef bint stopping = False
+        while not stopping:
+            record = self._queue.get()
+            taken = 1
+            batch = []
+            while True:
+                if record is None:  # Sentinel, leave any later records queued
+                    stopping = True
+                    break
+                batch.append(record)
+                if len(batch) >= self.batch_size:
+                    break
+                try:
+                    record = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                taken += 1
+
+            self._deliver(batch)
+
+            for _ in range(taken):
+                self._queue.task_done()
+
+    cdef void _deliver(self, list batch) except *:
+        if not batch:
+            return
+
+        cdef dict record
+        for record in batch:
+            for handler in self._sinks:
+                try:
+                    handler(record)
+                except Exception as e:
+                    self.error_count += 1
+                    self.last_error = e
+                    if self.error_count == 1:  # Report the first error only
+                        print(
+                            f"Error delivering log record to sink {handler!r} "
+                            f"(further errors are counted only):",
+                            file=sys.stderr,
+                        )
+                        traceback.print_exception(type(e), e, e.__traceback__, file=sys.stderr)
+
+        self.delivered_count += len(batch)
+        self.batch_count += 1
+
+
 cdef class Logger:
     """
     Provides a high-performance logger.
@@ -164,6 +360,12 @@ cdef class Logger:
             <bint>bypass,
         )
         self._sinks = []
+        self._sink_worker = None
+
+        # Static record fields
+        self._trader_id_str = trader_id_str
+        self._machine_id = machine_id
+        self._instance_id_str = instance_id_str
 
     def __del__(self) -> None:
         logger_free(self._logger)  # `self._logger` moved to Rust (then dropped)
@@ -216,6 +418,18 @@ cdef class Logger:
         """
         return <bint>logger_is_bypassed(&self._logger)
 
+    @property
+    def sink_worker(self) -> Optional[LogSinkWorker]:
+        """
+        Return the worker delivering records to the sinks (if async).
+
+        Returns
+        -------
+        LogSinkWorker or ``None``
+
+        """
+        return self._sink_worker
+
     cpdef void register_sink(self, handler: Callable[[Dict], None]) except *:
         """
         Register the given sink handler with the logger.
@@ -236,6 +450,62 @@ cdef class Logger:
 
         self._sinks.append(handler)
 
+    cpdef void enable_async_sinks(self, int queue_size = 10_000, int batch_size = 100) except *:
+        """
+        Deliver records to the sinks asynchronously.
+
+        Records are placed on a bounded queue and delivered in batches from a
+        background thread, rather than calling every sink handler on the
+        logging thread. If the queue is full then the record is dropped (and
+        counted) rather than blocking.
+
+        Parameters
+        ----------
+        queue_size : int, default 10_000
+            The maximum count of records waiting for delivery.
+        batch_size : int, default 100
+            The maximum count of records delivered per batch.
+
+        Raises
+        ------
+        ValueError
+            If `queue_size` is not positive (> 0).
+        ValueError
+            If `batch_size` is not positive (> 0).
+
+        """
+        if self._sink_worker is not None:
+            return  # Already async
+
+        self._sink_worker = LogSinkWorker(
+            sinks=self._sinks,
+            queue_size=queue_size,
+            batch_size=batch_size,
+        )
+        self._sink_worker.start()
+
+    cpdef void disable_async_sinks(self) except *:
+        """
+        Deliver records to the sinks synchronously.
+
+        Any queued records are delivered before the background worker is
+        stopped.
+
+        """
+        if self._sink_worker is None:
+            return  # Already synchronous
+
+        self._sink_worker.stop()
+        self._sink_worker = None
+
+    cpdef void flush_sinks(self) except *:
+        """
+        Block until all queued records have been delivered to the sinks.
+
+        """
+        if self._sink_worker is not None:
+            self._sink_worker.flush()
+
     cdef void change_clock_c(self, Clock clock) except *:
         """
         Change the loggers internal clock to the given clock.
@@ -251,23 +521,24 @@ cdef class Logger:
 
     cdef dict create_record(
         self,
+        uint64_t timestamp_ns,
         LogLevel level,
         str component,
         str msg,
         dict annotations = None,
     ):
         cdef dict record = {
-            "timestamp": self._clock.timestamp_ns(),
+            "timestamp": timestamp_ns,
             "level": LogLevelParser.to_str(level),
-            "trader_id": str(self.trader_id),
-            "machine_id": self.machine_id,
-            "instance_id": str(self.instance_id),
+            "trader_id": self._trader_id_str,
+            "machine_id": self._machine_id,
+            "instance_id": self._instance_id_str,
             "component": component,
             "msg": msg,
         }
 
         if annotations is not None:
-            record = {**record, **annotations}
+            record.update(annotations)
 
         return record
 
@@ -311,12 +582,17 @@ cdef class Logger:
             return
 
         cdef dict record = self.create_record(
+            timestamp_ns=timestamp_ns,
             level=level,
             component=component,
             msg=msg,
             annotations=annotations,
         )
 
+        if self._sink_worker is not None:
+            self._sink_worker.put(record)
+            return
+
         for handler in self._sinks:
             handler(record)
 
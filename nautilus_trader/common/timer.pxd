@@ -68,3 +68,7 @@ cdef class ThreadTimer(LiveTimer):
 
 cdef class LoopTimer(LiveTimer):
     cdef object _loop
+
+
+cdef class ScheduledTimer(LiveTimer):
+    pass
@@ -392,3 +392,56 @@ cdef class LoopTimer(LiveTimer):
             self.callback,
             self,
         )
+
+
+cdef class ScheduledTimer(LiveTimer):
+    """
+    Provides a timer driven by a clock scheduler for live trading.
+
+    The timer holds no thread or loop handle of its own, the owning clock is
+    responsible for raising its events at the next time.
+
+    Parameters
+    ----------
+    name : str
+        The name for the timer.
+    callback : Callable[[TimeEvent], None]
+        The delegate to call at the next time.
+    interval_ns : uint64_t
+        The time interval for the timer.
+    now_ns : uint64_t
+        The datetime now (UTC).
+    start_time_ns : uint64_t
+        The start datetime for the timer (UTC).
+    stop_time_ns : uint64_t, optional
+        The stop datetime for the timer (UTC) (if None then timer repeats).
+
+    Raises
+    ------
+    TypeError
+        If `callback` is not of type `Callable`.
+    """
+
+    def __init__(
+        self,
+        str name not None,
+        callback not None: Callable[[TimeEvent], None],
+        uint64_t interval_ns,
+        uint64_t now_ns,
+        uint64_t start_time_ns,
+        uint64_t stop_time_ns=0,
+    ):
+        super().__init__(
+            name=name,
+            callback=callback,
+            interval_ns=interval_ns,
+            now_ns=now_ns,
+            start_time_ns=start_time_ns,
+            stop_time_ns=stop_time_ns,
+        )
+
+    cpdef void cancel(self) except *:
+        pass  # Removal from the schedule is handled by the clock
+
+    cdef object _start_timer(self, uint64_t now_ns):
+        return None  # Scheduled by the clock
@@ -106,6 +106,7 @@ class BacktestVenueConfig(Partialable):
     routing: bool = False
     frozen_account: bool = False
     reject_stop_orders: bool = True
+    indexed_order_matching: bool = False
     # fill_model: Optional[FillModel] = None  # TODO(cs): Implement
     # modules: Optional[List[SimulationModule]] = None  # TODO(cs): Implement
 
@@ -123,6 +124,7 @@ class BacktestVenueConfig(Partialable):
             self.routing,
             self.frozen_account,
             self.reject_stop_orders,
+            self.indexed_order_matching,
             # self.modules,  # TODO(cs): Implement
         ]
         return tuple(values)
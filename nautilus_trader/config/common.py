@@ -69,10 +69,15 @@ class CacheConfig(NautilusConfig):
         The maximum length for internal tick dequeues.
     bar_capacity : int
         The maximum length for internal bar dequeues.
+    columnar : bool, default False
+        If quote tick, trade tick and bar history should be held in columnar
+        ring buffers of raw values (materializing objects on access) rather
+        than dequeues of objects. Enables array access to recent history.
     """
 
     tick_capacity: PositiveInt = 1000
     bar_capacity: PositiveInt = 1000
+    columnar: bool = False
 
 
 class CacheDatabaseConfig(NautilusConfig):
@@ -89,12 +94,30 @@ class CacheDatabaseConfig(NautilusConfig):
         The database port (default for Redis).
     flush : bool, default False
         If database should be flushed before start.
+    write_behind : bool, default False
+        If order, position and account events should be written from a
+        background writer in pipelined batches, rather than synchronously.
+    write_batch_size : int, default 512
+        The maximum count of commands written in one batch (write-behind mode).
+    write_flush_interval_ms : int, default 50
+        The maximum time (milliseconds) a command waits to be batched before
+        being written (write-behind mode).
+    write_queue_size : int, default 100_000
+        The maximum count of pending commands, beyond which writes block until
+        the writer catches up (write-behind mode).
+    load_batch_size : int, default 1000
+        The count of keys scanned and fetched per pipelined batch when loading.
     """
 
     type: str = "in-memory"
     host: str = "localhost"
     port: int = 6379
     flush: bool = False
+    write_behind: bool = False
+    write_batch_size: PositiveInt = 512
+    write_flush_interval_ms: PositiveInt = 50
+    write_queue_size: PositiveInt = 100_000
+    load_batch_size: PositiveInt = 1000
 
 
 class InstrumentProviderConfig(NautilusConfig):
@@ -209,6 +232,14 @@ class StreamingConfig(NautilusConfig):
         The flush interval (milliseconds) for writing chunks.
     replace_existing: bool, default False
         If any existing feather files should be replaced.
+    include_types : List[str], optional
+        The type names to stream (if ``None`` then all types are streamed).
+    batch_size : int, optional
+        The number of rows to buffer per table before writing a record batch.
+        If ``None`` then each object is written as its own record batch.
+    batch_bytes : int, optional
+        The estimated buffered size (bytes) per table at which a record batch
+        is written (only applies when `batch_size` is set).
     """
 
     catalog_path: str
@@ -217,6 +248,8 @@ class StreamingConfig(NautilusConfig):
     flush_interval_ms: Optional[int] = None
     replace_existing: bool = False
     include_types: Optional[List[str]] = None
+    batch_size: Optional[int] = None
+    batch_bytes: Optional[int] = None
 
     @property
     def fs(self):
@@ -407,6 +440,18 @@ class NautilusKernelConfig(NautilusConfig):
         The stdout log level for the node.
     bypass_logging : bool, default False
         If logging to stdout should be bypassed.
+    msgbus_profiling : bool, default False
+        If message bus handler dispatch latency should be profiled, with the
+        results logged when the system is disposed.
+    portfolio_incremental : bool, default False
+        If the portfolio should maintain unrealized PnL and net exposures
+        incrementally, rather than recalculating them on each query.
+    log_sinks_async : bool, default False
+        If log records should be delivered to registered sinks in batches from a
+        background thread, rather than synchronously on the logging thread.
+    clock_scheduler : bool, default False
+        If live clock timers should all be driven by a single min-heap scheduler,
+        rather than by a thread or event loop handle per timer.
     """
 
     environment: Environment
@@ -424,3 +469,7 @@ class NautilusKernelConfig(NautilusConfig):
     loop_debug: bool = False
     log_level: str = "INFO"
     bypass_logging: bool = False
+    msgbus_profiling: bool = False
+    portfolio_incremental: bool = False
+    log_sinks_async: bool = False
+    clock_scheduler: bool = False
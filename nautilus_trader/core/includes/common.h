@@ -119,6 +119,8 @@ void vec_time_events_drop(struct Vec_TimeEvent v);
  */
 uint64_t test_clock_next_time_ns(struct CTestClock *clock, PyObject *name);
 
+uint64_t test_clock_next_event_time_ns(const struct CTestClock *clock);
+
 /**
  * # Safety
  * - Assumes `name` is borrowed from a valid Python UTF-8 `str`.
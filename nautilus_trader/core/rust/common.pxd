@@ -96,6 +96,8 @@ cdef extern from "../includes/common.h":
     # - Assumes `name` is borrowed from a valid Python UTF-8 `str`.
     uint64_t test_clock_next_time_ns(CTestClock *clock, PyObject *name);
 
+    uint64_t test_clock_next_event_time_ns(const CTestClock *clock);
+
     # # Safety
     # - Assumes `name` is borrowed from a valid Python UTF-8 `str`.
     void test_clock_cancel_timer(CTestClock *clock, PyObject *name);
@@ -75,6 +75,14 @@ from nautilus_trader.model.orderbook.book cimport OrderBook
 from nautilus_trader.model.orderbook.data cimport OrderBookData
 from nautilus_trader.model.orderbook.data cimport OrderBookSnapshot
 from nautilus_trader.msgbus.bus cimport MessageBus
+from nautilus_trader.msgbus.topics cimport get_bars_topic
+from nautilus_trader.msgbus.topics cimport get_book_deltas_topic
+from nautilus_trader.msgbus.topics cimport get_book_snapshots_topic
+from nautilus_trader.msgbus.topics cimport get_close_price_topic
+from nautilus_trader.msgbus.topics cimport get_instrument_topic
+from nautilus_trader.msgbus.topics cimport get_quotes_topic
+from nautilus_trader.msgbus.topics cimport get_tickers_topic
+from nautilus_trader.msgbus.topics cimport get_trades_topic
 
 
 cdef class DataEngine(Component):
@@ -711,9 +719,7 @@ cdef class DataEngine(Component):
         )
 
         self._msgbus.subscribe(
-            topic=f"data.book.deltas"
-                  f".{instrument_id.venue}"
-                  f".{instrument_id.symbol}",
+            topic=get_book_deltas_topic(instrument_id),
             handler=self._maintain_order_book,
             priority=10,
         )
@@ -780,9 +786,7 @@ cdef class DataEngine(Component):
                 )
 
         self._msgbus.subscribe(
-            topic=f"data.book.deltas"
-                  f".{instrument_id.venue}"
-                  f".{instrument_id.symbol}",
+            topic=get_book_deltas_topic(instrument_id),
             handler=self._maintain_order_book,
             priority=10,
         )
@@ -889,9 +893,7 @@ cdef class DataEngine(Component):
             return
         else:
             if not self._msgbus.has_subscribers(
-                f"data.instrument"
-                f".{instrument_id.venue}"
-                f".{instrument_id.symbol}",
+                get_instrument_topic(instrument_id),
             ):
                 client.unsubscribe_instrument(instrument_id)
 
@@ -906,9 +908,7 @@ cdef class DataEngine(Component):
         Condition.not_none(metadata, "metadata")
 
         if not self._msgbus.has_subscribers(
-            f"data.book.deltas"
-            f".{instrument_id.venue}"
-            f".{instrument_id.symbol}",
+            get_book_deltas_topic(instrument_id),
         ):
             client.unsubscribe_order_book_deltas(instrument_id)
 
@@ -923,9 +923,7 @@ cdef class DataEngine(Component):
         Condition.not_none(metadata, "metadata")
 
         if not self._msgbus.has_subscribers(
-            f"data.book.snapshots"
-            f".{instrument_id.venue}"
-            f".{instrument_id.symbol}",
+            get_book_snapshots_topic(instrument_id),
         ):
             client.unsubscribe_order_book_snapshots(instrument_id)
 
@@ -938,9 +936,7 @@ cdef class DataEngine(Component):
         Condition.not_none(instrument_id, "instrument_id")
 
         if not self._msgbus.has_subscribers(
-            f"data.tickers"
-            f".{instrument_id.venue}"
-            f".{instrument_id.symbol}",
+            get_tickers_topic(instrument_id),
         ):
             client.unsubscribe_ticker(instrument_id)
 
@@ -953,9 +949,7 @@ cdef class DataEngine(Component):
         Condition.not_none(instrument_id, "instrument_id")
 
         if not self._msgbus.has_subscribers(
-            f"data.quotes"
-            f".{instrument_id.venue}"
-            f".{instrument_id.symbol}",
+            get_quotes_topic(instrument_id),
         ):
             client.unsubscribe_quote_ticks(instrument_id)
 
@@ -968,9 +962,7 @@ cdef class DataEngine(Component):
         Condition.not_none(instrument_id, "instrument_id")
 
         if not self._msgbus.has_subscribers(
-            f"data.trades"
-            f".{instrument_id.venue}"
-            f".{instrument_id.symbol}",
+            get_trades_topic(instrument_id),
         ):
             client.unsubscribe_trade_ticks(instrument_id)
 
@@ -986,7 +978,7 @@ cdef class DataEngine(Component):
             # Internal aggregation
             self._stop_bar_aggregator(client, bar_type)
         else:
-            if not self._msgbus.has_subscribers(f"data.bars.{bar_type}"):
+            if not self._msgbus.has_subscribers(get_bars_topic(bar_type)):
                 # External aggregation
                 client.unsubscribe_bars(bar_type)
 
@@ -1095,57 +1087,47 @@ cdef class DataEngine(Component):
     cdef void _handle_instrument(self, Instrument instrument) except *:
         self._cache.add_instrument(instrument)
         self._msgbus.publish_c(
-            topic=f"data.instrument"
-                  f".{instrument.id.venue}"
-                  f".{instrument.id.symbol}",
+            topic=get_instrument_topic(instrument.id),
             msg=instrument,
         )
 
     cdef void _handle_order_book_data(self, OrderBookData data) except *:
         self._msgbus.publish_c(
-            topic=f"data.book.deltas"
-                  f".{data.instrument_id.venue}"
-                  f".{data.instrument_id.symbol}",
+            topic=get_book_deltas_topic(data.instrument_id),
             msg=data,
         )
 
     cdef void _handle_ticker(self, Ticker ticker) except *:
         self._cache.add_ticker(ticker)
         self._msgbus.publish_c(
-            topic=f"data.tickers"
-                  f".{ticker.instrument_id.venue}"
-                  f".{ticker.instrument_id.symbol}",
+            topic=get_tickers_topic(ticker.instrument_id),
             msg=ticker,
         )
 
     cdef void _handle_quote_tick(self, QuoteTick tick) except *:
         self._cache.add_quote_tick(tick)
         self._msgbus.publish_c(
-            topic=f"data.quotes"
-                  f".{tick.instrument_id.venue}"
-                  f".{tick.instrument_id.symbol}",
+            topic=get_quotes_topic(tick.instrument_id),
             msg=tick,
         )
 
     cdef void _handle_trade_tick(self, TradeTick tick) except *:
         self._cache.add_trade_tick(tick)
         self._msgbus.publish_c(
-            topic=f"data.trades"
-                  f".{tick.instrument_id.venue}"
-                  f".{tick.instrument_id.symbol}",
+            topic=get_trades_topic(tick.instrument_id),
             msg=tick,
         )
 
     cdef void _handle_bar(self, Bar bar) except *:
         self._cache.add_bar(bar)
 
-        self._msgbus.publish_c(topic=f"data.bars.{bar.type}", msg=bar)
+        self._msgbus.publish_c(topic=get_bars_topic(bar.type), msg=bar)
 
     cdef void _handle_status_update(self, StatusUpdate data) except *:
         self._msgbus.publish_c(topic=f"data.venue.status", msg=data)
 
     cdef void _handle_close_price(self, InstrumentClosePrice data) except *:
-        self._msgbus.publish_c(topic=f"data.venue.close_price.{data.instrument_id}", msg=data)
+        self._msgbus.publish_c(topic=get_close_price_topic(data.instrument_id), msg=data)
 
     cdef void _handle_generic_data(self, GenericData data) except *:
         self._msgbus.publish_c(topic=f"data.{data.data_type.topic}", msg=data.data)
@@ -1228,10 +1210,7 @@ cdef class DataEngine(Component):
                 return
 
             self._msgbus.publish_c(
-                topic=f"data.book.snapshots"
-                      f".{instrument_id.venue}"
-                      f".{instrument_id.symbol}"
-                      f".{interval_ms}",
+                topic=get_book_snapshots_topic(instrument_id, interval_ms),
                 msg=order_book,
             )
 
@@ -1293,18 +1272,14 @@ cdef class DataEngine(Component):
         # Subscribe to required data
         if bar_type.spec.price_type == PriceType.LAST:
             self._msgbus.subscribe(
-                topic=f"data.trades"
-                      f".{bar_type.instrument_id.venue}"
-                      f".{bar_type.instrument_id.symbol}",
+                topic=get_trades_topic(bar_type.instrument_id),
                 handler=aggregator.handle_trade_tick,
                 priority=5,
             )
             self._handle_subscribe_trade_ticks(client, bar_type.instrument_id)
         else:
             self._msgbus.subscribe(
-                topic=f"data.quotes"
-                      f".{bar_type.instrument_id.venue}"
-                      f".{bar_type.instrument_id.symbol}",
+                topic=get_quotes_topic(bar_type.instrument_id),
                 handler=aggregator.handle_quote_tick,
                 priority=5,
             )
@@ -1325,17 +1300,13 @@ cdef class DataEngine(Component):
         # Unsubscribe from update ticks
         if bar_type.spec.price_type == PriceType.LAST:
             self._msgbus.unsubscribe(
-                topic=f"data.trades"
-                      f".{bar_type.instrument_id.venue}"
-                      f".{bar_type.instrument_id.symbol}",
+                topic=get_trades_topic(bar_type.instrument_id),
                 handler=aggregator.handle_trade_tick,
             )
             self._handle_unsubscribe_trade_ticks(client, bar_type.instrument_id)
         else:
             self._msgbus.unsubscribe(
-                topic=f"data.quotes"
-                      f".{bar_type.instrument_id.venue}"
-                      f".{bar_type.instrument_id.symbol}",
+                topic=get_quotes_topic(bar_type.instrument_id),
                 handler=aggregator.handle_quote_tick,
             )
             self._handle_unsubscribe_quote_ticks(client, bar_type.instrument_id)
@@ -13,10 +13,53 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from libc.stdint cimport uint64_t
+
+from nautilus_trader.accounting.accounts.base cimport Account
 from nautilus_trader.cache.database cimport CacheDatabase
+from nautilus_trader.common.logging cimport LoggerAdapter
+from nautilus_trader.model.currency cimport Currency
+from nautilus_trader.model.orders.base cimport Order
+from nautilus_trader.model.position cimport Position
 from nautilus_trader.serialization.base cimport Serializer
 
 
+cdef class RedisWriteBehind:
+    cdef object _redis
+    cdef LoggerAdapter _log
+    cdef object _queue
+    cdef object _thread
+    cdef int _batch_size
+    cdef double _flush_interval
+    cdef bint _is_stopped
+    cdef int _dropped_count
+
+    cdef readonly int max_pending
+    """The maximum count of pending commands reached.\n\n:returns: `int`"""
+    cdef readonly uint64_t written_count
+    """The count of commands written.\n\n:returns: `uint64_t`"""
+    cdef readonly uint64_t batch_count
+    """The count of pipelined batches executed.\n\n:returns: `uint64_t`"""
+    cdef readonly uint64_t error_count
+    """The count of commands dropped by failed writes or rejected after stop.\n\n:returns: `uint64_t`"""
+    cdef readonly uint64_t backpressure_count
+    """The count of writes which blocked on a full queue.\n\n:returns: `uint64_t`"""
+    cdef readonly uint64_t backpressure_ns
+    """The cumulative time (nanoseconds) writes blocked on a full queue.\n\n:returns: `uint64_t`"""
+    cdef readonly object last_error
+    """The last exception raised when writing a batch.\n\n:returns: `Exception` or ``None``"""
+
+    cpdef bint is_running(self) except *
+    cpdef int pending_count(self) except *
+    cpdef void start(self) except *
+    cpdef void push(self, str key, bytes value) except *
+    cpdef void drain(self) except *
+    cpdef void stop(self) except *
+    cpdef dict stats(self)
+    cdef void _write_batch(self, list batch) except *
+    cdef void _raise_dropped(self) except *
+
+
 cdef class RedisCacheDatabase(CacheDatabase):
     cdef str _key_trader
     cdef str _key_currencies
@@ -28,3 +71,16 @@ cdef class RedisCacheDatabase(CacheDatabase):
 
     cdef Serializer _serializer
     cdef object _redis
+    cdef RedisWriteBehind _writer
+    cdef int _load_batch_size
+
+    cpdef dict write_behind_stats(self)
+    cdef int _rpush(self, str key, bytes value) except *
+    cdef void _drain_writes(self) except *
+    cdef list _scan_keys(self, str prefix)
+    cdef list _fetch_batched(self, list keys, str command, tuple args=*)
+    cdef dict _load_events(self, str prefix)
+    cdef Currency _currency_from_hash(self, str code, dict c_hash)
+    cdef Account _account_from_events(self, list events)
+    cdef Order _order_from_events(self, list events)
+    cdef Position _position_from_events(self, list events, dict instruments)
@@ -13,15 +13,25 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import threading
 import warnings
-from typing import Optional
+from queue import Empty
+from queue import Full
+from queue import Queue
+from time import monotonic
+from time import perf_counter_ns
+from time import sleep
+from typing import Any, Optional
 
 from nautilus_trader.config import CacheDatabaseConfig
 
+from libc.stdint cimport uint64_t
+
 from nautilus_trader.accounting.accounts.base cimport Account
 from nautilus_trader.accounting.factory cimport AccountFactory
 from nautilus_trader.cache.database cimport CacheDatabase
 from nautilus_trader.common.logging cimport Logger
+from nautilus_trader.common.logging cimport LoggerAdapter
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.model.c_enums.currency_type cimport CurrencyTypeParser
 from nautilus_trader.model.currency cimport Currency
@@ -56,6 +66,295 @@ cdef str _ORDERS = 'Orders'
 cdef str _POSITIONS = 'Positions'
 cdef str _STRATEGIES = 'Strategies'
 
+cdef object _STOP = object()  # Sentinel to stop the write-behind thread
+cdef int _WRITE_RETRIES = 3   # Retries of a failed write-behind batch
+
+
+cdef class RedisWriteBehind:
+    """
+    Provides a background writer which pushes serialized events to Redis in
+    pipelined batches.
+
+    Commands are written in the order they were pushed by a single writer
+    thread, so the events for any key are always appended in order. A batch is
+    written once `batch_size` commands are pending, or `flush_interval_ms` has
+    elapsed since the first command of the batch was taken off the queue.
+
+    The queue is bounded, when it is full `push` blocks until the writer has
+    caught up, with the count and duration of these stalls recorded as
+    back-pressure metrics.
+
+    A batch which fails to write is logged and retried with a backoff. If all
+    retries fail then the batch is dropped, and the failure is raised from the
+    next call to `drain` or `stop`. Commands pushed after `stop` are rejected.
+
+    Parameters
+    ----------
+    redis_client : redis.Redis
+        The Redis client to write with.
+    logger : Logger
+        The logger for the writer.
+    batch_size : int
+        The maximum count of commands written in one pipelined batch.
+    flush_interval_ms : int
+        The maximum time (milliseconds) to wait for a batch to fill.
+    queue_size : int
+        The maximum count of pending commands.
+
+    Raises
+    ------
+    ValueError
+        If `batch_size` is not positive (> 0).
+    ValueError
+        If `flush_interval_ms` is not positive (> 0).
+    ValueError
+        If `queue_size` is not positive (> 0).
+    """
+
+    def __init__(
+        self,
+        redis_client not None,
+        Logger logger not None,
+        int batch_size,
+        int flush_interval_ms,
+        int queue_size,
+    ):
+        Condition.positive_int(batch_size, "batch_size")
+        Condition.positive_int(flush_interval_ms, "flush_interval_ms")
+        Condition.positive_int(queue_size, "queue_size")
+
+        self._redis = redis_client
+        self._log = LoggerAdapter(component_name=type(self).__name__, logger=logger)
+        self._queue = Queue(maxsize=queue_size)
+        self._thread = None
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval_ms / 1000.0
+        self._is_stopped = False
+        self._dropped_count = 0
+
+        # Metrics
+        self.max_pending = 0
+        self.written_count = 0
+        self.batch_count = 0
+        self.error_count = 0
+        self.backpressure_count = 0
+        self.backpressure_ns = 0
+        self.last_error = None
+
+    cpdef bint is_running(self) except *:
+        """
+        Return a value indicating whether the writer thread is running.
+
+        Returns
+        -------
+        bool
+
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    cpdef int pending_count(self) except *:
+        """
+        Return the count of commands pending write.
+
+        Returns
+        -------
+        int
+
+        """
+        return self._queue.qsize()
+
+    cpdef void start(self) except *:
+        """
+        Start the writer thread (if not already running).
+
+        """
+        if self.is_running():
+            return
+
+        self._thread = threading.Thread(target=self._run, name=type(self).__name__, daemon=True)
+        self._thread.start()
+
+    cpdef void push(self, str key, bytes value) except *:
+        """
+        Push the given value onto the end of the list at `key`.
+
+        Blocks while the queue is full. If the writer has been stopped then the
+        command is rejected (and logged).
+
+        Parameters
+        ----------
+        key : str
+            The Redis key of the list.
+        value : bytes
+            The value to push.
+
+        """
+        if self._is_stopped:
+            self.error_count += 1
+            self._log.error(f"Cannot push to {key}: writer was stopped.")
+            return
+
+        cdef uint64_t ts_blocked
+        try:
+            self._queue.put_nowait((key, value))
+        except Full:
+            self.backpressure_count += 1
+            ts_blocked = perf_counter_ns()
+            self._queue.put((key, value))
+            self.backpressure_ns += perf_counter_ns() - ts_blocked
+
+        cdef int pending = self._queue.qsize()
+        if pending > self.max_pending:
+            self.max_pending = pending
+
+    cpdef void drain(self) except *:
+        """
+        Block until all pending commands have been written.
+
+        If the writer thread is not running then pending commands are written
+        from the calling thread.
+
+        Raises
+        ------
+        RuntimeError
+            If any commands were dropped after failing all write retries since
+            the last call.
+
+        """
+        if self.is_running():
+            self._queue.join()
+            self._raise_dropped()
+            return
+
+        cdef list batch = []
+        while True:
+            try:
+                batch.append(self._queue.get_nowait())
+            except Empty:
+                break
+            self._queue.task_done()
+
+        batch = [item for item in batch if item is not _STOP]
+        if batch:
+            self._write_batch(batch)
+        self._raise_dropped()
+
+    cpdef void stop(self) except *:
+        """
+        Stop the writer thread once all pending commands have been written.
+
+        Raises
+        ------
+        RuntimeError
+            If any commands were dropped after failing all write retries since
+            the last call to `drain`.
+
+        """
+        if not self.is_running():
+            self.drain()
+            self._is_stopped = True
+            return
+
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._thread = None
+        self._is_stopped = True
+        self._raise_dropped()
+
+    cpdef dict stats(self):
+        """
+        Return the writer metrics.
+
+        Returns
+        -------
+        dict[str, int]
+
+        """
+        return {
+            "pending": self.pending_count(),
+            "max_pending": self.max_pending,
+            "written": self.written_count,
+            "batches": self.batch_count,
+            "errors": self.error_count,
+            "backpressure_count": self.backpressure_count,
+            "backpressure_ns": self.backpressure_ns,
+        }
+
+    def _run(self) -> None:
+        cdef list batch
+        cdef bint stopping = False
+        cdef double deadline
+        cdef double remaining
+        while not stopping:
+            item = self._queue.get()
+            if item is _STOP:
+                self._queue.task_done()
+                return
+
+            batch = [item]
+            deadline = monotonic() + self._flush_interval
+            while len(batch) < self._batch_size:
+                remaining = deadline - monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            self._write_batch(batch)
+
+            for _ in range(len(batch)):
+                self._queue.task_done()
+            if stopping:
+                self._queue.task_done()  # Stop sentinel
+
+    cdef void _write_batch(self, list batch) except *:
+        pipe = self._redis.pipeline(transaction=False)
+
+        cdef tuple command
+        cdef int attempt
+        cdef double delay = self._flush_interval
+        for attempt in range(_WRITE_RETRIES + 1):
+            for command in batch:
+                pipe.rpush(command[0], command[1])
+            try:
+                pipe.execute()
+                self.written_count += len(batch)
+                break
+            except Exception as e:
+                self.last_error = e
+                if attempt < _WRITE_RETRIES:
+                    self._log.warning(
+                        f"Failed to write batch of {len(batch)} command(s), "
+                        f"retrying in {delay}s: {repr(e)}.",
+                    )
+                    sleep(delay)
+                    delay *= 2
+                    continue
+                self.error_count += len(batch)
+                self._dropped_count += len(batch)
+                self._log.error(
+                    f"Dropped batch of {len(batch)} command(s) after "
+                    f"{_WRITE_RETRIES} retries: {repr(e)}.",
+                )
+        self.batch_count += 1
+
+    cdef void _raise_dropped(self) except *:
+        if self._dropped_count == 0:
+            return
+
+        cdef int dropped = self._dropped_count
+        self._dropped_count = 0
+        raise RuntimeError(
+            f"Write-behind dropped {dropped} command(s), "
+            f"last error: {repr(self.last_error)}",
+        )
+
 
 cdef class RedisCacheDatabase(CacheDatabase):
     """
@@ -71,6 +370,9 @@ cdef class RedisCacheDatabase(CacheDatabase):
         The serializer for database operations.
     config : CacheDatabaseConfig, optional
         The configuration for the instance.
+    redis_client : redis.Redis, optional
+        The Redis client (or compatible stand-in) to use. If ``None`` then a
+        client is created for the configured host and port.
 
     Raises
     ------
@@ -86,6 +388,17 @@ cdef class RedisCacheDatabase(CacheDatabase):
     timestamp strings back to int64's on the way out. One way to achieve this is
     to set the `timestamps_as_str` flag to true for the `MsgPackSerializer`, as
     per the default implementations for both `TradingNode` and `BacktestEngine`.
+
+    Loading scans keys with `SCAN` and fetches their values in pipelined
+    batches of `load_batch_size`, rather than a `KEYS` call and one round-trip
+    per key.
+
+    With `write_behind` configured, order, position and account events are
+    written asynchronously, so the data integrity checks made on the replies to
+    synchronous writes are not performed. Pending writes are completed before
+    any of these objects are loaded, the database is flushed, or on `dispose`.
+    Batches which still fail after retrying are logged, and raised from the
+    next of these calls.
     """
 
     def __init__(
@@ -94,6 +407,7 @@ cdef class RedisCacheDatabase(CacheDatabase):
         Logger logger not None,
         Serializer serializer not None,
         config: Optional[CacheDatabaseConfig] = None,
+        redis_client: Optional[Any] = None,
     ):
         if redis is None:
             warnings.warn("redis is not available.")
@@ -111,12 +425,27 @@ cdef class RedisCacheDatabase(CacheDatabase):
         self._key_orders      = f"{self._key_trader}:{_ORDERS}:"      # noqa
         self._key_positions   = f"{self._key_trader}:{_POSITIONS}:"   # noqa
         self._key_strategies  = f"{self._key_trader}:{_STRATEGIES}:"  # noqa
+        self._load_batch_size = config.load_batch_size
 
         # Serializers
         self._serializer = serializer
 
         # Redis client
-        self._redis = redis.Redis(host=config.host, port=config.port, db=0)
+        if redis_client is None:
+            redis_client = redis.Redis(host=config.host, port=config.port, db=0)
+        self._redis = redis_client
+
+        # Write-behind
+        self._writer = None
+        if config.write_behind:
+            self._writer = RedisWriteBehind(
+                redis_client=self._redis,
+                logger=logger,
+                batch_size=config.write_batch_size,
+                flush_interval_ms=config.write_flush_interval_ms,
+                queue_size=config.write_queue_size,
+            )
+            self._writer.start()
 
 # -- COMMANDS -------------------------------------------------------------------------------------
 
@@ -126,6 +455,7 @@ cdef class RedisCacheDatabase(CacheDatabase):
 
         """
         self._log.debug("Flushing database....")
+        self._drain_writes()
         self._redis.flushdb()
         self._log.info("Flushed database.")
 
@@ -140,16 +470,18 @@ cdef class RedisCacheDatabase(CacheDatabase):
         """
         cdef dict currencies = {}
 
-        cdef list currency_keys = self._redis.keys(f"{self._key_currencies}*")
+        cdef list currency_keys = self._scan_keys(self._key_currencies)
         if not currency_keys:
             return currencies
 
-        cdef bytes key_bytes
+        cdef list hashes = self._fetch_batched(currency_keys, "hgetall")
+
+        cdef int i
         cdef str currency_code
         cdef Currency currency
-        for key_bytes in currency_keys:
-            currency_code = key_bytes.decode(_UTF8).rsplit(':', maxsplit=1)[1]
-            currency = self.load_currency(currency_code)
+        for i in range(len(currency_keys)):
+            currency_code = currency_keys[i].decode(_UTF8).rsplit(':', maxsplit=1)[1]
+            currency = self._currency_from_hash(currency_code, hashes[i])
 
             if currency is not None:
                 currencies[currency.code] = currency
@@ -167,21 +499,19 @@ cdef class RedisCacheDatabase(CacheDatabase):
         """
         cdef dict instruments = {}
 
-        cdef list instrument_keys = self._redis.keys(f"{self._key_instruments}*")
+        cdef list instrument_keys = self._scan_keys(self._key_instruments)
         if not instrument_keys:
             return instruments
 
-        cdef bytes key_bytes
-        cdef str key_str
-        cdef InstrumentId instrument_id
-        cdef Instrument instrument
-        for key_bytes in instrument_keys:
-            key_str = key_bytes.decode(_UTF8).rsplit(':', maxsplit=1)[1]
-            instrument_id = InstrumentId.from_str_c(key_str)
-            instrument = self.load_instrument(instrument_id)
+        cdef list values = self._fetch_batched(instrument_keys, "get")
 
-            if instrument is not None:
-                instruments[instrument.id] = instrument
+        cdef bytes instrument_bytes
+        cdef Instrument instrument
+        for instrument_bytes in values:
+            if not instrument_bytes:
+                continue
+            instrument = self._serializer.deserialize(instrument_bytes)
+            instruments[instrument.id] = instrument
 
         return instruments
 
@@ -194,20 +524,14 @@ cdef class RedisCacheDatabase(CacheDatabase):
         dict[AccountId, Account]
 
         """
-        cdef dict accounts = {}
+        self._drain_writes()
 
-        cdef list account_keys = self._redis.keys(f"{self._key_accounts}*")
-        if not account_keys:
-            return accounts
+        cdef dict accounts = {}
 
-        cdef bytes key_bytes
-        cdef str account_str
-        cdef AccountId account_id
+        cdef list events
         cdef Account account
-        for key_bytes in account_keys:
-            account_str = key_bytes.decode(_UTF8).rsplit(':', maxsplit=1)[1]
-            account_id = AccountId(account_str)
-            account = self.load_account(account_id)
+        for events in self._load_events(self._key_accounts, None).values():
+            account = self._account_from_events(events)
 
             if account is not None:
                 accounts[account.id] = account
@@ -223,20 +547,14 @@ cdef class RedisCacheDatabase(CacheDatabase):
         dict[ClientOrderId, Order]
 
         """
-        cdef dict orders = {}
+        self._drain_writes()
 
-        cdef list order_keys = self._redis.keys(f"{self._key_orders}*")
-        if not order_keys:
-            return orders
+        cdef dict orders = {}
 
-        cdef bytes key_bytes
-        cdef str key_str
-        cdef ClientOrderId client_order_id
+        cdef list events
         cdef Order order
-        for key_bytes in order_keys:
-            key_str = key_bytes.decode(_UTF8).rsplit(':', maxsplit=1)[1]
-            client_order_id = ClientOrderId(key_str)
-            order = self.load_order(client_order_id)
+        for events in self._load_events(self._key_orders).values():
+            order = self._order_from_events(events)
 
             if order is not None:
                 orders[order.client_order_id] = order
@@ -252,20 +570,15 @@ cdef class RedisCacheDatabase(CacheDatabase):
         dict[PositionId, Position]
 
         """
-        cdef dict positions = {}
+        self._drain_writes()
 
-        cdef list position_keys = self._redis.keys(f"{self._key_positions}*")
-        if not position_keys:
-            return positions
+        cdef dict positions = {}
+        cdef dict instruments = {}  # Loaded once per instrument
 
-        cdef bytes key_bytes
-        cdef str key_str
-        cdef PositionId position_id
+        cdef list events
         cdef Position position
-        for key_bytes in position_keys:
-            key_str = key_bytes.decode(_UTF8).rsplit(':', maxsplit=1)[1]
-            position_id = PositionId(key_str)
-            position = self.load_position(position_id)
+        for events in self._load_events(self._key_positions).values():
+            position = self._position_from_events(events, instruments)
 
             if position is not None:
                 positions[position.id] = position
@@ -288,18 +601,7 @@ cdef class RedisCacheDatabase(CacheDatabase):
         """
         Condition.not_none(code, "code")
 
-        cdef dict c_hash = self._redis.hgetall(name=self._key_currencies + code)
-        cdef dict c_map = {k.decode('utf-8'): v for k, v in c_hash.items()}
-        if not c_map:
-            return None
-
-        return Currency(
-            code=code,
-            precision=int(c_map["precision"]),
-            iso4217=int(c_map["iso4217"]),
-            name=c_map["name"].decode(_UTF8),
-            currency_type=CurrencyTypeParser.from_str(c_map["currency_type"].decode("utf-8")),
-        )
+        return self._currency_from_hash(code, self._redis.hgetall(name=self._key_currencies + code))
 
     cpdef Instrument load_instrument(self, InstrumentId instrument_id):
         """
@@ -341,22 +643,15 @@ cdef class RedisCacheDatabase(CacheDatabase):
         """
         Condition.not_none(account_id, "account_id")
 
+        self._drain_writes()
+
         cdef list events = self._redis.lrange(
             name=self._key_accounts + account_id.to_str(),
             start=0,
             end=-1,
         )
 
-        # Check there is at least one event to pop
-        if not events:
-            return None
-
-        cdef bytes event
-        cdef Account account = AccountFactory.create_c(self._serializer.deserialize(events[0]))
-        for event in events[1:]:
-            account.apply(event=self._serializer.deserialize(event))
-
-        return account
+        return self._account_from_events(events)
 
     cpdef Order load_order(self, ClientOrderId client_order_id):
         """
@@ -374,24 +669,15 @@ cdef class RedisCacheDatabase(CacheDatabase):
         """
         Condition.not_none(client_order_id, "client_order_id")
 
+        self._drain_writes()
+
         cdef list events = self._redis.lrange(
             name=self._key_orders + client_order_id.to_str(),
             start=0,
             end=-1,
         )
 
-        # Check there is at least one event to pop
-        if not events:
-            return None
-
-        cdef OrderInitialized init = self._serializer.deserialize(events.pop(0))
-        cdef Order order = OrderUnpacker.from_init_c(init)
-
-        cdef bytes event_bytes
-        for event_bytes in events:
-            order.apply(self._serializer.deserialize(event_bytes))
-
-        return order
+        return self._order_from_events(events)
 
     cpdef Position load_position(self, PositionId position_id):
         """
@@ -409,32 +695,15 @@ cdef class RedisCacheDatabase(CacheDatabase):
         """
         Condition.not_none(position_id, "position_id")
 
+        self._drain_writes()
+
         cdef list events = self._redis.lrange(
             name=self._key_positions + position_id.to_str(),
             start=0,
             end=-1,
         )
 
-        # Check there is at least one event to pop
-        if not events:
-            return None
-
-        cdef OrderFilled initial_fill = self._serializer.deserialize(events.pop(0))
-        cdef Instrument instrument = self.load_instrument(initial_fill.instrument_id)
-        if instrument is None:
-            self._log.error(
-                f"Cannot load position: "
-                f"no instrument found for {initial_fill.instrument_id}",
-            )
-            return
-
-        cdef Position position = Position(instrument, initial_fill)
-
-        cdef bytes event_bytes
-        for event_bytes in events:
-            position.apply(self._serializer.deserialize(event_bytes))
-
-        return position
+        return self._position_from_events(events, None)
 
     cpdef dict load_strategy(self, StrategyId strategy_id):
         """
@@ -529,13 +798,11 @@ cdef class RedisCacheDatabase(CacheDatabase):
         """
         Condition.not_none(account, "account")
 
-        # Command pipeline
-        pipe = self._redis.pipeline()
-        pipe.rpush(self._key_accounts + account.id.to_str(), self._serializer.serialize(account.last_event_c()))
-        cdef list reply = pipe.execute()
+        cdef bytes last_event = self._serializer.serialize(account.last_event_c())
+        cdef int reply = self._rpush(self._key_accounts + account.id.to_str(), last_event)
 
         # Check data integrity of reply
-        if len(reply) > 1:  # Reply = The length of the list after the push operation
+        if reply > 1:  # Reply = The length of the list after the push operation
             self._log.error(
                 f"The {repr(account.id)} already existed and was appended to.",
             )
@@ -555,7 +822,7 @@ cdef class RedisCacheDatabase(CacheDatabase):
         Condition.not_none(order, "order")
 
         cdef bytes last_event = self._serializer.serialize(order.last_event_c())
-        cdef int reply = self._redis.rpush(self._key_orders + order.client_order_id.to_str(), last_event)
+        cdef int reply = self._rpush(self._key_orders + order.client_order_id.to_str(), last_event)
 
         # Check data integrity of reply
         if reply > 1:  # Reply = The length of the list after the push operation
@@ -578,7 +845,7 @@ cdef class RedisCacheDatabase(CacheDatabase):
         Condition.not_none(position, "position")
 
         cdef bytes last_event = self._serializer.serialize(position.last_event_c())
-        cdef int reply = self._redis.rpush(self._key_positions + position.id.to_str(), last_event)
+        cdef int reply = self._rpush(self._key_positions + position.id.to_str(), last_event)
 
         # Check data integrity of reply
         if reply > 1:  # Reply = The length of the list after the push operation
@@ -627,7 +894,7 @@ cdef class RedisCacheDatabase(CacheDatabase):
         Condition.not_none(account, "account")
 
         cdef bytes serialized_event = self._serializer.serialize(account.last_event_c())
-        self._redis.rpush(self._key_accounts + account.id.to_str(), serialized_event)
+        self._rpush(self._key_accounts + account.id.to_str(), serialized_event)
 
         self._log.debug(f"Updated {account}.")
 
@@ -644,7 +911,7 @@ cdef class RedisCacheDatabase(CacheDatabase):
         Condition.not_none(order, "order")
 
         cdef bytes serialized_event = self._serializer.serialize(order.last_event_c())
-        cdef int reply = self._redis.rpush(self._key_orders + order.client_order_id.to_str(), serialized_event)
+        cdef int reply = self._rpush(self._key_orders + order.client_order_id.to_str(), serialized_event)
 
         # Check data integrity of reply
         if reply == 1:  # Reply = The length of the list after the push operation
@@ -665,6 +932,143 @@ cdef class RedisCacheDatabase(CacheDatabase):
         Condition.not_none(position, "position")
 
         cdef bytes serialized_event = self._serializer.serialize(position.last_event_c())
-        cdef int reply = self._redis.rpush(self._key_positions + position.id.to_str(), serialized_event)
+        self._rpush(self._key_positions + position.id.to_str(), serialized_event)
 
         self._log.debug(f"Updated {position}.")
+
+    cpdef void dispose(self) except *:
+        """
+        Dispose of the database, completing any pending writes.
+
+        """
+        if self._writer is None:
+            return
+
+        try:
+            self._writer.stop()
+        except RuntimeError as e:
+            self._log.error(f"{e}.")
+
+        cdef dict stats = self._writer.stats()
+        self._log.info(f"Write-behind stopped {stats}.")
+
+    cpdef dict write_behind_stats(self):
+        """
+        Return the write-behind writer metrics.
+
+        Returns
+        -------
+        dict[str, int]
+            Empty if write-behind is not configured.
+
+        """
+        if self._writer is None:
+            return {}
+        return self._writer.stats()
+
+    cdef int _rpush(self, str key, bytes value) except *:
+        # Returns the length of the list after the push, or -1 if deferred
+        if self._writer is None:
+            return self._redis.rpush(key, value)
+
+        self._writer.push(key, value)
+        return -1
+
+    cdef void _drain_writes(self) except *:
+        if self._writer is not None:
+            self._writer.drain()
+
+    cdef list _scan_keys(self, str prefix):
+        # SCAN may return a key more than once, so keys are deduplicated in order
+        keys = self._redis.scan_iter(match=f"{prefix}*", count=self._load_batch_size)
+        return list(dict.fromkeys(keys))
+
+    cdef list _fetch_batched(self, list keys, str command, tuple args=()):
+        cdef list results = []
+        cdef int i
+        for i in range(0, len(keys), self._load_batch_size):
+            pipe = self._redis.pipeline(transaction=False)
+            method = getattr(pipe, command)
+            for key in keys[i:i + self._load_batch_size]:
+                method(key, *args)
+            results.extend(pipe.execute())
+
+        return results
+
+    cdef dict _load_events(self, str prefix):
+        # Returns the events for each object ID
+        cdef list keys = self._scan_keys(prefix)
+        cdef list lists = self._fetch_batched(keys, "lrange", (0, -1))
+
+        cdef int i
+        return {
+            keys[i].decode(_UTF8).rsplit(':', maxsplit=1)[1]: lists[i]
+            for i in range(len(keys))
+        }
+
+    cdef Currency _currency_from_hash(self, str code, dict c_hash):
+        cdef dict c_map = {k.decode(_UTF8): v for k, v in c_hash.items()}
+        if not c_map:
+            return None
+
+        return Currency(
+            code=code,
+            precision=int(c_map["precision"]),
+            iso4217=int(c_map["iso4217"]),
+            name=c_map["name"].decode(_UTF8),
+            currency_type=CurrencyTypeParser.from_str(c_map["currency_type"].decode(_UTF8)),
+        )
+
+    cdef Account _account_from_events(self, list events):
+        # Check there is at least one event to pop
+        if not events:
+            return None
+
+        cdef bytes event
+        cdef Account account = AccountFactory.create_c(self._serializer.deserialize(events[0]))
+        for event in events[1:]:
+            account.apply(event=self._serializer.deserialize(event))
+
+        return account
+
+    cdef Order _order_from_events(self, list events):
+        # Check there is at least one event to pop
+        if not events:
+            return None
+
+        cdef OrderInitialized init = self._serializer.deserialize(events[0])
+        cdef Order order = OrderUnpacker.from_init_c(init)
+
+        cdef bytes event_bytes
+        for event_bytes in events[1:]:
+            order.apply(self._serializer.deserialize(event_bytes))
+
+        return order
+
+    cdef Position _position_from_events(self, list events, dict instruments):
+        # Check there is at least one event to pop
+        if not events:
+            return None
+
+        cdef OrderFilled initial_fill = self._serializer.deserialize(events[0])
+        cdef Instrument instrument = None
+        if instruments is not None:
+            instrument = instruments.get(initial_fill.instrument_id)
+        if instrument is None:
+            instrument = self.load_instrument(initial_fill.instrument_id)
+            if instruments is not None and instrument is not None:
+                instruments[instrument.id] = instrument
+        if instrument is None:
+            self._log.error(
+                f"Cannot load position: "
+                f"no instrument found for {initial_fill.instrument_id}",
+            )
+            return None
+
+        cdef Position position = Position(instrument, initial_fill)
+
+        cdef bytes event_bytes
+        for event_bytes in events[1:]:
+            position.apply(self._serializer.deserialize(event_bytes))
+
+        return position
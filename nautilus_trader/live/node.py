@@ -83,6 +83,10 @@ class TradingNode:
             loop_debug=config.loop_debug,
             loop_sig_callback=self._loop_sig_handler,
             log_level=LogLevelParser.from_str_py(config.log_level.upper()),
+            msgbus_profiling=config.msgbus_profiling,
+            portfolio_incremental=config.portfolio_incremental,
+            log_sinks_async=config.log_sinks_async,
+            clock_scheduler=config.clock_scheduler,
         )
 
         self._builder = TradingNodeBuilder(
@@ -348,6 +352,9 @@ class TradingNode:
             self.kernel.data_engine.dispose()
             self.kernel.exec_engine.dispose()
             self.kernel.risk_engine.dispose()
+            self.kernel.cache.dispose()
+            self.kernel.dump_msgbus_profile()
+            self.kernel.logger.disable_async_sinks()  # Flushes queued sink records
 
             # Cleanup writer
             if self.kernel.writer is not None:
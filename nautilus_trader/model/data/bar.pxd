@@ -13,6 +13,10 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from libc.stdint cimport int64_t
+from libc.stdint cimport uint8_t
+from libc.stdint cimport uint64_t
+
 from nautilus_trader.core.data cimport Data
 from nautilus_trader.core.rust.model cimport Bar_t
 from nautilus_trader.core.rust.model cimport BarSpecification_t
@@ -69,6 +73,20 @@ cdef class Bar(Data):
 
     cdef str to_str(self)
 
+    @staticmethod
+    cdef Bar from_raw_c(
+        BarType bar_type,
+        int64_t raw_open,
+        int64_t raw_high,
+        int64_t raw_low,
+        int64_t raw_close,
+        uint8_t price_prec,
+        uint64_t raw_volume,
+        uint8_t size_prec,
+        uint64_t ts_event,
+        uint64_t ts_init,
+    )
+
     @staticmethod
     cdef Bar from_dict_c(dict values)
 
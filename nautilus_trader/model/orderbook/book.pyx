@@ -561,15 +561,15 @@ cdef class OrderBook:
             {
                 "bids": [
                     getattr(order, show)
-                    for order in level.orders
-                    if level.price in self.bids.prices()
+                    for order in (<Level>level)._orders.values()
+                    if self.bids.contains_price(level.price)
                 ]
                 or None,
                 "price": level.price,
                 "asks": [
                     getattr(order, show)
-                    for order in level.orders
-                    if level.price in self.asks.prices()
+                    for order in (<Level>level)._orders.values()
+                    if self.asks.contains_price(level.price)
                 ]
                 or None,
             }
@@ -843,7 +843,7 @@ cdef class L2OrderBook(OrderBook):
 
         cdef Level level
         for level in self.bids.levels + self.asks.levels:
-            num_orders = len(level.orders)
+            num_orders = level.count()
             if num_orders != 1:
                 raise BookIntegrityError(f"Number of orders on {level} != 1, was {num_orders}")
 
@@ -856,9 +856,9 @@ cdef class L2OrderBook(OrderBook):
     cdef void _remove_if_exists(self, Order order, int update_id) except *:
         # For a L2OrderBook, an order update means a whole level update. If this
         # level exists, remove it so that we can insert the new level.
-        if order.side == OrderSide.BUY and order.price in self.bids.prices():
+        if order.side == OrderSide.BUY and self.bids.contains_price(order.price):
             self._delete(order, update_id=update_id)
-        elif order.side == OrderSide.SELL and order.price in self.asks.prices():
+        elif order.side == OrderSide.SELL and self.asks.contains_price(order.price):
             self._delete(order, update_id=update_id)
 
 
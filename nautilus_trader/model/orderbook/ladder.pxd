@@ -20,11 +20,19 @@ from nautilus_trader.model.orderbook.data cimport Order
 from nautilus_trader.model.orderbook.level cimport Level
 
 
+cdef class _LevelNode:
+    cdef double key
+    cdef Level level
+    cdef list next
+
+
 cdef class Ladder:
     cdef dict _order_id_level_index
+    cdef dict _price_levels
+    cdef _LevelNode _head
+    cdef int _height
+    cdef list _levels
 
-    cdef readonly list levels
-    """The ladders levels.\n\n:returns: `list[Level]`"""
     cdef readonly bint is_reversed
     """If the ladder is in reverse order.\n\n:returns: `bool`"""
     cdef readonly uint8_t price_precision
@@ -35,9 +43,17 @@ cdef class Ladder:
     cpdef void add(self, Order order) except *
     cpdef void update(self, Order order) except *
     cpdef void delete(self, Order order) except *
+    cpdef bint contains_price(self, double price) except *
     cpdef list depth(self, int n=*)
     cpdef list prices(self)
     cpdef list volumes(self)
     cpdef list exposures(self)
     cpdef Level top(self)
     cpdef list simulate_order_fills(self, Order order, DepthType depth_type=*)
+
+    cdef void _reprice_level(self, Level level, double price) except *
+    cdef double _key(self, double price)
+    cdef void _insert_level(self, Level level) except *
+    cdef void _remove_level(self, Level level) except *
+    cdef list _find_predecessors(self, double key)
+    cdef list _get_levels(self)
@@ -13,11 +13,10 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-import heapq
-
 from libc.stdint cimport uint8_t
+from libc.stdlib cimport RAND_MAX
+from libc.stdlib cimport rand
 
-from nautilus_trader.core.collections cimport bisect_right
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.model.c_enums.depth_type cimport DepthType
 from nautilus_trader.model.objects cimport Price
@@ -26,12 +25,31 @@ from nautilus_trader.model.orderbook.data cimport Order
 from nautilus_trader.model.orderbook.level cimport Level
 
 
+cdef int _MAX_HEIGHT = 32
+cdef double _P = 0.25  # Probability of a node reaching the next height
+
+
+cdef class _LevelNode:
+    """
+    Represents a node of the ladders skip list, holding a level at a sort key.
+    """
+
+    def __init__(self, double key, Level level, int height):
+        self.key = key
+        self.level = level
+        self.next = [None] * height
+
+
 cdef class Ladder:
     """
     Represents a ladder of price levels in a book.
 
     A ladder is on one side of the book, either bid or ask/offer.
 
+    Levels are held in a price to level map alongside a skip list of levels
+    (best price first), so that updates to existing levels are O(1), adding and
+    removing levels is O(log n) expected, and the top of book is O(1).
+
     Parameters
     ----------
     reverse : bool
@@ -59,8 +77,11 @@ cdef class Ladder:
         Condition.not_negative_int(size_precision, "size_precision")
 
         self._order_id_level_index = {}  # type: dict[str, Level]
+        self._price_levels = {}  # type: dict[double, Level]
+        self._head = _LevelNode(0.0, None, _MAX_HEIGHT)
+        self._height = 1
+        self._levels = []  # type: list[Level]  # Cached until the levels change
 
-        self.levels = []  # type: list[Level]  # TODO: Make levels private??
         self.is_reversed = reverse
         self.price_precision = price_precision
         self.size_precision = size_precision
@@ -68,6 +89,18 @@ cdef class Ladder:
     def __repr__(self) -> str:
         return f"{Ladder.__name__}({self.levels})"
 
+    @property
+    def levels(self):
+        """
+        The ladders levels (best price first).
+
+        Returns
+        -------
+        list[Level]
+
+        """
+        return self._get_levels()
+
     cpdef void add(self, Order order) except *:
         """
         Add the given order to the ladder.
@@ -80,28 +113,14 @@ cdef class Ladder:
         """
         Condition.not_none(order, "order")
 
-        cdef list existing_prices = self.prices()
-
-        cdef int price_idx
-        cdef Level level
-        if order.price in existing_prices:
-            # Level exists, add new order
-            price_idx = existing_prices.index(order.price)
-            level = self.levels[price_idx]
-            level.add(order=order)
-        else:
+        cdef Level level = self._price_levels.get(order.price)
+        if level is None:
             # New price, create Level
             level = Level(price=order.price)
-            level.add(order)
-
-            if self.is_reversed:
-                self.levels.append(level)
-                # TODO: heapq._siftdown_max is temporary before custom data structure
-                heapq._siftdown_max(self.levels, 0, len(self.levels) - 1)
-            else:
-                price_idx = bisect_right(existing_prices, level.price)
-                self.levels.insert(price_idx, level)
+            self._insert_level(level)
+            self._price_levels[order.price] = level
 
+        level.add(order=order)
         self._order_id_level_index[order.id] = level
 
     cpdef void update(self, Order order) except *:
@@ -125,8 +144,10 @@ cdef class Ladder:
         if order.price == level.price:
             # This update contains a volume update
             level.update(order=order)
-            if not level.orders:
-                self.levels.remove(level)
+            if order.size == 0:
+                self._order_id_level_index.pop(order.id, None)
+            if level.is_empty():
+                self._remove_level(level)
         else:
             # New price for this order, delete and insert
             self.delete(order=order)
@@ -152,11 +173,111 @@ cdef class Ladder:
         if level is None:
             return
             # TODO: raise KeyError("Cannot delete order: not found at level.")
-        cdef int price_idx = self.prices().index(level.price)
         level.delete(order=order)
         self._order_id_level_index.pop(order.id)
-        if not level.orders:
-            del self.levels[price_idx]
+        if level.is_empty():
+            self._remove_level(level)
+
+    cdef void _reprice_level(self, Level level, double price) except *:
+        # Move an existing level (and its orders) to a new price, keeping the
+        # price index and ordering consistent.
+        Condition.is_in(level.price, self._price_levels, "level.price", "_price_levels")
+        self._remove_level(level)
+        level._set_price(price)
+        self._insert_level(level)
+        self._price_levels[price] = level
+
+    cdef double _key(self, double price):
+        # Levels are stored best price first, so reversed (bid) ladders are
+        # keyed on the negated price to keep the keys in ascending order.
+        return -price if self.is_reversed else price
+
+    cdef void _insert_level(self, Level level) except *:
+        # Inserts ahead of any equal keys, as per `bisect_left`
+        cdef double key = self._key(level.price)
+        cdef list update = self._find_predecessors(key)
+
+        cdef int height = 1
+        while height < _MAX_HEIGHT and rand() < _P * RAND_MAX:
+            height += 1
+        cdef int i
+        if height > self._height:
+            for i in range(self._height, height):
+                update[i] = self._head
+            self._height = height
+
+        cdef _LevelNode node = _LevelNode(key, level, height)
+        cdef _LevelNode previous
+        for i in range(height):
+            previous = update[i]
+            node.next[i] = previous.next[i]
+            previous.next[i] = node
+
+        self._levels = None
+
+    cdef void _remove_level(self, Level level) except *:
+        cdef list update = self._find_predecessors(self._key(level.price))
+        cdef _LevelNode node = (<_LevelNode>update[0]).next[0]
+        if node is None or node.level is not level:
+            return  # Level not in this ladder
+
+        cdef int i
+        cdef _LevelNode previous
+        for i in range(self._height):
+            previous = update[i]
+            if previous.next[i] is not node:
+                break
+            previous.next[i] = node.next[i]
+
+        while self._height > 1 and self._head.next[self._height - 1] is None:
+            self._height -= 1
+
+        self._price_levels.pop(level.price, None)
+        self._levels = None
+
+    cdef list _find_predecessors(self, double key):
+        # Returns the last node before `key` at each height of the list
+        cdef list update = [None] * _MAX_HEIGHT
+        cdef _LevelNode node = self._head
+        cdef _LevelNode next_node
+        cdef int i
+        for i in range(self._height - 1, -1, -1):
+            next_node = node.next[i]
+            while next_node is not None and next_node.key < key:
+                node = next_node
+                next_node = node.next[i]
+            update[i] = node
+
+        return update
+
+    cdef list _get_levels(self):
+        if self._levels is not None:
+            return self._levels
+
+        cdef list levels = []
+        cdef _LevelNode node = self._head.next[0]
+        while node is not None:
+            levels.append(node.level)
+            node = node.next[0]
+
+        self._levels = levels
+        return levels
+
+    cpdef bint contains_price(self, double price) except *:
+        """
+        Return a value indicating whether the ladder has a level at the given price.
+
+        Parameters
+        ----------
+        price : double
+            The price to check.
+
+        Returns
+        -------
+        bool
+
+        """
+        return price in self._price_levels
 
     cpdef list depth(self, int n=1):
         """
@@ -172,10 +293,11 @@ cdef class Ladder:
         list[Level]
 
         """
-        if not self.levels:
+        cdef list levels = self._get_levels()
+        if not levels:
             return []
-        n = n or len(self.levels)
-        return self.levels[:n]
+        n = n or len(levels)
+        return levels[:n]
 
     cpdef list prices(self):
         """
@@ -186,7 +308,7 @@ cdef class Ladder:
         list[double]
 
         """
-        return [level.price for level in self.levels]
+        return [level.price for level in self._get_levels()]
 
     cpdef list volumes(self):
         """
@@ -197,7 +319,7 @@ cdef class Ladder:
         list[double]
 
         """
-        return [level.volume() for level in self.levels]
+        return [level.volume() for level in self._get_levels()]
 
     cpdef list exposures(self):
         """
@@ -208,7 +330,7 @@ cdef class Ladder:
         list[double]
 
         """
-        return [level.exposure() for level in self.levels]
+        return [level.exposure() for level in self._get_levels()]
 
     cpdef Level top(self):
         """
@@ -219,9 +341,9 @@ cdef class Ladder:
         Level or ``None``
 
         """
-        cdef list top = self.depth(1)
-        if top:
-            return top[0]
+        cdef _LevelNode node = self._head.next[0]
+        if node is not None:
+            return node.level
         else:
             return None
 
@@ -251,12 +373,12 @@ cdef class Ladder:
 
         cdef Level level
         cdef Order book_order
-        for level in self.levels:
+        for level in self._get_levels():
             if self.is_reversed and level.price < order.price:
                 break
             elif not self.is_reversed and level.price > order.price:
                 break
-            for book_order in level.orders:
+            for book_order in level._orders.values():
                 current = book_order.size if depth_type == DepthType.VOLUME else book_order.exposure()
                 if (cumulative_denominator + current) >= target:
                     # This order has filled us, calc and return
@@ -17,15 +17,23 @@ from nautilus_trader.model.orderbook.data cimport Order
 
 
 cdef class Level:
+    cdef dict _orders
+    cdef dict _sizes
+    cdef list _orders_list
+    cdef double _volume
+
     cdef readonly double price
     """The levels price.\n\n:returns: `double`"""
-    cdef readonly list orders
-    """The orders at the level.\n\n:returns: `list[Order]`"""
 
     cpdef void bulk_add(self, list orders) except *
     cpdef void add(self, Order order) except *
     cpdef void update(self, Order order) except *
     cpdef void delete(self, Order order) except *
+    cpdef bint is_empty(self) except *
+    cpdef int count(self) except *
 
     cpdef double volume(self) except *
     cpdef double exposure(self)
+
+    cdef void _set_price(self, double price) except *
+    cdef void _update_size(self, Order order, double size) except *
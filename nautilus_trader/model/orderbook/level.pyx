@@ -23,6 +23,10 @@ cdef class Level:
 
     A price level on one side of the `OrderBook` with one or more individual orders.
 
+    Orders are indexed by ID (in time priority order), and the levels volume is
+    maintained as a running total, so updates, deletes and volume/exposure
+    queries are O(1).
+
     Parameters
     ----------
     price : double
@@ -31,7 +35,11 @@ cdef class Level:
 
     def __init__(self, double price):
         self.price = price
-        self.orders = []
+
+        self._orders = {}  # type: dict[str, Order]
+        self._sizes = {}   # type: dict[str, double]  # Order sizes as last applied
+        self._orders_list = None  # Cached orders list (None when stale)
+        self._volume = 0.0
 
     def __eq__(self, Level other) -> bool:
         return self.price == other.price
@@ -49,7 +57,21 @@ cdef class Level:
         return self.price >= other.price
 
     def __repr__(self) -> str:
-        return f"Level(price={self.price}, orders={self.orders[:5]})"
+        return f"Level(price={self.price}, orders={list(self._orders.values())[:5]})"
+
+    @property
+    def orders(self):
+        """
+        The orders at the level (in time priority order).
+
+        Returns
+        -------
+        list[Order]
+
+        """
+        if self._orders_list is None:
+            self._orders_list = list(self._orders.values())
+        return self._orders_list
 
     cpdef void bulk_add(self, list orders) except *:
         """
@@ -69,6 +91,9 @@ cdef class Level:
         """
         Add the given order to this level.
 
+        If an order with the same ID is already at this level, then it is
+        replaced by the given order.
+
         Parameters
         ----------
         order : Order
@@ -83,7 +108,10 @@ cdef class Level:
         Condition.not_none(order, "order")
         Condition.equal(order.price, self.price, "order.price", "self.price")
 
-        self.orders.append(order)
+        self._volume += order.size - self._sizes.get(order.id, 0.0)
+        self._orders[order.id] = order
+        self._orders_list = None
+        self._sizes[order.id] = order.size
 
     cpdef void update(self, Order order) except *:
         """
@@ -96,7 +124,7 @@ cdef class Level:
 
         Raises
         ------
-        KeyError
+        ValueError
             If `order` is not found at this level.
 
         """
@@ -107,10 +135,10 @@ cdef class Level:
         if order.size == 0:
             self.delete(order=order)
         else:
-            existing = self.orders[self.orders.index(order)]
+            existing = self._orders.get(order.id)
             if existing is None:
-                raise KeyError("Cannot update order: order not found")
-            existing.update_size(size=order.size)
+                raise ValueError(f"Cannot update order: {order.id} not found at level")
+            self._update_size(existing, order.size)
 
     cpdef void delete(self, Order order) except *:
         """
@@ -121,10 +149,42 @@ cdef class Level:
         order : Order
             The order to delete.
 
+        Raises
+        ------
+        ValueError
+            If `order` is not found at this level.
+
         """
         Condition.not_none(order, "order")
 
-        self.orders.remove(order)
+        if self._orders.pop(order.id, None) is None:
+            raise ValueError(f"Cannot delete order: {order.id} not found at level")
+        self._orders_list = None
+        self._volume -= self._sizes.pop(order.id)
+        if not self._orders:
+            self._volume = 0.0  # Reset any accumulated floating point error
+
+    cpdef bint is_empty(self) except *:
+        """
+        Return a value indicating whether there are no orders at this level.
+
+        Returns
+        -------
+        bool
+
+        """
+        return not self._orders
+
+    cpdef int count(self) except *:
+        """
+        Return the count of orders at this level.
+
+        Returns
+        -------
+        int
+
+        """
+        return len(self._orders)
 
     cpdef double volume(self) except *:
         """
@@ -135,7 +195,7 @@ cdef class Level:
         double
 
         """
-        return sum([order.size for order in self.orders])
+        return self._volume
 
     cpdef double exposure(self):
         """
@@ -146,4 +206,17 @@ cdef class Level:
         double
 
         """
-        return self.price * self.volume()
+        return self.price * self._volume
+
+    cdef void _set_price(self, double price) except *:
+        # Reprice the level and its orders (the owning ladder must re-index it)
+        self.price = price
+
+        cdef Order order
+        for order in self._orders.values():
+            order.price = price
+
+    cdef void _update_size(self, Order order, double size) except *:
+        self._volume += size - self._sizes[order.id]
+        self._sizes[order.id] = size
+        order.update_size(size=size)
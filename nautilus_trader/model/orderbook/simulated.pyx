@@ -98,27 +98,27 @@ cdef class SimulatedL1OrderBook(L1OrderBook):
 
     cdef void _update_bid(self, double price, double size) except *:
         cdef Order bid
-        if self._top_bid is None:
+        if self._top_bid is None or self.bids.top() is not self._top_bid_level:
             bid = Order(price, size, OrderSide.BUY, "B")
             self._add(bid, update_id=0)
             self._top_bid = bid
             self._top_bid_level = self.bids.top()
         else:
-            self._top_bid_level.price = price
-            self._top_bid.price = price
-            self._top_bid.size = size
+            if price != self._top_bid_level.price:
+                self.bids._reprice_level(self._top_bid_level, price)
+            self._top_bid_level._update_size(self._top_bid, size)
 
     cdef void _update_ask(self, double price, double size) except *:
         cdef Order ask
-        if self._top_ask is None:
+        if self._top_ask is None or self.asks.top() is not self._top_ask_level:
             ask = Order(price, size, OrderSide.SELL, "A")
             self._add(ask, update_id=0)
             self._top_ask = ask
             self._top_ask_level = self.asks.top()
         else:
-            self._top_ask_level.price = price
-            self._top_ask.price = price
-            self._top_ask.size = size
+            if price != self._top_ask_level.price:
+                self.asks._reprice_level(self._top_ask_level, price)
+            self._top_ask_level._update_size(self._top_ask, size)
 
 
 cdef class SimulatedL2OrderBook(L2OrderBook):
@@ -18,16 +18,21 @@ from nautilus_trader.common.logging cimport LoggerAdapter
 from nautilus_trader.core.message cimport Request
 from nautilus_trader.core.message cimport Response
 from nautilus_trader.model.identifiers cimport TraderId
+from nautilus_trader.msgbus.profiler cimport DispatchProfiler
 from nautilus_trader.msgbus.subscription cimport Subscription
+from nautilus_trader.msgbus.trie cimport SubscriptionTrie
 
 
 cdef class MessageBus:
     cdef Clock _clock
     cdef LoggerAdapter _log
     cdef dict _subscriptions
-    cdef dict _patterns
+    cdef SubscriptionTrie _index
+    cdef int _subscription_seq
+    cdef object _patterns
     cdef dict _endpoints
     cdef dict _correlation_index
+    cdef DispatchProfiler _profiler
 
     cdef readonly TraderId trader_id
     """The trader ID associated with the bus.\n\n:returns: `TraderId`"""
@@ -39,11 +44,24 @@ cdef class MessageBus:
     """The count of responses processed by the bus.\n\n:returns: `int`"""
     cdef readonly int pub_count
     """The count of messages published by the bus.\n\n:returns: `int`"""
+    cdef readonly int cache_size
+    """The maximum count of resolved topics cached by the bus.\n\n:returns: `int`"""
+    cdef readonly int cache_hits
+    """The count of published topics resolved from the cache.\n\n:returns: `int`"""
+    cdef readonly int cache_misses
+    """The count of published topics resolved from the subscription index.\n\n:returns: `int`"""
 
     cpdef list endpoints(self)
     cpdef list topics(self)
     cpdef list subscriptions(self, str pattern=*)
     cpdef bint has_subscribers(self, str pattern=*)
+    cpdef int cached_topics_count(self) except *
+    cpdef bint is_profiling(self) except *
+    cpdef void enable_profiling(self, int sample_size=*) except *
+    cpdef void disable_profiling(self) except *
+    cpdef void reset_profiling(self) except *
+    cpdef list handler_stats(self)
+    cpdef list slowest_topics(self, int n=*)
 
     cpdef void register(self, str endpoint, handler) except *
     cpdef void deregister(self, str endpoint, handler) except *
@@ -54,4 +72,6 @@ cdef class MessageBus:
     cpdef void unsubscribe(self, str topic, handler) except *
     cpdef void publish(self, str topic, msg) except *
     cdef void publish_c(self, str topic, msg) except *
+    cdef void _publish_profiled(self, str topic, Subscription[:] subs, msg) except *
     cdef Subscription[:] _resolve_subscriptions(self, str topic)
+    cdef void _invalidate_cached_topics(self, str pattern) except *
@@ -13,16 +13,23 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from collections import OrderedDict
+from time import perf_counter_ns
 from typing import Any, Callable
 
 import cython
 import numpy as np
 
+from libc.stdint cimport uint64_t
+
 from nautilus_trader.common.clock cimport Clock
 from nautilus_trader.common.logging cimport Logger
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.uuid cimport UUID4
 from nautilus_trader.model.identifiers cimport TraderId
+from nautilus_trader.msgbus.profiler cimport DispatchProfiler
+from nautilus_trader.msgbus.trie cimport SubscriptionTrie
+from nautilus_trader.msgbus.trie cimport is_wildcard
 from nautilus_trader.msgbus.wildcard cimport is_matching
 
 
@@ -55,11 +62,18 @@ cdef class MessageBus:
         The logger for the message bus.
     name : str, optional
         The custom name for the message bus.
+    cache_size : int, default 10_000
+        The maximum count of resolved topics to cache, with the least recently
+        published topics evicted first.
+    profiling : bool, default False
+        If handler dispatch latency profiling should be enabled on start.
 
     Raises
     ------
     ValueError
         If `name` is not ``None`` and not a valid string.
+    ValueError
+        If `cache_size` is not positive (> 0).
 
     Warnings
     --------
@@ -73,10 +87,13 @@ cdef class MessageBus:
         Clock clock not None,
         Logger logger not None,
         str name = None,
+        int cache_size = 10_000,
+        bint profiling = False,
     ):
         if name is None:
             name = type(self).__name__
         Condition.valid_string(name, "name")
+        Condition.positive_int(cache_size, "cache_size")
 
         self.trader_id = trader_id
 
@@ -84,15 +101,21 @@ cdef class MessageBus:
         self._log = LoggerAdapter(component_name=name, logger=logger)
 
         self._endpoints = {}          # type: dict[str, Callable[[Any], None]]
-        self._patterns = {}           # type: dict[str, Subscription[:]]
-        self._subscriptions = {}      # type: dict[Subscription, list[str]]
+        self._patterns = OrderedDict()  # type: OrderedDict[str, Subscription[:]]
+        self._subscriptions = {}      # type: dict[Subscription, int]
+        self._index = SubscriptionTrie()
+        self._subscription_seq = 0
         self._correlation_index = {}  # type: dict[UUID4, Callable[[Any], None]]
+        self._profiler = DispatchProfiler() if profiling else None
 
         # Counters
         self.sent_count = 0
         self.req_count = 0
         self.res_count = 0
         self.pub_count = 0
+        self.cache_size = cache_size
+        self.cache_hits = 0
+        self.cache_misses = 0
 
     cpdef list endpoints(self):
         """
@@ -154,6 +177,105 @@ cdef class MessageBus:
         """
         return len(self.subscriptions(pattern)) > 0
 
+    cpdef int cached_topics_count(self) except *:
+        """
+        Return the count of resolved topics currently cached by the bus.
+
+        Returns
+        -------
+        int
+
+        """
+        return len(self._patterns)
+
+    cpdef bint is_profiling(self) except *:
+        """
+        Return a value indicating whether handler dispatch profiling is enabled.
+
+        Returns
+        -------
+        bool
+
+        """
+        return self._profiler is not None
+
+    cpdef void enable_profiling(self, int sample_size = 1024) except *:
+        """
+        Enable handler dispatch latency profiling.
+
+        Every published message and sent message will be timed per handler,
+        which adds overhead to dispatch while enabled. If profiling is already
+        enabled then the recorded stats are retained.
+
+        Parameters
+        ----------
+        sample_size : int, default 1024
+            The count of recent dispatch times to retain per handler and topic
+            for computing percentiles.
+
+        Raises
+        ------
+        ValueError
+            If `sample_size` is not positive (> 0).
+
+        """
+        Condition.positive_int(sample_size, "sample_size")
+
+        if self._profiler is None:
+            self._profiler = DispatchProfiler(sample_size)
+
+    cpdef void disable_profiling(self) except *:
+        """
+        Disable handler dispatch latency profiling and discard recorded stats.
+
+        """
+        self._profiler = None
+
+    cpdef void reset_profiling(self) except *:
+        """
+        Clear all recorded handler dispatch stats (if profiling).
+
+        """
+        if self._profiler is not None:
+            self._profiler.clear()
+
+    cpdef list handler_stats(self):
+        """
+        Return the dispatch stats for every profiled handler.
+
+        Publish subscriptions are keyed by their topic pattern, and endpoint
+        handlers by their endpoint address. Ordered by cumulative dispatch time
+        (highest first).
+
+        Returns
+        -------
+        list[DispatchStats]
+
+        """
+        if self._profiler is None:
+            return []
+        return self._profiler.handler_stats()
+
+    cpdef list slowest_topics(self, int n = 10):
+        """
+        Return the dispatch stats for the slowest published topics.
+
+        Ordered by cumulative dispatch time across all handlers (highest first).
+
+        Parameters
+        ----------
+        n : int, default 10
+            The maximum count of topics to return.
+
+        Returns
+        -------
+        list[DispatchStats]
+
+        """
+        if self._profiler is None:
+            return []
+        return self._profiler.slowest_topics(n)
+
     cpdef void register(self, str endpoint, handler: Callable[[Any], None]) except *:
         """
         Register the given `handler` to receive messages at the `endpoint` address.
@@ -237,7 +359,14 @@ cdef class MessageBus:
             )
             return  # Cannot send
 
-        handler(msg)
+        cdef uint64_t ts_start
+        if self._profiler is None:
+            handler(msg)
+        else:
+            ts_start = perf_counter_ns()
+            handler(msg)
+            self._profiler.record_handler(endpoint, handler, perf_counter_ns() - ts_start)
+
         self.sent_count += 1
 
     cpdef void request(self, str endpoint, Request request) except *:
@@ -354,20 +483,10 @@ cdef class MessageBus:
             self._log.warning(f"{sub} already exists.")
             return
 
-        cdef list matches = []
-        cdef list patterns = list(self._patterns.keys())
-
-        cdef str pattern
-        cdef list subs
-        for pattern in patterns:
-            if is_matching(topic, pattern):
-                subs = list(self._patterns[pattern])
-                subs.append(sub)
-                subs = sorted(subs, reverse=True)
-                self._patterns[pattern] = np.ascontiguousarray(subs, dtype=Subscription)
-                matches.append(pattern)
-
-        self._subscriptions[sub] = sorted(matches)
+        self._subscription_seq += 1
+        self._subscriptions[sub] = self._subscription_seq
+        self._index.add(sub)
+        self._invalidate_cached_topics(topic)
 
         self._log.debug(f"Added {sub}.")
 
@@ -396,21 +515,14 @@ cdef class MessageBus:
 
         cdef Subscription sub = Subscription(topic=topic, handler=handler)
 
-        cdef list patterns = self._subscriptions.get(sub)
-
         # Check if exists
-        if patterns is None:
+        if sub not in self._subscriptions:
             self._log.warning(f"{sub} not found.")
             return
 
-        cdef str pattern
-        for pattern in patterns:
-            subs = list(self._patterns[pattern])
-            subs.remove(sub)
-            subs = sorted(subs, reverse=True)
-            self._patterns[pattern] = np.ascontiguousarray(subs, dtype=Subscription)
-
         del self._subscriptions[sub]
+        self._index.remove(sub)
+        self._invalidate_cached_topics(topic)
 
         self._log.debug(f"Removed {sub}.")
 
@@ -442,30 +554,58 @@ cdef class MessageBus:
         if subs is None:
             # Add the topic pattern and get matching subscribers
             subs = self._resolve_subscriptions(topic)
+            self.cache_misses += 1
+        else:
+            self._patterns.move_to_end(topic)
+            self.cache_hits += 1
 
         # Send message to all matched subscribers
         cdef int i
-        for i in range(len(subs)):
-            subs[i].handler(msg)
+        if self._profiler is None:
+            for i in range(len(subs)):
+                subs[i].handler(msg)
+        else:
+            self._publish_profiled(topic, subs, msg)
 
         self.pub_count += 1
 
-    cdef Subscription[:] _resolve_subscriptions(self, str topic):
-        cdef list subs_list = []
-        cdef Subscription existing_sub
-        for existing_sub in self._subscriptions:
-            if is_matching(topic, existing_sub.topic):
-                subs_list.append(existing_sub)
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef void _publish_profiled(self, str topic, Subscription[:] subs, msg: Any) except *:
+        cdef Subscription sub
+        cdef uint64_t ts_start = perf_counter_ns()
+        cdef uint64_t ts_handler
+        cdef int i
+        for i in range(len(subs)):
+            sub = subs[i]
+            ts_handler = perf_counter_ns()
+            sub.handler(msg)
+            self._profiler.record_handler(sub.topic, sub.handler, perf_counter_ns() - ts_handler)
+
+        self._profiler.record_topic(topic, perf_counter_ns() - ts_start)
 
-        subs_list = sorted(subs_list, reverse=True)
+    cdef Subscription[:] _resolve_subscriptions(self, str topic):
+        # Order by priority (highest first) then by subscription order
+        cdef Subscription sub
+        cdef list ordered = sorted([
+            (-sub.priority, self._subscriptions[sub], sub) for sub in self._index.match(topic)
+        ])
+        cdef list subs_list = [entry[2] for entry in ordered]
         cdef Subscription[:] subs_array = np.ascontiguousarray(subs_list, dtype=Subscription)
-        self._patterns[topic] = subs_array
 
-        cdef list matches
-        for sub in subs_array:
-            matches = self._subscriptions.get(sub, [])
-            if topic not in matches:
-                matches.append(topic)
-            self._subscriptions[sub] = sorted(matches)
+        self._patterns[topic] = subs_array
+        if len(self._patterns) > self.cache_size:
+            self._patterns.popitem(last=False)  # Evict least recently published
 
         return subs_array
+
+    cdef void _invalidate_cached_topics(self, str pattern) except *:
+        # Resolved topics matching the subscription pattern are re-resolved on
+        # next publish, all other cached topics are unaffected
+        if not is_wildcard(pattern):
+            self._patterns.pop(pattern, None)
+            return
+
+        cdef str topic
+        for topic in [t for t in self._patterns if is_matching(t, pattern)]:
+            del self._patterns[topic]
@@ -0,0 +1,57 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from libc.stdint cimport uint64_t
+
+
+cdef class DispatchStats:
+    cdef list _samples
+    cdef int _sample_size
+    cdef int _sample_index
+
+    cdef readonly str target
+    """The topic or endpoint the stats are recorded against.\n\n:returns: `str`"""
+    cdef readonly object handler
+    """The handler the stats are recorded for (``None`` for a whole topic).\n\n:returns: `Callable` or ``None``"""
+    cdef readonly uint64_t count
+    """The count of recorded dispatches.\n\n:returns: `uint64_t`"""
+    cdef readonly uint64_t total_ns
+    """The cumulative dispatch time (nanoseconds).\n\n:returns: `uint64_t`"""
+    cdef readonly uint64_t min_ns
+    """The minimum dispatch time (nanoseconds).\n\n:returns: `uint64_t`"""
+    cdef readonly uint64_t max_ns
+    """The maximum dispatch time (nanoseconds).\n\n:returns: `uint64_t`"""
+
+    cdef void record(self, uint64_t elapsed_ns) except *
+    cpdef double mean_ns(self) except *
+    cpdef uint64_t percentile_ns(self, double q) except *
+    cpdef dict to_dict(self)
+
+
+cdef class DispatchProfiler:
+    cdef dict _handlers
+    cdef dict _topics
+
+    cdef readonly int sample_size
+    """The count of recent dispatch times retained per handler for percentiles.\n\n:returns: `int`"""
+
+    cdef void record_handler(self, str target, handler, uint64_t elapsed_ns) except *
+    cdef void record_topic(self, str topic, uint64_t elapsed_ns) except *
+    cpdef list handler_stats(self)
+    cpdef list slowest_topics(self, int n=*)
+    cpdef void clear(self) except *
+
+
+cpdef str handler_name(handler)
@@ -0,0 +1,259 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from libc.math cimport ceil
+from libc.stdint cimport uint64_t
+
+from nautilus_trader.core.correctness cimport Condition
+
+
+cdef class DispatchStats:
+    """
+    Represents dispatch latency statistics for a message bus handler or topic.
+
+    The count, cumulative, minimum and maximum times cover every recorded
+    dispatch, whereas percentiles are computed over a ring of the most recent
+    `sample_size` dispatch times.
+
+    Parameters
+    ----------
+    target : str
+        The topic or endpoint the stats are recorded against.
+    handler : Callable, optional
+        The handler the stats are recorded for (``None`` for a whole topic).
+    sample_size : int
+        The count of recent dispatch times to retain for percentiles.
+
+    Raises
+    ------
+    ValueError
+        If `sample_size` is not positive (> 0).
+    """
+
+    def __init__(self, str target not None, handler, int sample_size):
+        Condition.positive_int(sample_size, "sample_size")
+
+        self.target = target
+        self.handler = handler
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+        self._samples = []  # type: list[int]
+        self._sample_size = sample_size
+        self._sample_index = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}("
+            f"target={self.target}, "
+            f"handler={handler_name(self.handler)}, "
+            f"count={self.count}, "
+            f"total_ns={self.total_ns})"
+        )
+
+    cdef void record(self, uint64_t elapsed_ns) except *:
+        self.count += 1
+        self.total_ns += elapsed_ns
+        if self.count == 1 or elapsed_ns < self.min_ns:
+            self.min_ns = elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+
+        if len(self._samples) < self._sample_size:
+            self._samples.append(elapsed_ns)
+        else:
+            self._samples[self._sample_index] = elapsed_ns
+            self._sample_index = (self._sample_index + 1) % self._sample_size
+
+    cpdef double mean_ns(self) except *:
+        """
+        Return the mean dispatch time (nanoseconds).
+
+        Returns
+        -------
+        double
+
+        """
+        if self.count == 0:
+            return 0.0
+        return <double>self.total_ns / self.count
+
+    cpdef uint64_t percentile_ns(self, double q) except *:
+        """
+        Return the given percentile of the recent dispatch times (nanoseconds).
+
+        Uses the nearest-rank method.
+
+        Parameters
+        ----------
+        q : double
+            The percentile to compute, in the range [0, 100].
+
+        Returns
+        -------
+        uint64_t
+
+        Raises
+        ------
+        ValueError
+            If `q` is not in range [0, 100].
+
+        """
+        Condition.in_range(q, 0.0, 100.0, "q")
+
+        if not self._samples:
+            return 0
+
+        cdef list ordered = sorted(self._samples)
+        cdef int rank = <int>ceil(q / 100.0 * len(ordered))
+        if rank < 1:
+            rank = 1
+        return ordered[rank - 1]
+
+    cpdef dict to_dict(self):
+        """
+        Return a dictionary representation of the stats.
+
+        Returns
+        -------
+        dict[str, object]
+
+        """
+        return {
+            "target": self.target,
+            "handler": handler_name(self.handler),
+            "count": self.count,
+            "total_ns": self.total_ns,
+            "mean_ns": self.mean_ns(),
+            "min_ns": self.min_ns,
+            "max_ns": self.max_ns,
+            "p50_ns": self.percentile_ns(50.0),
+            "p90_ns": self.percentile_ns(90.0),
+            "p99_ns": self.percentile_ns(99.0),
+        }
+
+
+cdef class DispatchProfiler:
+    """
+    Provides dispatch latency profiling for the message bus.
+
+    Records per-subscription (and per-endpoint) handler call counts and
+    latencies, as well as the overall dispatch latency of each published topic.
+
+    Parameters
+    ----------
+    sample_size : int, default 1024
+        The count of recent dispatch times to retain per handler and topic for
+        computing percentiles.
+
+    Raises
+    ------
+    ValueError
+        If `sample_size` is not positive (> 0).
+    """
+
+    def __init__(self, int sample_size=1024):
+        Condition.positive_int(sample_size, "sample_size")
+
+        self.sample_size = sample_size
+        self._handlers = {}  # type: dict[tuple[str, Callable], DispatchStats]
+        self._topics = {}    # type: dict[str, DispatchStats]
+
+    cdef void record_handler(self, str target, handler, uint64_t elapsed_ns) except *:
+        cdef tuple key = (target, handler)
+        cdef DispatchStats stats = self._handlers.get(key)
+        if stats is None:
+            stats = DispatchStats(target, handler, self.sample_size)
+            self._handlers[key] = stats
+        stats.record(elapsed_ns)
+
+    cdef void record_topic(self, str topic, uint64_t elapsed_ns) except *:
+        cdef DispatchStats stats = self._topics.get(topic)
+        if stats is None:
+            stats = DispatchStats(topic, None, self.sample_size)
+            self._topics[topic] = stats
+        stats.record(elapsed_ns)
+
+    cpdef list handler_stats(self):
+        """
+        Return the stats for every profiled handler.
+
+        Ordered by cumulative dispatch time (highest first).
+
+        Returns
+        -------
+        list[DispatchStats]
+
+        """
+        return sorted(self._handlers.values(), key=_total_ns, reverse=True)
+
+    cpdef list slowest_topics(self, int n=10):
+        """
+        Return the stats for the slowest published topics.
+
+        Ordered by cumulative dispatch time (highest first).
+
+        Parameters
+        ----------
+        n : int, default 10
+            The maximum count of topics to return.
+
+        Returns
+        -------
+        list[DispatchStats]
+
+        """
+        return sorted(self._topics.values(), key=_total_ns, reverse=True)[:n]
+
+    cpdef void clear(self) except *:
+        """
+        Clear all recorded stats.
+
+        """
+        self._handlers.clear()
+        self._topics.clear()
+
+
+def _total_ns(DispatchStats stats):
+    return stats.total_ns
+
+
+cpdef str handler_name(handler):
+    """
+    Return a readable name for the given handler.
+
+    Bound methods are named with their owning instance, so handlers of
+    different strategies and actors can be told apart.
+
+    Parameters
+    ----------
+    handler : Callable, optional
+        The handler to name.
+
+    Returns
+    -------
+    str
+
+    """
+    if handler is None:
+        return "None"
+    owner = getattr(handler, "__self__", None)
+    name = getattr(handler, "__qualname__", None)
+    if name is None:
+        return repr(handler)
+    if owner is not None:
+        return f"{owner}.{getattr(handler, '__name__', name)}"
+    return name
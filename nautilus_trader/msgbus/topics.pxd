@@ -0,0 +1,28 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from nautilus_trader.model.data.bar cimport BarType
+from nautilus_trader.model.identifiers cimport InstrumentId
+
+
+cpdef str get_instrument_topic(InstrumentId instrument_id)
+cpdef str get_book_deltas_topic(InstrumentId instrument_id)
+cpdef str get_book_snapshots_topic(InstrumentId instrument_id, int interval_ms=*)
+cpdef str get_tickers_topic(InstrumentId instrument_id)
+cpdef str get_quotes_topic(InstrumentId instrument_id)
+cpdef str get_trades_topic(InstrumentId instrument_id)
+cpdef str get_bars_topic(BarType bar_type)
+cpdef str get_close_price_topic(InstrumentId instrument_id)
+cpdef void clear_topic_cache() except *
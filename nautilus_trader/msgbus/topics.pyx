@@ -0,0 +1,216 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+"""
+Provides cached message bus topics for market data.
+
+Topics are built once per data kind and instrument ID (or bar type) then
+interned, so the publishers on the hot path, the subscribing actors and the
+message bus all share the same string objects. Repeat lookups avoid the string
+formatting, and the message bus pattern lookups hit the cached string hash.
+"""
+
+import sys
+
+from nautilus_trader.model.data.bar cimport BarType
+from nautilus_trader.model.identifiers cimport InstrumentId
+
+
+cdef dict _INSTRUMENT_TOPICS = {}      # type: dict[InstrumentId, str]
+cdef dict _BOOK_DELTAS_TOPICS = {}     # type: dict[InstrumentId, str]
+cdef dict _BOOK_SNAPSHOTS_TOPICS = {}  # type: dict[InstrumentId | tuple[InstrumentId, int], str]
+cdef dict _TICKERS_TOPICS = {}         # type: dict[InstrumentId, str]
+cdef dict _QUOTES_TOPICS = {}          # type: dict[InstrumentId, str]
+cdef dict _TRADES_TOPICS = {}          # type: dict[InstrumentId, str]
+cdef dict _BARS_TOPICS = {}            # type: dict[BarType, str]
+cdef dict _CLOSE_PRICE_TOPICS = {}     # type: dict[InstrumentId, str]
+
+
+cdef inline str _instrument_topic(dict cache, str prefix, InstrumentId instrument_id):
+    cdef str topic = cache.get(instrument_id)
+    if topic is None:
+        topic = sys.intern(f"{prefix}.{instrument_id.venue}.{instrument_id.symbol}")
+        cache[instrument_id] = topic
+    return topic
+
+
+cpdef str get_instrument_topic(InstrumentId instrument_id):
+    """
+    Return the topic for instruments of the given instrument ID.
+
+    Parameters
+    ----------
+    instrument_id : InstrumentId
+        The instrument ID for the topic.
+
+    Returns
+    -------
+    str
+
+    """
+    return _instrument_topic(_INSTRUMENT_TOPICS, "data.instrument", instrument_id)
+
+
+cpdef str get_book_deltas_topic(InstrumentId instrument_id):
+    """
+    Return the topic for order book deltas of the given instrument ID.
+
+    Parameters
+    ----------
+    instrument_id : InstrumentId
+        The instrument ID for the topic.
+
+    Returns
+    -------
+    str
+
+    """
+    return _instrument_topic(_BOOK_DELTAS_TOPICS, "data.book.deltas", instrument_id)
+
+
+cpdef str get_book_snapshots_topic(InstrumentId instrument_id, int interval_ms = 0):
+    """
+    Return the topic for order book snapshots of the given instrument ID.
+
+    Parameters
+    ----------
+    instrument_id : InstrumentId
+        The instrument ID for the topic.
+    interval_ms : int, default 0
+        The snapshot interval in milliseconds (if zero then no interval suffix).
+
+    Returns
+    -------
+    str
+
+    """
+    if interval_ms == 0:
+        return _instrument_topic(_BOOK_SNAPSHOTS_TOPICS, "data.book.snapshots", instrument_id)
+
+    cdef tuple key = (instrument_id, interval_ms)
+    cdef str topic = _BOOK_SNAPSHOTS_TOPICS.get(key)
+    if topic is None:
+        topic = sys.intern(
+            f"data.book.snapshots.{instrument_id.venue}.{instrument_id.symbol}.{interval_ms}",
+        )
+        _BOOK_SNAPSHOTS_TOPICS[key] = topic
+    return topic
+
+
+cpdef str get_tickers_topic(InstrumentId instrument_id):
+    """
+    Return the topic for tickers of the given instrument ID.
+
+    Parameters
+    ----------
+    instrument_id : InstrumentId
+        The instrument ID for the topic.
+
+    Returns
+    -------
+    str
+
+    """
+    return _instrument_topic(_TICKERS_TOPICS, "data.tickers", instrument_id)
+
+
+cpdef str get_quotes_topic(InstrumentId instrument_id):
+    """
+    Return the topic for quote ticks of the given instrument ID.
+
+    Parameters
+    ----------
+    instrument_id : InstrumentId
+        The instrument ID for the topic.
+
+    Returns
+    -------
+    str
+
+    """
+    return _instrument_topic(_QUOTES_TOPICS, "data.quotes", instrument_id)
+
+
+cpdef str get_trades_topic(InstrumentId instrument_id):
+    """
+    Return the topic for trade ticks of the given instrument ID.
+
+    Parameters
+    ----------
+    instrument_id : InstrumentId
+        The instrument ID for the topic.
+
+    Returns
+    -------
+    str
+
+    """
+    return _instrument_topic(_TRADES_TOPICS, "data.trades", instrument_id)
+
+
+cpdef str get_bars_topic(BarType bar_type):
+    """
+    Return the topic for bars of the given bar type.
+
+    Parameters
+    ----------
+    bar_type : BarType
+        The bar type for the topic.
+
+    Returns
+    -------
+    str
+
+    """
+    cdef str topic = _BARS_TOPICS.get(bar_type)
+    if topic is None:
+        topic = sys.intern(f"data.bars.{bar_type}")
+        _BARS_TOPICS[bar_type] = topic
+    return topic
+
+
+cpdef str get_close_price_topic(InstrumentId instrument_id):
+    """
+    Return the topic for instrument close prices of the given instrument ID.
+
+    Parameters
+    ----------
+    instrument_id : InstrumentId
+        The instrument ID for the topic.
+
+    Returns
+    -------
+    str
+
+    """
+    cdef str topic = _CLOSE_PRICE_TOPICS.get(instrument_id)
+    if topic is None:
+        topic = sys.intern(f"data.venue.close_price.{instrument_id}")
+        _CLOSE_PRICE_TOPICS[instrument_id] = topic
+    return topic
+
+
+cpdef void clear_topic_cache() except *:
+    """
+    Clear all cached topics.
+    """
+    _INSTRUMENT_TOPICS.clear()
+    _BOOK_DELTAS_TOPICS.clear()
+    _BOOK_SNAPSHOTS_TOPICS.clear()
+    _TICKERS_TOPICS.clear()
+    _QUOTES_TOPICS.clear()
+    _TRADES_TOPICS.clear()
+    _BARS_TOPICS.clear()
+    _CLOSE_PRICE_TOPICS.clear()
@@ -0,0 +1,39 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from nautilus_trader.msgbus.subscription cimport Subscription
+
+
+cdef class TopicNode:
+    cdef dict children
+    cdef list exact
+    cdef list wildcard
+
+
+cdef class SubscriptionTrie:
+    cdef TopicNode _root
+
+    cdef readonly int count
+    """The count of subscriptions in the trie.\n\n:returns: `int`"""
+
+    cpdef void add(self, Subscription sub) except *
+    cpdef bint remove(self, Subscription sub) except *
+    cpdef list match(self, str topic)
+    cpdef void clear(self) except *
+
+    cdef TopicNode _find_node(self, list segments, bint create)
+
+
+cdef bint is_wildcard(str pattern) except *
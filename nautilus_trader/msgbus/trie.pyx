@@ -0,0 +1,182 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from nautilus_trader.msgbus.subscription cimport Subscription
+from nautilus_trader.msgbus.wildcard cimport is_matching
+
+
+cdef class TopicNode:
+    """
+    Represents a node of a `SubscriptionTrie` for one topic segment.
+
+    This is an internal class intended to be used by the message bus to index
+    subscriptions.
+    """
+
+    def __init__(self):
+        self.children = {}  # type: dict[str, TopicNode]
+        self.exact = []     # type: list[Subscription]
+        self.wildcard = []  # type: list[Subscription]
+
+
+cdef class SubscriptionTrie:
+    """
+    Provides an index of subscriptions over dot separated topic segments.
+
+    Subscriptions are stored at the node for the literal segments of their
+    topic. A topic containing wildcard characters is stored against its literal
+    prefix (the segments before the first wildcard), and is checked against the
+    full topic on matching as `*` may span segments. Matching a topic therefore
+    only visits the subscriptions sharing its literal prefix, rather than
+    scanning every subscription.
+
+    This is an internal class intended to be used by the message bus to index
+    subscriptions.
+    """
+
+    def __init__(self):
+        self._root = TopicNode()
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    cpdef void add(self, Subscription sub) except *:
+        """
+        Add the given subscription to the trie.
+
+        Parameters
+        ----------
+        sub : Subscription
+            The subscription to add.
+
+        """
+        cdef list segments = sub.topic.split(".")
+        cdef int i
+        for i in range(len(segments)):
+            if is_wildcard(segments[i]):
+                self._find_node(segments[:i], create=True).wildcard.append(sub)
+                self.count += 1
+                return
+
+        self._find_node(segments, create=True).exact.append(sub)
+        self.count += 1
+
+    cpdef bint remove(self, Subscription sub) except *:
+        """
+        Remove the given subscription from the trie (if found).
+
+        Parameters
+        ----------
+        sub : Subscription
+            The subscription to remove.
+
+        Returns
+        -------
+        bool
+            True if the subscription was found and removed, else False.
+
+        """
+        cdef list segments = sub.topic.split(".")
+        cdef bint wildcard = False
+        cdef int i
+        for i in range(len(segments)):
+            if is_wildcard(segments[i]):
+                segments = segments[:i]
+                wildcard = True
+                break
+
+        # Walk down the trie recording the path for pruning empty nodes
+        cdef list path = []
+        cdef TopicNode node = self._root
+        cdef str segment
+        for segment in segments:
+            path.append((node, segment))
+            node = node.children.get(segment)
+            if node is None:
+                return False
+
+        cdef list subs = node.wildcard if wildcard else node.exact
+        if sub not in subs:
+            return False
+
+        subs.remove(sub)
+        self.count -= 1
+
+        cdef TopicNode parent
+        while path and not (node.children or node.exact or node.wildcard):
+            parent, segment = path.pop()
+            del parent.children[segment]
+            node = parent
+
+        return True
+
+    cpdef list match(self, str topic):
+        """
+        Return the subscriptions matching the given topic.
+
+        Parameters
+        ----------
+        topic : str
+            The topic to match (without wildcard characters).
+
+        Returns
+        -------
+        list[Subscription]
+
+        """
+        cdef list matches = []
+        cdef TopicNode node = self._root
+        cdef Subscription sub
+        cdef str segment
+        for segment in topic.split("."):
+            for sub in node.wildcard:
+                if is_matching(topic, sub.topic):
+                    matches.append(sub)
+            node = node.children.get(segment)
+            if node is None:
+                return matches
+
+        for sub in node.wildcard:
+            if is_matching(topic, sub.topic):
+                matches.append(sub)
+        matches.extend(node.exact)
+
+        return matches
+
+    cpdef void clear(self) except *:
+        """
+        Clear all subscriptions from the trie.
+        """
+        self._root = TopicNode()
+        self.count = 0
+
+    cdef TopicNode _find_node(self, list segments, bint create):
+        cdef TopicNode node = self._root
+        cdef TopicNode child
+        cdef str segment
+        for segment in segments:
+            child = node.children.get(segment)
+            if child is None:
+                if not create:
+                    return None
+                child = TopicNode()
+                node.children[segment] = child
+            node = child
+        return node
+
+
+cdef bint is_wildcard(str pattern) except *:
+    return "*" in pattern or "?" in pattern
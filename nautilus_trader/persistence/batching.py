@@ -15,12 +15,13 @@
 
 import heapq
 import itertools
-import sys
 from collections import namedtuple
-from typing import Dict, Iterator, List, Set
+from typing import Dict, Iterator, List, Optional
 
 import fsspec
-import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.dataset as ds
 import pyarrow.parquet as pq
 from pyarrow.lib import ArrowInvalid
@@ -39,7 +40,7 @@ def dataset_batches(
     file_meta: FileMeta,
     fs: fsspec.AbstractFileSystem,
     n_rows: int,
-) -> Iterator[pd.DataFrame]:
+) -> Iterator[pa.Table]:
     try:
         d: ds.Dataset = ds.dataset(file_meta.filename, filesystem=fs)
     except ArrowInvalid:
@@ -49,13 +50,23 @@ def dataset_batches(
         for batch in f.iter_batches(batch_size=n_rows):
             if batch.num_rows == 0:
                 break
-            df = batch.to_pandas()
-            df = df[(df["ts_init"] >= file_meta.start) & (df["ts_init"] <= file_meta.end)]
-            if df.empty:
+            table = pa.Table.from_batches([batch])
+            ts_init = table.column("ts_init")
+            in_range = pc.and_(
+                pc.greater_equal(ts_init, pa.scalar(file_meta.start, ts_init.type)),
+                pc.less_equal(ts_init, pa.scalar(file_meta.end, ts_init.type)),
+            )
+            table = table.filter(in_range)
+            if table.num_rows == 0:
                 continue
             if file_meta.instrument_id:
-                df.loc[:, "instrument_id"] = file_meta.instrument_id
-            yield df
+                instrument_ids = pa.array([file_meta.instrument_id] * table.num_rows)
+                if "instrument_id" in table.column_names:
+                    idx = table.column_names.index("instrument_id")
+                    table = table.set_column(idx, "instrument_id", instrument_ids)
+                else:
+                    table = table.append_column("instrument_id", instrument_ids)
+            yield table
 
 
 def build_filenames(
@@ -82,56 +93,144 @@ def build_filenames(
     return files
 
 
-def frame_to_nautilus(df: pd.DataFrame, cls: type):
-    return ParquetSerializer.deserialize(cls=cls, chunk=df.to_dict("records"))
+def table_to_nautilus(table: pa.Table, cls: type):
+    return ParquetSerializer.deserialize(cls=cls, chunk=table.to_pylist())
+
+
+class _StreamBuffer:
+    """
+    Provides a buffer of Arrow rows for a single file stream, kept sorted on `ts_init`.
+    """
+
+    def __init__(self, file_meta: FileMeta, batches: Iterator[pa.Table]):
+        self.file_meta = file_meta
+        self.completed = False
+        self._batches = batches
+        self._table: Optional[pa.Table] = None
+        self._ts: np.ndarray = np.empty(0, dtype=np.uint64)
+        self.row_nbytes: float = 0.0
+
+    @property
+    def num_rows(self) -> int:
+        return len(self._ts)
+
+    @property
+    def max_ts(self) -> int:
+        return int(self._ts[-1])
+
+    def fill(self, n_rows: int) -> None:
+        if self.completed or self.num_rows >= n_rows:
+            return
+        table = next(self._batches, None)
+        if table is None:
+            self.completed = True
+            return
+        # Measured on the newly read table, as buffer sizes of sliced tables
+        # include the parent buffers.
+        self.row_nbytes = table.nbytes / table.num_rows
+        if self._table is not None and self._table.num_rows:
+            table = pa.concat_tables([self._table, table], promote=True)
+        self._set_table(table)
 
+    def take_until(self, ts: int) -> Optional[pa.Table]:
+        # Zero-copy split of the buffer at the last row with `ts_init <= ts`
+        if self._table is None:
+            return None
+        n = int(np.searchsorted(self._ts, ts, side="right"))
+        if n == 0:
+            return None
+        head = self._table.slice(0, n)
+        self._table = self._table.slice(n)
+        self._ts = self._ts[n:]
+        return head
 
-def batch_files(  # noqa: C901
+    def _set_table(self, table: pa.Table) -> None:
+        ts = table.column("ts_init").to_numpy()
+        if len(ts) > 1 and np.any(ts[1:] < ts[:-1]):
+            table = table.sort_by("ts_init")
+            ts = table.column("ts_init").to_numpy()
+        self._table = table
+        self._ts = ts
+
+
+def batch_files(
     catalog: ParquetDataCatalog,
     data_configs: List[BacktestDataConfig],
     read_num_rows: int = 10000,
     target_batch_size_bytes: int = parse_bytes("100mb"),  # noqa: B008,
 ):
+    """
+    Stream the data for the given configs as batches of Nautilus objects sorted
+    on `ts_init`.
+
+    Each file is read as a stream of Arrow record batches, and the streams are
+    k-way merged on `ts_init`. Objects are only materialized for the window of
+    rows which is safe to emit (no stream can still produce an earlier row), so
+    memory is bounded by roughly `read_num_rows` per stream plus the pending
+    batch. The batch size is measured using the Arrow buffer sizes of the rows
+    which were emitted.
+
+    Parameters
+    ----------
+    catalog : ParquetDataCatalog
+        The data catalog to read from.
+    data_configs : list[BacktestDataConfig]
+        The data configurations to stream.
+    read_num_rows : int, default 10000
+        The number of rows to read from each file at a time.
+    target_batch_size_bytes : int, default 100mb
+        The target size of each yielded batch (measured as Arrow buffer bytes).
+
+    Yields
+    ------
+    list[Data]
+
+    Raises
+    ------
+    ValueError
+        If no data was found for the `data_configs`.
+
+    """
     files = build_filenames(catalog=catalog, data_configs=data_configs)
-    buffer = {fn.filename: pd.DataFrame() for fn in files}
-    datasets = {
-        f.filename: dataset_batches(file_meta=f, fs=catalog.fs, n_rows=read_num_rows) for f in files
-    }
-    completed: Set[str] = set()
+    streams = [
+        _StreamBuffer(
+            file_meta=f,
+            batches=dataset_batches(file_meta=f, fs=catalog.fs, n_rows=read_num_rows),
+        )
+        for f in files
+    ]
     bytes_read = 0
     values = []
     sent_count = 0
-    while set([f.filename for f in files]) != completed:
-        # Fill buffer (if required)
-        for fn in buffer:
-            if len(buffer[fn]) < read_num_rows:
-                next_buf = next(datasets[fn], None)
-                if next_buf is None:
-                    completed.add(fn)
-                    continue
-                buffer[fn] = pd.concat([buffer[fn], next_buf])
-
-        # Determine minimum timestamp
-        max_ts_per_frame = {fn: df["ts_init"].max() for fn, df in buffer.items() if not df.empty}
-        if not max_ts_per_frame:
-            continue
-        min_ts = min(max_ts_per_frame.values())
+    while streams:
+        # Fill buffers (if required)
+        for stream in streams:
+            stream.fill(n_rows=read_num_rows)
 
-        # Filter buffer dataframes based on min_timestamp
+        # Only streams which may still produce rows constrain the merge window,
+        # once every stream is completed all remaining rows can be emitted.
+        pending = [s.max_ts for s in streams if not s.completed and s.num_rows]
+        min_ts = min(pending) if pending else None
+
+        # Materialize objects only for the emitted window
         batches = []
-        for f in files:
-            df = buffer[f.filename]
-            if df.empty:
+        for stream in streams:
+            if min_ts is None:
+                head = stream.take_until(stream.max_ts) if stream.num_rows else None
+            else:
+                head = stream.take_until(min_ts)
+            if head is None:
                 continue
-            ts_filter = df["ts_init"] <= min_ts  # min of max timestamps
-            batch = df[ts_filter]
-            buffer[f.filename] = df[~ts_filter]
-            objs = frame_to_nautilus(df=batch, cls=f.datatype)
-            batches.append(objs)
-            bytes_read += sum([sys.getsizeof(x) for x in objs])
+            bytes_read += int(head.num_rows * stream.row_nbytes)
+            batches.append(table_to_nautilus(table=head, cls=stream.file_meta.datatype))
+
+        streams = [s for s in streams if not (s.completed and s.num_rows == 0)]
 
         # Merge ticks
-        values.extend(list(heapq.merge(*batches, key=lambda x: x.ts_init)))
+        if len(batches) == 1:
+            values.extend(batches[0])
+        elif batches:
+            values.extend(heapq.merge(*batches, key=lambda x: x.ts_init))
         if bytes_read > target_batch_size_bytes:
             yield values
             sent_count += len(values)
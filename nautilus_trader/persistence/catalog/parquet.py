@@ -23,10 +23,15 @@ import pandas as pd
 import pyarrow as pa
 import pyarrow.dataset as ds
 import pyarrow.parquet as pq
+from fsspec.implementations.local import LocalFileSystem
 from fsspec.utils import infer_storage_options
 from pyarrow import ArrowInvalid
 
+from nautilus_trader.model.data.tick import QuoteTick
+from nautilus_trader.model.data.tick import TradeTick
+from nautilus_trader.model.identifiers import InstrumentId
 from nautilus_trader.persistence.catalog.base import BaseDataCatalog
+from nautilus_trader.persistence.catalog.rust.reader import ParquetReader
 from nautilus_trader.persistence.external.metadata import load_mappings
 from nautilus_trader.serialization.arrow.serializer import ParquetSerializer
 from nautilus_trader.serialization.arrow.serializer import list_schemas
@@ -94,14 +99,36 @@ class ParquetDataCatalog(BaseDataCatalog):
         clean_instrument_keys: bool = True,
         as_dataframe: bool = True,
         projections: Optional[Dict] = None,
+        use_rust: bool = True,
         **kwargs,
     ):
-        filters = [filter_expr] if filter_expr is not None else []
         if instrument_ids is not None:
             if not isinstance(instrument_ids, list):
                 instrument_ids = [instrument_ids]
             if clean_instrument_keys:
                 instrument_ids = list(set(map(clean_key, instrument_ids)))
+
+        if (
+            use_rust
+            and not as_dataframe
+            and cls in RUST_READER_TYPES
+            and filter_expr is None
+            and ts_column == "ts_init"
+            and instrument_id_column == "instrument_id"
+            and not table_kwargs
+            and not projections
+        ):
+            objs = self._query_rust(
+                cls=cls,
+                instrument_ids=instrument_ids,
+                start=start,
+                end=end,
+            )
+            if objs is not None:
+                return objs
+
+        filters = [filter_expr] if filter_expr is not None else []
+        if instrument_ids is not None:
             filters.append(ds.field(instrument_id_column).cast("string").isin(instrument_ids))
         if start is not None:
             filters.append(ds.field(ts_column) >= int(pd.Timestamp(start).to_datetime64()))
@@ -123,12 +150,6 @@ class ParquetDataCatalog(BaseDataCatalog):
         table = dataset.to_table(filter=combine_filters(*filters), **(table_kwargs or {}))
         mappings = self.load_inverse_mappings(path=full_path)
 
-        # TODO: Un-wired rust parquet reader
-        # if isinstance(cls, QuoteTick):
-        #     reader = ParquetReader(file_path=full_path, parquet_type=QuoteTick)  # noqa
-        # elif isinstance(cls, TradeTick):
-        #     reader = ParquetReader(file_path=full_path, parquet_type=TradeTick)  # noqa
-
         if as_dataframe:
             return self._handle_table_dataframe(
                 table=table, mappings=mappings, raise_on_empty=raise_on_empty, **kwargs
@@ -136,6 +157,66 @@ class ParquetDataCatalog(BaseDataCatalog):
         else:
             return self._handle_table_nautilus(table=table, cls=cls, mappings=mappings)
 
+    def _query_rust(
+        self,
+        cls: type,
+        instrument_ids: Optional[List[str]] = None,
+        start: Optional[Union[pd.Timestamp, str, int]] = None,
+        end: Optional[Union[pd.Timestamp, str, int]] = None,
+        chunk_size: int = 10_000,
+    ) -> Optional[List]:
+        """
+        Query the catalog for `cls` objects using the chunked Rust parquet reader.
+
+        Returns ``None`` if the query cannot be served by the Rust reader (not a
+        local filesystem, or any of the files were not written in the Rust
+        layout), in which case the caller should fall back to the arrow path.
+
+        Instrument IDs are unmapped with the catalog's partition mappings, as
+        per the arrow path.
+        """
+        if not isinstance(self.fs, LocalFileSystem):
+            return None
+
+        full_path = str(self._make_path(cls=cls))
+        if not self.fs.exists(full_path):
+            return None
+
+        files = sorted(self.fs.glob(f"{full_path}/**/*.parquet"))
+        if instrument_ids is not None:
+            # Partition keys are the cleaned instrument IDs (`instrument_id=...`)
+            partitions = {f"instrument_id={key}" for key in instrument_ids}
+            files = [f for f in files if partitions.intersection(pathlib.Path(f).parts)]
+        if not files:
+            return None
+        file_instrument_ids = [_rust_parquet_instrument_id(fn, fs=self.fs) for fn in files]
+        if None in file_instrument_ids:
+            return None
+
+        instrument_id_mappings = self.load_inverse_mappings(path=full_path).get(
+            "instrument_id", {}
+        )
+
+        start_ns = int(pd.Timestamp(start).to_datetime64()) if start is not None else None
+        end_ns = int(pd.Timestamp(end).to_datetime64()) if end is not None else None
+
+        objs: List = []
+        for fn, file_instrument_id in zip(files, file_instrument_ids):
+            # Unmap the instrument ID once per file, the reader assigns it to each object
+            instrument_id = instrument_id_mappings.get(file_instrument_id)
+            reader = ParquetReader(
+                file_path=fn,
+                parquet_type=cls,
+                chunk_size=chunk_size,
+                instrument_id=InstrumentId.from_str(instrument_id) if instrument_id else None,
+            )
+            for chunk in reader:
+                # Files are written in `ts_init` order, so each chunk is sliced
+                if end_ns is not None and chunk[0].ts_init > end_ns:
+                    break
+                objs.extend(_slice_chunk_by_ts(chunk, start_ns=start_ns, end_ns=end_ns))
+        return objs
+
     def load_inverse_mappings(self, path):
         mappings = load_mappings(fs=self.fs, path=path)
         for key in mappings:
@@ -278,6 +359,45 @@ class ParquetDataCatalog(BaseDataCatalog):
         return sorted(sum(data.values(), list()), key=lambda x: x.ts_init)
 
 
+RUST_READER_TYPES = (QuoteTick, TradeTick)
+
+
+def _rust_parquet_instrument_id(path: str, fs: fsspec.AbstractFileSystem) -> Optional[str]:
+    # Files written by the Rust `ParquetWriter` hold one instrument per file, with
+    # the instrument ID and precisions stored in the schema metadata. Returns
+    # ``None`` for files not written in this layout.
+    with fs.open(path) as f:
+        metadata = pq.read_schema(f).metadata or {}
+    if b"instrument_id" not in metadata or b"price_precision" not in metadata:
+        return None
+    return metadata[b"instrument_id"].decode()
+
+
+def _slice_chunk_by_ts(chunk: List, start_ns: Optional[int], end_ns: Optional[int]) -> List:
+    # Binary searches a `ts_init` sorted chunk for the `[start_ns, end_ns]` range
+    lo = 0
+    if start_ns is not None and chunk[0].ts_init < start_ns:
+        hi = len(chunk)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if chunk[mid].ts_init < start_ns:
+                lo = mid + 1
+            else:
+                hi = mid
+    hi = len(chunk)
+    if end_ns is not None and chunk[-1].ts_init > end_ns:
+        left = lo
+        while left < hi:
+            mid = (left + hi) // 2
+            if chunk[mid].ts_init <= end_ns:
+                left = mid + 1
+            else:
+                hi = mid
+    if lo == 0 and hi == len(chunk):
+        return chunk
+    return chunk[lo:hi]
+
+
 def read_feather_file(path: str, fs: fsspec.AbstractFileSystem = None):
     fs = fs or fsspec.filesystem("file")
     if not fs.exists(path):
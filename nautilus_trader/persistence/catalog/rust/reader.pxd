@@ -15,11 +15,13 @@
 
 from nautilus_trader.core.rust.core cimport CVec
 from nautilus_trader.core.rust.persistence cimport ParquetType
+from nautilus_trader.model.identifiers cimport InstrumentId
 
 
 cdef class ParquetReader:
     cdef str _file_path
     cdef ParquetType _parquet_type
+    cdef InstrumentId _instrument_id
     cdef CVec _chunk
     cdef void* _reader
 
@@ -29,3 +31,6 @@ cdef class ParquetReader:
 
 
 cdef list _parse_quote_tick_chunk(CVec chunk)
+cdef list _parse_quote_tick_chunk_as(CVec chunk, InstrumentId instrument_id)
+cdef list _parse_trade_tick_chunk(CVec chunk)
+cdef list _parse_trade_tick_chunk_as(CVec chunk, InstrumentId instrument_id)
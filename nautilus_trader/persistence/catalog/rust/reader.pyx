@@ -24,19 +24,35 @@ from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.rust.core cimport CVec
 from nautilus_trader.core.rust.model cimport QuoteTick_t
 from nautilus_trader.core.rust.model cimport TradeTick_t
+from nautilus_trader.core.rust.model cimport trade_id_to_pystr
 from nautilus_trader.core.rust.persistence cimport ParquetType
 from nautilus_trader.core.rust.persistence cimport parquet_reader_drop
 from nautilus_trader.core.rust.persistence cimport parquet_reader_drop_chunk
 from nautilus_trader.core.rust.persistence cimport parquet_reader_index_chunk
 from nautilus_trader.core.rust.persistence cimport parquet_reader_new
 from nautilus_trader.core.rust.persistence cimport parquet_reader_next_chunk
+from nautilus_trader.model.c_enums.aggressor_side cimport AggressorSide
 from nautilus_trader.model.data.tick cimport QuoteTick
 from nautilus_trader.model.data.tick cimport TradeTick
+from nautilus_trader.model.identifiers cimport InstrumentId
+from nautilus_trader.model.identifiers cimport TradeId
 
 
 cdef class ParquetReader:
     """
     Provides a parquet reader implemented in Rust under the hood.
+
+    Parameters
+    ----------
+    file_path : str
+        The path of the file to read.
+    parquet_type : type
+        The type of data to read.
+    chunk_size : uint64_t
+        The maximum number of objects per chunk.
+    instrument_id : InstrumentId, optional
+        The instrument ID to assign to the read objects, replacing the one in
+        the file metadata (e.g. to reverse a catalog partition mapping).
     """
 
     def __init__(
@@ -44,6 +60,7 @@ cdef class ParquetReader:
         str file_path,
         type parquet_type,
         uint64_t chunk_size=1000,  # TBD
+        InstrumentId instrument_id=None,
     ):
         Condition.valid_string(file_path, "file_path")
         if not os.path.exists(file_path):
@@ -51,6 +68,7 @@ cdef class ParquetReader:
 
         self._file_path = file_path
         self._parquet_type = py_type_to_parquet_type(parquet_type)
+        self._instrument_id = instrument_id
         self._reader = parquet_reader_new(
             file_path=<PyObject *>self._file_path,
             reader_type=self._parquet_type,
@@ -79,8 +97,12 @@ cdef class ParquetReader:
     cdef list _parse_chunk(self, CVec chunk):
         # Initialize Python objects from the rust vector.
         if self._parquet_type == ParquetType.QuoteTick:
+            if self._instrument_id is not None:
+                return _parse_quote_tick_chunk_as(chunk, self._instrument_id)
             return _parse_quote_tick_chunk(chunk)
         elif self._parquet_type == ParquetType.TradeTick:
+            if self._instrument_id is not None:
+                return _parse_trade_tick_chunk_as(chunk, self._instrument_id)
             return _parse_trade_tick_chunk(chunk)
         else:
             raise RuntimeError("")
@@ -107,6 +129,32 @@ cdef list _parse_quote_tick_chunk(CVec chunk):
 
     return ticks
 
+
+cdef list _parse_quote_tick_chunk_as(CVec chunk, InstrumentId instrument_id):
+    cdef list ticks = []
+
+    cdef:
+        QuoteTick_t _mem
+        uint64_t i
+    for i in range(0, chunk.len):
+        _mem = (<QuoteTick_t *>(parquet_reader_index_chunk(chunk, ParquetType.QuoteTick, i)))[0]
+        ticks.append(
+            QuoteTick.from_raw_c(
+                instrument_id,
+                _mem.bid.raw,
+                _mem.ask.raw,
+                _mem.bid.precision,
+                _mem.bid_size.raw,
+                _mem.ask_size.raw,
+                _mem.bid_size.precision,
+                _mem.ts_event,
+                _mem.ts_init,
+            )
+        )
+
+    return ticks
+
+
 cdef list _parse_trade_tick_chunk(CVec chunk):
     cdef list ticks = []
 
@@ -123,3 +171,28 @@ cdef list _parse_trade_tick_chunk(CVec chunk):
         ticks.append(tick)
 
     return ticks
+
+
+cdef list _parse_trade_tick_chunk_as(CVec chunk, InstrumentId instrument_id):
+    cdef list ticks = []
+
+    cdef:
+        TradeTick_t _mem
+        uint64_t i
+    for i in range(0, chunk.len):
+        _mem = (<TradeTick_t *>(parquet_reader_index_chunk(chunk, ParquetType.TradeTick, i)))[0]
+        ticks.append(
+            TradeTick.from_raw_c(
+                instrument_id,
+                _mem.price.raw,
+                _mem.price.precision,
+                _mem.size.raw,
+                _mem.size.precision,
+                <AggressorSide>_mem.aggressor_side,
+                TradeId(<str>trade_id_to_pystr(&_mem.trade_id)),
+                _mem.ts_event,
+                _mem.ts_init,
+            )
+        )
+
+    return ticks
@@ -19,6 +19,9 @@ from nautilus_trader.core.rust.persistence cimport ParquetType
 cdef class ParquetWriter:
     cdef void *_writer
     cdef ParquetType _parquet_type
-    cpdef void write(self, list items)
-    cdef void _write(self, list items)
-    # cdef list _parse(self, list items)
+
+    cpdef void write(self, list items) except *
+    cpdef void close(self) except *
+    cdef void _write(self, list items) except *
+    cdef void _write_quote_ticks(self, list items) except *
+    cdef void _write_trade_ticks(self, list items) except *
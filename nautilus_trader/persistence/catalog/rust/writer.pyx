@@ -18,26 +18,46 @@ import os
 from nautilus_trader.persistence.catalog.rust.common import py_type_to_parquet_type
 
 from cpython.object cimport PyObject
+from libc.stdlib cimport free
+from libc.stdlib cimport malloc
 
 from nautilus_trader.core.correctness cimport Condition
-from nautilus_trader.core.rust.core cimport CVec
-from nautilus_trader.core.rust.core cimport cvec_new
-from nautilus_trader.core.rust.persistence cimport parquet_writer_chunk_append
+from nautilus_trader.core.rust.model cimport QuoteTick_t
+from nautilus_trader.core.rust.model cimport TradeTick_t
+from nautilus_trader.core.rust.persistence cimport ParquetType
+from nautilus_trader.core.rust.persistence cimport parquet_writer_drop
 from nautilus_trader.core.rust.persistence cimport parquet_writer_new
+from nautilus_trader.core.rust.persistence cimport parquet_writer_write
 from nautilus_trader.model.data.tick cimport QuoteTick
+from nautilus_trader.model.data.tick cimport TradeTick
 
 
 cdef class ParquetWriter:
     """
     Provides a parquet writer implemented in Rust under the hood.
+
+    The file is only complete once the writer is closed (or dropped).
+
+    Parameters
+    ----------
+    file_path : str
+        The path of the file to write.
+    parquet_type : type
+        The type of data to write.
+    metadata : dict[str, str], optional
+        The schema metadata. The Rust reader requires the `instrument_id`,
+        `price_precision` and `size_precision` of the data.
     """
+
     def __init__(
         self,
         str file_path,
         type parquet_type,
-        dict metadata = {"key": "value"}, # TODO
+        dict metadata = None,
     ):
         Condition.valid_string(file_path, "file_path")
+        if metadata is None:
+            metadata = {}
 
         assert  all(isinstance(k, str) and isinstance(v, str)
                 for k, v in metadata.items())
@@ -51,16 +71,66 @@ cdef class ParquetWriter:
             <PyObject *>metadata,
         )
 
-    cpdef void write(self, list items):
+    def __dealloc__(self) -> None:
+        # Only the native writer is touched here, as required during deallocation
+        if self._writer != NULL:
+            parquet_writer_drop(self._writer, self._parquet_type)
+            self._writer = NULL
+
+    cpdef void write(self, list items) except *:
+        if self._writer == NULL:
+            raise RuntimeError("writer was closed")
+        if not items:
+            return
+
         self._write(items)
 
-    cdef void _write(self, list items):
-        cdef CVec chunk = cvec_new()
+    cpdef void close(self) except *:
+        if self._writer == NULL:
+            return
+
+        # Dropping the writer writes the file footer
+        parquet_writer_drop(self._writer, self._parquet_type)
+        self._writer = NULL
+
+    cdef void _write(self, list items) except *:
+        if self._parquet_type == ParquetType.QuoteTick:
+            self._write_quote_ticks(items)
+        elif self._parquet_type == ParquetType.TradeTick:
+            self._write_trade_ticks(items)
+        else:
+            raise RuntimeError(f"Cannot write {self._parquet_type} data with the Rust writer.")
+
+    cdef void _write_quote_ticks(self, list items) except *:
+        cdef QuoteTick_t *data = <QuoteTick_t *>malloc(len(items) * sizeof(QuoteTick_t))
+        if data == NULL:
+            raise MemoryError()
 
         cdef:
             QuoteTick tick
-            void *item
-        tick = <QuoteTick>items[0]
-        item = <void *>&tick._mem
+            int i
+        try:
+            # The structs are borrowed by the writer, so are not freed individually
+            for i in range(len(items)):
+                tick = <QuoteTick>items[i]
+                data[i] = tick._mem
+            parquet_writer_write(self._writer, self._parquet_type, <void *>data, len(items))
+        finally:
+            free(data)
 
-        chunk = parquet_writer_chunk_append(chunk, item, self._parquet_type)
+    cdef void _write_trade_ticks(self, list items) except *:
+        cdef TradeTick_t *data = <TradeTick_t *>malloc(len(items) * sizeof(TradeTick_t))
+        if data == NULL:
+            raise MemoryError()
+
+        cdef:
+            TradeTick tick
+            int i
+        try:
+            # The structs are borrowed by the writer, so are not freed individually
+            for i in range(len(items)):
+                tick = <TradeTick>items[i]
+                data[i] = tick._mem
+            parquet_writer_write(self._writer, self._parquet_type, <void *>data, len(items))
+        finally:
+            free(data)
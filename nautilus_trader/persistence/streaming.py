@@ -15,7 +15,7 @@
 
 import datetime
 import pathlib
-from typing import BinaryIO, Dict, Optional, Set, Tuple
+from typing import Any, BinaryIO, Dict, List, Optional, Set, Tuple
 
 import fsspec
 import pyarrow as pa
@@ -39,6 +39,10 @@ from nautilus_trader.serialization.arrow.util import GENERIC_DATA_PREFIX
 from nautilus_trader.serialization.arrow.util import list_dicts_to_dict_lists
 
 
+# The estimated bytes per value of a variable width column (offset plus value)
+_VARIABLE_WIDTH_NBYTES = 24
+
+
 class StreamingFeatherWriter:
     """
     Provides a stream writer of Nautilus objects into feather files.
@@ -55,6 +59,22 @@ class StreamingFeatherWriter:
         The flush interval (milliseconds) for writing chunks.
     replace : bool, default False
         If existing files at the given `path` should be replaced.
+    include_types : Tuple[type], optional
+        The types to write (if ``None`` then all types with a schema are written).
+    batch_size : int, optional
+        The number of rows to buffer per table before writing a single record
+        batch. If ``None`` then every object is written as its own record batch.
+    batch_bytes : int, optional
+        The estimated buffered size (bytes) per table at which a record batch
+        is written (only applies when `batch_size` is set). Row sizes are
+        estimated from the table schema until the first batch is written.
+
+    Notes
+    -----
+    In buffered mode a row which fails to serialize is logged and dropped,
+    without dropping the other rows of its batch. Pending rows are only
+    written on a call to `write`, `check_flush`, `flush` or `close`, so the
+    owner of a quiet stream should call `check_flush` periodically.
     """
 
     def __init__(
@@ -65,7 +85,13 @@ class StreamingFeatherWriter:
         flush_interval_ms: Optional[int] = None,
         replace: bool = False,
         include_types: Optional[Tuple[type]] = None,
+        batch_size: Optional[int] = None,
+        batch_bytes: Optional[int] = None,
     ):
+        if batch_size is not None:
+            PyCondition.positive_int(batch_size, "batch_size")
+        if batch_bytes is not None:
+            PyCondition.positive_int(batch_bytes, "batch_bytes")
         self.fs: fsspec.AbstractFileSystem = fsspec.filesystem(fs_protocol)
         self.path = self._check_path(path)
         self.include_types = include_types
@@ -90,6 +116,26 @@ class StreamingFeatherWriter:
         self._last_flush = datetime.datetime(1970, 1, 1)  # Default value to begin
         self.missing_writers: Set[type] = set()
 
+        # Buffered (columnar micro-batching) mode
+        self.batch_size = batch_size
+        self.batch_bytes = batch_bytes
+        self._buffers: Dict[str, Dict[str, List[Any]]] = {}
+        self._buffer_schemas: Dict[str, pa.Schema] = {}
+        self._buffer_rows: Dict[str, int] = {}
+        self._row_nbytes: Dict[str, float] = {}
+
+    @property
+    def is_buffered(self) -> bool:
+        """
+        If the writer buffers rows into multi-row record batches.
+
+        Returns
+        -------
+        bool
+
+        """
+        return self.batch_size is not None
+
     def _check_path(self, p: str) -> str:
         path = pathlib.Path(p)
         err_parent = f"Parent of path {path} does not exist, please create it"
@@ -170,10 +216,14 @@ class StreamingFeatherWriter:
                 return
             else:
                 return
-        writer: RecordBatchStreamWriter = self._writers[table]
         serialized = ParquetSerializer.serialize(obj)
         if isinstance(serialized, dict):
             serialized = [serialized]
+        if self.is_buffered:
+            self._buffer_rows_for(table=table, cls=cls, rows=serialized)
+            self.check_flush()
+            return
+        writer: RecordBatchStreamWriter = self._writers[table]
         original = list_dicts_to_dict_lists(
             serialized,
             keys=self._schemas[cls].names,
@@ -188,6 +238,80 @@ class StreamingFeatherWriter:
             self.logger.error(f"ERROR = `{e}`")
             self.logger.debug(f"data = {original}")
 
+    def _buffer_rows_for(self, table: str, cls: type, rows: List[Dict]) -> None:
+        columns = self._buffers.get(table)
+        if columns is None:
+            schema = self._schemas[cls]
+            columns = {name: [] for name in schema.names}
+            self._buffers[table] = columns
+            self._buffer_schemas[table] = schema
+            self._buffer_rows[table] = 0
+            self._row_nbytes[table] = _estimate_row_nbytes(schema)
+
+        for row in rows:
+            for name, values in columns.items():
+                values.append(row.get(name))
+
+        count = self._buffer_rows[table] + len(rows)
+        self._buffer_rows[table] = count
+        if count >= self.batch_size:
+            self._write_buffer(table)
+        elif self.batch_bytes is not None and count * self._row_nbytes[table] >= self.batch_bytes:
+            self._write_buffer(table)
+
+    def _write_buffer(self, table: str) -> None:
+        count = self._buffer_rows.get(table, 0)
+        if count == 0:
+            return
+        columns = self._buffers[table]
+        schema = self._buffer_schemas[table]
+        try:
+            batch = self._build_batch(table, list(columns.values()), schema, count)
+            if batch.num_rows > 0:
+                self._writers[table].write_batch(batch)
+                # Track the average row size so the byte threshold can be estimated
+                # without building arrays for every buffered row.
+                self._row_nbytes[table] = batch.nbytes / batch.num_rows
+        except Exception as e:
+            self.logger.error(f"Failed to write batch for {table=}")
+            self.logger.error(f"ERROR = `{e}`")
+        finally:
+            for values in columns.values():
+                values.clear()
+            self._buffer_rows[table] = 0
+
+    def _build_batch(
+        self,
+        table: str,
+        data: List[List[Any]],
+        schema: pa.Schema,
+        count: int,
+    ) -> pa.RecordBatch:
+        try:
+            return pa.record_batch(data, schema=schema)
+        except Exception as e:
+            self.logger.warning(f"Failed to serialize batch for {table=}, retrying by row: {e}")
+
+        # Find and drop the rows which fail to serialize, keeping the rest
+        valid: List[int] = []
+        for i in range(count):
+            row = [[values[i]] for values in data]
+            try:
+                pa.record_batch(row, schema=schema)
+            except Exception as e:
+                self.logger.error(f"Failed to serialize row for {table=}")
+                self.logger.error(f"ERROR = `{e}`")
+                self.logger.debug(f"data = {dict(zip(schema.names, row))}")
+                continue
+            valid.append(i)
+
+        return pa.record_batch([[values[i] for i in valid] for values in data], schema=schema)
+
+    def _write_buffers(self) -> None:
+        for table in self._buffers:
+            if table in self._writers:
+                self._write_buffer(table)
+
     def check_flush(self) -> None:
         """
         Flush all stream writers if current time greater than the next flush interval.
@@ -200,7 +324,10 @@ class StreamingFeatherWriter:
     def flush(self) -> None:
         """
         Flush all stream writers.
+
+        In buffered mode any pending rows are first written as record batches.
         """
+        self._write_buffers()
         for cls in self._files:
             self._files[cls].flush()
 
@@ -216,6 +343,19 @@ class StreamingFeatherWriter:
             self._files[cls].close()
 
 
+def _estimate_row_nbytes(schema: pa.Schema) -> float:
+    nbytes = 0.0
+    for field in schema:
+        dtype = field.type
+        if pa.types.is_dictionary(dtype):
+            dtype = dtype.index_type
+        try:
+            nbytes += dtype.bit_width / 8
+        except ValueError:  # Variable width
+            nbytes += _VARIABLE_WIDTH_NBYTES
+    return nbytes
+
+
 def generate_signal_class(name: str):
     """
     Dynamically create a Data subclass for this signal.
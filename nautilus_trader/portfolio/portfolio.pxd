@@ -20,6 +20,7 @@ from nautilus_trader.common.clock cimport Clock
 from nautilus_trader.common.logging cimport LoggerAdapter
 from nautilus_trader.model.c_enums.order_side cimport OrderSide
 from nautilus_trader.model.data.tick cimport QuoteTick
+from nautilus_trader.model.data.tick cimport TradeTick
 from nautilus_trader.model.events.account cimport AccountState
 from nautilus_trader.model.events.order cimport OrderEvent
 from nautilus_trader.model.events.position cimport PositionEvent
@@ -42,12 +43,25 @@ cdef class Portfolio(PortfolioFacade):
     cdef dict _unrealized_pnls
     cdef dict _net_positions
     cdef set _pending_calcs
+    cdef set _open_instruments
+    cdef dict _xrate_dependents
+    cdef dict _net_exposures
+    cdef dict _pnl_contributions
+    cdef dict _exposure_contributions
+    cdef dict _venue_pnls
+    cdef dict _venue_exposures
+    cdef dict _pnl_failures
+    cdef dict _exposure_failures
+
+    cdef readonly bint incremental
+    """If unrealized PnL and net exposures are maintained incrementally.\n\n:returns: `bool`"""
 
 # -- COMMANDS -------------------------------------------------------------------------------------
 
     cpdef void initialize_orders(self) except *
     cpdef void initialize_positions(self) except *
     cpdef void update_quote_tick(self, QuoteTick tick) except *
+    cpdef void update_trade_tick(self, TradeTick tick) except *
     cpdef void update_account(self, AccountState event) except *
     cpdef void update_order(self, OrderEvent event) except *
     cpdef void update_position(self, PositionEvent event) except *
@@ -58,5 +72,12 @@ cdef class Portfolio(PortfolioFacade):
     cdef object _net_position(self, InstrumentId instrument_id)
     cdef void _update_net_position(self, InstrumentId instrument_id, list positions_open) except *
     cdef Money _calculate_unrealized_pnl(self, InstrumentId instrument_id)
+    cdef Money _calculate_net_exposure(self, InstrumentId instrument_id)
+    cdef void _update_incremental(self, InstrumentId instrument_id, list positions_open) except *
+    cdef void _refresh_for_price(self, InstrumentId instrument_id) except *
+    cdef void _refresh_instrument(self, InstrumentId instrument_id) except *
+    cdef void _apply_contribution(self, dict totals, dict contributions, InstrumentId instrument_id, Money value) except *
+    cdef bint _requires_xrate(self, InstrumentId instrument_id) except *
+    cdef void _clear_incremental(self) except *
     cdef Price _get_last_price(self, Position position)
     cdef double _calculate_xrate_to_base(self, Account account, Instrument instrument, OrderSide side)
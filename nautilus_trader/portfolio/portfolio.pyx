@@ -90,6 +90,13 @@ cdef class Portfolio(PortfolioFacade):
         The clock for the portfolio.
     logger : Logger
         The logger for the portfolio.
+    incremental : bool, default False
+        If unrealized PnL and net exposures should be maintained incrementally.
+        Each instrument is recalculated on its own quotes and position events
+        (and on quotes for its venue if a conversion to the account base
+        currency is required), with running per-venue sums kept so that venue
+        level queries do not recalculate every open position. Positions must
+        be in the cache before their events are applied to the portfolio.
     """
 
     def __init__(
@@ -98,6 +105,7 @@ cdef class Portfolio(PortfolioFacade):
         CacheFacade cache not None,
         Clock clock not None,
         Logger logger = None,
+        bint incremental = False,
     ):
         self._clock = clock
         self._log = LoggerAdapter(component_name=type(self).__name__, logger=logger)
@@ -113,6 +121,18 @@ cdef class Portfolio(PortfolioFacade):
         self._net_positions = {}     # type: dict[InstrumentId, float]
         self._pending_calcs = set()  # type: set[InstrumentId]
 
+        # Incremental state
+        self.incremental = incremental
+        self._open_instruments = set()       # type: set[InstrumentId]
+        self._xrate_dependents = {}          # type: dict[Venue, set[InstrumentId]]
+        self._net_exposures = {}             # type: dict[InstrumentId, Money]
+        self._pnl_contributions = {}         # type: dict[InstrumentId, Money]
+        self._exposure_contributions = {}    # type: dict[InstrumentId, Money]
+        self._venue_pnls = {}                # type: dict[Venue, dict[Currency, list]]
+        self._venue_exposures = {}           # type: dict[Venue, dict[Currency, list]]
+        self._pnl_failures = {}              # type: dict[Venue, set[InstrumentId]]
+        self._exposure_failures = {}         # type: dict[Venue, set[InstrumentId]]
+
         self.analyzer = PortfolioAnalyzer()
 
         # Register default statistics
@@ -139,6 +159,9 @@ cdef class Portfolio(PortfolioFacade):
 
         # Required subscriptions
         self._msgbus.subscribe(topic="data.quotes*", handler=self.update_quote_tick, priority=10)
+        if self.incremental:
+            # Last prices fall back to trade ticks, which also move PnLs and exposures
+            self._msgbus.subscribe(topic="data.trades*", handler=self.update_trade_tick, priority=10)
         self._msgbus.subscribe(topic="events.order*", handler=self.update_order, priority=10)
         self._msgbus.subscribe(topic="events.position*", handler=self.update_position, priority=10)
         self._msgbus.subscribe(topic="events.account*", handler=self.update_account, priority=10)
@@ -215,6 +238,7 @@ cdef class Portfolio(PortfolioFacade):
         """
         # Clean slate
         self._unrealized_pnls.clear()
+        self._clear_incremental()
 
         cdef list all_positions_open = self._cache.positions_open()
 
@@ -242,7 +266,10 @@ cdef class Portfolio(PortfolioFacade):
                 positions_open=positions_open,
             )
 
-            self._unrealized_pnls[instrument_id] = self._calculate_unrealized_pnl(instrument_id)
+            if self.incremental:
+                self._update_incremental(instrument_id, positions_open)
+            else:
+                self._unrealized_pnls[instrument_id] = self._calculate_unrealized_pnl(instrument_id)
 
             account = self._cache.account_for_venue(instrument_id.venue)
             if account is None:
@@ -289,9 +316,10 @@ cdef class Portfolio(PortfolioFacade):
         """
         Update the portfolio with the given tick.
 
-        Clears the unrealized PnL for the quote ticks instrument, and
-        performs any initialization calculations which may have been pending
-        a market quote update.
+        Clears the unrealized PnL for the quote ticks instrument (or
+        recalculates the affected instruments if incremental), and performs any
+        initialization calculations which may have been pending a market quote
+        update.
 
         Parameters
         ----------
@@ -301,7 +329,10 @@ cdef class Portfolio(PortfolioFacade):
         """
         Condition.not_none(tick, "tick")
 
-        self._unrealized_pnls.pop(tick.instrument_id, None)
+        if self.incremental:
+            self._refresh_for_price(tick.instrument_id)
+        else:
+            self._unrealized_pnls.pop(tick.instrument_id, None)
 
         if self.initialized:
             return
@@ -364,6 +395,24 @@ cdef class Portfolio(PortfolioFacade):
             if not self._pending_calcs:
                 self.initialized = True
 
+    cpdef void update_trade_tick(self, TradeTick tick) except *:
+        """
+        Update the portfolio with the given tick.
+
+        Only subscribed when incremental, in which case the instruments
+        affected by the trade price are recalculated.
+
+        Parameters
+        ----------
+        tick : TradeTick
+            The tick to update with.
+
+        """
+        Condition.not_none(tick, "tick")
+
+        if self.incremental:
+            self._refresh_for_price(tick.instrument_id)
+
     cpdef void update_account(self, AccountState event) except *:
         """
         Apply the given account state.
@@ -489,9 +538,12 @@ cdef class Portfolio(PortfolioFacade):
             positions_open=positions_open
         )
 
-        self._unrealized_pnls[event.instrument_id] = self._calculate_unrealized_pnl(
-            instrument_id=event.instrument_id,
-        )
+        if self.incremental:
+            self._update_incremental(event.instrument_id, positions_open)
+        else:
+            self._unrealized_pnls[event.instrument_id] = self._calculate_unrealized_pnl(
+                instrument_id=event.instrument_id,
+            )
 
         cdef Account account = self._cache.account(event.account_id)
         if account is None:
@@ -541,6 +593,7 @@ cdef class Portfolio(PortfolioFacade):
         self._net_positions.clear()
         self._unrealized_pnls.clear()
         self._pending_calcs.clear()
+        self._clear_incremental()
         self.analyzer.reset()
 
         self.initialized = False
@@ -675,6 +728,20 @@ cdef class Portfolio(PortfolioFacade):
         """
         Condition.not_none(venue, "venue")
 
+        cdef set failures
+        if self.incremental:
+            failures = self._pnl_failures.get(venue)
+            if failures:
+                self._log.error(
+                    f"Cannot calculate unrealized PnLs: "
+                    f"insufficient data for {sorted(str(i) for i in failures)}."
+                )
+                return None  # Cannot calculate
+            return {
+                currency: Money(total[0], currency)
+                for currency, total in self._venue_pnls.get(venue, {}).items()
+            }
+
         cdef list positions_open = self._cache.positions_open(venue)
         if not positions_open:
             return {}  # Nothing to calculate
@@ -695,7 +762,7 @@ cdef class Portfolio(PortfolioFacade):
             # Calculate PnL
             pnl = self._calculate_unrealized_pnl(instrument_id)
             if pnl is None:
-                continue  # Error logged in `_calculate_unrealized_pnl`
+                return None  # Error logged in `_calculate_unrealized_pnl`
             unrealized_pnls[pnl.currency] = unrealized_pnls.get(pnl.currency, 0.0) + pnl.as_f64_c()
 
         return {k: Money(v, k) for k, v in unrealized_pnls.items()}
@@ -724,6 +791,20 @@ cdef class Portfolio(PortfolioFacade):
             )
             return None  # Cannot calculate
 
+        cdef set failures
+        if self.incremental:
+            failures = self._exposure_failures.get(venue)
+            if failures:
+                self._log.error(
+                    f"Cannot calculate net exposures: "
+                    f"insufficient data for {sorted(str(i) for i in failures)}."
+                )
+                return None  # Cannot calculate
+            return {
+                currency: Money(total[0], currency)
+                for currency, total in self._venue_exposures.get(venue, {}).items()
+            }
+
         cdef list positions_open = self._cache.positions_open(venue)
         if not positions_open:
             return {}  # Nothing to calculate
@@ -825,68 +906,13 @@ cdef class Portfolio(PortfolioFacade):
         """
         Condition.not_none(instrument_id, "instrument_id")
 
-        cdef Account account = self._cache.account_for_venue(instrument_id.venue)
-        if account is None:
-            self._log.error(
-                f"Cannot calculate net exposure: "
-                f"no account registered for {instrument_id.venue}."
-            )
-            return None  # Cannot calculate
-
-        cdef instrument = self._cache.instrument(instrument_id)
-        if instrument is None:
-            self._log.error(
-                f"Cannot calculate net exposure: "
-                f"no instrument for {instrument_id}."
-            )
-            return None  # Cannot calculate
+        cdef Money net_exposure
+        if self.incremental:
+            net_exposure = self._net_exposures.get(instrument_id)
+            if net_exposure is not None:
+                return net_exposure
 
-        cdef list positions_open = self._cache.positions_open(
-            venue=None,  # Faster query filtering
-            instrument_id=instrument_id,
-        )
-        if not positions_open:
-            return Money(0, instrument.get_cost_currency())
-
-        cdef double net_exposure = 0.0
-
-        cdef:
-            Position position
-            Price last
-            double xrate
-            Money notional_value
-        for position in positions_open:
-            last = self._get_last_price(position)
-            if last is None:
-                self._log.error(
-                    f"Cannot calculate net exposure: "
-                    f"no prices for {position.instrument_id}."
-                )
-                continue  # Cannot calculate
-
-            xrate = self._calculate_xrate_to_base(
-                instrument=instrument,
-                account=account,
-                side=position.entry,
-            )
-
-            if xrate == 0.0:
-                self._log.error(
-                    f"Cannot calculate net exposure: "
-                    f"insufficient data for {instrument.get_cost_currency()}/{account.base_currency}."
-                )
-                return None  # Cannot calculate
-
-            notional_value = instrument.notional_value(
-                position.quantity,
-                last,
-            )
-            net_exposure += notional_value.as_f64_c() * xrate
-
-        if account.base_currency is not None:
-            return Money(net_exposure, account.base_currency)
-        else:
-            return Money(net_exposure, instrument.get_cost_currency())
+        return self._calculate_net_exposure(instrument_id)
 
     cpdef object net_position(self, InstrumentId instrument_id):
         """
@@ -1072,6 +1098,70 @@ cdef class Portfolio(PortfolioFacade):
 
         return Money(total_pnl, currency)
 
+    cdef Money _calculate_net_exposure(self, InstrumentId instrument_id):
+        cdef Account account = self._cache.account_for_venue(instrument_id.venue)
+        if account is None:
+            self._log.error(
+                f"Cannot calculate net exposure: "
+                f"no account registered for {instrument_id.venue}."
+            )
+            return None  # Cannot calculate
+
+        cdef instrument = self._cache.instrument(instrument_id)
+        if instrument is None:
+            self._log.error(
+                f"Cannot calculate net exposure: "
+                f"no instrument for {instrument_id}."
+            )
+            return None  # Cannot calculate
+
+        cdef list positions_open = self._cache.positions_open(
+            venue=None,  # Faster query filtering
+            instrument_id=instrument_id,
+        )
+        if not positions_open:
+            return Money(0, instrument.get_cost_currency())
+
+        cdef double net_exposure = 0.0
+
+        cdef:
+            Position position
+            Price last
+            double xrate
+            Money notional_value
+        for position in positions_open:
+            last = self._get_last_price(position)
+            if last is None:
+                self._log.error(
+                    f"Cannot calculate net exposure: "
+                    f"no prices for {position.instrument_id}."
+                )
+                continue  # Cannot calculate
+
+            xrate = self._calculate_xrate_to_base(
+                instrument=instrument,
+                account=account,
+                side=position.entry,
+            )
+
+            if xrate == 0.0:
+                self._log.error(
+                    f"Cannot calculate net exposure: "
+                    f"insufficient data for {instrument.get_cost_currency()}/{account.base_currency}."
+                )
+                return None  # Cannot calculate
+
+            notional_value = instrument.notional_value(
+                position.quantity,
+                last,
+            )
+            net_exposure += notional_value.as_f64_c() * xrate
+
+        if account.base_currency is not None:
+            return Money(net_exposure, account.base_currency)
+        else:
+            return Money(net_exposure, instrument.get_cost_currency())
+
     cdef Price _get_last_price(self, Position position):
         cdef QuoteTick quote_tick = self._cache.quote_tick(position.instrument_id)
         if quote_tick is not None:
@@ -1097,3 +1187,119 @@ cdef class Portfolio(PortfolioFacade):
             )
 
         return Decimal(1)  # No conversion needed
+
+    cdef void _update_incremental(self, InstrumentId instrument_id, list positions_open) except *:
+        cdef set dependents = self._xrate_dependents.get(instrument_id.venue)
+        if positions_open:
+            self._open_instruments.add(instrument_id)
+            if self._requires_xrate(instrument_id):
+                if dependents is None:
+                    dependents = set()
+                    self._xrate_dependents[instrument_id.venue] = dependents
+                dependents.add(instrument_id)
+            self._refresh_instrument(instrument_id)
+            return
+
+        # No open positions remain for the instrument
+        self._open_instruments.discard(instrument_id)
+        if dependents is not None:
+            dependents.discard(instrument_id)
+        self._pnl_failures.get(instrument_id.venue, set()).discard(instrument_id)
+        self._exposure_failures.get(instrument_id.venue, set()).discard(instrument_id)
+        self._unrealized_pnls[instrument_id] = self._calculate_unrealized_pnl(instrument_id)
+        self._net_exposures.pop(instrument_id, None)
+        self._apply_contribution(self._venue_pnls, self._pnl_contributions, instrument_id, None)
+        self._apply_contribution(self._venue_exposures, self._exposure_contributions, instrument_id, None)
+
+    cdef void _refresh_for_price(self, InstrumentId instrument_id) except *:
+        # Recalculates the instrument, and those converted with the venues rates
+        if instrument_id in self._open_instruments:
+            self._refresh_instrument(instrument_id)
+
+        cdef set dependents = self._xrate_dependents.get(instrument_id.venue)
+        if not dependents:
+            return
+
+        cdef InstrumentId dependent
+        for dependent in dependents:
+            if dependent != instrument_id:
+                self._refresh_instrument(dependent)
+
+    cdef void _refresh_instrument(self, InstrumentId instrument_id) except *:
+        cdef Money pnl = self._calculate_unrealized_pnl(instrument_id)
+        cdef Money net_exposure = self._calculate_net_exposure(instrument_id)
+
+        self._unrealized_pnls[instrument_id] = pnl
+        if pnl is None:
+            # Venue unrealized PnLs cannot be calculated until this succeeds
+            self._pnl_failures.setdefault(instrument_id.venue, set()).add(instrument_id)
+        else:
+            self._pnl_failures.get(instrument_id.venue, set()).discard(instrument_id)
+
+        if net_exposure is None:
+            # Venue net exposures cannot be calculated until this succeeds
+            self._net_exposures.pop(instrument_id, None)
+            self._exposure_failures.setdefault(instrument_id.venue, set()).add(instrument_id)
+        else:
+            self._net_exposures[instrument_id] = net_exposure
+            self._exposure_failures.get(instrument_id.venue, set()).discard(instrument_id)
+
+        self._apply_contribution(self._venue_pnls, self._pnl_contributions, instrument_id, pnl)
+        self._apply_contribution(self._venue_exposures, self._exposure_contributions, instrument_id, net_exposure)
+
+    cdef void _apply_contribution(
+        self,
+        dict totals,
+        dict contributions,
+        InstrumentId instrument_id,
+        Money value,
+    ) except *:
+        # Venue totals are held per currency as [sum, contributor count], so a
+        # currency is removed once no instrument contributes to it. Sums are
+        # held as `Decimal` so repeated updates do not accumulate float error
+        cdef dict venue_totals = totals.get(instrument_id.venue)
+        if venue_totals is None:
+            venue_totals = {}
+            totals[instrument_id.venue] = venue_totals
+
+        cdef list total
+        cdef Money previous = contributions.pop(instrument_id, None)
+        if previous is not None:
+            total = venue_totals[previous.currency]
+            total[0] -= previous.as_decimal()
+            total[1] -= 1
+            if total[1] == 0:
+                del venue_totals[previous.currency]
+
+        if value is None:
+            return
+
+        contributions[instrument_id] = value
+        total = venue_totals.get(value.currency)
+        if total is None:
+            venue_totals[value.currency] = [value.as_decimal(), 1]
+        else:
+            total[0] += value.as_decimal()
+            total[1] += 1
+
+    cdef bint _requires_xrate(self, InstrumentId instrument_id) except *:
+        cdef Account account = self._cache.account_for_venue(instrument_id.venue)
+        if account is None or account.base_currency is None:
+            return False
+
+        cdef Instrument instrument = self._cache.instrument(instrument_id)
+        if instrument is None:
+            return False
+
+        return instrument.get_cost_currency() != account.base_currency
+
+    cdef void _clear_incremental(self) except *:
+        self._open_instruments.clear()
+        self._xrate_dependents.clear()
+        self._net_exposures.clear()
+        self._pnl_contributions.clear()
+        self._exposure_contributions.clear()
+        self._venue_pnls.clear()
+        self._venue_exposures.clear()
+        self._pnl_failures.clear()
+        self._exposure_failures.clear()
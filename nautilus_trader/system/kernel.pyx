@@ -42,6 +42,7 @@ from nautilus_trader.persistence.streaming import StreamingFeatherWriter
 
 from nautilus_trader.cache.cache cimport Cache
 from nautilus_trader.common.actor cimport Actor
+from nautilus_trader.common.clock cimport HeapLiveClock
 from nautilus_trader.common.clock cimport LiveClock
 from nautilus_trader.common.clock cimport TestClock
 from nautilus_trader.common.logging cimport LiveLogger
@@ -59,6 +60,8 @@ from nautilus_trader.live.data_engine cimport LiveDataEngine
 from nautilus_trader.live.execution_engine cimport LiveExecutionEngine
 from nautilus_trader.live.risk_engine cimport LiveRiskEngine
 from nautilus_trader.msgbus.bus cimport MessageBus
+from nautilus_trader.msgbus.profiler cimport DispatchStats
+from nautilus_trader.msgbus.profiler cimport handler_name
 from nautilus_trader.portfolio.portfolio cimport Portfolio
 from nautilus_trader.risk.engine cimport RiskEngine
 from nautilus_trader.serialization.msgpack.serializer cimport MsgPackSerializer
@@ -117,6 +120,15 @@ cdef class NautilusKernel:
         The log level for the kernels logger.
     bypass_logging : bool, default False
         If logging to stdout should be bypassed.
+    msgbus_profiling : bool, default False
+        If message bus handler dispatch latency should be profiled.
+    portfolio_incremental : bool, default False
+        If the portfolio should maintain unrealized PnL and net exposures
+        incrementally.
+    log_sinks_async : bool, default False
+        If log records should be delivered to sinks from a background thread.
+    clock_scheduler : bool, default False
+        If live clock timers should be driven by a single min-heap scheduler.
 
     Raises
     ------
@@ -149,6 +161,10 @@ cdef class NautilusKernel:
         save_state: bool = False,
         LogLevel log_level = LogLevel.INFO,
         bypass_logging: bool = False,
+        bint msgbus_profiling = False,
+        bint portfolio_incremental = False,
+        bint log_sinks_async = False,
+        bint clock_scheduler = False,
     ):
         if uvloop is None:
             warnings.warn("uvloop is not available.")
@@ -186,7 +202,7 @@ cdef class NautilusKernel:
                 bypass=bypass_logging,
             )
         elif self.environment in (Environment.SANDBOX, Environment.LIVE):
-            self.clock = LiveClock(loop=loop)
+            self.clock = HeapLiveClock(loop=loop) if clock_scheduler else LiveClock(loop=loop)
             self.logger = LiveLogger(
                 loop=loop,
                 clock=self.clock,
@@ -198,12 +214,20 @@ cdef class NautilusKernel:
         else:  # pragma: no cover (design-time error)
             raise NotImplementedError(f"environment {environment} not recognized")
 
+        if log_sinks_async:
+            self.logger.enable_async_sinks()
+
         # Setup logging
         self.log = LoggerAdapter(
             component_name=name,
             logger=self.logger,
         )
 
+        if isinstance(self.clock, HeapLiveClock):
+            self.clock.register_logger(
+                LoggerAdapter(component_name=type(self.clock).__name__, logger=self.logger),
+            )
+
         nautilus_header(self.log)
         self.log.info("Building system kernel...")
 
@@ -241,6 +265,7 @@ cdef class NautilusKernel:
             trader_id=self.trader_id,
             clock=self.clock,
             logger=self.logger,
+            profiling=msgbus_profiling,
         )
 
         self.cache = Cache(
@@ -254,6 +279,7 @@ cdef class NautilusKernel:
             cache=self.cache,
             clock=self.clock,
             logger=self.logger,
+            incremental=portfolio_incremental,
         )
 
         ########################################################################
@@ -392,9 +418,18 @@ cdef class NautilusKernel:
             fs_protocol=config.fs_protocol,
             flush_interval_ms=config.flush_interval_ms,
             include_types=config.include_types,
-            logger=self.log
+            batch_size=config.batch_size,
+            batch_bytes=config.batch_bytes,
+            logger=self.log,
         )
         self.trader.subscribe("*", self.writer.write)
+        if self.environment != Environment.BACKTEST:
+            # Flush on an interval even when the stream is quiet (no writes)
+            self.clock.set_timer(
+                name="StreamingFeatherWriter-flush",
+                interval=self.writer.flush_interval_ms,
+                callback=lambda event: self.writer.check_flush(),
+            )
         self.log.info(f"Writing data & events to {path}")
 
     def add_log_sink(self, handler: Callable[[Dict], None]):
@@ -414,6 +449,33 @@ cdef class NautilusKernel:
         """
         self.logger.register_sink(handler=handler)
 
+    def dump_msgbus_profile(self, int n=10) -> None:
+        """
+        Log the message bus handler dispatch profile (if profiling).
+
+        Logs the stats for every profiled handler followed by the `n` slowest
+        published topics, ordered by cumulative dispatch time.
+
+        Parameters
+        ----------
+        n : int, default 10
+            The maximum count of slowest topics to log.
+
+        """
+        if not self.msgbus.is_profiling():
+            return
+
+        self.log.info("=================================================================")
+        self.log.info(" MESSAGE BUS PROFILE")
+        self.log.info("=================================================================")
+        self.log.info("Handlers (count, total_ms, mean_us, p50_us, p99_us, max_us):")
+        for stats in self.msgbus.handler_stats():
+            self.log.info(f"{stats.target} -> {handler_name(stats.handler)}: {_format_stats(stats)}")
+        self.log.info("-----------------------------------------------------------------")
+        self.log.info(f"Slowest {n} topics (count, total_ms, mean_us, p50_us, p99_us, max_us):")
+        for stats in self.msgbus.slowest_topics(n):
+            self.log.info(f"{stats.target}: {_format_stats(stats)}")
+
     def cancel_all_tasks(self) -> None:
         Condition.not_none(self.loop, "self.loop")
 
@@ -446,3 +508,14 @@ cdef class NautilusKernel:
                         "task": task,
                     }
                 )
+
+
+cdef str _format_stats(DispatchStats stats):
+    return (
+        f"{stats.count}, "
+        f"{stats.total_ns / 1_000_000:.3f}, "
+        f"{stats.mean_ns() / 1_000:.3f}, "
+        f"{stats.percentile_ns(50.0) / 1_000:.3f}, "
+        f"{stats.percentile_ns(99.0) / 1_000:.3f}, "
+        f"{stats.max_ns / 1_000:.3f}"
+    )
@@ -0,0 +1,208 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+from typing import Iterator, Optional
+
+from nautilus_trader.backtest.data.providers import TestInstrumentProvider
+from nautilus_trader.common.clock import TestClock
+from nautilus_trader.common.logging import Logger
+from nautilus_trader.config import CacheDatabaseConfig
+from nautilus_trader.infrastructure.cache import RedisCacheDatabase
+from nautilus_trader.model.currencies import USD
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.identifiers import PositionId
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from nautilus_trader.model.position import Position
+from nautilus_trader.msgbus.bus import MessageBus
+from nautilus_trader.portfolio.portfolio import Portfolio
+from nautilus_trader.serialization.msgpack.serializer import MsgPackSerializer
+from nautilus_trader.trading.strategy import Strategy
+from tests.test_kit.mocks.fake_redis import FakeRedis
+from tests.test_kit.stubs.component import TestComponentStubs
+from tests.test_kit.stubs.events import TestEventStubs
+from tests.test_kit.stubs.execution import TestExecStubs
+from tests.test_kit.stubs.identifiers import TestIdStubs
+
+
+AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+GBPUSD_SIM = TestInstrumentProvider.default_fx_ccy("GBP/USD")
+
+
+class DuplicateScanRedis(FakeRedis):
+    """
+    Provides a `FakeRedis` whose scans return every key twice, as `SCAN` may.
+    """
+
+    def scan_iter(self, match: str = "*", count: Optional[int] = None) -> Iterator[bytes]:
+        for key in list(super().scan_iter(match=match, count=count)):
+            yield key
+            yield key
+
+
+class TestRedisCacheDatabaseBulkLoading:
+    def setup(self):
+        # Fixture Setup
+        self.clock = TestClock()
+        self.logger = Logger(self.clock)
+
+        self.trader_id = TestIdStubs.trader_id()
+
+        self.msgbus = MessageBus(
+            trader_id=self.trader_id,
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        self.cache = TestComponentStubs.cache()
+
+        self.portfolio = Portfolio(
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        self.strategy = Strategy()
+        self.strategy.register(
+            trader_id=self.trader_id,
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        self.redis = FakeRedis()
+        self.database = RedisCacheDatabase(
+            trader_id=self.trader_id,
+            logger=self.logger,
+            serializer=MsgPackSerializer(timestamps_as_str=True),
+            config=CacheDatabaseConfig(type="redis", load_batch_size=4),
+            redis_client=self.redis,
+        )
+
+    def teardown(self):
+        self.database.dispose()
+
+    def _accepted_orders(self, count: int) -> list:
+        orders = []
+        for _ in range(count):
+            order = self.strategy.order_factory.limit(
+                AUDUSD_SIM.id,
+                OrderSide.BUY,
+                Quantity.from_int(100000),
+                Price.from_str("1.00000"),
+            )
+            self.database.add_order(order)
+            order.apply(TestEventStubs.order_submitted(order))
+            self.database.update_order(order)
+            order.apply(TestEventStubs.order_accepted(order))
+            self.database.update_order(order)
+            orders.append(order)
+        return orders
+
+    def _position(self, instrument, position_id: str) -> Position:
+        order = self.strategy.order_factory.market(
+            instrument.id,
+            OrderSide.BUY,
+            Quantity.from_int(100000),
+        )
+        fill = TestEventStubs.order_filled(
+            order,
+            instrument=instrument,
+            position_id=PositionId(position_id),
+            last_px=Price.from_str("1.00000"),
+        )
+        return Position(instrument=instrument, fill=fill)
+
+    def test_load_orders_scans_keys_and_fetches_in_pipelined_batches(self):
+        # Arrange
+        orders = self._accepted_orders(10)
+        self.redis.commands.clear()
+
+        # Act
+        result = self.database.load_orders()
+
+        # Assert
+        assert result == {order.client_order_id: order for order in orders}
+        assert "keys" not in self.redis.commands
+        assert self.redis.commands.count("execute") == 3  # 10 keys in batches of 4
+
+    def test_load_instruments_and_currencies_in_bulk(self):
+        # Arrange
+        self.database.add_instrument(AUDUSD_SIM)
+        self.database.add_instrument(GBPUSD_SIM)
+        self.database.add_currency(USD)
+        self.redis.commands.clear()
+
+        # Act
+        instruments = self.database.load_instruments()
+        currencies = self.database.load_currencies()
+
+        # Assert
+        assert instruments == {AUDUSD_SIM.id: AUDUSD_SIM, GBPUSD_SIM.id: GBPUSD_SIM}
+        assert currencies == {"USD": USD}
+        assert "keys" not in self.redis.commands
+        assert self.redis.commands.count("execute") == 2
+
+    def test_load_accounts(self):
+        # Arrange
+        account = TestExecStubs.cash_account()
+        self.database.add_account(account)
+        self.database.update_account(account)
+
+        # Act
+        result = self.database.load_accounts()
+
+        # Assert
+        assert result == {account.id: account}
+
+    def test_load_positions_loads_each_instrument_once(self):
+        # Arrange
+        self.database.add_instrument(AUDUSD_SIM)
+        positions = [self._position(AUDUSD_SIM, f"P-{i}") for i in range(5)]
+        for position in positions:
+            self.database.add_position(position)
+        self.redis.commands.clear()
+
+        # Act
+        result = self.database.load_positions()
+
+        # Assert
+        assert result == {position.id: position for position in positions}
+        assert self.redis.commands.count("get") == 1
+
+    def test_load_with_duplicate_scan_keys_applies_events_once(self):
+        # Arrange
+        self.redis = DuplicateScanRedis()
+        self.database = RedisCacheDatabase(
+            trader_id=self.trader_id,
+            logger=self.logger,
+            serializer=MsgPackSerializer(timestamps_as_str=True),
+            config=CacheDatabaseConfig(type="redis", load_batch_size=4),
+            redis_client=self.redis,
+        )
+        order = self._accepted_orders(1)[0]
+
+        # Act
+        loaded = self.database.load_orders()[order.client_order_id]
+        order.apply(TestEventStubs.order_canceled(order))
+        self.database.update_order(order)
+        reloaded = self.database.load_orders()[order.client_order_id]
+
+        # Assert
+        assert loaded.event_count == 3
+        assert reloaded.event_count == 4
+        assert reloaded.is_closed
@@ -0,0 +1,335 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import threading
+
+import pytest
+
+from nautilus_trader.backtest.data.providers import TestInstrumentProvider
+from nautilus_trader.common.clock import TestClock
+from nautilus_trader.common.logging import Logger
+from nautilus_trader.config import CacheDatabaseConfig
+from nautilus_trader.infrastructure.cache import RedisCacheDatabase
+from nautilus_trader.infrastructure.cache import RedisWriteBehind
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.identifiers import PositionId
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from nautilus_trader.model.position import Position
+from nautilus_trader.msgbus.bus import MessageBus
+from nautilus_trader.portfolio.portfolio import Portfolio
+from nautilus_trader.serialization.msgpack.serializer import MsgPackSerializer
+from nautilus_trader.trading.strategy import Strategy
+from tests.test_kit.mocks.fake_redis import FakeRedis
+from tests.test_kit.stubs.component import TestComponentStubs
+from tests.test_kit.stubs.events import TestEventStubs
+from tests.test_kit.stubs.execution import TestExecStubs
+from tests.test_kit.stubs.identifiers import TestIdStubs
+
+
+AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+
+
+class TestRedisCacheDatabaseWriteBehind:
+    def setup(self):
+        # Fixture Setup
+        self.clock = TestClock()
+        self.logger = Logger(self.clock)
+
+        self.trader_id = TestIdStubs.trader_id()
+
+        self.msgbus = MessageBus(
+            trader_id=self.trader_id,
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        self.cache = TestComponentStubs.cache()
+
+        self.portfolio = Portfolio(
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        self.strategy = Strategy()
+        self.strategy.register(
+            trader_id=self.trader_id,
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        self.redis = FakeRedis()
+        self.database = RedisCacheDatabase(
+            trader_id=self.trader_id,
+            logger=self.logger,
+            serializer=MsgPackSerializer(timestamps_as_str=True),
+            config=CacheDatabaseConfig(
+                type="redis",
+                write_behind=True,
+                write_batch_size=64,
+                write_flush_interval_ms=5,
+            ),
+            redis_client=self.redis,
+        )
+
+    def teardown(self):
+        self.database.dispose()
+
+    def test_write_behind_stats_when_not_configured_returns_empty_dict(self):
+        # Arrange
+        database = RedisCacheDatabase(
+            trader_id=self.trader_id,
+            logger=self.logger,
+            serializer=MsgPackSerializer(timestamps_as_str=True),
+            redis_client=FakeRedis(),
+        )
+
+        # Act, Assert
+        assert database.write_behind_stats() == {}
+
+    def test_add_and_update_order_then_load_returns_order(self):
+        # Arrange
+        order = self.strategy.order_factory.stop_market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100000),
+            Price.from_str("1.00000"),
+        )
+
+        self.database.add_order(order)
+        order.apply(TestEventStubs.order_submitted(order))
+        self.database.update_order(order)
+        order.apply(TestEventStubs.order_accepted(order))
+
+        # Act
+        self.database.update_order(order)
+
+        # Assert
+        assert self.database.load_order(order.client_order_id) == order
+        assert self.database.write_behind_stats()["written"] == 3
+        assert self.database.write_behind_stats()["pending"] == 0
+
+    def test_add_position_and_account_then_load_returns_objects(self):
+        # Arrange
+        order = self.strategy.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100000),
+        )
+        fill = TestEventStubs.order_filled(
+            order,
+            instrument=AUDUSD_SIM,
+            position_id=PositionId("P-1"),
+            last_px=Price.from_str("1.00000"),
+        )
+        position = Position(instrument=AUDUSD_SIM, fill=fill)
+        account = TestExecStubs.cash_account()
+        self.database.add_instrument(AUDUSD_SIM)
+
+        # Act
+        self.database.add_position(position)
+        self.database.add_account(account)
+        self.database.update_account(account)
+
+        # Assert
+        assert self.database.load_position(position.id) == position
+        assert self.database.load_account(account.id) == account
+        assert len(self.database.load_positions()) == 1
+        assert len(self.database.load_accounts()) == 1
+
+    def test_events_for_each_order_written_in_order(self):
+        # Arrange
+        orders = [
+            self.strategy.order_factory.stop_market(
+                AUDUSD_SIM.id,
+                OrderSide.BUY,
+                Quantity.from_int(100000),
+                Price.from_str("1.00000"),
+            )
+            for _ in range(10)
+        ]
+
+        # Act
+        for order in orders:
+            self.database.add_order(order)
+        for order in orders:
+            order.apply(TestEventStubs.order_submitted(order))
+            self.database.update_order(order)
+        for order in orders:
+            order.apply(TestEventStubs.order_accepted(order))
+            self.database.update_order(order)
+
+        self.database.dispose()
+
+        # Assert
+        assert self.database.load_orders() == {o.client_order_id: o for o in orders}
+        assert self.database.write_behind_stats()["written"] == 30
+        assert self.database.write_behind_stats()["batches"] < 30
+
+    def test_flush_completes_pending_writes_before_flushing(self):
+        # Arrange
+        account = TestExecStubs.cash_account()
+        self.database.add_account(account)
+
+        # Act
+        self.database.flush()
+
+        # Assert
+        assert self.database.load_account(account.id) is None
+
+
+class TestRedisWriteBehind:
+    def setup(self):
+        # Fixture Setup
+        self.logger = Logger(TestClock())
+        self.redis = FakeRedis()
+
+    def test_push_when_queue_full_blocks_and_records_backpressure(self):
+        # Arrange
+        writer = RedisWriteBehind(
+            redis_client=self.redis,
+            logger=self.logger,
+            batch_size=1,
+            flush_interval_ms=1,
+            queue_size=2,
+        )
+        writer.push("key", b"1")
+        writer.push("key", b"2")
+
+        # Writer starts after the next push has blocked on the full queue
+        threading.Timer(0.05, writer.start).start()
+
+        # Act
+        writer.push("key", b"3")
+        writer.stop()
+
+        # Assert
+        assert writer.backpressure_count == 1
+        assert writer.backpressure_ns > 0
+        assert writer.max_pending == 2
+        assert writer.written_count == 3
+        assert self.redis.lrange("key", 0, -1) == [b"1", b"2", b"3"]
+
+    def test_pushes_are_written_in_pipelined_batches(self):
+        # Arrange
+        writer = RedisWriteBehind(
+            redis_client=self.redis,
+            logger=self.logger,
+            batch_size=10,
+            flush_interval_ms=1000,
+            queue_size=100,
+        )
+        for i in range(25):
+            writer.push(f"key-{i % 2}", str(i).encode())
+
+        # Act
+        writer.start()
+        writer.stop()
+
+        # Assert
+        assert not writer.is_running()
+        assert writer.pending_count() == 0
+        assert writer.batch_count == 3
+        assert self.redis.lrange("key-0", 0, -1) == [str(i).encode() for i in range(0, 25, 2)]
+        assert self.redis.lrange("key-1", 0, -1) == [str(i).encode() for i in range(1, 25, 2)]
+
+    def test_drain_when_not_running_writes_from_calling_thread(self):
+        # Arrange
+        writer = RedisWriteBehind(
+            redis_client=self.redis,
+            logger=self.logger,
+            batch_size=10,
+            flush_interval_ms=10,
+            queue_size=100,
+        )
+        writer.push("key", b"1")
+
+        # Act
+        writer.drain()
+
+        # Assert
+        assert writer.written_count == 1
+        assert self.redis.lrange("key", 0, -1) == [b"1"]
+
+    def test_failed_batch_is_retried(self):
+        # Arrange
+        writer = RedisWriteBehind(
+            redis_client=self.redis,
+            logger=self.logger,
+            batch_size=10,
+            flush_interval_ms=10,
+            queue_size=100,
+        )
+        writer.push("key", b"1")
+        writer.push("key", b"2")
+        self.redis.fail_execute_count = 1
+
+        # Act
+        writer.start()
+        writer.stop()
+
+        # Assert
+        assert writer.error_count == 0
+        assert writer.written_count == 2
+        assert isinstance(writer.last_error, ConnectionError)
+        assert self.redis.lrange("key", 0, -1) == [b"1", b"2"]
+
+    def test_failed_batch_after_retries_records_error_and_raises_on_stop(self):
+        # Arrange
+        writer = RedisWriteBehind(
+            redis_client=self.redis,
+            logger=self.logger,
+            batch_size=10,
+            flush_interval_ms=10,
+            queue_size=100,
+        )
+        writer.push("key", b"1")
+        writer.push("key", b"2")
+        self.redis.fail_execute_count = 4
+
+        # Act
+        writer.start()
+        with pytest.raises(RuntimeError):
+            writer.stop()
+
+        # Assert
+        assert writer.error_count == 2
+        assert isinstance(writer.last_error, ConnectionError)
+        assert writer.stats()["errors"] == 2
+
+    def test_push_after_stop_is_rejected(self):
+        # Arrange
+        writer = RedisWriteBehind(
+            redis_client=self.redis,
+            logger=self.logger,
+            batch_size=10,
+            flush_interval_ms=10,
+            queue_size=100,
+        )
+        writer.start()
+        writer.stop()
+
+        # Act
+        writer.push("key", b"1")
+
+        # Assert
+        assert writer.pending_count() == 0
+        assert writer.error_count == 1
+        assert self.redis.lrange("key", 0, -1) == []
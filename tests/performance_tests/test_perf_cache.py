@@ -0,0 +1,133 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import pytest
+
+from nautilus_trader.backtest.data.providers import TestInstrumentProvider
+from nautilus_trader.common.clock import TestClock
+from nautilus_trader.common.factories import OrderFactory
+from nautilus_trader.model.enums import OMSType
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.identifiers import PositionId
+from nautilus_trader.model.identifiers import StrategyId
+from nautilus_trader.model.identifiers import TraderId
+from nautilus_trader.model.objects import Quantity
+from nautilus_trader.model.position import Position
+from tests.test_kit.performance import PerformanceHarness
+from tests.test_kit.stubs.component import TestComponentStubs
+from tests.test_kit.stubs.events import TestEventStubs
+
+
+INSTRUMENTS = [
+    TestInstrumentProvider.default_fx_ccy(symbol)
+    for symbol in ("AUD/USD", "GBP/USD", "EUR/USD", "USD/JPY", "NZD/USD")
+]
+STRATEGY_IDS = [StrategyId(f"S-{i:03d}") for i in range(4)]
+AUDUSD_SIM = INSTRUMENTS[0]
+
+
+@pytest.fixture(scope="module")
+def populated_cache():
+    # 4,000 orders spread across 5 instruments and 4 strategies: half open,
+    # a quarter closed and a quarter in-flight, plus one position per filled order
+    cache = TestComponentStubs.cache()
+    factories = {
+        strategy_id: OrderFactory(
+            trader_id=TraderId("TESTER-000"),
+            strategy_id=strategy_id,
+            clock=TestClock(),
+        )
+        for strategy_id in STRATEGY_IDS
+    }
+
+    for i in range(4_000):
+        instrument = INSTRUMENTS[i % len(INSTRUMENTS)]
+        strategy_id = STRATEGY_IDS[i % len(STRATEGY_IDS)]
+        order = factories[strategy_id].market(
+            instrument.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+        cache.add_order(order, None)
+
+        order.apply(TestEventStubs.order_submitted(order))
+        cache.update_order(order)
+        if i % 4 == 0:
+            continue  # In-flight
+
+        order.apply(TestEventStubs.order_accepted(order))
+        cache.update_order(order)
+        if i % 4 != 1:
+            continue  # Open
+
+        fill = TestEventStubs.order_filled(
+            order,
+            instrument=instrument,
+            position_id=PositionId(f"P-{i}"),
+        )
+        order.apply(fill)
+        cache.update_order(order)
+        cache.add_position(Position(instrument=instrument, fill=fill), OMSType.HEDGING)
+
+    return cache
+
+
+class TestCachePerformance(PerformanceHarness):
+    def test_orders_open_count(self, populated_cache):
+        self.benchmark.pedantic(
+            target=populated_cache.orders_open_count,
+            iterations=100_000,
+            rounds=1,
+        )
+
+    def test_orders_open_count_filtered(self, populated_cache):
+        self.benchmark.pedantic(
+            target=populated_cache.orders_open_count,
+            kwargs={"instrument_id": AUDUSD_SIM.id, "strategy_id": STRATEGY_IDS[2]},
+            iterations=100_000,
+            rounds=1,
+        )
+
+    def test_orders_inflight_count_filtered(self, populated_cache):
+        self.benchmark.pedantic(
+            target=populated_cache.orders_inflight_count,
+            kwargs={"venue": AUDUSD_SIM.venue, "strategy_id": STRATEGY_IDS[0]},
+            iterations=100_000,
+            rounds=1,
+        )
+
+    def test_orders_open_filtered(self, populated_cache):
+        self.benchmark.pedantic(
+            target=populated_cache.orders_open,
+            kwargs={"instrument_id": AUDUSD_SIM.id},
+            iterations=10_000,
+            rounds=1,
+        )
+
+    def test_positions_open_count_filtered(self, populated_cache):
+        self.benchmark.pedantic(
+            target=populated_cache.positions_open_count,
+            kwargs={"instrument_id": AUDUSD_SIM.id},
+            iterations=100_000,
+            rounds=1,
+        )
+
+    def test_positions_open_filtered(self, populated_cache):
+        self.benchmark.pedantic(
+            target=populated_cache.positions_open,
+            kwargs={"venue": AUDUSD_SIM.venue, "strategy_id": STRATEGY_IDS[1]},
+            iterations=10_000,
+            rounds=1,
+        )
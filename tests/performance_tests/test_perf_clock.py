@@ -17,6 +17,7 @@ from datetime import timedelta
 
 from nautilus_trader.common.clock import LiveClock
 from nautilus_trader.common.clock import TestClock
+from nautilus_trader.common.clock import TestClockScheduler
 from tests.test_kit.performance import PerformanceHarness
 
 
@@ -79,3 +80,31 @@ class TestClockPerformanceTests(PerformanceHarness):
         )
         # ~320.1ms                       minimum of 1 runs @ 1 iteration each run. (100000 advances)
         # ~3.7ms / ~3655.1μs / 3655108ns minimum of 1 runs @ 1 iteration each run.
+
+
+class TestClockSchedulerHarness:
+    @staticmethod
+    def iteratively_advance_time(scheduler):
+        test_time = scheduler.time_ns
+        for _ in range(100000):
+            test_time += 1
+            scheduler.advance_time(to_time_ns=test_time)
+
+
+class TestClockSchedulerPerformanceTests(PerformanceHarness):
+    def test_iteratively_advance_time_with_many_clocks(self):
+        # 51 clocks (as for 50 strategies plus the kernel), each with a timer
+        # which is only due once every second
+        scheduler = TestClockScheduler()
+        store = []
+        for i in range(51):
+            clock = TestClock()
+            scheduler.register(clock)
+            clock.set_timer("test", timedelta(seconds=1), callback=store.append)
+
+        self.benchmark.pedantic(
+            target=TestClockSchedulerHarness.iteratively_advance_time,
+            args=(scheduler,),
+            iterations=1,
+            rounds=1,
+        )
@@ -13,7 +13,12 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import random
+
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.orderbook.book import L2OrderBook
 from nautilus_trader.model.orderbook.book import L3OrderBook
+from nautilus_trader.model.orderbook.data import Order
 from tests.test_kit.stubs.data import TestDataStubs
 from tests.test_kit.stubs.identifiers import TestIdStubs
 
@@ -41,3 +46,48 @@ def test_orderbook_updates(benchmark):
     # benchmark something
     # book = benchmark(run_l3_test, book=book, feed=feed)
     benchmark.pedantic(run_l3_test, args=(book, feed), rounds=10, iterations=10, warmup_rounds=5)
+
+
+def deep_l2_feed(levels: int, updates: int, seed: int = 42):
+    # Replays a stream of L2 deltas over a deep book, mostly volume updates to
+    # existing levels with levels periodically emptied and re-created.
+    rng = random.Random(seed)
+    feed = []
+    for i in range(levels):
+        feed.append(("update", Order(price=1000.0 - i, size=1.0, side=OrderSide.BUY)))
+        feed.append(("update", Order(price=1001.0 + i, size=1.0, side=OrderSide.SELL)))
+    for _ in range(updates):
+        offset = rng.randrange(levels)
+        if rng.random() < 0.5:
+            order = Order(price=1000.0 - offset, size=0.0, side=OrderSide.BUY)
+        else:
+            order = Order(price=1001.0 + offset, size=0.0, side=OrderSide.SELL)
+        if rng.random() < 0.2:
+            feed.append(("delete", order))
+        else:
+            order.update_size(size=float(rng.randrange(1, 100)))
+            feed.append(("update", order))
+    return feed
+
+
+def run_l2_test(book, feed):
+    for op, order in feed:
+        if op == "update":
+            book.update(order=order)
+        else:
+            book.delete(order=order)
+    return book
+
+
+def test_orderbook_deep_l2_updates(benchmark):
+    feed = deep_l2_feed(levels=2_000, updates=100_000)
+
+    def setup():
+        book = L2OrderBook(
+            instrument_id=TestIdStubs.audusd_id(),
+            price_precision=2,
+            size_precision=0,
+        )
+        return (book, feed), {}
+
+    benchmark.pedantic(run_l2_test, setup=setup, rounds=5, iterations=1, warmup_rounds=1)
@@ -14,12 +14,26 @@
 # -------------------------------------------------------------------------------------------------
 
 from nautilus_trader.accounting.calculators import ExchangeRateCalculator
+from nautilus_trader.accounting.calculators import ExchangeRateGraph
+from nautilus_trader.model.currencies import AUD
 from nautilus_trader.model.currencies import ETH
+from nautilus_trader.model.currencies import NZD
 from nautilus_trader.model.currencies import USDT
 from nautilus_trader.model.enums import PriceType
 from tests.test_kit.performance import PerformanceBench
 
 
+_CURRENCIES = ["USD", "EUR", "GBP", "JPY", "AUD", "NZD", "CAD", "CHF", "SEK", "NOK"]
+# 45 pairs, every combination of the above currencies
+_BID_QUOTES = {
+    f"{base}/{quote}": 1.0 + 0.01 * i + 0.001 * j
+    for i, base in enumerate(_CURRENCIES)
+    for j, quote in enumerate(_CURRENCIES)
+    if j > i
+}
+_ASK_QUOTES = {symbol: bid + 0.0001 for symbol, bid in _BID_QUOTES.items()}
+
+
 class TestExchangeRateCalculatorPerformanceTests:
     @staticmethod
     def get_xrate():
@@ -50,3 +64,56 @@ class TestExchangeRateCalculatorPerformanceTests:
         )
         # ~0.0ms / ~8.2μs / 8198ns minimum of 100,000 runs @ 1 iteration each run.
         # ~0.0ms / ~4.7μs / 4732ns minimum of 100,000 runs @ 1 iteration each run.
+
+    def test_get_xrate_many_pairs(self):
+        def get_xrate():
+            ExchangeRateCalculator().get_rate(
+                from_currency=AUD,
+                to_currency=NZD,
+                price_type=PriceType.MID,
+                bid_quotes=_BID_QUOTES,
+                ask_quotes=_ASK_QUOTES,
+            )
+
+        PerformanceBench.profile_function(
+            target=get_xrate,
+            runs=10_000,
+            iterations=1,
+        )
+
+
+class TestExchangeRateGraphPerformanceTests:
+    @staticmethod
+    def build_graph():
+        graph = ExchangeRateGraph()
+        for symbol, bid in _BID_QUOTES.items():
+            base, _, quote = symbol.partition("/")
+            graph.update(base, quote, bid, _ASK_QUOTES[symbol])
+        return graph
+
+    def test_get_xrate_many_pairs_cached(self):
+        graph = self.build_graph()
+
+        def get_xrate():
+            graph.get_rate(AUD, NZD, PriceType.MID)
+
+        PerformanceBench.profile_function(
+            target=get_xrate,
+            runs=100_000,
+            iterations=1,
+        )
+
+    def test_get_xrate_many_pairs_with_quote_update(self):
+        graph = self.build_graph()
+
+        def get_xrate():
+            # Each call changes a contributing quote, so the rate is recalculated
+            graph.update("AUD", "NZD", 1.04, 1.0401)
+            graph.update("AUD", "NZD", 1.05, 1.0501)
+            graph.get_rate(AUD, NZD, PriceType.MID)
+
+        PerformanceBench.profile_function(
+            target=get_xrate,
+            runs=100_000,
+            iterations=1,
+        )
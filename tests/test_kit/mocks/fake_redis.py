@@ -0,0 +1,141 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import fnmatch
+import threading
+from typing import Dict, Iterator, List, Optional
+
+
+class FakeRedis:
+    """
+    Provides an in-memory stand-in for the subset of the `redis.Redis` client
+    used by the `RedisCacheDatabase`.
+
+    Keys are returned as bytes and values are stored as bytes, as per Redis.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._data: Dict[str, object] = {}
+        self.commands: List[str] = []  # Names of commands executed, in order
+        self.fail_execute_count = 0  # Count of next pipeline executions to fail
+
+    def flushdb(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def flushall(self) -> None:
+        self.flushdb()
+
+    def keys(self, pattern: str = "*") -> List[bytes]:
+        with self._lock:
+            self.commands.append("keys")
+            return [k.encode() for k in self._data if fnmatch.fnmatchcase(k, pattern)]
+
+    def scan_iter(self, match: str = "*", count: Optional[int] = None) -> Iterator[bytes]:
+        with self._lock:
+            self.commands.append("scan")
+            keys = [k.encode() for k in self._data if fnmatch.fnmatchcase(k, match)]
+        yield from keys
+
+    def delete(self, *names: str) -> int:
+        with self._lock:
+            return sum(self._data.pop(_decode(name), None) is not None for name in names)
+
+    def set(self, name: str, value) -> bool:
+        name = _decode(name)
+        with self._lock:
+            self.commands.append("set")
+            self._data[name] = _to_bytes(value)
+            return True
+
+    def get(self, name: str) -> Optional[bytes]:
+        name = _decode(name)
+        with self._lock:
+            self.commands.append("get")
+            return self._data.get(name)
+
+    def hset(self, name: str, key: str, value) -> int:
+        name = _decode(name)
+        with self._lock:
+            self.commands.append("hset")
+            mapping = self._data.setdefault(name, {})
+            added = _to_bytes(key) not in mapping
+            mapping[_to_bytes(key)] = _to_bytes(value)
+            return int(added)
+
+    def hgetall(self, name: str) -> Dict[bytes, bytes]:
+        name = _decode(name)
+        with self._lock:
+            self.commands.append("hgetall")
+            return dict(self._data.get(name, {}))
+
+    def rpush(self, name: str, *values) -> int:
+        name = _decode(name)
+        with self._lock:
+            self.commands.append("rpush")
+            items = self._data.setdefault(name, [])
+            items.extend(_to_bytes(v) for v in values)
+            return len(items)
+
+    def lrange(self, name: str, start: int, end: int) -> List[bytes]:
+        name = _decode(name)
+        with self._lock:
+            self.commands.append("lrange")
+            items = self._data.get(name, [])
+            return list(items[start:] if end == -1 else items[start : end + 1])
+
+    def pipeline(self, transaction: bool = True) -> "FakePipeline":
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    """
+    Provides a stand-in for a `redis` client pipeline, which buffers commands
+    until executed.
+    """
+
+    def __init__(self, client: FakeRedis):
+        self._client = client
+        self._commands: List[tuple] = []
+
+    def __getattr__(self, name: str):
+        method = getattr(self._client, name)
+
+        def buffer(*args, **kwargs):
+            self._commands.append((method, args, kwargs))
+            return self
+
+        return buffer
+
+    def execute(self) -> list:
+        commands, self._commands = self._commands, []
+        if self._client.fail_execute_count > 0:
+            self._client.fail_execute_count -= 1
+            raise ConnectionError("simulated connection failure")
+        self._client.commands.append("execute")
+        return [method(*args, **kwargs) for method, args, kwargs in commands]
+
+
+def _to_bytes(value) -> bytes:
+    if isinstance(value, bytes):
+        return value
+    return str(value).encode()
+
+
+def _decode(name) -> str:
+    if isinstance(name, bytes):
+        return name.decode()
+    return name
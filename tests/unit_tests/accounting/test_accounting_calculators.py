@@ -21,9 +21,11 @@ import pandas as pd
 import pytest
 
 from nautilus_trader.accounting.calculators import ExchangeRateCalculator
+from nautilus_trader.accounting.calculators import ExchangeRateGraph
 from nautilus_trader.accounting.calculators import RolloverInterestCalculator
 from nautilus_trader.model.currencies import AUD
 from nautilus_trader.model.currencies import BTC
+from nautilus_trader.model.currencies import GBP
 from nautilus_trader.model.currencies import JPY
 from nautilus_trader.model.currencies import USD
 from nautilus_trader.model.enums import PriceType
@@ -216,6 +218,127 @@ class TestExchangeRateCalculator:
         assert result == 110.115
 
 
+class TestExchangeRateGraph:
+    def test_get_rate_when_from_currency_equals_to_currency_returns_one(self):
+        # Arrange
+        graph = ExchangeRateGraph()
+        graph.update("AUD", "USD", 0.80000, 0.80010)
+
+        # Act
+        result = graph.get_rate(USD, USD, PriceType.BID)
+
+        # Assert
+        assert result == 1
+
+    def test_get_rate_when_no_currency_rate_returns_zero(self):
+        # Arrange
+        graph = ExchangeRateGraph()
+        graph.update("AUD", "USD", 0.80000, 0.80010)
+
+        # Act
+        result = graph.get_rate(USD, JPY, PriceType.BID)
+
+        # Assert
+        assert result == 0
+        assert graph.pair_count() == 1
+
+    def test_get_rate_with_last_price_type_raises_value_error(self):
+        # Arrange
+        graph = ExchangeRateGraph()
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            graph.get_rate(AUD, USD, PriceType.LAST)
+
+    def test_get_rate(self):
+        # Arrange
+        graph = ExchangeRateGraph()
+        graph.update("AUD", "USD", 0.80000, 0.80010)
+
+        # Act, Assert
+        assert graph.get_rate(AUD, USD, PriceType.BID) == 0.80000
+        assert graph.get_rate(AUD, USD, PriceType.ASK) == 0.80010
+        assert graph.get_rate(AUD, USD, PriceType.MID) == 0.80005
+
+    def test_get_rate_for_inverse(self):
+        # Arrange
+        graph = ExchangeRateGraph()
+        graph.update("USD", "JPY", 110.100, 110.130)
+
+        # Act
+        result1 = graph.get_rate(JPY, USD, PriceType.BID)
+        result2 = graph.get_rate(JPY, USD, PriceType.MID)
+
+        # Assert
+        assert result1 == 0.009082652134423252
+        assert result2 == 0.009081414884438995
+
+    def test_get_rate_by_inference_matches_calculator(self):
+        # Arrange
+        graph = ExchangeRateGraph()
+        graph.update("USD", "JPY", 110.100, 110.130)
+        graph.update("AUD", "USD", 0.80000, 0.80010)
+
+        # Act
+        result1 = graph.get_rate(JPY, AUD, PriceType.BID)
+        result2 = graph.get_rate(AUD, JPY, PriceType.ASK)
+
+        # Assert
+        assert result1 == pytest.approx(0.011353315168029064)
+        assert result2 == pytest.approx(88.11501299999999)
+
+    def test_get_rate_across_multiple_pairs(self):
+        # Arrange
+        graph = ExchangeRateGraph()
+        graph.update("GBP", "USD", 1.25, 1.25)
+        graph.update("USD", "JPY", 110.0, 110.0)
+        graph.update("BTC", "JPY", 2_200_000.0, 2_200_000.0)
+
+        # Act
+        result = graph.get_rate(GBP, BTC, PriceType.MID)
+
+        # Assert
+        assert result == pytest.approx(1.25 * 110.0 / 2_200_000.0)
+
+    def test_update_quote_invalidates_cached_cross_rate(self):
+        # Arrange
+        graph = ExchangeRateGraph()
+        graph.update("USD", "JPY", 110.0, 110.0)
+        graph.update("AUD", "USD", 0.80, 0.80)
+        graph.get_rate(AUD, JPY, PriceType.MID)
+
+        # Act
+        graph.update("AUD", "USD", 0.70, 0.70)
+        result = graph.get_rate(AUD, JPY, PriceType.MID)
+
+        # Assert
+        assert result == pytest.approx(0.70 * 110.0)
+
+    def test_adding_pair_resolves_previously_missing_rate(self):
+        # Arrange
+        graph = ExchangeRateGraph()
+        graph.update("AUD", "USD", 0.80, 0.80)
+        assert graph.get_rate(AUD, JPY, PriceType.MID) == 0
+
+        # Act
+        graph.update("USD", "JPY", 110.0, 110.0)
+        result = graph.get_rate(AUD, JPY, PriceType.MID)
+
+        # Assert
+        assert result == pytest.approx(88.0)
+
+    def test_clear(self):
+        # Arrange
+        graph = ExchangeRateGraph()
+        graph.update("AUD", "USD", 0.80, 0.80)
+
+        # Act
+        graph.clear()
+
+        # Assert
+        assert graph.pair_count() == 0
+        assert graph.get_rate(AUD, USD, PriceType.MID) == 0
+
 class TestRolloverInterestCalculator:
     def setup(self):
         # Fixture Setup
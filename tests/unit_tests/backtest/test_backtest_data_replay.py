@@ -0,0 +1,234 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import numpy as np
+import pytest
+
+from nautilus_trader.backtest.data.providers import TestInstrumentProvider
+from nautilus_trader.backtest.data.replay import BAR_RECORD
+from nautilus_trader.backtest.data.replay import QUOTE_TICK_RECORD
+from nautilus_trader.backtest.data.replay import open_replay_file
+from nautilus_trader.backtest.data.replay import read_replay_header
+from nautilus_trader.backtest.data.replay import trade_tick_record
+from nautilus_trader.backtest.data.replay import write_replay_file
+from nautilus_trader.backtest.data.replay import write_replay_file_from_catalog
+from nautilus_trader.backtest.data.stream import BarDataStream
+from nautilus_trader.backtest.data.stream import QuoteTickDataStream
+from nautilus_trader.backtest.data.stream import TradeTickDataStream
+from nautilus_trader.model.data.tick import QuoteTick
+from nautilus_trader.model.data.tick import TradeTick
+from nautilus_trader.model.enums import AggressorSide
+from nautilus_trader.model.identifiers import TradeId
+from nautilus_trader.model.identifiers import Venue
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from nautilus_trader.persistence.external.core import write_objects
+from tests.test_kit.mocks.data import data_catalog_setup
+from tests.test_kit.stubs.data import TestDataStubs
+
+
+AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+USDJPY_SIM = TestInstrumentProvider.default_fx_ccy("USD/JPY")
+
+
+def _quote_ticks():
+    return [
+        QuoteTick(
+            instrument_id=instrument.id,
+            bid=Price(bid, instrument.price_precision),
+            ask=Price(bid + 0.01, instrument.price_precision),
+            bid_size=Quantity.from_int(1_000_000),
+            ask_size=Quantity.from_int(2_000_000),
+            ts_event=i * 1_000 - 1,
+            ts_init=i * 1_000,
+        )
+        for i, (instrument, bid) in enumerate(
+            [(AUDUSD_SIM, 0.7), (USDJPY_SIM, 90.0), (AUDUSD_SIM, 0.71), (USDJPY_SIM, 90.1)],
+            start=1,
+        )
+    ]
+
+
+class TestReplayFile:
+    def test_record_sizes_are_fixed_width_and_aligned(self):
+        # Arrange, Act, Assert
+        assert QUOTE_TICK_RECORD.itemsize == 56
+        assert trade_tick_record(13).itemsize == 48
+        assert trade_tick_record(14).itemsize == 56
+        assert BAR_RECORD.itemsize == 64
+
+    def test_write_and_read_header(self, tmp_path):
+        # Arrange
+        path = str(tmp_path / "quotes.replay")
+        stream = QuoteTickDataStream.from_ticks([AUDUSD_SIM, USDJPY_SIM], _quote_ticks())
+
+        # Act
+        nbytes = write_replay_file(path, stream)
+        header = read_replay_header(path)
+
+        # Assert
+        assert header["kind"] == "QuoteTick"
+        assert header["count"] == 4
+        assert header["keys"] == ["AUD/USD.SIM", "USD/JPY.SIM"]
+        assert header["sorted"]
+        assert header["offset"] % 64 == 0
+        assert nbytes == header["offset"] + 4 * QUOTE_TICK_RECORD.itemsize
+        assert (tmp_path / "quotes.replay").stat().st_size == nbytes
+
+    def test_open_quote_tick_replay_file_round_trips_ticks(self, tmp_path):
+        # Arrange
+        path = str(tmp_path / "quotes.replay")
+        ticks = _quote_ticks()
+        write_replay_file(path, QuoteTickDataStream.from_ticks([AUDUSD_SIM, USDJPY_SIM], ticks))
+
+        # Act
+        stream = open_replay_file(path, [USDJPY_SIM, AUDUSD_SIM])
+        result = list(stream)
+
+        # Assert
+        assert isinstance(stream, QuoteTickDataStream)
+        assert result == ticks
+        assert [t.ts_event for t in result] == [t.ts_event for t in ticks]
+        assert [t.ts_init for t in result] == [t.ts_init for t in ticks]
+
+    def test_open_replay_file_columns_are_read_only_views(self, tmp_path):
+        # Arrange
+        path = str(tmp_path / "quotes.replay")
+        stream = QuoteTickDataStream.from_ticks([AUDUSD_SIM, USDJPY_SIM], _quote_ticks())
+        write_replay_file(path, stream)
+
+        # Act
+        columns = open_replay_file(path, [AUDUSD_SIM, USDJPY_SIM]).columns()
+
+        # Assert
+        assert not columns["bid"].flags.writeable
+        assert not columns["bid"].flags.owndata
+        assert columns["ts_init"].strides == (QUOTE_TICK_RECORD.itemsize,)
+
+    def test_open_trade_tick_replay_file_round_trips_ticks(self, tmp_path):
+        # Arrange
+        path = str(tmp_path / "trades.replay")
+        ticks = [
+            TradeTick(
+                instrument_id=AUDUSD_SIM.id,
+                price=Price.from_str("1.00001"),
+                size=Quantity.from_int(100_000),
+                aggressor_side=side,
+                trade_id=TradeId(str(123456 + i)),
+                ts_event=i,
+                ts_init=i,
+            )
+            for i, side in enumerate([AggressorSide.BUY, AggressorSide.SELL])
+        ]
+        write_replay_file(path, TradeTickDataStream.from_ticks([AUDUSD_SIM], ticks))
+
+        # Act
+        result = list(open_replay_file(path, [AUDUSD_SIM]))
+
+        # Assert
+        assert result == ticks
+        assert [t.aggressor_side for t in result] == [AggressorSide.BUY, AggressorSide.SELL]
+
+    def test_open_trade_tick_replay_file_round_trips_trade_ids_losslessly(self, tmp_path):
+        # Arrange
+        path = str(tmp_path / "trades.replay")
+        trade_ids = ["00123", "123", "a1b2-c3d4-e5f6", "7"]
+        ticks = [
+            TradeTick(
+                instrument_id=AUDUSD_SIM.id,
+                price=Price.from_str("1.00001"),
+                size=Quantity.from_int(100_000),
+                aggressor_side=AggressorSide.BUY,
+                trade_id=TradeId(trade_id),
+                ts_event=i,
+                ts_init=i,
+            )
+            for i, trade_id in enumerate(trade_ids)
+        ]
+        write_replay_file(path, TradeTickDataStream.from_ticks([AUDUSD_SIM], ticks))
+
+        # Act
+        header = read_replay_header(path)
+        result = list(open_replay_file(path, [AUDUSD_SIM]))
+
+        # Assert
+        assert header["trade_id_size"] == len("a1b2-c3d4-e5f6")
+        assert [t.trade_id.value for t in result] == trade_ids
+
+    def test_open_bar_replay_file_round_trips_bars(self, tmp_path):
+        # Arrange
+        path = str(tmp_path / "bars.replay")
+        bar = TestDataStubs.bar_5decimal()
+        write_replay_file(path, BarDataStream.from_bars([AUDUSD_SIM], [bar]))
+
+        # Act
+        stream = open_replay_file(path, [AUDUSD_SIM])
+
+        # Assert
+        assert isinstance(stream, BarDataStream)
+        assert stream.bar_types() == [bar.type]
+        assert list(stream) == [bar]
+
+    def test_open_replay_file_with_missing_instrument_raises_value_error(self, tmp_path):
+        # Arrange
+        path = str(tmp_path / "quotes.replay")
+        stream = QuoteTickDataStream.from_ticks([AUDUSD_SIM, USDJPY_SIM], _quote_ticks())
+        write_replay_file(path, stream)
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            open_replay_file(path, [AUDUSD_SIM])
+
+    def test_open_replay_file_not_recorded_as_sorted_is_validated(self, tmp_path):
+        # Arrange
+        path = tmp_path / "quotes.replay"
+        stream = QuoteTickDataStream.from_ticks([AUDUSD_SIM, USDJPY_SIM], _quote_ticks())
+        write_replay_file(str(path), stream)
+        header = read_replay_header(str(path))
+
+        # Unset the sorted flag and reverse the records
+        data = path.read_bytes()
+        offset = header["offset"]
+        records = np.frombuffer(data[offset:], dtype=QUOTE_TICK_RECORD)[::-1].tobytes()
+        path.write_bytes(
+            data[:offset].replace(b'"sorted":true', b'"sorted":null') + records,
+        )
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            open_replay_file(str(path), [AUDUSD_SIM, USDJPY_SIM])
+
+    def test_read_header_of_invalid_file_raises_value_error(self, tmp_path):
+        # Arrange
+        path = tmp_path / "invalid.replay"
+        path.write_bytes(np.arange(16, dtype=np.uint64).tobytes())
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            read_replay_header(str(path))
+
+    def test_write_replay_file_from_catalog(self, tmp_path):
+        # Arrange
+        catalog = data_catalog_setup()
+        instrument = TestInstrumentProvider.default_fx_ccy("AUD/USD", venue=Venue("SIM"))
+        ticks = [t for t in _quote_ticks() if t.instrument_id == instrument.id]
+        write_objects(catalog=catalog, chunk=[instrument] + ticks)
+        path = str(tmp_path / "quotes.replay")
+
+        # Act
+        write_replay_file_from_catalog(catalog, path, QuoteTick)
+
+        # Assert
+        assert list(open_replay_file(path, [instrument])) == ticks
@@ -0,0 +1,293 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import numpy as np
+import pytest
+
+from nautilus_trader.backtest.data.providers import TestInstrumentProvider
+from nautilus_trader.backtest.data.stream import BarDataStream
+from nautilus_trader.backtest.data.stream import QuoteTickDataStream
+from nautilus_trader.backtest.data.stream import TradeTickDataStream
+from nautilus_trader.model.data.bar import Bar
+from nautilus_trader.model.data.tick import QuoteTick
+from nautilus_trader.model.data.tick import TradeTick
+from nautilus_trader.model.enums import AggressorSide
+from nautilus_trader.model.identifiers import TradeId
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from tests.test_kit.stubs.data import TestDataStubs
+
+
+AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+USDJPY_SIM = TestInstrumentProvider.default_fx_ccy("USD/JPY")
+
+
+def _quote_tick(instrument, bid: str, ask: str, ts: int) -> QuoteTick:
+    return QuoteTick(
+        instrument_id=instrument.id,
+        bid=Price.from_str(bid),
+        ask=Price.from_str(ask),
+        bid_size=Quantity.from_int(1_000_000),
+        ask_size=Quantity.from_int(2_000_000),
+        ts_event=ts - 1,
+        ts_init=ts,
+    )
+
+
+class TestQuoteTickDataStream:
+    def setup(self):
+        # Fixture Setup
+        self.ticks = [
+            _quote_tick(AUDUSD_SIM, "1.00001", "1.00003", 1_000),
+            _quote_tick(USDJPY_SIM, "90.002", "90.005", 2_000),
+            _quote_tick(AUDUSD_SIM, "1.00002", "1.00004", 2_000),
+            _quote_tick(USDJPY_SIM, "90.003", "90.006", 3_000),
+        ]
+        self.stream = QuoteTickDataStream.from_ticks([AUDUSD_SIM, USDJPY_SIM], self.ticks)
+
+    def test_instantiate_from_columns(self):
+        # Arrange, Act
+        stream = QuoteTickDataStream(
+            instruments=[AUDUSD_SIM],
+            bid=np.array([1_000_010_000, 1_000_020_000]),
+            ask=np.array([1_000_030_000, 1_000_040_000]),
+            bid_size=np.array([1_000_000_000_000_000, 1_000_000_000_000_000]),
+            ask_size=np.array([2_000_000_000_000_000, 2_000_000_000_000_000]),
+            ts_init=np.array([1_000, 2_000]),
+        )
+        tick = stream.pop()
+
+        # Assert
+        assert len(stream) == 2
+        assert stream.instrument_ids() == [AUDUSD_SIM.id]
+        assert tick.instrument_id == AUDUSD_SIM.id
+        assert tick.bid == Price.from_str("1.00001")
+        assert tick.ask == Price.from_str("1.00003")
+        assert tick.bid_size == Quantity.from_int(1_000_000)
+        assert tick.ask_size == Quantity.from_int(2_000_000)
+        assert tick.ts_event == 1_000  # <-- defaults to ts_init
+        assert tick.ts_init == 1_000
+
+    def test_pop_materializes_ticks_in_order(self):
+        # Arrange, Act
+        result = []
+        while not self.stream.is_exhausted():
+            result.append(self.stream.pop())
+
+        # Assert
+        assert result == self.ticks
+        assert [t.ts_event for t in result] == [t.ts_event for t in self.ticks]
+        assert [t.ts_init for t in result] == [t.ts_init for t in self.ticks]
+        assert self.stream.index == 4
+        assert self.stream.pop() is None
+
+    def test_iter_does_not_advance_stream(self):
+        # Arrange, Act
+        result = list(self.stream)
+
+        # Assert
+        assert result == self.ticks
+        assert self.stream.index == 0
+
+    def test_timestamps(self):
+        # Arrange, Act, Assert
+        assert self.stream.first_ts() == 1_000
+        assert self.stream.last_ts() == 3_000
+        assert self.stream.peek_ts() == 1_000
+
+    def test_seek_moves_to_first_row_at_or_after_timestamp(self):
+        # Arrange, Act
+        self.stream.seek(1_500)
+
+        # Assert
+        assert self.stream.index == 1
+        assert self.stream.peek_ts() == 2_000
+        assert self.stream.pop() == self.ticks[1]
+
+    def test_seek_past_end_exhausts_stream(self):
+        # Arrange, Act
+        self.stream.seek(4_000)
+
+        # Assert
+        assert self.stream.is_exhausted()
+        assert self.stream.pop() is None
+
+    def test_reset(self):
+        # Arrange
+        self.stream.pop()
+        self.stream.pop()
+
+        # Act
+        self.stream.reset()
+
+        # Assert
+        assert self.stream.index == 0
+        assert self.stream.pop() == self.ticks[0]
+
+    def test_nbytes_scales_with_columns(self):
+        # Arrange, Act, Assert
+        # 4 rows x (bid, ask, bid_size, ask_size, ts_event, ts_init) x 8 bytes + 4 x 2 byte index
+        assert self.stream.nbytes == 4 * 6 * 8 + 4 * 2
+
+    def test_instantiate_with_unsorted_ts_init_raises_value_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            QuoteTickDataStream(
+                instruments=[AUDUSD_SIM],
+                bid=np.array([1, 1]),
+                ask=np.array([1, 1]),
+                bid_size=np.array([1, 1]),
+                ask_size=np.array([1, 1]),
+                ts_init=np.array([2_000, 1_000]),
+            )
+
+    def test_instantiate_with_mismatched_column_length_raises_value_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            QuoteTickDataStream(
+                instruments=[AUDUSD_SIM],
+                bid=np.array([1, 1]),
+                ask=np.array([1]),
+                bid_size=np.array([1, 1]),
+                ask_size=np.array([1, 1]),
+                ts_init=np.array([1_000, 2_000]),
+            )
+
+    def test_instantiate_with_out_of_range_instrument_index_raises_value_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            QuoteTickDataStream(
+                instruments=[AUDUSD_SIM],
+                bid=np.array([1, 1]),
+                ask=np.array([1, 1]),
+                bid_size=np.array([1, 1]),
+                ask_size=np.array([1, 1]),
+                ts_init=np.array([1_000, 2_000]),
+                instrument_index=np.array([0, 1]),
+            )
+
+    def test_instantiate_multiple_instruments_without_index_raises_value_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            QuoteTickDataStream(
+                instruments=[AUDUSD_SIM, USDJPY_SIM],
+                bid=np.array([1, 1]),
+                ask=np.array([1, 1]),
+                bid_size=np.array([1, 1]),
+                ask_size=np.array([1, 1]),
+                ts_init=np.array([1_000, 2_000]),
+            )
+
+
+class TestTradeTickDataStream:
+    def test_from_ticks_round_trips_ticks(self):
+        # Arrange
+        ticks = [
+            TradeTick(
+                instrument_id=AUDUSD_SIM.id,
+                price=Price.from_str("1.00001"),
+                size=Quantity.from_int(100_000),
+                aggressor_side=side,
+                trade_id=TradeId(str(123456 + i)),
+                ts_event=i,
+                ts_init=i,
+            )
+            for i, side in enumerate([AggressorSide.BUY, AggressorSide.SELL, AggressorSide.BUY])
+        ]
+
+        # Act
+        stream = TradeTickDataStream.from_ticks([AUDUSD_SIM], ticks)
+
+        # Assert
+        assert list(stream) == ticks
+        assert [t.aggressor_side for t in stream] == [t.aggressor_side for t in ticks]
+
+    def test_from_ticks_preserves_non_numeric_trade_ids(self):
+        # Arrange
+        ticks = [
+            TradeTick(
+                instrument_id=AUDUSD_SIM.id,
+                price=Price.from_str("1.00001"),
+                size=Quantity.from_int(100_000),
+                aggressor_side=AggressorSide.BUY,
+                trade_id=TradeId(trade_id),
+                ts_event=i,
+                ts_init=i,
+            )
+            for i, trade_id in enumerate(["00123", "T-1"])
+        ]
+
+        # Act
+        stream = TradeTickDataStream.from_ticks([AUDUSD_SIM], ticks)
+
+        # Assert
+        assert [t.trade_id for t in stream] == [TradeId("00123"), TradeId("T-1")]
+
+    def test_trade_id_defaults_to_row_index(self):
+        # Arrange
+        stream = TradeTickDataStream(
+            instruments=[AUDUSD_SIM],
+            price=np.array([1_000_010_000, 1_000_020_000]),
+            size=np.array([100_000_000_000_000, 200_000_000_000_000]),
+            aggressor_side=np.array([AggressorSide.BUY.value, AggressorSide.SELL.value]),
+            ts_init=np.array([1_000, 2_000]),
+        )
+
+        # Act
+        ticks = list(stream)
+
+        # Assert
+        assert [t.trade_id for t in ticks] == [TradeId("0"), TradeId("1")]
+        assert [t.aggressor_side for t in ticks] == [AggressorSide.BUY, AggressorSide.SELL]
+        assert ticks[1].price == Price.from_str("1.00002")
+        assert ticks[1].size == Quantity.from_int(200_000)
+
+
+class TestBarDataStream:
+    def test_from_bars_round_trips_bars(self):
+        # Arrange
+        bar1 = TestDataStubs.bar_5decimal()
+        bar2 = Bar(
+            bar_type=TestDataStubs.bartype_usdjpy_1min_bid(),
+            open=Price.from_str("90.002"),
+            high=Price.from_str("90.004"),
+            low=Price.from_str("90.001"),
+            close=Price.from_str("90.003"),
+            volume=Quantity.from_int(1_000_000),
+            ts_event=60_000_000_000,
+            ts_init=60_000_000_000,
+        )
+
+        # Act
+        stream = BarDataStream.from_bars([AUDUSD_SIM, USDJPY_SIM], [bar1, bar2])
+
+        # Assert
+        assert list(stream) == [bar1, bar2]
+        assert stream.bar_types() == [bar1.type, bar2.type]
+        assert stream.instrument_ids() == [AUDUSD_SIM.id, USDJPY_SIM.id]
+
+    def test_instantiate_with_missing_instrument_raises_key_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(KeyError):
+            BarDataStream(
+                bar_types=[TestDataStubs.bartype_usdjpy_1min_bid()],
+                instruments=[AUDUSD_SIM],
+                open=np.array([1]),
+                high=np.array([1]),
+                low=np.array([1]),
+                close=np.array([1]),
+                volume=np.array([1]),
+                ts_init=np.array([1_000]),
+            )
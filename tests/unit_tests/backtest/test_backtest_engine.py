@@ -21,6 +21,8 @@ import pytest
 
 from nautilus_trader.backtest.data.providers import TestDataProvider
 from nautilus_trader.backtest.data.providers import TestInstrumentProvider
+from nautilus_trader.backtest.data.replay import write_replay_file
+from nautilus_trader.backtest.data.stream import QuoteTickDataStream
 from nautilus_trader.backtest.data.wranglers import BarDataWrangler
 from nautilus_trader.backtest.data.wranglers import QuoteTickDataWrangler
 from nautilus_trader.backtest.data.wranglers import TradeTickDataWrangler
@@ -131,6 +133,70 @@ class TestBacktestEngine:
         # Assert
         assert self.engine.iteration == 8000
 
+    def test_run_with_no_strategies_records_loop_counters(self):
+        # Arrange, Act
+        self.engine.run()
+
+        # Assert
+        assert self.engine.loop_counters == {
+            "order_book": 0,
+            "quote_tick": 8000,
+            "trade_tick": 0,
+            "bar": 0,
+            "other": 0,
+            "timer_checks_skipped": 8000,
+            "time_events": 0,
+        }
+
+    def test_run_with_time_alert_skips_timer_checks_until_due(self):
+        # Arrange
+        class AlertStrategy(Strategy):
+            def __init__(self):
+                super().__init__()
+                self.events = []
+
+            def on_start(self):
+                self.clock.set_time_alert_ns(
+                    name="ALERT",
+                    alert_time_ns=self.clock.timestamp_ns() + 60_000_000_000,
+                    callback=self.events.append,
+                )
+
+        strategy = AlertStrategy()
+        self.engine.add_strategy(strategy)
+
+        # Act
+        self.engine.run()
+
+        # Assert
+        assert len(strategy.events) == 1
+        assert self.engine.loop_counters["time_events"] == 1
+        assert self.engine.loop_counters["timer_checks_skipped"] == 7999
+
+    def test_run_with_data_stream_interleaves_with_data(self):
+        # Arrange
+        stream = QuoteTickDataStream.from_ticks([USDJPY_SIM], TestDataStubs.quote_ticks_usdjpy())
+        self.engine.add_data_stream(stream)
+
+        # Act
+        self.engine.run()
+
+        # Assert
+        assert self.engine.iteration == 16000
+        assert self.engine.loop_counters["quote_tick"] == 16000
+        assert stream.is_exhausted()
+
+    def test_reset_clears_loop_counters(self):
+        # Arrange
+        self.engine.run()
+
+        # Act
+        self.engine.reset()
+
+        # Assert
+        assert self.engine.loop_counters["quote_tick"] == 0
+        assert self.engine.loop_counters["timer_checks_skipped"] == 0
+
     def test_run(self):
         # Arrange, Act
         self.engine.add_strategy(Strategy())
@@ -139,6 +205,29 @@ class TestBacktestEngine:
         # Assert
         assert len(self.engine.trader.strategy_states()) == 1
 
+    def test_run_with_msgbus_profiling_records_dispatch_stats(self):
+        # Arrange
+        engine = BacktestEngine(config=BacktestEngineConfig(msgbus_profiling=True))
+        engine.add_venue(
+            venue=Venue("SIM"),
+            oms_type=OMSType.HEDGING,
+            account_type=AccountType.MARGIN,
+            base_currency=USD,
+            starting_balances=[Money(1_000_000, USD)],
+        )
+        engine.add_instrument(USDJPY_SIM)
+        engine.add_data(TestDataStubs.quote_ticks_usdjpy())
+        engine.add_strategy(Strategy())
+
+        # Act
+        engine.run()
+        engine.dispose()
+
+        # Assert
+        assert engine.kernel.msgbus.is_profiling()
+        assert len(engine.kernel.msgbus.handler_stats()) > 0
+        assert len(engine.kernel.msgbus.slowest_topics()) > 0
+
     def test_change_fill_model(self):
         # Arrange, Act
         self.engine.change_fill_model(Venue("SIM"), FillModel())
@@ -231,6 +320,116 @@ class TestBacktestEngineData:
         # Assert
         assert len(self.engine.data) == 5
 
+    def test_add_data_merges_streams_stably_on_finalize(self):
+        # Arrange
+        data_type = DataType(MyData, metadata={"news_wire": "hacks"})
+        stream1 = [
+            GenericData(data_type, MyData("A1", 1000, 1000)),
+            GenericData(data_type, MyData("A2", 3000, 3000)),
+        ]
+        stream2 = [
+            GenericData(data_type, MyData("B2", 3000, 3000)),  # <-- not sorted
+            GenericData(data_type, MyData("B1", 1000, 1000)),
+        ]
+        stream3 = [GenericData(data_type, MyData("C1", 2000, 2000))]
+
+        # Act
+        self.engine.add_data(stream1, ClientId("NEWS_CLIENT"))
+        self.engine.add_data(stream2, ClientId("NEWS_CLIENT"))
+        self.engine.add_data(stream3, ClientId("NEWS_CLIENT"))
+        self.engine.finalize_data()
+
+        # Assert
+        assert [d.data.value for d in self.engine.data] == ["A1", "B1", "C1", "A2", "B2"]
+
+    def test_add_data_after_finalize_merges_with_existing_stream(self):
+        # Arrange
+        data_type = DataType(MyData, metadata={"news_wire": "hacks"})
+        self.engine.add_data(
+            [
+                GenericData(data_type, MyData("A1", 1000, 1000)),
+                GenericData(data_type, MyData("A2", 2000, 2000)),
+            ],
+            ClientId("NEWS_CLIENT"),
+        )
+        self.engine.finalize_data()
+
+        # Act
+        self.engine.add_data(
+            [
+                GenericData(data_type, MyData("B1", 1000, 1000)),
+                GenericData(data_type, MyData("B2", 3000, 3000)),
+            ],
+            ClientId("NEWS_CLIENT"),
+        )
+
+        # Assert
+        assert [d.data.value for d in self.engine.data] == ["A1", "B1", "A2", "B2"]
+
+    def test_clear_data_clears_pending_streams(self):
+        # Arrange
+        data_type = DataType(MyData, metadata={"news_wire": "hacks"})
+        self.engine.add_data(
+            [GenericData(data_type, MyData("A1", 1000, 1000))],
+            ClientId("NEWS_CLIENT"),
+        )
+
+        # Act
+        self.engine.clear_data()
+
+        # Assert
+        assert self.engine.data == []
+
+    def test_add_data_stream_when_instrument_not_in_cache_raises_value_error(self):
+        # Arrange
+        stream = QuoteTickDataStream.from_ticks([USDJPY_SIM], TestDataStubs.quote_ticks_usdjpy())
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            self.engine.add_data_stream(stream)
+
+    def test_run_with_only_data_stream(self):
+        # Arrange
+        self.engine.add_instrument(USDJPY_SIM)
+        stream = QuoteTickDataStream.from_ticks([USDJPY_SIM], TestDataStubs.quote_ticks_usdjpy())
+        self.engine.add_data_stream(stream)
+
+        # Act
+        self.engine.run()
+
+        # Assert
+        assert self.engine.data == []
+        assert self.engine.iteration == 8000
+        assert self.engine.backtest_start.value == stream.first_ts()
+
+    def test_run_with_replay_file(self, tmp_path):
+        # Arrange
+        path = str(tmp_path / "usdjpy.replay")
+        ticks = TestDataStubs.quote_ticks_usdjpy()
+        write_replay_file(path, QuoteTickDataStream.from_ticks([USDJPY_SIM], ticks))
+        self.engine.add_instrument(USDJPY_SIM)
+        self.engine.add_replay_file(path)
+
+        # Act
+        self.engine.run()
+
+        # Assert
+        assert self.engine.iteration == 8000
+        assert self.engine.loop_counters["quote_tick"] == 8000
+
+    def test_clear_data_clears_data_streams(self):
+        # Arrange
+        self.engine.add_instrument(USDJPY_SIM)
+        stream = QuoteTickDataStream.from_ticks([USDJPY_SIM], TestDataStubs.quote_ticks_usdjpy())
+        self.engine.add_data_stream(stream)
+
+        # Act
+        self.engine.clear_data()
+
+        # Assert
+        with pytest.raises(ValueError):
+            self.engine.run()
+
     def test_add_instrument_when_no_venue_raises_exception(self):
         # Arrange
         engine = BacktestEngine()
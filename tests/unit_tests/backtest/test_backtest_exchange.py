@@ -34,6 +34,7 @@ from nautilus_trader.execution.messages import CancelOrder
 from nautilus_trader.execution.messages import ModifyOrder
 from nautilus_trader.model.currencies import JPY
 from nautilus_trader.model.currencies import USD
+from nautilus_trader.model.data.bar import Bar
 from nautilus_trader.model.data.tick import QuoteTick
 from nautilus_trader.model.enums import AccountType
 from nautilus_trader.model.enums import AggressorSide
@@ -69,6 +70,8 @@ USDJPY_SIM = TestInstrumentProvider.default_fx_ccy("USD/JPY")
 
 
 class TestSimulatedExchange:
+    indexed_order_matching = False
+
     def setup(self):
         # Fixture Setup
         self.clock = TestClock()
@@ -133,6 +136,7 @@ class TestSimulatedExchange:
             clock=self.clock,
             logger=self.logger,
             latency_model=LatencyModel(0),
+            indexed_order_matching=self.indexed_order_matching,
         )
 
         self.exec_client = BacktestExecClient(
@@ -2155,3 +2159,219 @@ class TestSimulatedExchange:
         # Assert
         assert entry.status == OrderStatus.ACCEPTED
         assert entry.quantity == 200000
+
+    def test_latency_model_inflight_stats(self):
+        # Arrange
+        self.exchange.set_latency_model(
+            LatencyModel(
+                base_latency_nanos=secs_to_nanos(1),
+                cancel_latency_nanos=secs_to_nanos(2),
+            ),
+        )
+        entry1 = self.strategy.order_factory.limit(
+            instrument_id=USDJPY_SIM.id,
+            order_side=OrderSide.BUY,
+            price=Price.from_int(100),
+            quantity=Quantity.from_int(200000),
+        )
+        entry2 = self.strategy.order_factory.limit(
+            instrument_id=USDJPY_SIM.id,
+            order_side=OrderSide.BUY,
+            price=Price.from_int(99),
+            quantity=Quantity.from_int(200000),
+        )
+
+        # Act
+        self.strategy.submit_order(entry1)
+        self.strategy.submit_order(entry2)
+        self.exchange.process(secs_to_nanos(1))
+        self.strategy.cancel_order(entry1)
+        self.exchange.process(secs_to_nanos(2))  # Cancel still in-flight
+        stats_inflight = self.exchange.get_inflight_stats()
+        self.exchange.process(secs_to_nanos(4))
+        stats = self.exchange.get_inflight_stats()
+
+        # Assert
+        assert entry1.status == OrderStatus.CANCELED
+        assert entry2.status == OrderStatus.ACCEPTED
+        assert stats_inflight["count"] == 1
+        assert stats["count"] == 0
+        assert stats["max_count"] == 2
+        assert stats["total_count"] == 3
+        assert stats["latency_min_ns"] == secs_to_nanos(1)
+        assert stats["latency_max_ns"] == secs_to_nanos(3)
+
+    def test_process_bars_fills_resting_orders(self):
+        # Runs against both the full scan and the indexed matching engines,
+        # which must give the same fills under bar execution
+        # Arrange: Prepare market
+        tick = TestDataStubs.quote_tick_3decimal(
+            instrument_id=USDJPY_SIM.id,
+            bid=Price.from_str("90.002"),
+            ask=Price.from_str("90.005"),
+        )
+        self.data_engine.process(tick)
+        self.exchange.process_quote_tick(tick)
+
+        buy_limit1 = self.strategy.order_factory.limit(
+            USDJPY_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100000),
+            Price.from_str("90.000"),
+        )
+        buy_limit2 = self.strategy.order_factory.limit(
+            USDJPY_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100000),
+            Price.from_str("89.990"),
+        )
+        sell_limit1 = self.strategy.order_factory.limit(
+            USDJPY_SIM.id,
+            OrderSide.SELL,
+            Quantity.from_int(100000),
+            Price.from_str("90.010"),
+        )
+        sell_limit2 = self.strategy.order_factory.limit(
+            USDJPY_SIM.id,
+            OrderSide.SELL,
+            Quantity.from_int(100000),
+            Price.from_str("90.020"),
+        )
+        buy_stop = self.strategy.order_factory.stop_market(
+            USDJPY_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100000),
+            Price.from_str("90.013"),
+        )
+        for order in (buy_limit1, buy_limit2, sell_limit1, sell_limit2, buy_stop):
+            self.strategy.submit_order(order)
+        self.exchange.process(0)
+
+        bid_bar = Bar(
+            bar_type=TestDataStubs.bartype_usdjpy_1min_bid(),
+            open=Price.from_str("90.002"),
+            high=Price.from_str("90.012"),
+            low=Price.from_str("89.996"),
+            close=Price.from_str("90.003"),
+            volume=Quantity.from_int(1_000_000),
+            ts_event=0,
+            ts_init=0,
+        )
+        ask_bar = Bar(
+            bar_type=TestDataStubs.bartype_usdjpy_1min_ask(),
+            open=Price.from_str("90.005"),
+            high=Price.from_str("90.015"),
+            low=Price.from_str("89.999"),
+            close=Price.from_str("90.006"),
+            volume=Quantity.from_int(1_000_000),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        # Act
+        self.exchange.process_bar(bid_bar)
+        self.exchange.process_bar(ask_bar)
+
+        # Assert
+        assert buy_limit1.status == OrderStatus.FILLED
+        assert buy_limit1.avg_px == 90.000
+        assert buy_limit2.status == OrderStatus.ACCEPTED
+        assert sell_limit1.status == OrderStatus.FILLED
+        assert sell_limit1.avg_px == 90.010
+        assert sell_limit2.status == OrderStatus.ACCEPTED
+        assert buy_stop.status == OrderStatus.FILLED
+        assert {o.client_order_id for o in self.exchange.get_open_orders()} == {
+            buy_limit2.client_order_id,
+            sell_limit2.client_order_id,
+        }
+
+
+class TestSimulatedExchangeIndexedOrderMatching(TestSimulatedExchange):
+    # Runs the full exchange test suite against the price indexed order store
+    indexed_order_matching = True
+
+    def test_indexed_order_matching_flag(self):
+        # Arrange, Act, Assert
+        assert self.exchange.indexed_order_matching
+
+    def test_process_quote_tick_only_fills_crossed_limit_orders(self):
+        # Arrange: Prepare market
+        tick1 = TestDataStubs.quote_tick_3decimal(
+            instrument_id=USDJPY_SIM.id,
+            bid=Price.from_str("90.002"),
+            ask=Price.from_str("90.005"),
+        )
+        self.data_engine.process(tick1)
+        self.exchange.process_quote_tick(tick1)
+
+        orders = [
+            self.strategy.order_factory.limit(
+                USDJPY_SIM.id,
+                OrderSide.BUY,
+                Quantity.from_int(100000),
+                Price.from_str(price),
+            )
+            for price in ("90.001", "89.990", "89.980")
+        ]
+        for order in orders:
+            self.strategy.submit_order(order)
+        self.exchange.process(0)
+
+        tick2 = QuoteTick(
+            instrument_id=USDJPY_SIM.id,
+            bid=Price.from_str("89.980"),
+            ask=Price.from_str("89.985"),
+            bid_size=Quantity.from_int(100000),
+            ask_size=Quantity.from_int(100000),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        # Act
+        self.exchange.process_quote_tick(tick2)
+
+        # Assert
+        assert orders[0].status == OrderStatus.FILLED
+        assert orders[1].status == OrderStatus.FILLED
+        assert orders[2].status == OrderStatus.ACCEPTED
+        assert self.exchange.get_open_bid_orders(USDJPY_SIM.id) == [orders[2]]
+
+    def test_modify_limit_order_repositions_order_in_index(self):
+        # Arrange: Prepare market
+        tick1 = TestDataStubs.quote_tick_3decimal(
+            instrument_id=USDJPY_SIM.id,
+            bid=Price.from_str("90.002"),
+            ask=Price.from_str("90.005"),
+        )
+        self.data_engine.process(tick1)
+        self.exchange.process_quote_tick(tick1)
+
+        order = self.strategy.order_factory.limit(
+            USDJPY_SIM.id,
+            OrderSide.SELL,
+            Quantity.from_int(100000),
+            Price.from_str("90.100"),
+        )
+        self.strategy.submit_order(order)
+        self.exchange.process(0)
+
+        self.strategy.modify_order(order, order.quantity, Price.from_str("90.050"))
+        self.exchange.process(0)
+
+        tick2 = QuoteTick(
+            instrument_id=USDJPY_SIM.id,
+            bid=Price.from_str("90.060"),
+            ask=Price.from_str("90.065"),
+            bid_size=Quantity.from_int(100000),
+            ask_size=Quantity.from_int(100000),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        # Act
+        self.exchange.process_quote_tick(tick2)
+
+        # Assert
+        assert order.status == OrderStatus.FILLED
+        assert order.avg_px == 90.060
+        assert self.exchange.get_open_orders() == []
@@ -13,6 +13,7 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import pickle
 from decimal import Decimal
 
 import hyperopt
@@ -91,3 +92,62 @@ class TestHyperoptBacktestNode:
                 ),
                 max_evals=2,
             )
+
+    def test_hyperopt_search_parallel_persists_trials(self, tmp_path):
+        # Arrange
+        node = HyperoptBacktestNode(base_config=self.base_config)
+        node.set_strategy_config(
+            strategy_path="nautilus_trader.examples.strategies.ema_cross:EMACross",
+            config_path="nautilus_trader.examples.strategies.ema_cross:EMACrossConfig",
+        )
+        params = dict(
+            instrument_id="AUD/USD.SIM",
+            bar_type="AUD/USD.SIM-100-TICK-MID-INTERNAL",
+            fast_ema_period=10,
+            slow_ema_period=20,
+            trade_size=Decimal(1_000_000),
+            order_id_tag="001",
+        )
+        trials_path = str(tmp_path / "trials.pkl")
+
+        # Act
+        with pytest.raises(hyperopt.exceptions.AllTrialsFailed):
+            node.hyperopt_search(
+                params=params,
+                max_evals=2,
+                workers=2,
+                trials_path=trials_path,
+            )
+
+        # Assert
+        with open(trials_path, "rb") as f:
+            trials = pickle.load(f)  # noqa
+        assert len(trials) == 2
+
+    def test_hyperopt_search_resumes_from_trials_path(self, tmp_path):
+        # Arrange
+        node = HyperoptBacktestNode(base_config=self.base_config)
+        node.set_strategy_config(
+            strategy_path="nautilus_trader.examples.strategies.ema_cross:EMACross",
+            config_path="nautilus_trader.examples.strategies.ema_cross:EMACrossConfig",
+        )
+        params = dict(
+            instrument_id="AUD/USD.SIM",
+            bar_type="AUD/USD.SIM-100-TICK-MID-INTERNAL",
+            fast_ema_period=10,
+            slow_ema_period=20,
+            trade_size=Decimal(1_000_000),
+            order_id_tag="001",
+        )
+        trials_path = str(tmp_path / "trials.pkl")
+        with pytest.raises(hyperopt.exceptions.AllTrialsFailed):
+            node.hyperopt_search(params=params, max_evals=1, workers=1, trials_path=trials_path)
+
+        # Act
+        with pytest.raises(hyperopt.exceptions.AllTrialsFailed):
+            node.hyperopt_search(params=params, max_evals=3, workers=2, trials_path=trials_path)
+
+        # Assert
+        with open(trials_path, "rb") as f:
+            trials = pickle.load(f)  # noqa
+        assert len(trials) == 3
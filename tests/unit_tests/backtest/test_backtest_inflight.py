@@ -0,0 +1,120 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import pytest
+
+from nautilus_trader.backtest.inflight import InflightQueue
+
+
+class TestInflightQueue:
+    def test_instantiate(self):
+        # Arrange, Act
+        queue = InflightQueue()
+
+        # Assert
+        assert queue.count == 0
+        assert len(queue) == 0
+        assert queue.pop_due(1_000) == []
+        assert repr(queue) == "InflightQueue(count=0, max_count=0)"
+
+    def test_peek_and_pop_when_empty_raises_index_error(self):
+        # Arrange
+        queue = InflightQueue()
+
+        # Act, Assert
+        with pytest.raises(IndexError):
+            queue.peek_ts()
+        with pytest.raises(IndexError):
+            queue.pop()
+
+    def test_items_released_in_arrival_order(self):
+        # Arrange
+        queue = InflightQueue()
+        queue.push(300, 200, "c")
+        queue.push(100, 100, "a")
+        queue.push(200, 100, "b")
+
+        # Act
+        ts = queue.peek_ts()
+        first = queue.pop()
+
+        # Assert
+        assert ts == 100
+        assert first == "a"
+        assert queue.pop_due(300) == ["b", "c"]
+        assert queue.count == 0
+
+    def test_items_with_same_arrival_released_in_push_order(self):
+        # Arrange
+        queue = InflightQueue()
+        items = [{"id": i} for i in range(5)]  # Not orderable
+        for item in items:
+            queue.push(100, 0, item)
+
+        # Act
+        result = queue.pop_due(100)
+
+        # Assert
+        assert result == items
+
+    def test_pop_due_leaves_items_not_yet_arrived(self):
+        # Arrange
+        queue = InflightQueue()
+        queue.push(100, 100, "a")
+        queue.push(200, 100, "b")
+
+        # Act
+        result = queue.pop_due(150)
+
+        # Assert
+        assert result == ["a"]
+        assert queue.count == 1
+        assert queue.peek_ts() == 200
+
+    def test_stats(self):
+        # Arrange
+        queue = InflightQueue()
+        queue.push(100, 100, "a")
+        queue.push(300, 300, "b")
+        queue.pop_due(100)
+        queue.push(500, 200, "c")
+
+        # Act
+        stats = queue.stats()
+
+        # Assert
+        assert stats == {
+            "count": 2,
+            "max_count": 2,
+            "total_count": 3,
+            "latency_min_ns": 100,
+            "latency_max_ns": 300,
+            "latency_mean_ns": 200.0,
+            "latency_std_ns": pytest.approx(81.6496580927726),
+        }
+
+    def test_reset_clears_items_and_stats(self):
+        # Arrange
+        queue = InflightQueue()
+        queue.push(100, 100, "a")
+
+        # Act
+        queue.reset()
+
+        # Assert
+        assert queue.count == 0
+        assert queue.total_count == 0
+        assert queue.latency_max_ns == 0
+        assert queue.latency_mean_ns() == 0.0
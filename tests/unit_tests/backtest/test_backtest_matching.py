@@ -0,0 +1,196 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from datetime import timedelta
+from decimal import Decimal
+
+import pytest
+
+from nautilus_trader.backtest.data.providers import TestInstrumentProvider
+from nautilus_trader.backtest.matching import RestingOrderIndex
+from nautilus_trader.common.clock import TestClock
+from nautilus_trader.common.factories import OrderFactory
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.enums import TimeInForce
+from nautilus_trader.model.enums import TrailingOffsetType
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from tests.test_kit.stubs import UNIX_EPOCH
+from tests.test_kit.stubs.identifiers import TestIdStubs
+
+
+USDJPY_SIM = TestInstrumentProvider.default_fx_ccy("USD/JPY")
+
+
+class TestRestingOrderIndex:
+    def setup(self):
+        # Fixture Setup
+        self.order_factory = OrderFactory(
+            trader_id=TestIdStubs.trader_id(),
+            strategy_id=TestIdStubs.strategy_id(),
+            clock=TestClock(),
+        )
+        self.index = RestingOrderIndex(USDJPY_SIM.id)
+
+    def limit(self, side, price):
+        return self.order_factory.limit(
+            USDJPY_SIM.id,
+            side,
+            Quantity.from_int(100000),
+            Price.from_str(price),
+        )
+
+    def stop_market(self, side, trigger_price):
+        return self.order_factory.stop_market(
+            USDJPY_SIM.id,
+            side,
+            Quantity.from_int(100000),
+            Price.from_str(trigger_price),
+        )
+
+    def test_instantiate(self):
+        # Arrange, Act, Assert
+        assert self.index.instrument_id == USDJPY_SIM.id
+        assert self.index.count() == 0
+        assert len(self.index) == 0
+        assert self.index.candidates(Price.from_str("90.000"), Price.from_str("90.005")) == []
+        assert repr(self.index) == "RestingOrderIndex(instrument_id=USD/JPY.SIM, bids=0, asks=0)"
+
+    def test_add_order_twice_raises_key_error(self):
+        # Arrange
+        order = self.limit(OrderSide.BUY, "90.000")
+        self.index.add(order)
+
+        # Act, Assert
+        with pytest.raises(KeyError):
+            self.index.add(order)
+
+    def test_bid_orders_held_in_matching_priority(self):
+        # Arrange
+        order1 = self.limit(OrderSide.BUY, "89.990")
+        order2 = self.limit(OrderSide.BUY, "90.000")
+        order3 = self.limit(OrderSide.BUY, "90.000")
+        order4 = self.stop_market(OrderSide.BUY, "90.020")
+        order5 = self.stop_market(OrderSide.BUY, "90.010")
+
+        # Act
+        for order in (order1, order2, order3, order4, order5):
+            self.index.add(order)
+
+        # Assert
+        assert self.index.count() == 5
+        assert self.index.bids.orders() == [order2, order3, order1, order5, order4]
+        assert self.index.asks.orders() == []
+
+    def test_candidates_only_returns_orders_crossing_touch(self):
+        # Arrange
+        bid1 = self.limit(OrderSide.BUY, "90.000")
+        bid2 = self.limit(OrderSide.BUY, "89.990")
+        bid_stop = self.stop_market(OrderSide.BUY, "90.020")
+        ask1 = self.limit(OrderSide.SELL, "90.010")
+        ask2 = self.limit(OrderSide.SELL, "90.020")
+        ask_stop = self.stop_market(OrderSide.SELL, "89.980")
+        for order in (bid1, bid2, bid_stop, ask1, ask2, ask_stop):
+            self.index.add(order)
+
+        # Act
+        result1 = self.index.candidates(Price.from_str("89.995"), Price.from_str("90.005"))
+        result2 = self.index.candidates(Price.from_str("90.015"), Price.from_str("90.020"))
+        result3 = self.index.candidates(Price.from_str("89.975"), Price.from_str("89.990"))
+
+        # Assert
+        assert result1 == []
+        assert result2 == [bid_stop, ask1]
+        assert result3 == [bid1, bid2, ask_stop]
+
+    def test_candidates_with_no_market_returns_only_unindexed_orders(self):
+        # Arrange
+        trailing = self.order_factory.trailing_stop_market(
+            USDJPY_SIM.id,
+            OrderSide.SELL,
+            Quantity.from_int(100000),
+            trailing_offset=Decimal("0.010"),
+            trailing_offset_type=TrailingOffsetType.PRICE,
+        )
+        self.index.add(self.limit(OrderSide.BUY, "90.000"))
+        self.index.add(trailing)
+
+        # Act
+        result = self.index.candidates(None, None)
+
+        # Assert
+        assert result == [trailing]
+
+    def test_remove_order(self):
+        # Arrange
+        order1 = self.limit(OrderSide.SELL, "90.010")
+        order2 = self.limit(OrderSide.SELL, "90.010")
+        self.index.add(order1)
+        self.index.add(order2)
+
+        # Act
+        removed = self.index.remove(order1)
+        removed_again = self.index.remove(order1)
+
+        # Assert
+        assert removed
+        assert not removed_again
+        assert not self.index.contains(order1)
+        assert self.index.contains(order2)
+        assert self.index.asks.orders() == [order2]
+
+    def test_expired_returns_orders_at_or_past_expire_time(self):
+        # Arrange
+        order1 = self.order_factory.limit(
+            USDJPY_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100000),
+            Price.from_str("90.000"),
+            time_in_force=TimeInForce.GTD,
+            expire_time=UNIX_EPOCH + timedelta(minutes=1),
+        )
+        order2 = self.order_factory.limit(
+            USDJPY_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100000),
+            Price.from_str("90.000"),
+            time_in_force=TimeInForce.GTD,
+            expire_time=UNIX_EPOCH + timedelta(minutes=2),
+        )
+        order3 = self.limit(OrderSide.BUY, "90.000")
+        for order in (order1, order2, order3):
+            self.index.add(order)
+        self.index.remove(order2)
+
+        # Act
+        result1 = self.index.expired(30_000_000_000)
+        result2 = self.index.expired(180_000_000_000)
+
+        # Assert
+        assert result1 == []
+        assert result2 == [order1]
+
+    def test_clear(self):
+        # Arrange
+        self.index.add(self.limit(OrderSide.BUY, "90.000"))
+        self.index.add(self.stop_market(OrderSide.SELL, "89.000"))
+
+        # Act
+        self.index.clear()
+
+        # Assert
+        assert self.index.count() == 0
+        assert self.index.bids.orders() == []
+        assert self.index.asks.orders() == []
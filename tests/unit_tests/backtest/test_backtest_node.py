@@ -84,6 +84,43 @@ class TestBacktestNode:
         # Assert
         assert len(results) == 1
 
+    def test_run_parallel_returns_results_in_input_order(self):
+        # Arrange
+        configs = self.backtest_configs * 2
+        node = BacktestNode(configs=configs)
+
+        # Act
+        results = node.run(workers=2, share_catalog=True)
+
+        # Assert
+        assert len(results) == 2
+        assert all(result is not None for result in results)
+        assert [r.run_config_id for r in results] == [c.id for c in configs]
+        assert node.get_failures() == {}
+
+    def test_run_parallel_with_failing_config_does_not_abort_batch(self):
+        # Arrange
+        bad_strategy = ImportableStrategyConfig(
+            strategy_path="nautilus_trader.examples.strategies.ema_cross:DoesNotExist",
+            config_path="nautilus_trader.examples.strategies.ema_cross:EMACrossConfig",
+            config=self.strategies[0].config,
+        )
+        bad_config = BacktestRunConfig(
+            engine=BacktestEngineConfig(strategies=[bad_strategy]),
+            venues=[self.venue_config],
+            data=[self.data_config],
+        )
+        node = BacktestNode(configs=[bad_config] + self.backtest_configs + [bad_config])
+
+        # Act
+        results = node.run(workers=2, share_catalog=True)
+
+        # Assert
+        assert results[0] is None
+        assert results[1] is not None
+        assert results[2] is None
+        assert sorted(node.get_failures()) == [0, 2]  # Identical configs keyed by run
+
     def test_backtest_run_streaming_sync(self):
         # Arrange
         config = BacktestRunConfig(
@@ -0,0 +1,188 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import numpy as np
+import pytest
+
+from nautilus_trader.cache.buffers import BarBuffer
+from nautilus_trader.cache.buffers import QuoteTickBuffer
+from nautilus_trader.cache.buffers import TradeTickBuffer
+from nautilus_trader.model.enums import AggressorSide
+from nautilus_trader.model.objects import Price
+from tests.test_kit.stubs.data import TestDataStubs
+from tests.test_kit.stubs.identifiers import TestIdStubs
+
+
+AUDUSD_SIM_ID = TestIdStubs.audusd_id()
+
+
+def _quote_tick(i):
+    return TestDataStubs.quote_tick_5decimal(
+        bid=Price.from_str(f"1.{i:05d}"),
+        ask=Price.from_str(f"1.{i + 2:05d}"),
+    )
+
+
+class TestQuoteTickBuffer:
+    def test_instantiate_with_zero_capacity_raises_value_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            QuoteTickBuffer(AUDUSD_SIM_ID, 0)
+
+    def test_empty_buffer(self):
+        # Arrange, Act
+        buffer = QuoteTickBuffer(AUDUSD_SIM_ID, 3)
+
+        # Assert
+        assert buffer.instrument_id == AUDUSD_SIM_ID
+        assert buffer.capacity == 3
+        assert buffer.count == 0
+        assert len(buffer) == 0
+        assert not buffer
+        assert list(buffer) == []
+        assert len(buffer.arrays()["bid"]) == 0
+
+    def test_index_out_of_range_raises_index_error(self):
+        # Arrange
+        buffer = QuoteTickBuffer(AUDUSD_SIM_ID, 3)
+        buffer.appendleft(_quote_tick(1))
+
+        # Act, Assert
+        with pytest.raises(IndexError):
+            buffer[1]
+
+    def test_appendleft_materializes_equal_ticks_most_recent_first(self):
+        # Arrange
+        buffer = QuoteTickBuffer(AUDUSD_SIM_ID, 3)
+        tick1 = _quote_tick(1)
+        tick2 = _quote_tick(2)
+
+        # Act
+        buffer.appendleft(tick1)
+        buffer.appendleft(tick2)
+
+        # Assert
+        assert len(buffer) == 2
+        assert buffer[0] == tick2
+        assert buffer[1] == tick1
+        assert buffer[-1] == tick1
+        assert list(buffer) == [tick2, tick1]
+
+    def test_appendleft_beyond_capacity_drops_oldest(self):
+        # Arrange
+        buffer = QuoteTickBuffer(AUDUSD_SIM_ID, 3)
+        ticks = [_quote_tick(i) for i in range(5)]
+
+        # Act
+        for tick in ticks:
+            buffer.appendleft(tick)
+
+        # Assert
+        assert len(buffer) == 3
+        assert list(buffer) == [ticks[4], ticks[3], ticks[2]]
+
+    def test_arrays_returns_chronological_views(self):
+        # Arrange
+        buffer = QuoteTickBuffer(AUDUSD_SIM_ID, 3)
+        ticks = [_quote_tick(i) for i in range(5)]
+        for tick in ticks:
+            buffer.appendleft(tick)
+
+        # Act
+        arrays = buffer.arrays()
+        recent = buffer.arrays(count=2)
+
+        # Assert
+        assert arrays["bid"].dtype == np.int64
+        assert list(arrays["bid"]) == [t.bid.raw for t in ticks[2:]]
+        assert list(arrays["ask"]) == [t.ask.raw for t in ticks[2:]]
+        assert list(recent["bid"]) == [t.bid.raw for t in ticks[3:]]
+        assert not arrays["bid"].flags["OWNDATA"]  # View, not a copy
+
+    def test_arrays_are_read_only(self):
+        # Arrange
+        buffer = QuoteTickBuffer(AUDUSD_SIM_ID, 3)
+        buffer.appendleft(_quote_tick(1))
+
+        # Act
+        arrays = buffer.arrays()
+
+        # Assert
+        assert not arrays["bid"].flags["WRITEABLE"]
+        with pytest.raises(ValueError):
+            arrays["bid"][0] = 0
+
+    def test_most_recent_tick_is_not_materialized(self):
+        # Arrange
+        buffer = QuoteTickBuffer(AUDUSD_SIM_ID, 3)
+        tick1 = _quote_tick(1)
+        tick2 = _quote_tick(2)
+
+        # Act
+        buffer.appendleft(tick1)
+        buffer.appendleft(tick2)
+
+        # Assert
+        assert buffer[0] is tick2
+        assert buffer[-2] is tick2
+        assert buffer[1] is not tick1
+        assert buffer[1] == tick1
+
+    def test_clear(self):
+        # Arrange
+        buffer = QuoteTickBuffer(AUDUSD_SIM_ID, 3)
+        buffer.appendleft(_quote_tick(1))
+
+        # Act
+        buffer.clear()
+
+        # Assert
+        assert len(buffer) == 0
+        assert buffer.arrays(count=1)["bid"].size == 0
+
+
+class TestTradeTickBuffer:
+    def test_appendleft_materializes_equal_ticks(self):
+        # Arrange
+        buffer = TradeTickBuffer(AUDUSD_SIM_ID, 2)
+        tick1 = TestDataStubs.trade_tick_5decimal(aggressor_side=AggressorSide.SELL)
+        tick2 = TestDataStubs.trade_tick_5decimal(price=Price.from_str("1.00002"))
+        tick3 = TestDataStubs.trade_tick_5decimal(price=Price.from_str("1.00003"))
+
+        # Act
+        buffer.appendleft(tick1)
+        buffer.appendleft(tick2)
+        buffer.appendleft(tick3)
+
+        # Assert
+        assert list(buffer) == [tick3, tick2]
+        assert buffer[0].trade_id == tick3.trade_id
+        assert list(buffer.arrays()["price"]) == [tick2.price.raw, tick3.price.raw]
+
+
+class TestBarBuffer:
+    def test_appendleft_materializes_equal_bars(self):
+        # Arrange
+        bar = TestDataStubs.bar_5decimal()
+        buffer = BarBuffer(bar.type, 10)
+
+        # Act
+        buffer.appendleft(bar)
+
+        # Assert
+        assert buffer.bar_type == bar.type
+        assert buffer[0] == bar
+        assert list(buffer.arrays()["close"]) == [bar.close.raw]
+        assert list(buffer.arrays()["volume"]) == [bar.volume.raw]
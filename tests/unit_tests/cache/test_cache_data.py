@@ -18,6 +18,8 @@ from decimal import Decimal
 import pytest
 
 from nautilus_trader.backtest.data.providers import TestInstrumentProvider
+from nautilus_trader.cache.cache import Cache
+from nautilus_trader.config import CacheConfig
 from nautilus_trader.model.currencies import AUD
 from nautilus_trader.model.currencies import JPY
 from nautilus_trader.model.currencies import USD
@@ -523,3 +525,93 @@ class TestCache:
 
         # Assert
         assert result == 0.80005
+
+    def test_get_xrate_reflects_latest_quote_tick(self):
+        # Arrange
+        self.cache.add_instrument(AUDUSD_SIM)
+        self.cache.add_instrument(USDJPY_SIM)
+
+        for instrument_id, price in ((AUDUSD_SIM.id, "0.80000"), (USDJPY_SIM.id, "110.000")):
+            self.cache.add_quote_tick(
+                QuoteTick(
+                    instrument_id=instrument_id,
+                    bid=Price.from_str(price),
+                    ask=Price.from_str(price),
+                    bid_size=Quantity.from_int(1),
+                    ask_size=Quantity.from_int(1),
+                    ts_event=0,
+                    ts_init=0,
+                ),
+            )
+        result1 = self.cache.get_xrate(SIM, AUD, JPY)
+
+        # Act
+        self.cache.add_quote_tick(
+            QuoteTick(
+                instrument_id=AUDUSD_SIM.id,
+                bid=Price.from_str("0.70000"),
+                ask=Price.from_str("0.70000"),
+                bid_size=Quantity.from_int(1),
+                ask_size=Quantity.from_int(1),
+                ts_event=1,
+                ts_init=1,
+            ),
+        )
+        result2 = self.cache.get_xrate(SIM, AUD, JPY)
+
+        # Assert
+        assert result1 == pytest.approx(88.0)
+        assert result2 == pytest.approx(77.0)
+
+
+class TestColumnarCache(TestCache):
+    def setup(self):
+        # Fixture Setup
+        self.cache = Cache(
+            database=None,
+            logger=TestComponentStubs.logger(),
+            config=CacheConfig(columnar=True),
+        )
+
+    def test_arrays_when_no_data_returns_none(self):
+        # Arrange, Act, Assert
+        assert self.cache.quote_tick_arrays(AUDUSD_SIM.id) is None
+        assert self.cache.trade_tick_arrays(AUDUSD_SIM.id) is None
+        assert self.cache.bar_arrays(TestDataStubs.bartype_audusd_1min_bid()) is None
+
+    def test_quote_tick_arrays_returns_recent_history(self):
+        # Arrange
+        tick1 = TestDataStubs.quote_tick_5decimal(bid=Price.from_str("1.00001"))
+        tick2 = TestDataStubs.quote_tick_5decimal(bid=Price.from_str("1.00002"))
+        self.cache.add_quote_tick(tick1)
+        self.cache.add_quote_tick(tick2)
+
+        # Act
+        result = self.cache.quote_tick_arrays(AUDUSD_SIM.id, count=1)
+
+        # Assert
+        assert list(result["bid"]) == [tick2.bid.raw]
+        assert list(self.cache.quote_tick_arrays(AUDUSD_SIM.id)["bid"]) == [
+            tick1.bid.raw,
+            tick2.bid.raw,
+        ]
+
+    def test_bar_arrays_returns_recent_history(self):
+        # Arrange
+        bar = TestDataStubs.bar_5decimal()
+        self.cache.add_bar(bar)
+
+        # Act
+        result = self.cache.bar_arrays(bar.type)
+
+        # Assert
+        assert list(result["close"]) == [bar.close.raw]
+        assert list(result["ts_event"]) == [bar.ts_event]
+
+    def test_arrays_when_not_columnar_returns_none(self):
+        # Arrange
+        cache = TestComponentStubs.cache()
+        cache.add_quote_tick(TestDataStubs.quote_tick_5decimal())
+
+        # Act, Assert
+        assert cache.quote_tick_arrays(AUDUSD_SIM.id) is None
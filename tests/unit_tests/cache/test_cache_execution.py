@@ -860,6 +860,95 @@ class TestCache:
         assert self.cache.positions_closed(venue=GBPUSD_SIM.venue) == [position2]
         assert self.cache.positions_closed(instrument_id=GBPUSD_SIM.id) == [position2]
 
+    def test_order_count_queries_with_filters_returns_expected_counts(self):
+        # Arrange
+        order1 = self.strategy.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100000),
+        )
+        order2 = self.strategy.order_factory.market(
+            GBPUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100000),
+        )
+
+        self.cache.add_order(order1, None)
+        self.cache.add_order(order2, None)
+
+        order1.apply(TestEventStubs.order_submitted(order1))
+        self.cache.update_order(order1)
+        order1.apply(TestEventStubs.order_accepted(order1))
+        self.cache.update_order(order1)
+
+        order2.apply(TestEventStubs.order_submitted(order2))
+        self.cache.update_order(order2)
+        order2.apply(TestEventStubs.order_accepted(order2))
+        self.cache.update_order(order2)
+
+        # Act
+        order2.apply(TestEventStubs.order_filled(order2, instrument=GBPUSD_SIM))
+        self.cache.update_order(order2)
+
+        # Assert
+        assert self.cache.orders_total_count(venue=AUDUSD_SIM.venue) == 2
+        assert self.cache.orders_open_count(instrument_id=AUDUSD_SIM.id) == 1
+        assert self.cache.orders_open_count(instrument_id=GBPUSD_SIM.id) == 0
+        assert self.cache.orders_closed_count(instrument_id=GBPUSD_SIM.id) == 1
+        assert self.cache.orders_open_count(strategy_id=self.strategy.id) == 1
+        assert self.cache.orders_closed_count(strategy_id=self.strategy.id) == 1
+        assert self.cache.orders_open_count(strategy_id=StrategyId("S-999")) == 0
+        assert (
+            self.cache.orders_open_count(
+                venue=BTCUSD_BINANCE.venue,
+                instrument_id=AUDUSD_SIM.id,
+            )
+            == 0
+        )
+        assert self.cache.orders_open(venue=AUDUSD_SIM.venue, strategy_id=self.strategy.id) == [
+            order1
+        ]
+        assert self.cache.orders_closed(instrument_id=GBPUSD_SIM.id) == [order2]
+        assert self.cache.client_order_ids_open(instrument_id=AUDUSD_SIM.id) == {
+            order1.client_order_id
+        }
+
+    def test_count_queries_after_rebuilding_index_returns_expected_counts(self):
+        # Arrange
+        order = self.strategy.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100000),
+        )
+
+        self.cache.add_order(order, PositionId("P-1"))
+        order.apply(TestEventStubs.order_submitted(order))
+        self.cache.update_order(order)
+        order.apply(TestEventStubs.order_accepted(order))
+        self.cache.update_order(order)
+
+        fill = TestEventStubs.order_filled(
+            order,
+            instrument=AUDUSD_SIM,
+            position_id=PositionId("P-1"),
+        )
+        order.apply(fill)
+        self.cache.update_order(order)
+
+        position = Position(instrument=AUDUSD_SIM, fill=fill)
+        self.cache.add_position(position, OMSType.HEDGING)
+
+        # Act
+        self.cache.build_index()
+
+        # Assert
+        assert self.cache.orders_closed_count(instrument_id=AUDUSD_SIM.id) == 1
+        assert self.cache.orders_open_count(instrument_id=AUDUSD_SIM.id) == 0
+        assert self.cache.positions_open_count(venue=AUDUSD_SIM.venue) == 1
+        assert self.cache.positions_open_count(strategy_id=self.strategy.id) == 1
+        assert self.cache.positions_closed_count(instrument_id=AUDUSD_SIM.id) == 0
+        assert self.cache.positions_total_count(instrument_id=GBPUSD_SIM.id) == 0
+
     def test_update_account(self):
         # Arrange
         account = TestExecStubs.cash_account()
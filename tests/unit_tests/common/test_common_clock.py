@@ -15,6 +15,7 @@
 
 import asyncio
 import sys
+import threading
 import time
 from datetime import datetime
 from datetime import timedelta
@@ -23,8 +24,10 @@ import pandas as pd
 import pytest
 import pytz
 
+from nautilus_trader.common.clock import HeapLiveClock
 from nautilus_trader.common.clock import LiveClock
 from nautilus_trader.common.clock import TestClock
+from nautilus_trader.common.clock import TestClockScheduler
 from nautilus_trader.common.timer import TimeEvent
 from nautilus_trader.common.timer import TimeEventHandler
 from nautilus_trader.core.datetime import millis_to_nanos
@@ -557,6 +560,148 @@ class TestTestClock:
         assert clock.timer_count == 2
 
 
+class TestTestClockScheduler:
+    def setup(self):
+        # Fixture Setup
+        self.handler = []
+        self.scheduler = TestClockScheduler()
+        self.clock1 = TestClock()
+        self.clock2 = TestClock()
+        self.clock1.register_default_handler(self.handler.append)
+        self.clock2.register_default_handler(self.handler.append)
+        self.scheduler.register(self.clock1)
+        self.scheduler.register(self.clock2)
+
+    def test_instantiated_scheduler(self):
+        # Arrange, Act, Assert
+        assert self.scheduler.time_ns == 0
+        assert self.scheduler.next_event_time_ns == 0
+        assert self.scheduler.clocks() == [self.clock1, self.clock2]
+
+    def test_set_time_sets_shared_time_of_clocks(self):
+        # Arrange, Act
+        self.scheduler.set_time(1_000)
+
+        # Assert
+        assert self.clock1.timestamp_ns() == 1_000
+        assert self.clock2.timestamp_ns() == 1_000
+
+    def test_set_time_does_not_sync_each_clock(self):
+        # Arrange
+        clocks = [TestClock() for _ in range(100)]
+        for clock in clocks:
+            self.scheduler.register(clock)
+
+        # Act
+        for i in range(1, 1_001):
+            self.scheduler.set_time(i)
+        self.scheduler.advance_time(1_001)
+
+        # Assert
+        assert self.scheduler.clock_sync_count == 0
+        assert self.scheduler.clock_advance_count == 0
+        assert all(clock.timestamp_ns() == 1_001 for clock in clocks)
+
+    def test_setting_timer_syncs_clock_to_shared_time(self):
+        # Arrange
+        self.scheduler.set_time(1_000)
+
+        # Act
+        self.clock1.set_time_alert_ns("ALERT1", 2_000)
+
+        # Assert
+        assert self.scheduler.clock_sync_count == 1
+        assert self.clock1.next_time_ns("ALERT1") == 2_000
+
+    def test_set_time_on_registered_clock_sets_shared_time(self):
+        # Arrange, Act
+        self.clock1.set_time(2_000)
+
+        # Assert
+        assert self.scheduler.time_ns == 2_000
+        assert self.clock2.timestamp_ns() == 2_000
+
+    def test_next_event_time_tracks_earliest_timer_across_clocks(self):
+        # Arrange, Act
+        self.clock1.set_time_alert_ns("ALERT1", 3_000)
+        self.clock2.set_time_alert_ns("ALERT2", 2_000)
+
+        # Assert
+        assert self.scheduler.next_event_time_ns == 2_000
+
+    def test_cancel_timer_updates_next_event_time(self):
+        # Arrange
+        self.clock1.set_time_alert_ns("ALERT1", 3_000)
+        self.clock2.set_time_alert_ns("ALERT2", 2_000)
+
+        # Act
+        self.clock2.cancel_timer("ALERT2")
+
+        # Assert
+        assert self.scheduler.next_event_time_ns == 3_000
+
+    def test_advance_time_when_no_timers_due_does_not_advance_clocks(self):
+        # Arrange
+        self.clock1.set_time_alert_ns("ALERT1", 3_000)
+
+        # Act
+        events = self.scheduler.advance_time(2_000)
+
+        # Assert
+        assert events == []
+        assert self.scheduler.clock_advance_count == 0
+        assert self.clock1.timestamp_ns() == 2_000
+
+    def test_advance_time_returns_events_merged_across_clocks(self):
+        # Arrange
+        self.clock1.set_timer_ns("TIMER1", 1_000, 0, 0)
+        self.clock2.set_time_alert_ns("ALERT2", 1_500)
+
+        # Act
+        events = self.scheduler.advance_time(2_000)
+
+        # Assert
+        assert [e.event.ts_event for e in events] == [1_000, 1_500, 2_000]
+        assert [e.event.name for e in events] == ["TIMER1", "ALERT2", "TIMER1"]
+        assert self.scheduler.clock_advance_count == 2
+        assert self.scheduler.next_event_time_ns == 3_000
+
+    def test_advance_time_only_advances_clocks_with_timer_due(self):
+        # Arrange
+        self.clock1.set_time_alert_ns("ALERT1", 1_000)
+        self.clock2.set_time_alert_ns("ALERT2", 5_000)
+
+        # Act
+        events = self.scheduler.advance_time(1_000)
+
+        # Assert
+        assert len(events) == 1
+        assert self.scheduler.clock_advance_count == 1
+        assert self.scheduler.next_event_time_ns == 5_000
+
+    def test_advance_time_when_earlier_than_time_raises_value_error(self):
+        # Arrange
+        self.scheduler.set_time(1_000)
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            self.scheduler.advance_time(999)
+
+    def test_deregister_clock_retains_time(self):
+        # Arrange
+        self.scheduler.set_time(1_000)
+        self.clock1.set_time_alert_ns("ALERT1", 2_000)
+        self.scheduler.advance_time(1_500)
+
+        # Act
+        self.scheduler.deregister(self.clock1)
+
+        # Assert
+        assert self.scheduler.clocks() == [self.clock2]
+        assert self.scheduler.next_event_time_ns == 0
+        assert self.clock1.timestamp_ns() == 1_500
+
+
 @pytest.mark.skipif(sys.platform == "win32", reason="Randomly failing on Windows in CI")
 class TestLiveClockWithThreadTimer:
     def setup(self):
@@ -1087,3 +1232,121 @@ class TestLiveClockWithLoopTimer:
 
         # Assert
         assert len(self.handler) >= 2
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Randomly failing on Windows in CI")
+class TestHeapLiveClockWithThreadScheduler(TestLiveClockWithThreadTimer):
+    def setup(self):
+        # Fixture Setup
+        self.handler = []
+        self.clock = HeapLiveClock()
+        self.clock.register_default_handler(self.handler.append)
+
+    def test_many_time_alerts_use_single_scheduler_thread(self):
+        # Arrange
+        thread_count = threading.active_count()
+        alert_time = self.clock.utc_now() + timedelta(milliseconds=100)
+
+        # Act
+        for i in range(500):
+            self.clock.set_time_alert(f"TEST_ALERT{i}", alert_time + timedelta(microseconds=i))
+
+        # Assert
+        assert self.clock.timer_count == 500
+        assert threading.active_count() <= thread_count + 1
+
+    def test_time_alerts_due_at_same_time_raised_in_one_wakeup(self):
+        # Arrange
+        alert_time = self.clock.utc_now() + timedelta(milliseconds=100)
+
+        # Act
+        for i in range(10):
+            self.clock.set_time_alert(f"TEST_ALERT{i}", alert_time)
+        time.sleep(0.5)
+
+        # Assert
+        assert self.clock.timer_count == 0
+        assert len(self.handler) == 10
+        assert self.clock.event_count == 10
+        assert self.clock.wakeup_count == 1
+        assert [event.name for event in self.handler] == [f"TEST_ALERT{i}" for i in range(10)]
+
+    def test_cancel_timers_compacts_schedule(self):
+        # Arrange
+        alert_time = self.clock.utc_now() + timedelta(seconds=60)
+        for i in range(200):
+            self.clock.set_time_alert(f"TEST_ALERT{i}", alert_time + timedelta(microseconds=i))
+
+        # Act
+        for i in range(150):
+            self.clock.cancel_timer(f"TEST_ALERT{i}")
+
+        # Assert
+        assert self.clock.timer_count == 50
+        assert self.clock.heap_size() < 200
+        assert self.clock.timer_names[0] == "TEST_ALERT150"
+
+    def test_handler_can_set_new_time_alert(self):
+        # Arrange
+        def handler(event):
+            self.handler.append(event)
+            if event.name == "TEST_ALERT1":
+                self.clock.set_time_alert(
+                    "TEST_ALERT2",
+                    self.clock.utc_now() + timedelta(milliseconds=50),
+                )
+
+        alert_time = self.clock.utc_now() + timedelta(milliseconds=50)
+
+        # Act
+        self.clock.set_time_alert("TEST_ALERT1", alert_time, callback=handler)
+        time.sleep(0.5)
+
+        # Assert
+        assert [event.name for event in self.handler] == ["TEST_ALERT1", "TEST_ALERT2"]
+        assert self.clock.error_count == 0
+
+    def test_failing_handler_does_not_drop_other_due_events(self):
+        # Arrange
+        def failing_handler(event):
+            raise RuntimeError("handler failed")
+
+        alert_time = self.clock.utc_now() + timedelta(milliseconds=100)
+
+        # Act
+        self.clock.set_time_alert("TEST_ALERT0", alert_time, callback=failing_handler)
+        for i in range(1, 5):
+            self.clock.set_time_alert(f"TEST_ALERT{i}", alert_time)
+        time.sleep(0.5)
+
+        # Assert
+        assert [event.name for event in self.handler] == [f"TEST_ALERT{i}" for i in range(1, 5)]
+        assert self.clock.error_count == 1
+        assert isinstance(self.clock.last_error, RuntimeError)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Randomly failing on Windows in CI")
+class TestHeapLiveClockWithLoopScheduler(TestLiveClockWithLoopTimer):
+    def setup(self):
+        # Fixture Setup
+        self.loop = asyncio.get_event_loop()
+        self.loop.set_debug(True)
+
+        self.handler = []
+        self.clock = HeapLiveClock(loop=self.loop)
+        self.clock.register_default_handler(self.handler.append)
+
+    @pytest.mark.asyncio
+    async def test_time_alerts_due_at_same_time_raised_in_one_wakeup(self):
+        # Arrange
+        alert_time = self.clock.utc_now() + timedelta(milliseconds=100)
+
+        # Act
+        for i in range(10):
+            self.clock.set_time_alert(f"TEST_ALERT{i}", alert_time)
+        await asyncio.sleep(0.5)
+
+        # Assert
+        assert self.clock.timer_count == 0
+        assert len(self.handler) == 10
+        assert self.clock.wakeup_count == 1
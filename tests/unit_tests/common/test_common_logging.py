@@ -15,6 +15,8 @@
 
 import asyncio
 import socket
+import threading
+import time
 
 import pytest
 
@@ -26,6 +28,7 @@ from nautilus_trader.common.logging import Logger
 from nautilus_trader.common.logging import LoggerAdapter
 from nautilus_trader.common.logging import LogLevel
 from nautilus_trader.common.logging import LogLevelParser
+from nautilus_trader.common.logging import LogSinkWorker
 
 
 class TestLogLevelParser:
@@ -193,6 +196,126 @@ class TestLoggerTests:
             "trader_id": "TRADER-000",
         }
 
+    def test_enable_async_sinks_delivers_records_on_flush(self):
+        # Arrange
+        sink = []
+        logger = Logger(clock=TestClock(), level_stdout=LogLevel.CRITICAL)
+        logger_adapter = LoggerAdapter(component_name="TEST_LOGGER", logger=logger)
+        logger.register_sink(sink.append)
+
+        # Act
+        logger.enable_async_sinks(batch_size=10)
+        for i in range(25):
+            logger_adapter.info(f"Log event {i}")
+        logger.flush_sinks()
+
+        # Assert
+        assert logger.sink_worker.is_running()
+        assert len(sink) == 25
+        assert [record["msg"] for record in sink] == [f"Log event {i}" for i in range(25)]
+        assert sink[0]["trader_id"] == "TRADER-000"
+        assert sink[0]["instance_id"] == logger.instance_id.value
+        assert logger.sink_worker.delivered_count == 25
+        assert logger.sink_worker.drop_count == 0
+        logger.disable_async_sinks()
+
+    def test_disable_async_sinks_flushes_queued_records(self):
+        # Arrange
+        sink = []
+        logger = Logger(clock=TestClock(), level_stdout=LogLevel.CRITICAL)
+        logger_adapter = LoggerAdapter(component_name="TEST_LOGGER", logger=logger)
+        logger.register_sink(sink.append)
+        logger.enable_async_sinks()
+        worker = logger.sink_worker
+
+        # Act
+        for i in range(100):
+            logger_adapter.info(f"Log event {i}")
+        logger.disable_async_sinks()
+        logger_adapter.info("Sync event")
+
+        # Assert
+        assert logger.sink_worker is None
+        assert not worker.is_running()
+        assert len(sink) == 101
+        assert sink[-1]["msg"] == "Sync event"
+
+    def test_sink_worker_when_queue_full_counts_drops(self):
+        # Arrange
+        release = threading.Event()
+        sink = []
+
+        def blocking_sink(record):
+            release.wait()
+            sink.append(record)
+
+        worker = LogSinkWorker(sinks=[blocking_sink], queue_size=2, batch_size=1)
+        worker.start()
+
+        # Act
+        results = [worker.put({"msg": str(i)}) for i in range(10)]
+        release.set()
+        worker.stop()
+
+        # Assert
+        assert results.count(False) == worker.drop_count
+        assert 0 < worker.drop_count <= 8
+        assert worker.delivered_count == 10 - worker.drop_count
+        assert len(sink) == worker.delivered_count
+
+    def test_sink_worker_stop_delivers_records_queued_after_sentinel(self):
+        # Arrange
+        started = threading.Event()
+        release = threading.Event()
+        sink = []
+
+        def blocking_sink(record):
+            started.set()
+            release.wait()
+            sink.append(record)
+
+        worker = LogSinkWorker(sinks=[blocking_sink])
+        worker.start()
+        worker.put({"msg": "A"})
+        started.wait(1)
+
+        stopper = threading.Thread(target=worker.stop)
+        stopper.start()
+        while worker.pending_count() == 0:  # Wait for the stop sentinel
+            time.sleep(0.001)
+
+        # Act
+        worker.put({"msg": "B"})
+        release.set()
+        stopper.join(1)
+
+        # Assert
+        assert not stopper.is_alive()
+        assert not worker.is_running()
+        assert sink == [{"msg": "A"}, {"msg": "B"}]
+
+    def test_sink_worker_when_handler_raises_counts_errors_and_continues(self, capsys):
+        # Arrange
+        sink = []
+
+        def failing_sink(record):
+            raise RuntimeError("sink failure")
+
+        worker = LogSinkWorker(sinks=[failing_sink, sink.append])
+        worker.start()
+
+        # Act
+        worker.put({"msg": "A"})
+        worker.put({"msg": "B"})
+        worker.flush()
+
+        # Assert
+        assert worker.error_count == 2
+        assert isinstance(worker.last_error, RuntimeError)
+        assert sink == [{"msg": "A"}, {"msg": "B"}]
+        assert capsys.readouterr().err.count("RuntimeError: sink failure") == 1
+        worker.stop()
+
 
 class TestLiveLogger:
     def setup(self):
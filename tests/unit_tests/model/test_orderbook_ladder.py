@@ -96,6 +96,27 @@ def test_update_no_volume(bids):
     assert order.price not in bids.prices()
 
 
+@pytest.mark.parametrize("reverse", [False, True])
+def test_many_levels_added_and_deleted_remain_sorted(reverse):
+    # Arrange
+    orders = [
+        Order(price=float(price), size=1.0, side=OrderSide.BUY, id=str(price))
+        for price in (7 * i % 1000 for i in range(1000))
+    ]
+    ladder = Ladder(reverse=reverse, price_precision=0, size_precision=0)
+    for order in orders:
+        ladder.add(order=order)
+
+    # Act
+    for order in orders[::2]:
+        ladder.delete(order)
+
+    # Assert
+    expected = sorted((order.price for order in orders[1::2]), reverse=reverse)
+    assert ladder.prices() == expected
+    assert ladder.top().price == expected[0]
+
+
 def test_top_level(bids, asks):
     assert bids.top().price == Price.from_str("10")
     assert asks.top().price == Price.from_str("15")
@@ -169,3 +190,34 @@ def test_simulate_order_fills_l3():
         (Price.from_str("16.0000"), Quantity.from_str("1.0000")),
     ]
     assert fills == expected
+
+
+def test_reversed_ladder_levels_sorted_best_price_first():
+    ladder = Ladder(reverse=True, price_precision=0, size_precision=0)
+    for i, price in enumerate([101.0, 99.0, 105.0, 100.0, 103.0, 102.0, 104.0]):
+        ladder.add(Order(price=price, size=1.0, side=OrderSide.BUY, id=str(i)))
+
+    assert ladder.prices() == [105.0, 104.0, 103.0, 102.0, 101.0, 100.0, 99.0]
+    assert ladder.top().price == 105.0
+
+
+def test_delete_last_order_removes_level_and_keeps_order():
+    ladder = Ladder(reverse=False, price_precision=0, size_precision=0)
+    for i, price in enumerate([100.0, 101.0, 102.0]):
+        ladder.add(Order(price=price, size=1.0, side=OrderSide.SELL, id=str(i)))
+
+    ladder.delete(Order(price=101.0, size=1.0, side=OrderSide.SELL, id="1"))
+    ladder.add(Order(price=101.5, size=1.0, side=OrderSide.SELL, id="3"))
+
+    assert ladder.prices() == [100.0, 101.5, 102.0]
+
+
+def test_update_to_zero_size_then_readd_order_id():
+    ladder = Ladder(reverse=False, price_precision=0, size_precision=0)
+    ladder.add(Order(price=100.0, size=1.0, side=OrderSide.SELL, id="1"))
+
+    ladder.update(Order(price=100.0, size=0.0, side=OrderSide.SELL, id="1"))
+    ladder.update(Order(price=100.0, size=2.0, side=OrderSide.SELL, id="1"))
+
+    assert ladder.prices() == [100.0]
+    assert ladder.volumes() == [2.0]
@@ -13,6 +13,8 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import pytest
+
 from nautilus_trader.model.c_enums.order_side import OrderSide
 from nautilus_trader.model.orderbook.data import Order
 from nautilus_trader.model.orderbook.level import Level
@@ -75,3 +77,38 @@ def test_level_repr():
 
     expected = "Level(price=10.0, orders=[Order(10.0, 0.0, BUY, 1)])"
     assert str(level) == expected
+
+
+def test_volume_and_exposure_track_add_update_delete():
+    level = Level(price=10.0)
+    orders = [
+        Order(price=10.0, size=10.0, side=OrderSide.BUY, id="1"),
+        Order(price=10.0, size=20.0, side=OrderSide.BUY, id="2"),
+        Order(price=10.0, size=30.0, side=OrderSide.BUY, id="3"),
+    ]
+    level.bulk_add(orders=orders)
+
+    level.update(Order(price=10.0, size=5.0, side=OrderSide.BUY, id="2"))
+    level.delete(orders[0])
+
+    assert level.count() == 2
+    assert level.volume() == 35.0
+    assert level.exposure() == 350.0
+    assert [order.id for order in level.orders] == ["2", "3"]
+
+
+def test_update_to_zero_size_deletes_order():
+    level = Level(price=10.0)
+    level.add(Order(price=10.0, size=10.0, side=OrderSide.BUY, id="1"))
+
+    level.update(Order(price=10.0, size=0.0, side=OrderSide.BUY, id="1"))
+
+    assert level.is_empty()
+    assert level.volume() == 0.0
+
+
+def test_delete_unknown_order_raises_value_error():
+    level = Level(price=10.0)
+
+    with pytest.raises(ValueError):
+        level.delete(Order(price=10.0, size=10.0, side=OrderSide.BUY, id="1"))
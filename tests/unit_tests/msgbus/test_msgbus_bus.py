@@ -424,3 +424,189 @@ class TestMessageBus:
         # Assert
         assert handler1 == ["message1"]
         assert handler2 == ["message1", "message2", "message3"]
+
+    def test_subscribe_wildcard_after_topic_cached_receives_messages(self):
+        # Arrange
+        handler1 = []
+        handler2 = []
+
+        self.msgbus.subscribe(topic="data.signal.my_signal", handler=handler1.append)
+        self.msgbus.publish("data.signal.my_signal", "message1")
+
+        # Act
+        self.msgbus.subscribe(topic="data.*", handler=handler2.append)
+        self.msgbus.publish("data.signal.my_signal", "message2")
+
+        # Assert
+        assert handler1 == ["message1", "message2"]
+        assert handler2 == ["message2"]
+
+    def test_unsubscribe_after_topic_cached_stops_messages(self):
+        # Arrange
+        handler = []
+
+        self.msgbus.subscribe(topic="events.order*", handler=handler.append)
+        self.msgbus.publish("events.order.S-001", "message1")
+
+        # Act
+        self.msgbus.unsubscribe(topic="events.order*", handler=handler.append)
+        self.msgbus.publish("events.order.S-001", "message2")
+
+        # Assert
+        assert handler == ["message1"]
+
+    def test_publish_delivers_by_priority_then_subscription_order(self):
+        # Arrange
+        received = []
+
+        self.msgbus.subscribe(topic="data.*", handler=lambda m: received.append("wildcard"))
+        self.msgbus.subscribe(topic="data.quotes", handler=lambda m: received.append("exact"))
+        self.msgbus.subscribe(
+            topic="data.quotes",
+            handler=lambda m: received.append("priority"),
+            priority=10,
+        )
+
+        # Act
+        self.msgbus.publish("data.quotes", "message")
+
+        # Assert
+        assert received == ["priority", "wildcard", "exact"]
+
+    def test_publish_counts_cache_hits_and_misses(self):
+        # Arrange
+        self.msgbus.subscribe(topic="system", handler=self.handler.append)
+
+        # Act
+        self.msgbus.publish("system", "message1")
+        self.msgbus.publish("system", "message2")
+        self.msgbus.publish("other", "message3")
+
+        # Assert
+        assert self.msgbus.cache_misses == 2
+        assert self.msgbus.cache_hits == 1
+        assert self.msgbus.cached_topics_count() == 2
+        assert self.handler == ["message1", "message2"]
+
+    def test_resolved_topic_cache_evicts_least_recently_published(self):
+        # Arrange
+        msgbus = MessageBus(
+            trader_id=self.trader_id,
+            clock=self.clock,
+            logger=self.logger,
+            cache_size=2,
+        )
+        msgbus.subscribe(topic="events.*", handler=self.handler.append)
+
+        msgbus.publish("events.order.1", "message1")
+        msgbus.publish("events.order.2", "message2")
+        msgbus.publish("events.order.1", "message3")  # Hit, now most recent
+
+        # Act
+        msgbus.publish("events.order.3", "message4")  # Evicts events.order.2
+        msgbus.publish("events.order.1", "message5")
+        msgbus.publish("events.order.2", "message6")
+
+        # Assert
+        assert msgbus.cached_topics_count() == 2
+        assert msgbus.cache_hits == 2
+        assert msgbus.cache_misses == 4
+        assert self.handler == [f"message{i}" for i in range(1, 7)]
+
+    def test_profiling_disabled_by_default(self):
+        # Arrange
+        self.msgbus.subscribe(topic="system", handler=self.handler.append)
+
+        # Act
+        self.msgbus.publish("system", "message")
+
+        # Assert
+        assert not self.msgbus.is_profiling()
+        assert self.msgbus.handler_stats() == []
+        assert self.msgbus.slowest_topics() == []
+
+    def test_publish_when_profiling_records_handler_and_topic_stats(self):
+        # Arrange
+        handler1 = []
+        handler2 = []
+        self.msgbus.subscribe(topic="data.*", handler=handler1.append)
+        self.msgbus.subscribe(topic="data.quotes", handler=handler2.append)
+        self.msgbus.enable_profiling()
+
+        # Act
+        self.msgbus.publish("data.quotes", "message1")
+        self.msgbus.publish("data.quotes", "message2")
+        self.msgbus.publish("data.trades", "message3")
+
+        # Assert
+        stats = {(s.target, s.handler): s for s in self.msgbus.handler_stats()}
+        topics = {s.target: s for s in self.msgbus.slowest_topics()}
+        assert self.msgbus.is_profiling()
+        assert stats[("data.*", handler1.append)].count == 3
+        assert stats[("data.quotes", handler2.append)].count == 2
+        assert topics["data.quotes"].count == 2
+        assert topics["data.trades"].count == 1
+        assert handler1 == ["message1", "message2", "message3"]
+        assert handler2 == ["message1", "message2"]
+
+    def test_send_when_profiling_records_endpoint_handler_stats(self):
+        # Arrange
+        endpoint = []
+        self.msgbus.register(endpoint="mailbox", handler=endpoint.append)
+        self.msgbus.enable_profiling()
+
+        # Act
+        self.msgbus.send("mailbox", "message")
+
+        # Assert
+        stats = self.msgbus.handler_stats()
+        assert len(stats) == 1
+        assert stats[0].target == "mailbox"
+        assert stats[0].count == 1
+        assert endpoint == ["message"]
+
+    def test_reset_and_disable_profiling(self):
+        # Arrange
+        self.msgbus = MessageBus(
+            trader_id=self.trader_id,
+            clock=self.clock,
+            logger=self.logger,
+            profiling=True,
+        )
+        self.msgbus.subscribe(topic="system", handler=self.handler.append)
+        self.msgbus.publish("system", "message1")
+
+        # Act
+        self.msgbus.reset_profiling()
+        reset_stats = self.msgbus.handler_stats()
+        self.msgbus.disable_profiling()
+        self.msgbus.publish("system", "message2")
+
+        # Assert
+        assert reset_stats == []
+        assert not self.msgbus.is_profiling()
+        assert self.msgbus.handler_stats() == []
+        assert self.handler == ["message1", "message2"]
+
+    def test_handler_stats_ordered_by_cumulative_dispatch_time(self):
+        # Arrange
+        fast = []
+        self.msgbus.subscribe(topic="fast", handler=fast.append)
+        self.msgbus.subscribe(topic="slow", handler=lambda m: sum(range(100_000)))
+        self.msgbus.enable_profiling(sample_size=4)
+
+        # Act
+        for _ in range(10):
+            self.msgbus.publish("fast", "message")
+            self.msgbus.publish("slow", "message")
+
+        # Assert
+        slow = self.msgbus.handler_stats()[0]
+        topics = self.msgbus.slowest_topics(n=1)
+        assert slow.target == "slow"
+        assert slow.count == 10
+        assert slow.min_ns <= slow.percentile_ns(50.0) <= slow.percentile_ns(99.0) <= slow.max_ns
+        assert slow.min_ns <= slow.mean_ns() <= slow.max_ns
+        assert slow.to_dict()["count"] == 10
+        assert len(topics) == 1
+        assert topics[0].target == "slow"
@@ -0,0 +1,76 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import pytest
+
+from nautilus_trader.msgbus.profiler import DispatchProfiler
+from nautilus_trader.msgbus.profiler import DispatchStats
+from nautilus_trader.msgbus.profiler import handler_name
+
+
+class TestDispatchStats:
+    def test_instantiate_with_invalid_sample_size_raises_value_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            DispatchStats("data.quotes", None, 0)
+
+    def test_stats_with_no_dispatches(self):
+        # Arrange
+        stats = DispatchStats("data.quotes", None, 10)
+
+        # Act, Assert
+        assert stats.count == 0
+        assert stats.total_ns == 0
+        assert stats.mean_ns() == 0.0
+        assert stats.percentile_ns(99.0) == 0
+
+    def test_percentile_with_invalid_q_raises_value_error(self):
+        # Arrange
+        stats = DispatchStats("data.quotes", None, 10)
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            stats.percentile_ns(101.0)
+
+
+class TestDispatchProfiler:
+    def setup(self):
+        # Fixture Setup
+        self.profiler = DispatchProfiler(sample_size=4)
+
+    def test_handler_stats_with_no_dispatches_returns_empty_list(self):
+        # Arrange, Act, Assert
+        assert self.profiler.handler_stats() == []
+        assert self.profiler.slowest_topics() == []
+
+    def test_instantiate_with_invalid_sample_size_raises_value_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            DispatchProfiler(sample_size=0)
+
+    def test_handler_name_for_bound_method_includes_owner(self):
+        # Arrange
+        class Owner:
+            def __str__(self):
+                return "Owner-001"
+
+            def handle(self, msg):
+                pass
+
+        # Act, Assert
+        assert handler_name(Owner().handle) == "Owner-001.handle"
+        assert handler_name(handler_name) == "handler_name"
+        assert handler_name(None) == "None"
+
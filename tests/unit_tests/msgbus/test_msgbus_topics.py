@@ -0,0 +1,86 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import pytest
+
+from nautilus_trader.model.identifiers import InstrumentId
+from nautilus_trader.msgbus.topics import clear_topic_cache
+from nautilus_trader.msgbus.topics import get_bars_topic
+from nautilus_trader.msgbus.topics import get_book_deltas_topic
+from nautilus_trader.msgbus.topics import get_book_snapshots_topic
+from nautilus_trader.msgbus.topics import get_close_price_topic
+from nautilus_trader.msgbus.topics import get_instrument_topic
+from nautilus_trader.msgbus.topics import get_quotes_topic
+from nautilus_trader.msgbus.topics import get_tickers_topic
+from nautilus_trader.msgbus.topics import get_trades_topic
+from tests.test_kit.stubs.data import TestDataStubs
+
+
+AUDUSD_SIM = InstrumentId.from_str("AUD/USD.SIM")
+
+
+@pytest.mark.parametrize(
+    "get_topic, expected",
+    [
+        [get_instrument_topic, "data.instrument.SIM.AUD/USD"],
+        [get_book_deltas_topic, "data.book.deltas.SIM.AUD/USD"],
+        [get_book_snapshots_topic, "data.book.snapshots.SIM.AUD/USD"],
+        [get_tickers_topic, "data.tickers.SIM.AUD/USD"],
+        [get_quotes_topic, "data.quotes.SIM.AUD/USD"],
+        [get_trades_topic, "data.trades.SIM.AUD/USD"],
+        [get_close_price_topic, "data.venue.close_price.AUD/USD.SIM"],
+    ],
+)
+def test_instrument_topics(get_topic, expected):
+    # Arrange, Act
+    topic1 = get_topic(AUDUSD_SIM)
+    topic2 = get_topic(InstrumentId.from_str("AUD/USD.SIM"))
+
+    # Assert
+    assert topic1 == expected
+    assert topic2 is topic1
+
+
+def test_book_snapshots_topic_with_interval():
+    # Arrange, Act
+    topic = get_book_snapshots_topic(AUDUSD_SIM, 1000)
+
+    # Assert
+    assert topic == "data.book.snapshots.SIM.AUD/USD.1000"
+    assert get_book_snapshots_topic(AUDUSD_SIM, 1000) is topic
+    assert get_book_snapshots_topic(AUDUSD_SIM) == "data.book.snapshots.SIM.AUD/USD"
+
+
+def test_bars_topic():
+    # Arrange
+    bar_type = TestDataStubs.bartype_audusd_1min_bid()
+
+    # Act
+    topic = get_bars_topic(bar_type)
+
+    # Assert
+    assert topic == f"data.bars.{bar_type}"
+    assert get_bars_topic(bar_type) is topic
+
+
+def test_clear_topic_cache():
+    # Arrange
+    topic = get_quotes_topic(AUDUSD_SIM)
+
+    # Act
+    clear_topic_cache()
+
+    # Assert
+    assert get_quotes_topic(AUDUSD_SIM) == topic
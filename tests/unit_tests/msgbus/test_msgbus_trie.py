@@ -0,0 +1,101 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2022 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from nautilus_trader.msgbus.subscription import Subscription
+from nautilus_trader.msgbus.trie import SubscriptionTrie
+
+
+class TestSubscriptionTrie:
+    def setup(self):
+        # Fixture Setup
+        self.trie = SubscriptionTrie()
+
+    def test_match_with_no_subscriptions_returns_empty_list(self):
+        # Arrange, Act, Assert
+        assert self.trie.match("data.quotes.SIM.AUD/USD") == []
+        assert len(self.trie) == 0
+
+    def test_match_exact_topic(self):
+        # Arrange
+        sub1 = Subscription(topic="data.quotes.SIM.AUD/USD", handler=print)
+        sub2 = Subscription(topic="data.quotes.SIM.GBP/USD", handler=print)
+        self.trie.add(sub1)
+        self.trie.add(sub2)
+
+        # Act
+        result = self.trie.match("data.quotes.SIM.AUD/USD")
+
+        # Assert
+        assert result == [sub1]
+        assert self.trie.count == 2
+
+    def test_match_does_not_return_subscription_for_topic_prefix(self):
+        # Arrange
+        sub = Subscription(topic="data.quotes", handler=print)
+        self.trie.add(sub)
+
+        # Act, Assert
+        assert self.trie.match("data") == []
+        assert self.trie.match("data.quotes.SIM") == []
+
+    def test_match_wildcards(self):
+        # Arrange
+        sub1 = Subscription(topic="*", handler=print)
+        sub2 = Subscription(topic="data.*", handler=print)
+        sub3 = Subscription(topic="data.quotes*", handler=print)
+        sub4 = Subscription(topic="data.*.SIM.*", handler=print)
+        sub5 = Subscription(topic="data.trades.SIM.???/USD", handler=print)
+        for sub in (sub1, sub2, sub3, sub4, sub5):
+            self.trie.add(sub)
+
+        # Act
+        result1 = self.trie.match("data.quotes.SIM.AUD/USD")
+        result2 = self.trie.match("data.trades.SIM.AUD/USD")
+        result3 = self.trie.match("events.order.S-001")
+
+        # Assert
+        assert set(result1) == {sub1, sub2, sub3, sub4}
+        assert set(result2) == {sub1, sub2, sub4, sub5}
+        assert result3 == [sub1]
+
+    def test_remove_subscription(self):
+        # Arrange
+        sub1 = Subscription(topic="data.quotes.SIM.AUD/USD", handler=print)
+        sub2 = Subscription(topic="data.quotes.*", handler=print)
+        self.trie.add(sub1)
+        self.trie.add(sub2)
+
+        # Act
+        removed1 = self.trie.remove(sub1)
+        removed2 = self.trie.remove(sub2)
+        removed3 = self.trie.remove(sub2)
+
+        # Assert
+        assert removed1
+        assert removed2
+        assert not removed3
+        assert self.trie.count == 0
+        assert self.trie.match("data.quotes.SIM.AUD/USD") == []
+
+    def test_clear(self):
+        # Arrange
+        self.trie.add(Subscription(topic="data.*", handler=print))
+
+        # Act
+        self.trie.clear()
+
+        # Assert
+        assert self.trie.count == 0
+        assert self.trie.match("data.quotes") == []
@@ -85,6 +85,41 @@ class TestPersistenceBatching:
             latest_timestamp = max(timestamps)
             assert timestamps == sorted(timestamps)
 
+    def test_batch_files_emits_all_rows_regardless_of_read_size(self):
+        # Arrange
+        instrument_ids = self.catalog.instruments()["id"].unique().tolist()
+        base = BacktestDataConfig(
+            catalog_path=str(self.catalog.path),
+            catalog_fs_protocol=self.catalog.fs.protocol,
+            data_cls=OrderBookData,
+        )
+        data_configs = [
+            base.replace(instrument_id=instrument_ids[0]),
+            base.replace(instrument_id=instrument_ids[1]),
+        ]
+        expected = sum(
+            len(batch)
+            for batch in batch_files(
+                catalog=self.catalog,
+                data_configs=data_configs,
+                read_num_rows=1_000_000,
+            )
+        )
+
+        # Act
+        result = sum(
+            len(batch)
+            for batch in batch_files(
+                catalog=self.catalog,
+                data_configs=data_configs,
+                target_batch_size_bytes=parse_bytes("10kib"),
+                read_num_rows=50,
+            )
+        )
+
+        # Assert
+        assert result == expected
+
     def test_batch_generic_data(self):
         # Arrange
         TestPersistenceStubs.setup_news_event_persistence()
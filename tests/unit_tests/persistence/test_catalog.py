@@ -40,11 +40,13 @@ from nautilus_trader.model.objects import Price
 from nautilus_trader.model.objects import Quantity
 from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
 from nautilus_trader.persistence.catalog.parquet import resolve_path
+from nautilus_trader.persistence.catalog.rust.writer import ParquetWriter
 from nautilus_trader.persistence.external.core import dicts_to_dataframes
 from nautilus_trader.persistence.external.core import process_files
 from nautilus_trader.persistence.external.core import split_and_serialize
 from nautilus_trader.persistence.external.core import write_objects
 from nautilus_trader.persistence.external.core import write_tables
+from nautilus_trader.persistence.external.metadata import write_partition_column_mappings
 from nautilus_trader.persistence.external.readers import CSVReader
 from tests.integration_tests.adapters.betfair.test_kit import BetfairTestStubs
 from tests.test_kit import PACKAGE_ROOT
@@ -161,6 +163,118 @@ class TestPersistenceCatalog:
         assert all(isinstance(tick, TradeTick) for tick in trade_ticks)
         assert len(trade_ticks) == 312
 
+    def test_data_catalog_trade_ticks_as_nautilus_falls_back_when_not_rust_layout(self):
+        # Arrange, Act
+        rust_ticks = self.catalog._query_rust(cls=TradeTick)
+        trade_ticks = self.catalog.trade_ticks(
+            as_nautilus=True,
+            start=1576875378384999936,
+        )
+        expected = self.catalog.trade_ticks(
+            as_nautilus=True,
+            start=1576875378384999936,
+            use_rust=False,
+        )
+
+        # Assert
+        assert rust_ticks is None
+        assert trade_ticks == expected
+        assert len(trade_ticks) == 123
+
+    def test_data_catalog_quote_ticks_as_nautilus_reads_rust_layout(self, tmp_path):
+        # Arrange
+        catalog = ParquetDataCatalog(path=str(tmp_path), fs_protocol="file")
+        instrument = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+        ticks = [
+            QuoteTick(
+                instrument_id=InstrumentId.from_str("AUD-USD.SIM"),
+                bid=Price.from_str(f"1.0000{i}"),
+                ask=Price.from_str(f"1.0001{i}"),
+                bid_size=Quantity.from_int(100_000 + i),
+                ask_size=Quantity.from_int(200_000 + i),
+                ts_event=i,
+                ts_init=i + 1,
+            )
+            for i in range(5)
+        ]
+        full_path = catalog._make_path(cls=QuoteTick)
+        writer = ParquetWriter(
+            f"{full_path}/instrument_id=AUD-USD.SIM/part-0.parquet",
+            QuoteTick,
+            metadata={
+                "instrument_id": "AUD-USD.SIM",
+                "price_precision": str(instrument.price_precision),
+                "size_precision": str(instrument.size_precision),
+            },
+        )
+        writer.write(ticks)
+        writer.close()
+        write_partition_column_mappings(
+            fs=catalog.fs,
+            path=full_path,
+            mappings={"instrument_id": {"AUD/USD.SIM": "AUD-USD.SIM"}},
+        )
+
+        # Act
+        rust_ticks = catalog._query_rust(cls=QuoteTick)
+        result = catalog.quote_ticks(as_nautilus=True, start=3)
+
+        # Assert
+        assert len(rust_ticks) == 5
+        assert [tick.ts_init for tick in result] == [3, 4, 5]
+        assert all(tick.instrument_id == instrument.id for tick in result)
+        assert [tick.bid for tick in result] == [tick.bid for tick in ticks[2:]]
+        assert [tick.ask_size for tick in result] == [tick.ask_size for tick in ticks[2:]]
+
+    def test_data_catalog_trade_ticks_as_nautilus_reads_rust_layout(self, tmp_path):
+        # Arrange
+        catalog = ParquetDataCatalog(path=str(tmp_path), fs_protocol="file")
+        instrument = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+        ticks = [
+            TradeTick(
+                instrument_id=InstrumentId.from_str("AUD-USD.SIM"),
+                price=Price.from_str(f"1.0000{i}"),
+                size=Quantity.from_int(100_000 + i),
+                aggressor_side=AggressorSide.BUY if i % 2 else AggressorSide.SELL,
+                trade_id=TradeId(f"T-{i}"),
+                ts_event=i,
+                ts_init=i + 1,
+            )
+            for i in range(5)
+        ]
+        full_path = catalog._make_path(cls=TradeTick)
+        writer = ParquetWriter(
+            f"{full_path}/instrument_id=AUD-USD.SIM/part-0.parquet",
+            TradeTick,
+            metadata={
+                "instrument_id": "AUD-USD.SIM",
+                "price_precision": str(instrument.price_precision),
+                "size_precision": str(instrument.size_precision),
+            },
+        )
+        writer.write(ticks)
+        writer.close()
+        write_partition_column_mappings(
+            fs=catalog.fs,
+            path=full_path,
+            mappings={"instrument_id": {"AUD/USD.SIM": "AUD-USD.SIM"}},
+        )
+
+        # Act
+        rust_ticks = catalog._query_rust(cls=TradeTick)
+        result = catalog.trade_ticks(as_nautilus=True, start=2, end=4)
+
+        # Assert
+        assert len(rust_ticks) == 5
+        assert [tick.ts_init for tick in result] == [2, 3, 4]
+        assert all(tick.instrument_id == instrument.id for tick in result)
+        assert [tick.price for tick in result] == [tick.price for tick in ticks[1:4]]
+        assert [tick.size for tick in result] == [tick.size for tick in ticks[1:4]]
+        assert [tick.trade_id for tick in result] == [tick.trade_id for tick in ticks[1:4]]
+        assert [tick.aggressor_side for tick in result] == [
+            tick.aggressor_side for tick in ticks[1:4]
+        ]
+
     def test_partition_key_correctly_remapped(self):
         # Arrange
         instrument = TestInstrumentProvider.default_fx_ccy("AUD/USD")
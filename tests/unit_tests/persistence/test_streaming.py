@@ -13,27 +13,36 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import datetime
 import sys
 from collections import Counter
 
+import pyarrow as pa
 import pytest
 
 from nautilus_trader.adapters.betfair.providers import BetfairInstrumentProvider
 from nautilus_trader.backtest.node import BacktestNode
+from nautilus_trader.common.clock import TestClock
+from nautilus_trader.common.logging import Logger
+from nautilus_trader.common.logging import LoggerAdapter
 from nautilus_trader.config import BacktestDataConfig
 from nautilus_trader.config import BacktestEngineConfig
 from nautilus_trader.config import BacktestRunConfig
 from nautilus_trader.core.data import Data
+from nautilus_trader.model.data.tick import TradeTick
 from nautilus_trader.model.data.venue import InstrumentStatusUpdate
 from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
 from nautilus_trader.persistence.catalog.parquet import resolve_path
 from nautilus_trader.persistence.external.core import process_files
 from nautilus_trader.persistence.external.readers import CSVReader
+from nautilus_trader.persistence.streaming import StreamingFeatherWriter
 from nautilus_trader.persistence.streaming import generate_signal_class
+from nautilus_trader.serialization.arrow.serializer import ParquetSerializer
 from tests.integration_tests.adapters.betfair.test_kit import BetfairTestStubs
 from tests.test_kit import PACKAGE_ROOT
 from tests.test_kit.mocks.data import NewsEventData
 from tests.test_kit.mocks.data import data_catalog_setup
+from tests.test_kit.stubs.data import TestDataStubs
 from tests.test_kit.stubs.persistence import TestPersistenceStubs
 
 
@@ -102,6 +111,34 @@ class TestPersistenceStreaming:
 
         assert result == expected
 
+    @pytest.mark.skipif(sys.platform == "win32", reason="Currently flaky on Windows")
+    def test_feather_writer_buffered(self):
+        # Arrange
+        instrument = self.catalog.instruments(as_nautilus=True)[0]
+        run_config = BetfairTestStubs.betfair_backtest_run_config(
+            catalog_path=resolve_path(self.catalog.path, fs=self.fs),
+            catalog_fs_protocol=self.catalog.fs.protocol,
+            instrument_id=instrument.id.value,
+        )
+        run_config.engine.streaming.batch_size = 100
+        run_config.engine.streaming.batch_bytes = 64_000
+        node = BacktestNode(configs=[run_config])
+
+        # Act
+        backtest_result = node.run()
+
+        # Assert
+        result = self.catalog.read_backtest(
+            backtest_run_id=backtest_result[0].instance_id,
+            raise_on_failed_deserialize=True,
+        )
+        result = dict(Counter([r.__class__.__name__ for r in result]))
+
+        assert result["TradeTick"] == 198
+        assert result["OrderBookDeltas"] == 1077
+        assert result["OrderFilled"] == 322
+        assert result["PositionChanged"] == 321
+
     def test_feather_writer_generic_data(self):
         # Arrange
         TestPersistenceStubs.setup_news_event_persistence()
@@ -155,3 +192,74 @@ class TestPersistenceStreaming:
         assert instance.ts_event == 0
         assert instance.value == 5.0
         assert instance.ts_init == 0
+
+
+class TestStreamingFeatherWriterBuffered:
+    def setup(self):
+        self.catalog = data_catalog_setup()
+        self.logger = LoggerAdapter(
+            component_name="StreamingFeatherWriter",
+            logger=Logger(clock=TestClock(), bypass=True),
+        )
+
+    def _writer(self, **kwargs) -> StreamingFeatherWriter:
+        writer = StreamingFeatherWriter(
+            path=str(self.catalog.path / "stream"),
+            fs_protocol=self.catalog.fs.protocol,
+            logger=self.logger,
+            flush_interval_ms=60_000,
+            include_types=("TradeTick",),
+            **kwargs,
+        )
+        writer._last_flush = datetime.datetime.now()  # Don't flush on the first write
+        return writer
+
+    def _read_trade_ticks(self, writer: StreamingFeatherWriter) -> pa.Table:
+        with writer.fs.open(f"{writer.path}/TradeTick.feather", "rb") as f:
+            return pa.ipc.open_stream(f).read_all()
+
+    def test_batch_bytes_writes_before_first_batch(self):
+        # Arrange
+        writer = self._writer(batch_size=1_000, batch_bytes=250)
+        tick = TestDataStubs.trade_tick_5decimal()
+
+        # Act
+        writer.write(tick)
+        buffered_first = writer._buffer_rows["TradeTick"]
+        for _ in range(9):
+            writer.write(tick)
+
+        # Assert
+        assert buffered_first == 1
+        assert writer._buffer_rows["TradeTick"] < 10  # Written on the estimated size
+        writer.close()
+        assert self._read_trade_ticks(writer).num_rows == 10
+
+    def test_check_flush_writes_buffer_when_interval_elapsed(self):
+        # Arrange
+        writer = self._writer(batch_size=1_000)
+        writer.write(TestDataStubs.trade_tick_5decimal())
+        buffered = writer._buffer_rows["TradeTick"]
+
+        # Act
+        writer._last_flush = datetime.datetime(1970, 1, 1)  # Interval elapsed with no writes
+        writer.check_flush()
+
+        # Assert
+        assert buffered == 1
+        assert writer._buffer_rows["TradeTick"] == 0
+        writer.close()
+        assert self._read_trade_ticks(writer).num_rows == 1
+
+    def test_invalid_row_is_dropped_without_dropping_batch(self):
+        # Arrange
+        writer = self._writer(batch_size=1_000)
+        row = ParquetSerializer.serialize(TestDataStubs.trade_tick_5decimal())
+        invalid = dict(row, ts_init="not a timestamp")
+
+        # Act
+        writer._buffer_rows_for(table="TradeTick", cls=TradeTick, rows=[row, invalid, row])
+        writer.close()
+
+        # Assert
+        assert self._read_trade_ticks(writer).num_rows == 2
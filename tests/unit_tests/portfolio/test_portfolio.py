@@ -912,7 +912,7 @@ class TestPortfolio:
         result = self.portfolio.unrealized_pnls(BITMEX)
 
         # # Assert
-        assert result == {}
+        assert result is None
 
     def test_market_value_when_insufficient_data_for_xrate_returns_none(self):
         # Arrange
@@ -1413,3 +1413,235 @@ class TestPortfolio:
         assert self.portfolio.is_net_long(AUDUSD_SIM.id)
         assert self.portfolio.is_flat(GBPUSD_SIM.id)
         assert not self.portfolio.is_completely_flat()
+
+
+class TestPortfolioIncremental:
+    def setup(self):
+        # Fixture Setup
+        self.clock = TestClock()
+        self.logger = Logger(self.clock)
+
+        self.trader_id = TestIdStubs.trader_id()
+
+        self.order_factory = OrderFactory(
+            trader_id=self.trader_id,
+            strategy_id=StrategyId("S-001"),
+            clock=TestClock(),
+        )
+
+        self.msgbus = MessageBus(
+            trader_id=self.trader_id,
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        self.cache = TestComponentStubs.cache()
+
+        self.portfolio = Portfolio(
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            logger=self.logger,
+            incremental=True,
+        )
+
+        # Prepare components
+        self.cache.add_instrument(AUDUSD_SIM)
+        self.cache.add_instrument(GBPUSD_SIM)
+
+        AccountFactory.register_calculated_account("SIM")
+
+        self.account_id = AccountId("SIM-01234")
+        state = AccountState(
+            account_id=self.account_id,
+            account_type=AccountType.MARGIN,
+            base_currency=USD,
+            reported=True,
+            balances=[
+                AccountBalance(
+                    Money(1_000_000, USD),
+                    Money(0, USD),
+                    Money(1_000_000, USD),
+                ),
+            ],
+            margins=[],
+            info={},
+            event_id=UUID4(),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        self.portfolio.update_account(state)
+
+    def _open_position(self, instrument, position_id, last_px="1.00000"):
+        order = self.order_factory.market(
+            instrument.id,
+            OrderSide.BUY,
+            Quantity.from_int(100000),
+        )
+
+        fill = TestEventStubs.order_filled(
+            order,
+            instrument=instrument,
+            strategy_id=StrategyId("S-1"),
+            account_id=self.account_id,
+            position_id=position_id,
+            last_px=Price.from_str(last_px),
+        )
+
+        position = Position(instrument=instrument, fill=fill)
+        self.cache.add_position(position, OMSType.HEDGING)
+        self.portfolio.update_position(TestEventStubs.position_opened(position))
+        return position
+
+    def _update_quote(self, instrument, bid, ask):
+        tick = QuoteTick(
+            instrument_id=instrument.id,
+            bid=Price.from_str(bid),
+            ask=Price.from_str(ask),
+            bid_size=Quantity.from_int(1),
+            ask_size=Quantity.from_int(1),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        self.cache.add_quote_tick(tick)
+        self.portfolio.update_quote_tick(tick)
+
+    def test_incremental_flag(self):
+        # Arrange, Act, Assert
+        assert self.portfolio.incremental
+
+    def test_quote_tick_updates_venue_aggregates(self):
+        # Arrange
+        self._update_quote(AUDUSD_SIM, "0.80501", "0.80505")
+        self._open_position(AUDUSD_SIM, PositionId("P-1"))
+
+        # Act
+        self._update_quote(AUDUSD_SIM, "1.00010", "1.00012")
+
+        # Assert
+        assert self.portfolio.unrealized_pnls(SIM) == {USD: Money(10.00, USD)}
+        assert self.portfolio.net_exposures(SIM) == {USD: Money(100010.00, USD)}
+        assert self.portfolio.unrealized_pnl(AUDUSD_SIM.id) == Money(10.00, USD)
+        assert self.portfolio.net_exposure(AUDUSD_SIM.id) == Money(100010.00, USD)
+
+    def test_several_instruments_sum_into_venue_aggregates(self):
+        # Arrange
+        self._update_quote(AUDUSD_SIM, "0.80501", "0.80505")
+        self._update_quote(GBPUSD_SIM, "1.30315", "1.30317")
+
+        # Act
+        self._open_position(AUDUSD_SIM, PositionId("P-1"))
+        self._open_position(GBPUSD_SIM, PositionId("P-2"))
+
+        # Assert
+        assert self.portfolio.net_exposures(SIM) == {USD: Money(210816.00, USD)}
+        assert self.portfolio.unrealized_pnls(SIM) == {USD: Money(10816.00, USD)}
+
+    def test_trade_tick_on_bus_updates_venue_aggregates(self):
+        # Arrange
+        self.cache.add_trade_tick(TestDataStubs.trade_tick_5decimal(AUDUSD_SIM.id))
+        self._open_position(AUDUSD_SIM, PositionId("P-1"))
+        trade_tick = TestDataStubs.trade_tick_5decimal(
+            AUDUSD_SIM.id,
+            price=Price.from_str("1.00010"),
+        )
+        self.cache.add_trade_tick(trade_tick)
+
+        # Act
+        self.msgbus.publish(topic="data.trades.SIM.AUD/USD", msg=trade_tick)
+
+        # Assert
+        assert self.portfolio.unrealized_pnls(SIM) == {USD: Money(10.00, USD)}
+        assert self.portfolio.net_exposures(SIM) == {USD: Money(100010.00, USD)}
+
+    def test_unrealized_pnls_when_price_missing_returns_none(self):
+        # Arrange
+        self._update_quote(AUDUSD_SIM, "0.80501", "0.80505")
+        self._open_position(AUDUSD_SIM, PositionId("P-1"))
+
+        # Act
+        self._open_position(GBPUSD_SIM, PositionId("P-2"))
+
+        # Assert
+        assert self.portfolio.unrealized_pnls(SIM) is None
+
+    def test_net_exposures_when_exchange_rate_missing_returns_none(self):
+        # Arrange
+        self.cache.add_instrument(USDJPY_SIM)
+        self._update_quote(AUDUSD_SIM, "0.80501", "0.80505")
+        self._open_position(AUDUSD_SIM, PositionId("P-1"))
+
+        # Last price from a trade, with no quotes for a JPY/USD exchange rate
+        trade_tick = TestDataStubs.trade_tick_5decimal(
+            USDJPY_SIM.id,
+            price=Price.from_str("110.000"),
+        )
+        self.cache.add_trade_tick(trade_tick)
+
+        # Act
+        self._open_position(USDJPY_SIM, PositionId("P-2"), last_px="110.000")
+
+        # Assert
+        assert self.portfolio.net_exposures(SIM) is None
+
+    def test_net_exposures_when_exchange_rate_becomes_available_returns_totals(self):
+        # Arrange
+        self.cache.add_instrument(USDJPY_SIM)
+        trade_tick = TestDataStubs.trade_tick_5decimal(
+            USDJPY_SIM.id,
+            price=Price.from_str("110.000"),
+        )
+        self.cache.add_trade_tick(trade_tick)
+        self._open_position(USDJPY_SIM, PositionId("P-1"), last_px="110.000")
+
+        # Act
+        self._update_quote(USDJPY_SIM, "110.000", "110.002")
+
+        # Assert
+        assert self.portfolio.net_exposures(SIM) is not None
+
+    def test_closing_position_removes_contribution(self):
+        # Arrange
+        self._update_quote(AUDUSD_SIM, "0.80501", "0.80505")
+        self._update_quote(GBPUSD_SIM, "1.30315", "1.30317")
+        self._open_position(AUDUSD_SIM, PositionId("P-1"))
+        position = self._open_position(GBPUSD_SIM, PositionId("P-2"))
+
+        order = self.order_factory.market(
+            GBPUSD_SIM.id,
+            OrderSide.SELL,
+            Quantity.from_int(100000),
+        )
+
+        fill = TestEventStubs.order_filled(
+            order,
+            instrument=GBPUSD_SIM,
+            strategy_id=StrategyId("S-1"),
+            account_id=self.account_id,
+            position_id=PositionId("P-2"),
+            last_px=Price.from_str("1.30315"),
+        )
+
+        position.apply(fill)
+        self.cache.update_position(position)
+
+        # Act
+        self.portfolio.update_position(TestEventStubs.position_closed(position))
+
+        # Assert
+        assert self.portfolio.net_exposures(SIM) == {USD: Money(80501.00, USD)}
+        assert self.portfolio.unrealized_pnls(SIM) == {USD: Money(-19499.00, USD)}
+        assert self.portfolio.net_exposure(GBPUSD_SIM.id) == Money(0, USD)
+
+    def test_reset_clears_venue_aggregates(self):
+        # Arrange
+        self._update_quote(AUDUSD_SIM, "0.80501", "0.80505")
+        self._open_position(AUDUSD_SIM, PositionId("P-1"))
+
+        # Act
+        self.portfolio.reset()
+
+        # Assert
+        assert self.portfolio.unrealized_pnls(SIM) == {}